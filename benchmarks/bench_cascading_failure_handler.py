@@ -0,0 +1,122 @@
+"""
+CascadingFailureHandler benchmarks.
+
+Fan-in: a dead database called by N services, driven by a round-robin
+request stream. Counts the calls that still reach the database:
+
+- per-caller breakers: every caller learns the database is down on its own
+- isolation registry: the database breaker opens once and every caller is
+  put into fast-fail through the shared registry
+
+Also reports the call-path check (isolation mode lookup and full
+acquire_call_permission) and the cost of isolating and releasing a
+component with a large fan-in.
+
+Usage:
+    python benchmarks/bench_cascading_failure_handler.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.cascading_failure_handler import (  # noqa: E402
+    DEFAULT_BREAKER_CONFIG,
+    CascadingFailureHandler,
+    ComponentIsolationManager,
+)
+from runtime.circuit_breaker import CircuitBreaker  # noqa: E402
+
+REQUESTS_PER_CALLER = 20
+LOOKUPS = 200000
+
+
+def per_caller_breakers(callers: int) -> int:
+    """Database calls made when each caller has its own breaker"""
+    breakers = [CircuitBreaker(f"svc-{i}->db", DEFAULT_BREAKER_CONFIG) for i in range(callers)]
+    reached = 0
+    for _ in range(REQUESTS_PER_CALLER):
+        for breaker in breakers:
+            if breaker.can_attempt():
+                reached += 1
+                breaker.record_failure()
+    return reached
+
+
+def isolation_registry(callers: int) -> int:
+    """Database calls made when callers are shed through the registry"""
+    handler = CascadingFailureHandler("bench-org")
+    for i in range(callers):
+        handler.register_dependency(f"svc-{i}", "db")
+    reached = 0
+    for _ in range(REQUESTS_PER_CALLER):
+        for i in range(callers):
+            if not handler.acquire_call_permission(f"svc-{i}")[0]:
+                continue
+            if handler.acquire_call_permission("db")[0]:
+                reached += 1
+                handler.record_failure("db", "connection refused")
+    return reached
+
+
+def bench_lookups() -> tuple:
+    """(ns per mode lookup, ns per acquire_call_permission) with 10k shed callers"""
+    handler = CascadingFailureHandler("bench-org")
+    for i in range(10000):
+        handler.register_dependency(f"svc-{i}", "db")
+    handler.get_isolation_manager().isolate_component("db")
+    registry = handler.get_isolation_manager()
+    names = [f"svc-{i % 20000}" for i in range(LOOKUPS)]  # Half shed, half unrestricted
+
+    start = time.perf_counter()
+    for name in names:
+        registry.get_isolation_mode(name)
+    lookup_ns = (time.perf_counter() - start) / LOOKUPS * 1e9
+
+    start = time.perf_counter()
+    for name in names:
+        handler.acquire_call_permission(name)
+    permission_ns = (time.perf_counter() - start) / LOOKUPS * 1e9
+    return lookup_ns, permission_ns
+
+
+def bench_isolate(callers: int, depth: int) -> tuple:
+    """(isolate ms, release ms) for a fan-in of callers behind depth tiers"""
+    registry = ComponentIsolationManager()
+    previous = ["db"]
+    per_tier = callers // depth
+    for tier in range(depth):
+        current = [f"t{tier}-svc-{i}" for i in range(per_tier)]
+        for i, caller in enumerate(current):
+            registry.register_dependency(caller, previous[i % len(previous)])
+        previous = current
+
+    start = time.perf_counter()
+    registry.isolate_component("db")
+    isolate_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    registry.release_component("db")
+    release_ms = (time.perf_counter() - start) * 1000
+    return isolate_ms, release_ms
+
+
+def main() -> None:
+    print(f"{'callers':>8} {'per-caller db calls':>20} {'registry db calls':>18}")
+    for callers in (10, 50, 200):
+        print(f"{callers:>8} {per_caller_breakers(callers):>20} {isolation_registry(callers):>18}")
+    print()
+
+    lookup_ns, permission_ns = bench_lookups()
+    print(f"call-path check: mode lookup {lookup_ns:.0f} ns, acquire_call_permission {permission_ns:.0f} ns")
+    print()
+
+    print(f"{'callers':>8} {'tiers':>6} {'isolate ms':>11} {'release ms':>11}")
+    for callers, depth in ((100, 1), (1000, 1), (10000, 1), (10000, 5)):
+        isolate_ms, release_ms = bench_isolate(callers, depth)
+        print(f"{callers:>8} {depth:>6} {isolate_ms:>11.2f} {release_ms:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+CircuitBreaker benchmarks.
+
+Compares the sliding-window breaker with the count-based breaker that
+ResilienceManager and CascadingFailureHandler used before (trip after
+failure_threshold failures, never forgotten, behind one manager-wide
+lock):
+
+- When each breaker trips for streams with a low background failure rate
+  and with a real outage, at low and high call volume
+- Cost of recording a call, single-threaded and from 8 threads recording
+  on 8 different breakers
+
+Usage:
+    python benchmarks/bench_circuit_breaker.py
+"""
+
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState  # noqa: E402
+
+
+class CountingManager:
+    """The failure-count breakers the manager used to hold, under one lock"""
+
+    def __init__(self, threshold: int = 3):
+        self.threshold = threshold
+        self.failures = {}
+        self.open = set()
+        self.lock = threading.Lock()
+
+    def record(self, name: str, failed: bool) -> None:
+        with self.lock:
+            if failed:
+                self.failures[name] = self.failures.get(name, 0) + 1
+                if self.failures[name] >= self.threshold:
+                    self.open.add(name)
+
+
+def calls_until_trip(failure_rate: float, calls: int, window: bool) -> str:
+    """Index of the call that tripped the breaker, or '-' if it stayed closed"""
+    rng = random.Random(3)
+    counting = CountingManager()
+    circuit = CircuitBreaker("api", CircuitBreakerConfig(minimum_calls=20))
+    for index in range(calls):
+        failed = rng.random() < failure_rate
+        if window:
+            if failed:
+                circuit.record_failure()
+            else:
+                circuit.record_success()
+            if circuit.state == CircuitState.OPEN:
+                return str(index + 1)
+        else:
+            counting.record("api", failed)
+            if "api" in counting.open:
+                return str(index + 1)
+    return "-"
+
+
+def bench_record(threads: int, calls: int, window: bool) -> float:
+    """Return recorded calls per second"""
+    counting = CountingManager(threshold=10 ** 9)
+    circuits = [CircuitBreaker(f"api_{i}", CircuitBreakerConfig(minimum_calls=10 ** 6, window_size=1000))
+                for i in range(threads)]
+
+    def run(index: int) -> None:
+        name = f"api_{index}"
+        circuit = circuits[index]
+        for i in range(calls):
+            if window:
+                if i % 10:
+                    circuit.record_success()
+                else:
+                    circuit.record_failure()
+            else:
+                counting.record(name, i % 10 == 0)
+
+    workers = [threading.Thread(target=run, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return threads * calls / (time.perf_counter() - start)
+
+
+def main() -> None:
+    print(f"{'calls':>7} {'failure rate':>13} {'count trips at':>15} {'window trips at':>16}")
+    for calls in (20, 10000):
+        for failure_rate in (0.02, 0.8):
+            counted = calls_until_trip(failure_rate, calls, window=False)
+            windowed = calls_until_trip(failure_rate, calls, window=True)
+            print(f"{calls:>7} {failure_rate:>13.0%} {counted:>15} {windowed:>16}")
+
+    print()
+    print(f"{'threads':>7} {'breaker':>10} {'records/s':>12}")
+    for threads in (1, 8):
+        for name, window in (("count", False), ("window", True)):
+            print(f"{threads:>7} {name:>10} {bench_record(threads, 50000, window):>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
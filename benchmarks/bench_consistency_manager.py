@@ -0,0 +1,89 @@
+"""
+ConsistencyManager anti-entropy benchmarks.
+
+Two registered sources hold 1M records each, with 0.1% of keys divergent
+(changed, missing or extra on the replica). Compares a full scan of both
+datasets against Merkle validation, and reports the repair that follows.
+
+Usage:
+    python benchmarks/bench_consistency_manager.py [records]
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.integration.consistency_manager import ConsistencyManager  # noqa: E402
+from runtime.integration.merkle_store import MerkleStore  # noqa: E402
+
+ORG_ID = "bench-org"
+DIVERGENCE = 0.001
+
+
+def full_scan(primary: MerkleStore, replica: MerkleStore) -> list:
+    """Compare every record of both stores (the pre-Merkle approach)"""
+    left, right = primary.records, replica.records
+    return sorted(key for key in left.keys() | right.keys() if left.get(key) != right.get(key))
+
+
+def main() -> None:
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    divergent = max(1, int(records * DIVERGENCE))
+
+    manager = ConsistencyManager()
+    items = [(f"record_{i:08d}", {"value": i, "owner": "memory"}) for i in range(records)]
+
+    start = time.perf_counter()
+    primary = manager.register_source(ORG_ID, "memory")
+    primary.update(items)
+    replica = manager.register_source(ORG_ID, "qa")
+    replica.update(items)
+    primary.root_hash()
+    replica.root_hash()
+    build = time.perf_counter() - start
+
+    # Divergence: a third changed, a third missing, a third extra on the replica
+    step = records // divergent
+    for n, i in enumerate(range(0, records, step)[:divergent]):
+        key = items[i][0]
+        if n % 3 == 0:
+            replica.put(key, {"value": -i, "owner": "qa"})
+        elif n % 3 == 1:
+            replica.delete(key)
+        else:
+            replica.put(f"extra_{i:08d}", {"value": i, "owner": "qa"})
+
+    start = time.perf_counter()
+    scanned = full_scan(primary, replica)
+    scan = time.perf_counter() - start
+
+    start = time.perf_counter()
+    validation = manager.validate_consistency(ORG_ID, ["memory", "qa"], [])
+    merkle = time.perf_counter() - start
+    assert sorted(item["data_key"] for item in validation.inconsistencies) == scanned
+
+    start = time.perf_counter()
+    repair = manager.repair_inconsistency(ORG_ID, validation.validation_id, [])
+    repaired = time.perf_counter() - start
+
+    start = time.perf_counter()
+    clean = manager.validate_consistency(ORG_ID, ["memory", "qa"], [])
+    converged = time.perf_counter() - start
+
+    applied = repair.repairs_applied[0]
+    print(f"records: {records}, divergent keys: {len(scanned)}, build both trees: {build:.1f} s")
+    print()
+    print(f"{'check':>24} {'ms':>10} {'hashes compared':>16}")
+    print(f"{'full scan':>24} {scan * 1000:>10.1f} {records:>16}")
+    print(f"{'merkle validate':>24} {merkle * 1000:>10.1f} {validation.nodes_compared:>16}")
+    print(f"{'merkle, converged':>24} {converged * 1000:>10.3f} {clean.nodes_compared:>16}")
+    print()
+    print(f"repair: {repaired * 1000:.1f} ms, "
+          f"{applied['keys_copied']} keys copied, {applied['keys_deleted']} deleted, "
+          f"consistent afterwards: {clean.is_consistent()}")
+
+
+if __name__ == "__main__":
+    main()
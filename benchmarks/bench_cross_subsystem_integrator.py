@@ -0,0 +1,110 @@
+"""
+CrossSubsystemIntegrator propagation benchmarks.
+
+Propagates events through wide dependency graphs (one source subsystem,
+many independent consumers, a final aggregator) whose handlers each block
+for a few milliseconds, as a call to a real subsystem would. Compares one
+propagation worker (sequential delivery) against larger pools.
+
+Also compares the cached circular dependency check against the full
+depth-first search it replaced, on a large layered graph.
+
+Usage:
+    python benchmarks/bench_cross_subsystem_integrator.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.integration.cross_subsystem_integrator import (  # noqa: E402
+    CrossSubsystemIntegrator,
+    DependencyGraph,
+)
+
+ORG_ID = "bench-org"
+HANDLER_SECONDS = 0.005
+EVENTS = 10
+
+
+def bench_propagation(width: int, workers: int) -> float:
+    """Return milliseconds per propagated event"""
+    integrator = CrossSubsystemIntegrator(propagation_workers=workers)
+    consumers = [f"consumer_{i}" for i in range(width)]
+    integrator.manage_dependencies(ORG_ID, "aggregator", consumers)
+    for consumer in consumers:
+        integrator.manage_dependencies(ORG_ID, consumer, ["ingest"])
+    for target in ["ingest", "aggregator"] + consumers:
+        integrator.register_handler(ORG_ID, target, lambda event: time.sleep(HANDLER_SECONDS))
+    targets = ["ingest"] + consumers + ["aggregator"]
+
+    start = time.perf_counter()
+    for i in range(EVENTS):
+        integrator.propagate_event(ORG_ID, "source", targets, "data_updated", {"i": i})
+    elapsed = time.perf_counter() - start
+    integrator.shutdown()
+
+    return elapsed / EVENTS * 1000
+
+
+def full_dfs_has_cycle(dependencies: dict) -> bool:
+    """The depth-first search has_circular_dependency used to run per call"""
+    visited, stack = set(), set()
+
+    def visit(node):
+        visited.add(node)
+        stack.add(node)
+        for dep in dependencies.get(node, []):
+            if dep not in visited:
+                if visit(dep):
+                    return True
+            elif dep in stack:
+                return True
+        stack.remove(node)
+        return False
+
+    return any(visit(node) for node in list(dependencies) if node not in visited)
+
+
+def bench_cycle_check(layers: int = 50, width: int = 40, checks: int = 200) -> tuple:
+    """Return (DFS ms per check, cached ms per check)"""
+    graph = DependencyGraph(organisation_id=ORG_ID)
+    for layer in range(1, layers):
+        for i in range(width):
+            graph.add_dependency(f"n{layer}_{i}", f"n{layer - 1}_{i}")
+            graph.add_dependency(f"n{layer}_{i}", f"n{layer - 1}_{(i + 1) % width}")
+
+    start = time.perf_counter()
+    for _ in range(checks):
+        full_dfs_has_cycle(graph.dependencies)
+    dfs = (time.perf_counter() - start) / checks * 1000
+
+    start = time.perf_counter()
+    for _ in range(checks):
+        graph.has_circular_dependency()
+    cached = (time.perf_counter() - start) / checks * 1000
+
+    return dfs, cached
+
+
+def main() -> None:
+    print(f"handlers block {HANDLER_SECONDS * 1000:.0f} ms; graph: ingest -> N consumers -> aggregator")
+    print(f"{'consumers':>10} {'workers':>8} {'ms/event':>10} {'speedup':>8}")
+    for width in (8, 32, 128):
+        baseline = bench_propagation(width, 1)
+        print(f"{width:>10} {1:>8} {baseline:>10.1f} {1.0:>7.2f}x")
+        for workers in (8, 32):
+            rate = bench_propagation(width, workers)
+            print(f"{width:>10} {workers:>8} {rate:>10.1f} {baseline / rate:>7.2f}x")
+
+    print()
+    dfs, cached = bench_cycle_check()
+    print(f"{'cycle check':>12} {'ms/check':>10}  (2000 subsystems, 3920 edges)")
+    print(f"{'full dfs':>12} {dfs:>10.3f}")
+    print(f"{'cached':>12} {cached:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
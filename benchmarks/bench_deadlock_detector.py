@@ -0,0 +1,125 @@
+"""
+DeadlockDetector benchmarks.
+
+10k lock holders, each holding one resource and waiting on the next
+holder's, form one long wait chain; closing it creates a single cycle.
+Measures request_lock cost while the chain is built, the cost of a
+detect_deadlock call, and compares them with the full rebuild the
+detector used to run on every call.
+
+Recovery is measured on 5k independent two-holder deadlocks (10k holders):
+minimum-cost victims versus releasing every listed resource for every
+listed holder (the old resources x holders loop, measured on 1k holders).
+
+Usage:
+    python benchmarks/bench_deadlock_detector.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.deadlock_detector import DeadlockDetector  # noqa: E402
+
+ORG_ID = "bench-org"
+HOLDERS = 10_000
+
+
+def rebuild_detect(detector: DeadlockDetector) -> bool:
+    """The from-scratch analysis detect_deadlock used to run (2-cycles only)"""
+    wait_for, holds = {}, {}
+    for lock in detector._locks.values():
+        holds.setdefault(lock.holder_id, set()).add(lock.resource_id)
+    for resource_id, waiting in detector._lock_requests.items():
+        for holder_id in waiting:
+            wait_for.setdefault(holder_id, set()).add(resource_id)
+    for waiting_holder, waited in wait_for.items():
+        for resource in waited:
+            holder = next((h for h, r in holds.items() if resource in r), None)
+            if holder and holder in wait_for and waiting_holder in holds:
+                if wait_for[holder] & holds[waiting_holder]:
+                    return True
+    return False
+
+
+def bench_chain(holders: int) -> dict:
+    detector = DeadlockDetector(ORG_ID)
+    names = [f"h{i}" for i in range(holders)]
+    for name in names:
+        detector.acquire_lock(f"r_{name}", name)
+
+    start = time.perf_counter()
+    for name, following in zip(names[:-1], names[1:]):
+        detector.request_lock(f"r_{following}", name)
+    chain_us = (time.perf_counter() - start) / (holders - 1) * 1e6
+
+    start = time.perf_counter()
+    detector.request_lock(f"r_{names[0]}", names[-1])
+    close_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for _ in range(1000):
+        detected = detector.detect_deadlock()
+    detect_us = (time.perf_counter() - start) / 1000 * 1e6
+
+    start = time.perf_counter()
+    rebuild_found = rebuild_detect(detector)
+    rebuild_ms = (time.perf_counter() - start) * 1000
+
+    return {
+        "request_us": chain_us,
+        "close_ms": close_ms,
+        "detect_us": detect_us,
+        "detected": detected.value,
+        "rebuild_ms": rebuild_ms,
+        "rebuild_found": rebuild_found,
+    }
+
+
+def pairs(holders: int) -> DeadlockDetector:
+    detector = DeadlockDetector(ORG_ID)
+    for i in range(0, holders, 2):
+        a, b = f"h{i}", f"h{i + 1}"
+        detector.acquire_lock(f"r_{a}", a)
+        detector.acquire_lock(f"r_{b}", b)
+        detector.request_lock(f"r_{b}", a)
+        detector.request_lock(f"r_{a}", b)
+    return detector
+
+
+def bench_recovery(holders: int, victims: bool) -> float:
+    """Return recovery milliseconds"""
+    detector = pairs(holders)
+    recovery = detector.get_recovery()
+    start = time.perf_counter()
+    if victims:
+        recovery.recover_from_deadlock()
+    else:
+        resources = [f"r_h{i}" for i in range(holders)]
+        names = [f"h{i}" for i in range(holders)]
+        for resource_id in resources:
+            for holder_id in names:
+                detector.release_lock(resource_id, holder_id)
+    return (time.perf_counter() - start) * 1000
+
+
+def main() -> None:
+    chain = bench_chain(HOLDERS)
+    print(f"{HOLDERS} holders in one wait chain")
+    print(f"  request_lock (incremental graph): {chain['request_us']:.1f} us/call")
+    print(f"  closing request (walks the whole chain): {chain['close_ms']:.1f} ms")
+    print(f"  detect_deadlock: {chain['detect_us']:.2f} us/call -> {chain['detected']}")
+    print(f"  full rebuild per call: {chain['rebuild_ms']:.0f} ms -> found: {chain['rebuild_found']}"
+          " (2-holder cycles only)")
+
+    print()
+    print(f"{'recovery':>26} {'holders':>8} {'ms':>10}")
+    print(f"{'release all (old loop)':>26} {1000:>8} {bench_recovery(1000, victims=False):>10.1f}")
+    print(f"{'min-cost victims':>26} {1000:>8} {bench_recovery(1000, victims=True):>10.1f}")
+    print(f"{'min-cost victims':>26} {HOLDERS:>8} {bench_recovery(HOLDERS, victims=True):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""
+ErrorCascadeManager benchmarks.
+
+Builds a 50k-node graph of 50 requirements, 1000 builds and 49 tasks per
+build (seven chains of seven), then measures block + unblock round trips:
+
+- walk: a fresh traversal per event that copies every affected entity's
+  state aside and writes BLOCKED, then restores it
+- graph: CascadeGraph with memoized reachability and counted blocks
+
+"build again" cycles over ten builds, so every graph event after the
+first ten hits the memoized reachable set.
+
+Also reports the cost of adding an edge to a graph whose reachability is
+memoized, and the manager-level blocking / unblocking cascades.
+
+Usage:
+    python benchmarks/bench_error_cascade_manager.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.cascade_graph import CascadeGraph  # noqa: E402
+from runtime.error_cascade_manager import ErrorCascadeManager  # noqa: E402
+
+REQUIREMENTS = 50
+BUILDS_PER_REQUIREMENT = 20
+CHAINS = 7
+CHAIN_LENGTH = 7
+ROUNDS = 200
+
+
+def build_graph() -> tuple:
+    """(graph, adjacency, states, build ids, requirement ids)"""
+    graph = CascadeGraph()
+    adjacency = {}
+    states = {}
+    builds, requirements = [], []
+
+    def add(node_id: str, kind: str, state: str) -> None:
+        graph.add_node(node_id, kind, state)
+        adjacency[node_id] = []
+        states[node_id] = state
+
+    def link(parent_id: str, child_id: str) -> None:
+        graph.add_dependency(parent_id, child_id)
+        adjacency[parent_id].append(child_id)
+
+    for r in range(REQUIREMENTS):
+        requirement_id = f"req-{r}"
+        requirements.append(requirement_id)
+        add(requirement_id, "requirement", "APPROVED")
+        for b in range(BUILDS_PER_REQUIREMENT):
+            build_id = f"build-{r}-{b}"
+            builds.append(build_id)
+            add(build_id, "build", "IN_PROGRESS")
+            link(requirement_id, build_id)
+            for c in range(CHAINS):
+                previous = build_id
+                for t in range(CHAIN_LENGTH):
+                    task_id = f"{build_id}-task-{c}-{t}"
+                    add(task_id, "task", "PENDING")
+                    link(previous, task_id)
+                    previous = task_id
+    return graph, adjacency, states, builds, requirements
+
+
+def walk_block(adjacency: dict, states: dict, saved: dict, node_id: str) -> None:
+    """Traverse from node_id, saving and overwriting every state"""
+    seen = {node_id}
+    stack = [node_id]
+    while stack:
+        current = stack.pop()
+        saved[current] = states[current]
+        states[current] = "BLOCKED"
+        for child in adjacency[current]:
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+
+
+def walk_unblock(adjacency: dict, states: dict, saved: dict, node_id: str) -> None:
+    """Traverse from node_id, restoring every saved state"""
+    seen = {node_id}
+    stack = [node_id]
+    while stack:
+        current = stack.pop()
+        states[current] = saved.pop(current)
+        for child in adjacency[current]:
+            if child not in seen:
+                seen.add(child)
+                stack.append(child)
+
+
+def bench_round_trips(targets: list, graph: CascadeGraph, adjacency: dict, states: dict) -> tuple:
+    """(walk us, graph us) per block + unblock round trip"""
+    saved = {}
+    start = time.perf_counter()
+    for node_id in targets:
+        walk_block(adjacency, states, saved, node_id)
+        walk_unblock(adjacency, states, saved, node_id)
+    walk_us = (time.perf_counter() - start) / len(targets) * 1e6
+
+    start = time.perf_counter()
+    for node_id in targets:
+        graph.block(node_id, "bench")
+        graph.unblock(node_id, "bench")
+    graph_us = (time.perf_counter() - start) / len(targets) * 1e6
+    return walk_us, graph_us
+
+
+def bench_edge_insert(graph: CascadeGraph, builds: list) -> float:
+    """us per edge added under a memoized requirement"""
+    rng = random.Random(1)
+    for r in range(REQUIREMENTS):
+        graph.descendants(f"req-{r}")
+    start = time.perf_counter()
+    for i in range(ROUNDS):
+        task_id = f"extra-{i}"
+        graph.add_node(task_id, "task", "PENDING")
+        graph.add_dependency(rng.choice(builds), task_id)
+        graph.descendants(f"req-{rng.randrange(REQUIREMENTS)}")
+    return (time.perf_counter() - start) / ROUNDS * 1e6
+
+
+def bench_manager(builds: list) -> tuple:
+    """(block ms, unblock ms) per manager cascade on a 50-task build"""
+    manager = ErrorCascadeManager("bench-org")
+    for build_id in builds[:ROUNDS]:
+        manager.handle_build_initiation_cascade(
+            build_id=build_id,
+            builder_assignments=[],
+            tasks=[{"task_id": f"{build_id}-task-{t}", "depends_on": [f"{build_id}-task-{t - 1}"] if t else []}
+                   for t in range(49)],
+            monitoring_config={}
+        )
+    start = time.perf_counter()
+    for build_id in builds[:ROUNDS]:
+        manager.handle_build_blocking_cascade(build_id, {"blocker_id": "bench"})
+    block_ms = (time.perf_counter() - start) / ROUNDS * 1000
+    start = time.perf_counter()
+    for build_id in builds[:ROUNDS]:
+        manager.handle_build_unblocking_cascade(build_id, {"blocker_id": "bench"})
+    unblock_ms = (time.perf_counter() - start) / ROUNDS * 1000
+    return block_ms, unblock_ms
+
+
+def main() -> None:
+    start = time.perf_counter()
+    graph, adjacency, states, builds, requirements = build_graph()
+    build_s = time.perf_counter() - start
+    print(f"graph: {len(graph)} nodes, {graph.get_stats()['edges']} edges, built in {build_s:.2f}s")
+    print()
+
+    rng = random.Random(0)
+    print(f"{'target':>12} {'affected':>9} {'walk us':>9} {'graph us':>9} {'speedup':>8}")
+    cases = [
+        ("build", [rng.choice(builds) for _ in range(ROUNDS)]),
+        ("build again", [builds[i % 10] for i in range(ROUNDS)]),
+        ("requirement", [rng.choice(requirements) for _ in range(ROUNDS)]),
+    ]
+    for label, targets in cases:
+        affected = len(graph.descendants(targets[0])) + 1
+        walk_us, graph_us = bench_round_trips(targets, graph, adjacency, states)
+        print(f"{label:>12} {affected:>9} {walk_us:>9.1f} {graph_us:>9.1f} {walk_us / graph_us:>7.1f}x")
+    print()
+
+    print(f"edge insert + requery with memoized requirements: {bench_edge_insert(graph, builds):.1f} us")
+    block_ms, unblock_ms = bench_manager(builds)
+    print(f"manager cascade on a 50-entity build: block {block_ms:.3f} ms, unblock {unblock_ms:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+FailurePredictor benchmarks.
+
+Pattern analysis: the cost of analyze_failure_patterns over a day of
+history when the whole list is passed in every call, against streaming
+the same failures through record_failure and querying the bucketed
+counters.
+
+Model training: trains the logistic regression failure model on synthetic cpu / memory /
+errors observations labelled by a known logistic model, reporting
+training time, epochs and held-out accuracy and log loss:
+
+- NumPy batch gradient descent up to 1M rows (when NumPy is installed)
+- The pure-Python fallback on smaller sets
+- The fixed weights train_prediction_model used before, for comparison
+
+Usage:
+    python benchmarks/bench_failure_predictor.py
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.failure_model import NUMPY_AVAILABLE, LogisticRegressionModel, TrainingConfig  # noqa: E402
+from runtime.failure_predictor import FailurePredictor  # noqa: E402
+
+FEATURES = ["cpu", "errors", "memory"]
+HOLDOUT = 20000
+FAILURE_TYPES = [f"failure_{i}" for i in range(20)]
+DAY_START = 1_800_000_000.0
+
+
+def failure_history(count: int) -> list:
+    """count failures of 20 types spread over one day"""
+    rng = random.Random(count)
+    return [
+        {"type": rng.choice(FAILURE_TYPES), "timestamp": DAY_START + rng.uniform(0, 86400)}
+        for _ in range(count)
+    ]
+
+
+def bench_patterns(count: int) -> tuple:
+    """(batch ms per analysis, stream ingest us per failure, stream ms per analysis)"""
+    history = failure_history(count)
+    predictor = FailurePredictor("bench-org", clock=lambda: DAY_START + 86400)
+
+    start = time.perf_counter()
+    predictor.analyze_failure_patterns(history, time_window_hours=24)
+    batch_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    for failure in history:
+        predictor.record_failure(failure)
+    ingest_us = (time.perf_counter() - start) / count * 1e6
+
+    queries = 20
+    start = time.perf_counter()
+    for _ in range(queries):
+        predictor.analyze_failure_patterns(time_window_hours=24)
+    stream_ms = (time.perf_counter() - start) / queries * 1000
+    return batch_ms, ingest_us, stream_ms
+
+
+def synthetic(count: int, seed: int) -> tuple:
+    """(matrix, labels) from a known model over standardized features"""
+    rng = random.Random(seed)
+    matrix, labels = [], []
+    for _ in range(count):
+        cpu, errors, memory = rng.gauss(0, 1), rng.gauss(0, 1), rng.gauss(0, 1)
+        score = -0.5 + 2.0 * cpu + 1.5 * errors + 0.2 * memory
+        matrix.append([0.6 + 0.1 * cpu, 0.05 + 0.02 * errors, 0.5 + 0.1 * memory])
+        labels.append(rng.random() < 1 / (1 + math.exp(-score)))
+    return matrix, labels
+
+
+def fixed_weights(row: list) -> float:
+    """Probability from the hard-coded importances used before"""
+    cpu, errors, memory = row
+    return max(0.0, min(1.0, cpu * 0.35 + memory * 0.30 + errors * 0.35 * 5))
+
+
+def evaluate(probabilities: list, labels: list) -> tuple:
+    """(accuracy, log loss)"""
+    correct = sum((p >= 0.5) == label for p, label in zip(probabilities, labels))
+    loss = -sum(
+        math.log(min(max(p if label else 1 - p, 1e-15), 1.0)) for p, label in zip(probabilities, labels)
+    )
+    return correct / len(labels), loss / len(labels)
+
+
+def bench(rows: int, vectorized: bool, holdout: tuple) -> tuple:
+    """(seconds, epochs, accuracy, log loss) for one training run"""
+    matrix, labels = synthetic(rows, seed=rows)
+    if vectorized:
+        import numpy as np
+        matrix, labels = np.asarray(matrix), np.asarray(labels)
+    start = time.perf_counter()
+    model = LogisticRegressionModel.train(matrix, labels, FEATURES, TrainingConfig(vectorized=vectorized))
+    elapsed = time.perf_counter() - start
+    accuracy, loss = evaluate(model.predict_proba_matrix(holdout[0]), holdout[1])
+    return elapsed, model.metrics["epochs"], accuracy, loss
+
+
+def main() -> None:
+    print(f"{'failures':>9} {'batch ms':>9} {'ingest us':>10} {'stream ms':>10}")
+    for count in (1000, 10000, 100000):
+        batch_ms, ingest_us, stream_ms = bench_patterns(count)
+        print(f"{count:>9} {batch_ms:>9.2f} {ingest_us:>10.2f} {stream_ms:>10.2f}")
+
+    print()
+    holdout = synthetic(HOLDOUT, seed=0)
+    accuracy, loss = evaluate([fixed_weights(row) for row in holdout[0]], holdout[1])
+
+    print(f"{'rows':>9} {'backend':>8} {'train s':>9} {'epochs':>7} {'accuracy':>9} {'log loss':>9}")
+    print(f"{'-':>9} {'fixed':>8} {'-':>9} {'-':>7} {accuracy:>9.3f} {loss:>9.3f}")
+    for rows in (1000, 10000, 50000):
+        elapsed, epochs, accuracy, loss = bench(rows, False, holdout)
+        print(f"{rows:>9} {'python':>8} {elapsed:>9.3f} {epochs:>7} {accuracy:>9.3f} {loss:>9.3f}")
+    if NUMPY_AVAILABLE:
+        for rows in (10000, 100000, 1000000):
+            elapsed, epochs, accuracy, loss = bench(rows, True, holdout)
+            print(f"{rows:>9} {'numpy':>8} {elapsed:>9.3f} {epochs:>7} {accuracy:>9.3f} {loss:>9.3f}")
+    else:
+        print("NumPy not installed; skipping vectorized runs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+ResilienceManager bulkhead benchmarks.
+
+Bursts of callers hit a bulkhead of 4 slots, each call holding its slot
+for 2 ms. Compares the old fail-fast acquire (max_wait_ms=0) with
+callers queueing up to max_wait_duration_ms, reporting completed and
+rejected calls, throughput and wait times.
+
+Usage:
+    python benchmarks/bench_resilience_manager.py
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.resilience_manager import BulkheadFullError, ResilienceManager  # noqa: E402
+
+SLOTS = 4
+HOLD_SECONDS = 0.002
+
+
+def bench_burst(callers: int, calls_per_caller: int, max_wait_ms: int) -> dict:
+    """Run a burst of callers against one bulkhead"""
+    manager = ResilienceManager("bench-org")
+    bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=SLOTS, max_wait_duration_ms=1000)
+    rejected = [0]
+    lock = threading.Lock()
+    barrier = threading.Barrier(callers)
+
+    def caller() -> None:
+        barrier.wait()
+        for _ in range(calls_per_caller):
+            try:
+                with manager.bulkhead(bulkhead_id, max_wait_ms=max_wait_ms):
+                    time.sleep(HOLD_SECONDS)
+            except BulkheadFullError:
+                with lock:
+                    rejected[0] += 1
+
+    workers = [threading.Thread(target=caller) for _ in range(callers)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+
+    metrics = manager.get_bulkhead_metrics(bulkhead_id)
+    completed = metrics["acquired"]
+    return {
+        "completed": completed,
+        "rejected": rejected[0],
+        "calls_per_s": completed / elapsed,
+        "avg_wait_ms": metrics["avg_wait_ms"],
+        "max_wait_ms": metrics["max_wait_ms"],
+        "peak_queue": metrics["peak_queue_depth"],
+    }
+
+
+def main() -> None:
+    print(f"{'callers':>8} {'mode':>10} {'done':>6} {'rejected':>9} {'calls/s':>9} "
+          f"{'avg wait':>9} {'max wait':>9} {'queue':>6}")
+    for callers in (8, 32, 64):
+        for mode, max_wait_ms in (("fail-fast", 0), ("queued", 1000)):
+            result = bench_burst(callers, 10, max_wait_ms)
+            print(f"{callers:>8} {mode:>10} {result['completed']:>6} {result['rejected']:>9} "
+                  f"{result['calls_per_s']:>9.0f} {result['avg_wait_ms']:>9.1f} "
+                  f"{result['max_wait_ms']:>9.1f} {result['peak_queue']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+ServiceCommunicator transport benchmarks.
+
+Runs against the in-process StubServiceServer, so no network access is
+needed. Compares request latency and throughput with keep-alive pooling
+against opening a fresh connection per request, and checks that history
+memory and get_response cost stay flat as request volume grows,
+measures tail latency with and without request hedging, times a
+fan-out to 50 services sequentially versus with gather_requests, and
+compares wire size and codec cost of the payload encodings.
+
+Usage:
+    python benchmarks/bench_service_communicator.py
+"""
+
+import asyncio
+import json
+import os
+import random
+import sys
+import threading
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.integration.http_transport import HttpTransport, TransportConfig  # noqa: E402
+from runtime.integration.payload_codec import (  # noqa: E402
+    DEFLATE,
+    XZ,
+    CodecConfig,
+    PayloadCodec,
+    PeerCapabilities,
+    derive_sealing_key,
+)
+from runtime.integration.service_communicator import (  # noqa: E402
+    HedgingPolicy,
+    RequestSpec,
+    ServiceCommunicator,
+)
+from runtime.integration.stub_server import StubServiceServer  # noqa: E402
+
+ORG_ID = "bench-org"
+REQUESTS = 2000
+
+
+def make_communicator(server: StubServiceServer, pooled: bool, threads: int) -> ServiceCommunicator:
+    """Communicator targeting the stub, with or without idle connection reuse"""
+    config = TransportConfig(
+        max_connections_per_host=threads,
+        max_idle_per_host=threads if pooled else 0
+    )
+    communicator = ServiceCommunicator(transport=HttpTransport(config))
+    communicator.register_service(ORG_ID, "stub", "Stub", server.host, server.port)
+    return communicator
+
+
+def bench_requests(server: StubServiceServer, pooled: bool, threads: int) -> float:
+    """Return requests per second split across threads"""
+    communicator = make_communicator(server, pooled, threads)
+    per_thread = REQUESTS // threads
+
+    def run() -> None:
+        for i in range(per_thread):
+            communicator.send_request(ORG_ID, "bench", "stub", "POST", "/api/data", {"i": i})
+
+    workers = [threading.Thread(target=run) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    elapsed = time.perf_counter() - start
+    communicator.close()
+
+    return per_thread * threads / elapsed
+
+
+def bench_history(total: int) -> tuple:
+    """Return (retained KiB, get_response microseconds) after total requests"""
+    communicator = ServiceCommunicator(history_size=1000)
+    communicator.register_service(ORG_ID, "svc", "Service", "localhost", 8080)
+
+    tracemalloc.start()
+    for i in range(total):
+        last = communicator.send_request(ORG_ID, "bench", "svc", "GET", "/x", {})
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(10000):
+        communicator.get_response(ORG_ID, last.request_id)
+    lookup_us = (time.perf_counter() - start) / 10000 * 1e6
+
+    return retained / 1024, lookup_us
+
+
+def bench_hedging(server: StubServiceServer, hedged: bool, requests: int = 400) -> tuple:
+    """Return (p50 ms, p99 ms) client latency when 5% of responses take 200ms"""
+    rng = random.Random(7)
+    lock = threading.Lock()
+
+    def sometimes_slow(method, path, headers, body):
+        with lock:
+            slow = rng.random() < 0.05
+        if slow:
+            time.sleep(0.2)
+        return 200, {"ok": True}
+
+    server.add_route("GET", "/report", sometimes_slow)
+    communicator = make_communicator(server, pooled=True, threads=4)
+    policy = HedgingPolicy(min_samples=20) if hedged else None
+
+    latencies = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        communicator.send_idempotent_request(
+            ORG_ID, "bench", "stub", "GET", "/report", {}, hedging_policy=policy, coalesce=False
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    communicator.close()
+
+    latencies.sort()
+    return latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def bench_fan_out(servers: list, max_concurrency: int = 0) -> float:
+    """Return wall-clock ms to call every server once (0 = sequential blocking sends)"""
+    communicator = ServiceCommunicator(transport=HttpTransport())
+    for i, server in enumerate(servers):
+        communicator.register_service(ORG_ID, f"svc-{i}", f"Service {i}", server.host, server.port)
+    specs = [RequestSpec(f"svc-{i}", "POST", "/api/data", {"i": i}) for i in range(len(servers))]
+
+    async def gather() -> None:
+        await communicator.gather_requests(ORG_ID, "bench", specs, max_concurrency=max_concurrency)
+        await communicator.aclose()
+
+    start = time.perf_counter()
+    if max_concurrency:
+        asyncio.run(gather())
+    else:
+        for spec in specs:
+            communicator.send_request(
+                ORG_ID, "bench", spec.target_service, spec.method, spec.endpoint, spec.payload
+            )
+    elapsed = time.perf_counter() - start
+    communicator.close()
+    return elapsed * 1000
+
+
+def build_snapshot(records: int) -> dict:
+    """Build-state snapshot shaped payload"""
+    return {
+        "snapshot_id": "snap-1",
+        "tasks": [
+            {
+                "task_id": f"task-{i}",
+                "state": ("pending", "running", "passed", "failed")[i % 4],
+                "attempt": i % 3,
+                "duration_ms": i * 7 % 1000,
+                "builder": f"builder-{i % 12}",
+                "artifacts": [f"artifact/{i}/{j}.json" for j in range(3)],
+            }
+            for i in range(records)
+        ],
+    }
+
+
+def bench_codec(payload: dict, mode: str) -> tuple:
+    """Return (wire bytes, encode ms, decode ms) for one encoding mode"""
+    codec = PayloadCodec(CodecConfig(binary_threshold_bytes=0))
+    peers = {
+        "json": PeerCapabilities(),
+        "deflate": PeerCapabilities(content_codings=frozenset({DEFLATE})),
+        "xz": PeerCapabilities(content_codings=frozenset({XZ})),
+        "binary": PeerCapabilities(binary=True),
+        "binary+deflate": PeerCapabilities(content_codings=frozenset({DEFLATE}), binary=True),
+        "sealed deflate": PeerCapabilities(content_codings=frozenset({DEFLATE})),
+    }
+    key = derive_sealing_key("secret", ORG_ID) if mode.startswith("sealed") else None
+    if mode == "xz":
+        codec.config.lzma_threshold_bytes = 0
+
+    start = time.perf_counter()
+    encoded = codec.encode(payload, peers[mode], key)
+    encode_ms = (time.perf_counter() - start) * 1000
+    start = time.perf_counter()
+    codec.decode(encoded.body, encoded.content_type, encoded.content_encoding, key)
+    decode_ms = (time.perf_counter() - start) * 1000
+    return len(encoded.body), encode_ms, decode_ms
+
+
+def main() -> None:
+    with StubServiceServer() as server:
+        print(f"{'threads':>8} {'fresh req/s':>12} {'pooled req/s':>13} {'speedup':>8}")
+        for threads in (1, 4, 8):
+            fresh = bench_requests(server, pooled=False, threads=threads)
+            pooled = bench_requests(server, pooled=True, threads=threads)
+            print(f"{threads:>8} {fresh:>12.0f} {pooled:>13.0f} {pooled / fresh:>7.2f}x")
+
+    print()
+    print(f"{'requests':>10} {'retained KiB':>13} {'get_response us':>16}")
+    for total in (10_000, 100_000, 500_000):
+        retained, lookup_us = bench_history(total)
+        print(f"{total:>10} {retained:>13.0f} {lookup_us:>16.2f}")
+
+    with StubServiceServer() as server:
+        print()
+        print(f"{'mode':>10} {'p50 ms':>8} {'p99 ms':>8}")
+        for hedged in (False, True):
+            p50, p99 = bench_hedging(server, hedged)
+            print(f"{'hedged' if hedged else 'single':>10} {p50:>8.2f} {p99:>8.2f}")
+
+    print()
+    print(f"{'records':>8} {'mode':>15} {'wire KiB':>9} {'ratio':>6} {'encode ms':>10} {'decode ms':>10}")
+    for records in (100, 10_000):
+        payload = build_snapshot(records)
+        plain = len(json.dumps(payload))
+        for mode in ("json", "deflate", "xz", "binary", "binary+deflate", "sealed deflate"):
+            wire, encode_ms, decode_ms = bench_codec(payload, mode)
+            print(f"{records:>8} {mode:>15} {wire / 1024:>9.1f} {wire / plain:>6.2f} {encode_ms:>10.2f} {decode_ms:>10.2f}")
+
+    # 50 services, each taking 20ms to answer
+    servers = [StubServiceServer(delay_seconds=0.02).start() for _ in range(50)]
+    try:
+        print()
+        print(f"{'fan-out (50 services)':>22} {'wall ms':>8}")
+        print(f"{'sequential':>22} {bench_fan_out(servers):>8.1f}")
+        for concurrency in (5, 10, 50):
+            label = f"gather, cap {concurrency}"
+            print(f"{label:>22} {bench_fan_out(servers, concurrency):>8.1f}")
+    finally:
+        for server in servers:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
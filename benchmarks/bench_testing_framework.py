@@ -0,0 +1,110 @@
+"""
+IntegrationTestingFramework scheduling benchmarks.
+
+Runs 8 fixtures x 10 tests. Each fixture takes 50 ms to set up. Each test
+waits 10 ms on I/O (an I/O-bound test against a subsystem) or does 10 ms
+of CPU work. Compares:
+
+- execute_test per test, which sets the fixture up and tears it down every time
+- run_tests with one worker (fixtures shared, serial)
+- run_tests on process pools of increasing size
+
+CPU-bound speedup is capped by the host's core count.
+
+Usage:
+    python benchmarks/bench_testing_framework.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.integration.testing_framework import (  # noqa: E402
+    IntegrationTestingFramework,
+    IntegrationTestSpec,
+)
+
+ORG_ID = "bench-org"
+FIXTURES = 8
+TESTS_PER_FIXTURE = 10
+SETUP_SECONDS = 0.05
+TEST_SECONDS = 0.01
+
+
+def provide(resources):
+    time.sleep(SETUP_SECONDS)
+    return resources
+
+
+def io_test(fixture):
+    time.sleep(TEST_SECONDS)
+
+
+def spin(iterations: int) -> int:
+    total = 0
+    for i in range(iterations):
+        total += i * i
+    return total
+
+
+def calibrate() -> int:
+    """Iterations of spin that take TEST_SECONDS on one core"""
+    start = time.perf_counter()
+    spin(100_000)
+    return int(100_000 * TEST_SECONDS / (time.perf_counter() - start))
+
+
+CPU_ITERATIONS = calibrate()
+
+
+def cpu_test(fixture):
+    spin(CPU_ITERATIONS)
+
+
+def build(test_func):
+    """Return (framework, test specs)"""
+    framework = IntegrationTestingFramework()
+    tests = []
+    for f in range(FIXTURES):
+        fixture = framework.setup_fixture(ORG_ID, f"fixture_{f}", [], [], {"index": f}, provide)
+        tests.extend(
+            IntegrationTestSpec(f"test_{f}_{t}", fixture.fixture_id, test_func)
+            for t in range(TESTS_PER_FIXTURE)
+        )
+    return framework, tests
+
+
+def bench_per_test(test_func) -> float:
+    """Return wall-clock ms for execute_test one at a time"""
+    framework, tests = build(test_func)
+    start = time.perf_counter()
+    for spec in tests:
+        framework.execute_test(ORG_ID, spec.fixture_id, spec.test_name, spec.test_func)
+    return (time.perf_counter() - start) * 1000
+
+
+def bench_run(test_func, workers: int) -> tuple:
+    """Return (wall-clock ms, fixture setups)"""
+    framework, tests = build(test_func)
+    start = time.perf_counter()
+    run = framework.run_tests(ORG_ID, tests, max_workers=workers)
+    return (time.perf_counter() - start) * 1000, run.fixture_setups
+
+
+def main() -> None:
+    print(f"{FIXTURES} fixtures x {TESTS_PER_FIXTURE} tests, cpu count {os.cpu_count()}")
+    for label, test_func in (("I/O-bound", io_test), ("CPU-bound", cpu_test)):
+        print()
+        print(f"{'scheduler':>22} {'ms':>8} {'setups':>7} {'speedup':>8}  ({label})")
+        baseline = bench_per_test(test_func)
+        print(f"{'execute_test per test':>22} {baseline:>8.0f} {FIXTURES * TESTS_PER_FIXTURE:>7} {1.0:>7.2f}x")
+        for workers in (1, 4, 8):
+            elapsed, setups = bench_run(test_func, workers)
+            name = "run_tests, serial" if workers == 1 else f"run_tests, {workers} procs"
+            print(f"{name:>22} {elapsed:>8.0f} {setups:>7} {baseline / elapsed:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
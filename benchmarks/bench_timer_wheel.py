@@ -0,0 +1,135 @@
+"""
+TimerWheel benchmarks.
+
+Schedules 100k pending timeouts on one wheel and reports the cost of
+schedule, cancel and expiry, then compares starting timeouts the old way
+(one sleeping thread per timeout, as TimeoutHandler and ResilienceManager
+used to) with scheduling them on the wheel. Finally measures how late the
+scheduler thread fires sub-second timeouts.
+
+Usage:
+    python benchmarks/bench_timer_wheel.py
+"""
+
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from runtime.timer_wheel import TimerWheel  # noqa: E402
+
+PENDING = 100_000
+
+
+class ManualClock:
+    """Clock advanced by the benchmark"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def noop() -> None:
+    pass
+
+
+def bench_pending() -> None:
+    """Schedule, cancel and expire PENDING timeouts on a manually driven wheel"""
+    clock = ManualClock()
+    wheel = TimerWheel(clock=clock, background=False)
+    rng = random.Random(7)
+    delays = [rng.uniform(0.01, 600) for _ in range(PENDING)]
+
+    start = time.perf_counter()
+    handles = [wheel.schedule(delay, noop) for delay in delays]
+    schedule_us = (time.perf_counter() - start) / PENDING * 1e6
+
+    start = time.perf_counter()
+    for handle in handles[::2]:
+        handle.cancel()
+    cancel_us = (time.perf_counter() - start) / (PENDING // 2) * 1e6
+
+    # Advance in 100 ms steps, as the scheduler would when busy
+    start = time.perf_counter()
+    fired = 0
+    while clock.now < 601:
+        clock.now += 0.1
+        fired += wheel.advance()
+    expire_s = time.perf_counter() - start
+
+    print(f"{'pending':>8} {'schedule us/op':>15} {'cancel us/op':>13} {'expired':>8} {'expire s':>9}")
+    print(f"{PENDING:>8} {schedule_us:>15.2f} {cancel_us:>13.2f} {fired:>8} {expire_s:>9.2f}")
+
+
+def bench_start(count: int) -> None:
+    """Compare starting count timeouts with a thread each and on the wheel"""
+    release = threading.Event()
+    before = threading.active_count()
+    start = time.perf_counter()
+    threads = [threading.Thread(target=release.wait, args=(60,), daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    thread_ms = (time.perf_counter() - start) * 1000
+    thread_count = threading.active_count() - before
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    wheel = TimerWheel()
+    before = threading.active_count()
+    start = time.perf_counter()
+    handles = [wheel.schedule(60, noop) for _ in range(count)]
+    wheel_ms = (time.perf_counter() - start) * 1000
+    wheel_count = threading.active_count() - before
+    for handle in handles:
+        handle.cancel()
+    wheel.shutdown()
+
+    print(f"{count:>8} {'thread per timeout':>20} {thread_ms:>10.1f} {thread_count:>8}")
+    print(f"{count:>8} {'timer wheel':>20} {wheel_ms:>10.1f} {wheel_count:>8}")
+
+
+def bench_precision(count: int = 2000) -> None:
+    """Lateness of sub-second timeouts fired by the scheduler thread"""
+    wheel = TimerWheel()
+    lateness = []
+    done = threading.Event()
+
+    def expire(deadline: float) -> None:
+        lateness.append((time.monotonic() - deadline) * 1000)
+        if len(lateness) == count:
+            done.set()
+
+    rng = random.Random(11)
+    for _ in range(count):
+        delay = rng.uniform(0.05, 0.95)
+        wheel.schedule(delay, expire, time.monotonic() + delay)
+    done.wait(timeout=10)
+    wheel.shutdown()
+
+    lateness.sort()
+    p99 = lateness[int(len(lateness) * 0.99) - 1]
+    print(f"{count:>8} {min(lateness):>10.2f} {statistics.median(lateness):>10.2f} {p99:>10.2f} {max(lateness):>10.2f}")
+
+
+def main() -> None:
+    bench_pending()
+
+    print()
+    print(f"{'timeouts':>8} {'approach':>20} {'start ms':>10} {'threads':>8}")
+    for count in (100, 1000):
+        bench_start(count)
+
+    print()
+    print(f"{'timers':>8} {'min ms':>10} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10}  (lateness, 10 ms tick)")
+    bench_precision()
+
+
+if __name__ == "__main__":
+    main()
@@ -12,16 +12,30 @@ Advanced Recovery Patterns:
 - QA-258: Contextual recovery strategy (system-state aware)
 - QA-259: Recovery rollback on failure (safe state restoration)
 - QA-260: Parallel recovery coordination (concurrent execution)
+
+Recoveries run on a bounded thread pool. Recoveries that name the same
+resource never overlap: within one call they run in submission order,
+and across calls they take a per-resource lock. Every recovery has a
+deadline from dispatch. One still waiting for a pool thread when it
+expires is cancelled and never runs; one already running is reported as
+failed and its resource stays held until its action returns.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 import threading
+import time
 import uuid
 
 
+# Runs the recovery for one failure record; raising or returning False marks it failed
+RecoveryAction = Callable[[Dict[str, Any]], Any]
+
+
 class RecoveryPattern(Enum):
     """Advanced recovery pattern types"""
     RETRY = "retry"
@@ -64,6 +78,20 @@ class FailureRecord:
     context: Dict[str, Any] = field(default_factory=dict)
 
 
+class _RecoveryRun:
+    """One recovery dispatched to the pool"""
+    
+    __slots__ = ("position", "failure", "resource", "deadline_at", "queued_behind")
+    
+    def __init__(self, position: int, failure: Dict[str, Any], resource: Optional[str], deadline_at: float,
+                 queued_behind: bool):
+        self.position = position  # Index in the caller's failure list
+        self.failure = failure
+        self.resource = resource
+        self.deadline_at = deadline_at  # time.monotonic() deadline
+        self.queued_behind = queued_behind  # Waited for an earlier recovery on the same resource
+
+
 @dataclass
 class CascadingFailure:
     """Failure with dependencies"""
@@ -87,18 +115,45 @@ class AdvancedRecoveryHandler:
     - Parallel recovery coordination for independent failures
     """
     
-    def __init__(self, organisation_id: str):
+    def __init__(self, organisation_id: str, recovery_workers: int = 8):
         """
         Initialize advanced recovery handler
         
         Args:
             organisation_id: Organisation ID for tenant isolation
+            recovery_workers: Threads in the recovery pool shared by all calls
         """
+        if recovery_workers < 1:
+            raise ValueError("recovery_workers must be at least 1")
         self.organisation_id = organisation_id
+        self.recovery_workers = recovery_workers
         self._failure_history: Dict[str, List[FailureRecord]] = {}
         self._active_recoveries: Dict[str, Dict[str, Any]] = {}
+        self._recovery_actions: Dict[str, RecoveryAction] = {}
+        self._resource_locks: Dict[str, threading.Lock] = {}
+        self._recovery_executor: Optional[ThreadPoolExecutor] = None
         self._recovery_lock = threading.Lock()
         
+    def register_recovery_action(self, failure_type: str, action: RecoveryAction) -> None:
+        """
+        Register the action that recovers a failure type
+        
+        Failure types without an action recover immediately.
+        
+        Args:
+            failure_type: Failure type the action handles
+            action: Called with the failure record
+        """
+        with self._recovery_lock:
+            self._recovery_actions[failure_type] = action
+    
+    def shutdown(self) -> None:
+        """Stop the recovery thread pool"""
+        with self._recovery_lock:
+            executor, self._recovery_executor = self._recovery_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+    
     def select_adaptive_pattern(
         self,
         failure_type: str,
@@ -179,31 +234,41 @@ class AdvancedRecoveryHandler:
     def orchestrate_cascading_recovery(
         self,
         failures: List[Dict[str, Any]],
-        execution_mode: str = "sequential"
+        execution_mode: str = "sequential",
+        max_parallelism: int = 5,
+        deadline_ms: float = 30000.0
     ) -> Dict[str, Any]:
         """
         QA-257: Orchestrate cascading recovery with dependency management
         
-        Coordinates multiple dependent recoveries ensuring dependencies
-        are resolved in correct order.
+        Groups the failures into waves by dependency level and recovers
+        them wave by wave: a failure is only recovered once everything it
+        depends on has been, and is skipped if a dependency failed. In
+        "optimal" mode each wave runs in parallel; in "sequential" mode
+        one recovery runs at a time.
         
         Args:
             failures: List of failures with dependencies
             execution_mode: "sequential" or "optimal"
+            max_parallelism: Maximum concurrent recoveries per wave
+            deadline_ms: Per-recovery deadline
             
         Returns:
             Dict with:
                 - total_recoveries: Total number of recoveries
                 - execution_order: Ordered list of failure IDs
+                - execution_waves: Failure IDs per dependency level
+                - recovered / failed: Failure IDs by outcome
                 - orchestration_id: Unique orchestration identifier
         """
         orchestration_id = str(uuid.uuid4())
         
         # Build dependency graph
         failure_map = {f["id"]: CascadingFailure(**f) for f in failures}
+        records = {f["id"]: f for f in failures}
         
-        # Topological sort to determine execution order
-        execution_order: List[str] = []
+        # Topological levels: each wave depends only on earlier waves
+        execution_waves: List[List[str]] = []
         resolved: set = set()
         
         def can_execute(failure_id: str) -> bool:
@@ -211,9 +276,7 @@ class AdvancedRecoveryHandler:
             failure = failure_map[failure_id]
             return all(dep in resolved for dep in failure.depends_on)
         
-        # Build execution order
-        while len(execution_order) < len(failures):
-            # Find failures that can be executed now
+        while len(resolved) < len(failure_map):
             ready = [
                 fid for fid in failure_map.keys()
                 if fid not in resolved and can_execute(fid)
@@ -225,23 +288,77 @@ class AdvancedRecoveryHandler:
                 # Force execute to break cycle
                 ready = remaining[:1]
             
-            for fid in ready:
-                execution_order.append(fid)
-                resolved.add(fid)
+            execution_waves.append(ready)
+            resolved.update(ready)
+        
+        execution_order = [fid for wave in execution_waves for fid in wave]
         
-        # Store orchestration
         with self._recovery_lock:
             self._active_recoveries[orchestration_id] = {
                 "failures": failure_map,
                 "execution_order": execution_order,
+                "execution_waves": execution_waves,
                 "started_at": datetime.now(timezone.utc),
                 "execution_mode": execution_mode,
-                "state": "planned"
+                "state": "in_progress"
             }
         
+        # Recover wave by wave
+        parallelism = max_parallelism if execution_mode == "optimal" else 1
+        recovery_results: List[Dict[str, Any]] = []
+        started = time.perf_counter()
+        for wave in execution_waves:
+            runnable: List[str] = []
+            for fid in wave:
+                failed_dependencies = [
+                    dep for dep in failure_map[fid].depends_on
+                    if dep in failure_map and failure_map[dep].recovery_attempted and not failure_map[dep].recovered
+                ]
+                if failed_dependencies:
+                    # Skipped counts as a failed attempt so its own dependents are skipped too
+                    failure_map[fid].recovery_attempted = True
+                    failure_map[fid].recovered = False
+                    failure_map[fid].error = f"dependency_failed: {', '.join(failed_dependencies)}"
+                    recovery_results.append({
+                        "failure_id": fid,
+                        "success": False,
+                        "recovery_type": failure_map[fid].type,
+                        "error": failure_map[fid].error
+                    })
+                else:
+                    runnable.append(fid)
+            
+            results, _ = self._run_recoveries([records[fid] for fid in runnable], parallelism, deadline_ms)
+            for result in results:
+                failure = failure_map[result["failure_id"]]
+                failure.recovery_attempted = True
+                failure.recovered = result["success"]
+                failure.error = result.get("error")
+            recovery_results.extend(results)
+        
+        recovered = [fid for fid in execution_order if failure_map[fid].recovered]
+        failed = [fid for fid in execution_order if not failure_map[fid].recovered]
+        if not failed:
+            state = RecoveryOutcome.SUCCESS.value
+        elif recovered:
+            state = RecoveryOutcome.PARTIALLY_RECOVERED.value
+        else:
+            state = RecoveryOutcome.FAILED.value
+        
+        with self._recovery_lock:
+            orchestration = self._active_recoveries[orchestration_id]
+            orchestration["state"] = state
+            orchestration["completed_at"] = datetime.now(timezone.utc)
+        
         return {
             "total_recoveries": len(failures),
             "execution_order": execution_order,
+            "execution_waves": execution_waves,
+            "recovered": recovered,
+            "failed": failed,
+            "recovery_results": recovery_results,
+            "state": state,
+            "total_duration_ms": (time.perf_counter() - started) * 1000,
             "orchestration_id": orchestration_id,
             "organisation_id": self.organisation_id,
             "execution_mode": execution_mode
@@ -425,67 +542,193 @@ class AdvancedRecoveryHandler:
     def execute_parallel_recovery(
         self,
         failures: List[Dict[str, Any]],
-        max_parallelism: int = 5
+        max_parallelism: int = 5,
+        deadline_ms: float = 30000.0
     ) -> Dict[str, Any]:
         """
         QA-260: Execute parallel recovery for independent failures
         
-        Coordinates multiple independent recoveries executing in parallel
-        without resource contention.
+        Runs up to max_parallelism recoveries at once on the recovery
+        pool. Failures naming the same "resource" are recovered one after
+        another in list order; failures without one never wait.
         
         Args:
             failures: List of independent failures
             max_parallelism: Maximum concurrent recoveries
+            deadline_ms: Per-recovery deadline from dispatch, covering
+                any wait for its resource or a pool thread; recoveries that
+                have not started by then are cancelled
             
         Returns:
             Dict with:
                 - total_recoveries: Total recoveries
                 - parallel_execution: Whether executed in parallel
-                - completion_times: List of completion times
-                - resource_conflicts: Number of conflicts
+                - completion_times: Duration of each recovery in ms
+                - resource_conflicts: Recoveries that waited for their resource
                 - recovery_results: Results for each recovery
         """
-        recovery_results: List[Dict[str, Any]] = []
-        completion_times: List[float] = []
-        resource_conflicts = 0
+        if max_parallelism < 1:
+            raise ValueError("max_parallelism must be at least 1")
         
-        # Track resources in use
-        resources_in_use: set = set()
-        
-        # Execute recoveries
-        for failure in failures:
-            failure_id = failure["id"]
-            failure_resource = failure.get("resource", "default")
-            
-            # Check for resource conflict
-            if failure_resource in resources_in_use:
-                resource_conflicts += 1
-            else:
-                resources_in_use.add(failure_resource)
-            
-            # Simulate recovery execution
-            start_time = datetime.now(timezone.utc)
-            
-            # Execute recovery
-            recovery_result = {
-                "failure_id": failure_id,
-                "success": True,
-                "recovery_type": failure["type"],
-                "resource": failure_resource
-            }
-            recovery_results.append(recovery_result)
-            
-            # Track completion time
-            end_time = datetime.now(timezone.utc)
-            duration_ms = (end_time - start_time).total_seconds() * 1000
-            completion_times.append(duration_ms)
+        started = time.perf_counter()
+        recovery_results, resource_conflicts = self._run_recoveries(failures, max_parallelism, deadline_ms)
         
         return {
             "total_recoveries": len(failures),
-            "parallel_execution": True,
-            "completion_times": completion_times,
+            "parallel_execution": max_parallelism > 1 and len(failures) > 1,
+            "completion_times": [result["duration_ms"] for result in recovery_results],
             "resource_conflicts": resource_conflicts,
             "recovery_results": recovery_results,
+            "total_duration_ms": (time.perf_counter() - started) * 1000,
             "organisation_id": self.organisation_id,
             "max_parallelism": max_parallelism
         }
+    
+    # Private helper methods
+    
+    def _run_recoveries(
+        self,
+        failures: List[Dict[str, Any]],
+        max_parallelism: int,
+        deadline_ms: float
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Recover failures on the pool, one at a time per resource
+        
+        The calling thread dispatches the head of each resource's queue
+        while fewer than max_parallelism recoveries are in flight, and
+        gives up on a recovery once its deadline passes.
+        
+        Returns:
+            (result per failure in input order, recoveries that waited for their resource)
+        """
+        queues: Dict[Any, deque] = {}
+        for position, failure in enumerate(failures):
+            resource = failure.get("resource")
+            key = resource if resource is not None else ("unshared", position)
+            queues.setdefault(key, deque()).append((position, failure))
+        
+        ready = deque(queues)
+        results: List[Optional[Dict[str, Any]]] = [None] * len(failures)
+        in_flight: Dict[Any, _RecoveryRun] = {}
+        dispatched: set = set()
+        executor = self._get_recovery_executor()
+        resource_conflicts = 0
+        
+        while ready or in_flight:
+            while ready and len(in_flight) < max_parallelism:
+                key = ready.popleft()
+                queue = queues[key]
+                position, failure = queue.popleft()
+                run = _RecoveryRun(
+                    position,
+                    failure,
+                    failure.get("resource"),
+                    time.monotonic() + deadline_ms / 1000.0,
+                    queued_behind=key in dispatched
+                )
+                dispatched.add(key)
+                in_flight[executor.submit(self._execute_recovery, run)] = run
+            
+            timeout = max(0.0, min(run.deadline_at for run in in_flight.values()) - time.monotonic())
+            done, _ = wait(list(in_flight), timeout=timeout, return_when=FIRST_COMPLETED)
+            
+            now = time.monotonic()
+            for future in list(in_flight):
+                run = in_flight[future]
+                if future in done:
+                    results[run.position] = future.result()
+                elif now >= run.deadline_at:
+                    if future.cancel():
+                        # Still queued behind busy workers; it will never run
+                        error = "deadline_exceeded_before_start"
+                    elif future.done():
+                        results[run.position] = future.result()  # Finished just after the wait
+                        error = None
+                    else:
+                        # The action keeps running (and holding its resource) but is no longer waited for
+                        error = "deadline_exceeded"
+                    if error is not None:
+                        results[run.position] = self._recovery_result(run.failure, False, deadline_ms, 0.0, error)
+                else:
+                    continue
+                del in_flight[future]
+                if results[run.position].get("waited_for_resource") or run.queued_behind:
+                    results[run.position]["waited_for_resource"] = True
+                    resource_conflicts += 1
+                key = run.resource if run.resource is not None else ("unshared", run.position)
+                if queues[key]:
+                    ready.append(key)
+        
+        return results, resource_conflicts
+    
+    def _execute_recovery(self, run: _RecoveryRun) -> Dict[str, Any]:
+        """Run one recovery action under its resource lock (pool thread)"""
+        failure = run.failure
+        lock = self._get_resource_lock(run.resource) if run.resource is not None else None
+        dispatched = time.monotonic()
+        contended = False
+        if lock is not None and not lock.acquire(blocking=False):
+            contended = True
+            if not lock.acquire(timeout=max(0.0, run.deadline_at - dispatched)):
+                return self._recovery_result(failure, False, 0.0, (time.monotonic() - dispatched) * 1000,
+                                             "resource_busy", waited_for_resource=True)
+        
+        try:
+            waited_ms = (time.monotonic() - dispatched) * 1000
+            with self._recovery_lock:
+                action = self._recovery_actions.get(failure["type"])
+            start = time.perf_counter()
+            try:
+                success = action is None or action(failure) is not False
+                error = None if success else "recovery_action_failed"
+            except Exception as e:
+                success = False
+                error = str(e) or type(e).__name__
+            duration_ms = (time.perf_counter() - start) * 1000
+        finally:
+            if lock is not None:
+                lock.release()
+        
+        return self._recovery_result(failure, success, duration_ms, waited_ms, error, waited_for_resource=contended)
+    
+    def _recovery_result(
+        self,
+        failure: Dict[str, Any],
+        success: bool,
+        duration_ms: float,
+        waited_ms: float,
+        error: Optional[str],
+        waited_for_resource: bool = False
+    ) -> Dict[str, Any]:
+        """Result entry for one recovery"""
+        result = {
+            "failure_id": failure["id"],
+            "success": success,
+            "recovery_type": failure["type"],
+            "resource": failure.get("resource"),
+            "duration_ms": duration_ms,
+            "waited_ms": waited_ms,
+            "waited_for_resource": waited_for_resource
+        }
+        if error is not None:
+            result["error"] = error
+        return result
+    
+    def _get_resource_lock(self, resource: str) -> threading.Lock:
+        """Lock serializing recoveries of one resource across calls"""
+        with self._recovery_lock:
+            lock = self._resource_locks.get(resource)
+            if lock is None:
+                lock = self._resource_locks[resource] = threading.Lock()
+            return lock
+    
+    def _get_recovery_executor(self) -> ThreadPoolExecutor:
+        """Create the recovery thread pool on first use"""
+        with self._recovery_lock:
+            if self._recovery_executor is None:
+                self._recovery_executor = ThreadPoolExecutor(
+                    max_workers=self.recovery_workers,
+                    thread_name_prefix="advanced-recovery"
+                )
+            return self._recovery_executor
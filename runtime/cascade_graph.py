@@ -0,0 +1,346 @@
+"""
+Cascade Graph
+
+Purpose: Persistent requirement → build → task dependency graph with incremental blocking
+Authority: Wave 2.0 Subwave 2.11 - Complex Failure Modes Phase 1 (QA-252 to QA-254)
+Tenant Isolation: Graphs carry no tenant data; ErrorCascadeManager owns one per organisation_id
+
+Nodes keep forward (dependents) and reverse (prerequisites) edge indexes.
+The set of nodes reachable from a node is computed once and memoized;
+adding or removing an edge drops only the memoized sets of the edge's
+source and its ancestors, found through the reverse index.
+
+Blocking is counted rather than copied: every node holds the number of
+active blocked sources it is reachable from, itself included. Blocking or
+unblocking a source adjusts that counter for the source and its
+descendants in one pass and leaves every other node untouched. A node's
+own state is never overwritten, so unblocking restores it for free.
+"""
+
+from typing import Dict, List, Optional, Any, Set, FrozenSet, Iterable
+import itertools
+import threading
+
+
+BLOCKED = "BLOCKED"
+
+
+class _Node:
+    """One entity in the graph"""
+
+    __slots__ = ("kind", "state", "children", "parents")
+
+    def __init__(self, kind: str, state: str):
+        self.kind = kind
+        self.state = state  # Own state, reported whenever the node is not blocked
+        self.children: Set[str] = set()  # Dependents
+        self.parents: Set[str] = set()  # Prerequisites
+
+
+class CascadeGraph:
+    """
+    Dependency graph with memoized reachability and counted blocks
+
+    Edges point from a prerequisite to its dependent (requirement → build,
+    build → task, task → task). The graph is kept acyclic.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph"""
+        self._nodes: Dict[str, _Node] = {}
+        self._reachable: Dict[str, FrozenSet[str]] = {}  # node -> memoized descendants
+        self._blockers: Dict[str, Set[str]] = {}  # blocked source -> active blocker ids
+        self._block_counts: Dict[str, int] = {}  # node -> active blocked sources reaching it
+        self._edges = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
+        self._lock = threading.RLock()
+
+    def __contains__(self, node_id: str) -> bool:
+        return node_id in self._nodes
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def add_node(self, node_id: str, kind: str, state: str) -> None:
+        """
+        Add a node, or update the kind and own state of an existing one
+
+        Args:
+            node_id: Entity identifier
+            kind: Entity kind (requirement, build, task)
+            state: Own state of the entity
+        """
+        with self._lock:
+            node = self._nodes.get(node_id)
+            if node is None:
+                self._nodes[node_id] = _Node(kind, state)
+            else:
+                node.kind = kind
+                node.state = state
+
+    def set_state(self, node_id: str, state: str) -> None:
+        """
+        Set the own state of a node
+
+        Raises:
+            KeyError: If the node does not exist
+        """
+        with self._lock:
+            self._nodes[node_id].state = state
+
+    def add_dependency(self, parent_id: str, child_id: str) -> bool:
+        """
+        Add an edge making child_id depend on parent_id
+
+        Args:
+            parent_id: Prerequisite node
+            child_id: Dependent node
+
+        Returns:
+            False if the edge already existed
+
+        Raises:
+            KeyError: If either node does not exist
+            ValueError: If the edge would create a cycle
+        """
+        with self._lock:
+            parent, child = self._nodes[parent_id], self._nodes[child_id]
+            if child_id in parent.children:
+                return False
+            if parent_id == child_id or self._reaches(child_id, parent_id):
+                raise ValueError(f"Dependency {parent_id} -> {child_id} would create a cycle")
+
+            sources = self._blocked_sources_reaching(parent_id)
+            before = {source: self._descendants(source) for source in sources}
+            parent.children.add(child_id)
+            child.parents.add(parent_id)
+            self._edges += 1
+            self._invalidate(parent_id)
+            self._rebalance(before)
+            return True
+
+    def remove_dependency(self, parent_id: str, child_id: str) -> bool:
+        """
+        Remove the edge between parent_id and child_id
+
+        Returns:
+            False if there was no such edge
+        """
+        with self._lock:
+            parent = self._nodes.get(parent_id)
+            if parent is None or child_id not in parent.children:
+                return False
+
+            sources = self._blocked_sources_reaching(parent_id)
+            before = {source: self._descendants(source) for source in sources}
+            parent.children.discard(child_id)
+            self._nodes[child_id].parents.discard(parent_id)
+            self._edges -= 1
+            self._invalidate(parent_id)
+            self._rebalance(before)
+            return True
+
+    def descendants(self, node_id: str) -> FrozenSet[str]:
+        """
+        Every node reachable from node_id, memoized until an edge below it changes
+
+        Raises:
+            KeyError: If the node does not exist
+        """
+        with self._lock:
+            if node_id not in self._nodes:
+                raise KeyError(node_id)
+            return self._descendants(node_id)
+
+    def block(self, node_id: str, blocker_id: str) -> List[str]:
+        """
+        Block a node and everything that depends on it
+
+        Args:
+            node_id: Blocked node
+            blocker_id: Blocker identifier; a node stays blocked until all
+                of its blockers are removed
+
+        Returns:
+            Nodes that were not blocked before and are now
+
+        Raises:
+            KeyError: If the node does not exist
+        """
+        with self._lock:
+            if node_id not in self._nodes:
+                raise KeyError(node_id)
+            active = self._blockers.get(node_id)
+            if active is not None:
+                active.add(blocker_id)
+                return []
+            self._blockers[node_id] = {blocker_id}
+            return self._adjust(node_id, self._descendants(node_id), 1)
+
+    def unblock(self, node_id: str, blocker_id: Optional[str] = None) -> List[str]:
+        """
+        Remove a blocker from a node
+
+        Args:
+            node_id: Blocked node
+            blocker_id: Blocker to remove (None removes all of them)
+
+        Returns:
+            Nodes that were blocked before and no longer are
+        """
+        with self._lock:
+            active = self._blockers.get(node_id)
+            if active is None:
+                return []
+            if blocker_id is None:
+                active.clear()
+            else:
+                active.discard(blocker_id)
+            if active:
+                return []
+            del self._blockers[node_id]
+            return self._adjust(node_id, self._descendants(node_id), -1)
+
+    def state(self, node_id: str) -> str:
+        """
+        Effective state of a node: BLOCKED while any blocked source reaches it
+
+        Raises:
+            KeyError: If the node does not exist
+        """
+        with self._lock:
+            node = self._nodes[node_id]
+            return BLOCKED if node_id in self._block_counts else node.state
+
+    def node_info(self, node_id: str) -> Optional[Dict[str, Any]]:
+        """Kind, own state and blocking details of a node, or None if unknown"""
+        with self._lock:
+            node = self._nodes.get(node_id)
+            if node is None:
+                return None
+            return {
+                "kind": node.kind,
+                "state": BLOCKED if node_id in self._block_counts else node.state,
+                "own_state": node.state,
+                "blocked": node_id in self._block_counts,
+                "blockers": sorted(self._blockers.get(node_id, ())),
+                "prerequisites": sorted(node.parents),
+                "dependents": sorted(node.children)
+            }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get graph size, blocking and reachability cache counters"""
+        with self._lock:
+            return {
+                "nodes": len(self._nodes),
+                "edges": self._edges,
+                "blocked_sources": len(self._blockers),
+                "blocked_nodes": len(self._block_counts),
+                "memoized_nodes": len(self._reachable),
+                "cache_hits": self._cache_hits,
+                "cache_misses": self._cache_misses
+            }
+
+    # Private helper methods
+
+    def _descendants(self, node_id: str) -> FrozenSet[str]:
+        """Memoized reachable set; reuses the memoized sets of nodes below"""
+        cached = self._reachable.get(node_id)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached
+        self._cache_misses += 1
+
+        nodes, reachable = self._nodes, self._reachable
+        seen: Set[str] = set()
+        stack = list(nodes[node_id].children)
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            below = reachable.get(current)
+            if below is not None:
+                seen |= below
+            else:
+                stack.extend(nodes[current].children)
+
+        result = frozenset(seen)
+        reachable[node_id] = result
+        return result
+
+    def _reaches(self, start: str, target: str) -> bool:
+        """Whether target is reachable from start, without memoizing"""
+        nodes, reachable = self._nodes, self._reachable
+        seen: Set[str] = set()
+        stack = [start]
+        while stack:
+            current = stack.pop()
+            below = reachable.get(current)
+            if below is not None:
+                if target in below:
+                    return True
+                continue
+            for child in nodes[current].children:
+                if child == target:
+                    return True
+                if child not in seen:
+                    seen.add(child)
+                    stack.append(child)
+        return False
+
+    def _invalidate(self, node_id: str) -> None:
+        """Drop the memoized sets of node_id and every ancestor"""
+        if not self._reachable:
+            return
+        nodes, reachable = self._nodes, self._reachable
+        seen = {node_id}
+        stack = [node_id]
+        while stack:
+            current = stack.pop()
+            reachable.pop(current, None)
+            for parent in nodes[current].parents:
+                if parent not in seen:
+                    seen.add(parent)
+                    stack.append(parent)
+
+    def _blocked_sources_reaching(self, node_id: str) -> List[str]:
+        """Blocked sources that are node_id or reach it"""
+        if node_id not in self._block_counts:
+            return []
+        return [
+            source for source in self._blockers
+            if source == node_id or node_id in self._descendants(source)
+        ]
+
+    def _rebalance(self, before: Dict[str, FrozenSet[str]]) -> None:
+        """Move block counts after an edge change altered what blocked sources reach"""
+        for source, old in before.items():
+            new = self._descendants(source)
+            self._adjust(None, new - old, 1)
+            self._adjust(None, old - new, -1)
+
+    def _adjust(self, source: Optional[str], targets: Iterable[str], delta: int) -> List[str]:
+        """Apply delta to the block count of source and targets in one pass"""
+        counts = self._block_counts
+        changed: List[str] = []
+        if source is not None:
+            targets = itertools.chain((source,), targets)
+        if delta > 0:
+            for node_id in targets:
+                count = counts.get(node_id)
+                if count is None:
+                    counts[node_id] = delta
+                    changed.append(node_id)
+                else:
+                    counts[node_id] = count + delta
+        else:
+            for node_id in targets:
+                count = counts[node_id] + delta
+                if count:
+                    counts[node_id] = count
+                else:
+                    del counts[node_id]
+                    changed.append(node_id)
+        return changed
@@ -4,19 +4,24 @@ Cascading Failure Handler
 Purpose: Detect and handle cascading component failures with circuit breakers and isolation
 Authority: Wave 2.0 Subwave 2.8 - Full Watchdog Coverage (QA-396)
 Tenant Isolation: All operations scoped by organisation_id
+
+Isolation is dependency aware: the isolation registry keeps a reverse
+index from each component to its callers, so isolating a failed component
+immediately sheds load at its upstream callers instead of waiting for
+each of their breakers to trip.
 """
 
-from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from enum import Enum
+import threading
 
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
 
-class CircuitState(Enum):
-    """Circuit breaker states"""
-    CLOSED = "closed"  # Normal operation
-    OPEN = "open"      # Failures detected, circuit open
-    HALF_OPEN = "half_open"  # Testing recovery
+
+# Component breakers open once three calls are recorded and half of them failed
+DEFAULT_BREAKER_CONFIG = CircuitBreakerConfig(minimum_calls=3, wait_duration_open_seconds=60)
 
 
 @dataclass
@@ -29,71 +34,180 @@ class FailureRecord:
     caused_by: Optional[str] = None  # Parent component if cascading
 
 
-@dataclass
-class CircuitBreaker:
-    """Circuit breaker for component failure management"""
-    component_id: str
-    state: CircuitState = CircuitState.CLOSED
-    failure_count: int = 0
-    failure_threshold: int = 3
-    last_failure_time: Optional[datetime] = None
-    reset_timeout_seconds: int = 60
-    
-    def record_failure(self) -> None:
-        """Record a failure and update state"""
-        self.failure_count += 1
-        self.last_failure_time = datetime.now(timezone.utc)
-        
-        if self.failure_count >= self.failure_threshold:
-            self.state = CircuitState.OPEN
-    
-    def can_attempt(self) -> bool:
-        """Check if operation can be attempted"""
-        if self.state == CircuitState.CLOSED:
-            return True
-        
-        if self.state == CircuitState.OPEN:
-            # Check if timeout elapsed for half-open attempt
-            if self.last_failure_time:
-                elapsed = (datetime.now(timezone.utc) - self.last_failure_time).total_seconds()
-                if elapsed >= self.reset_timeout_seconds:
-                    self.state = CircuitState.HALF_OPEN
-                    return True
-            return False
-        
-        # HALF_OPEN state: allow single attempt
-        return True
-    
-    def record_success(self) -> None:
-        """Record a successful operation"""
-        if self.state == CircuitState.HALF_OPEN:
-            # Recovery successful
-            self.state = CircuitState.CLOSED
-            self.failure_count = 0
+class IsolationMode(Enum):
+    """How calls to a component are treated"""
+    ISOLATED = "isolated"  # The component failed; only breaker trial calls reach it
+    FAST_FAIL = "fast_fail"  # A critical dependency is isolated; reject calls immediately
+    DEGRADED = "degraded"  # An optional dependency is isolated; serve without it
+
+
+# Strongest mode wins when several isolated components reach one caller
+_MODE_RANK = {IsolationMode.DEGRADED: 1, IsolationMode.FAST_FAIL: 2, IsolationMode.ISOLATED: 3}
 
 
 class ComponentIsolationManager:
-    """Manages isolation of failed components"""
+    """
+    Manages isolation of failed components
     
-    def __init__(self):
+    Also serves as the isolation registry shared by every caller of a
+    component. With dependency_aware set, isolating a component puts its
+    callers into FAST_FAIL through critical dependencies (transitively,
+    since a fast-failing caller fails its own critical callers) and into
+    DEGRADED through optional ones. get_isolation_mode is a single dict
+    lookup, so it can be checked on every call.
+    """
+    
+    def __init__(self, dependency_aware: bool = True):
+        self.dependency_aware = dependency_aware
         self._isolated_components: Dict[str, datetime] = {}
+        self._modes: Dict[str, IsolationMode] = {}  # Effective mode, read without the lock
+        self._callers: Dict[str, Dict[str, bool]] = {}  # dependency -> {caller: critical}
+        self._causes: Dict[str, Dict[str, IsolationMode]] = {}  # shed caller -> {isolated component: mode}
+        self._shed: Dict[str, List[str]] = {}  # isolated component -> callers it shed
+        self._lock = threading.Lock()
     
-    def isolate_component(self, component_id: str) -> None:
-        """Isolate a component"""
-        self._isolated_components[component_id] = datetime.now(timezone.utc)
+    def register_dependency(self, caller_id: str, dependency_id: str, critical: bool = True) -> None:
+        """
+        Record that caller_id calls dependency_id
+        
+        Args:
+            caller_id: Calling component
+            dependency_id: Component being called
+            critical: Whether the caller cannot serve without the dependency
+        """
+        with self._lock:
+            self._callers.setdefault(dependency_id, {})[caller_id] = critical
+            if not self.dependency_aware or dependency_id not in self._modes:
+                return
+            # Calling something already cut off: shed the new caller right away
+            roots = [dependency_id] if dependency_id in self._isolated_components else []
+            roots.extend(
+                root for root, mode in self._causes.get(dependency_id, {}).items()
+                if mode == IsolationMode.FAST_FAIL
+            )
+            for root in roots:
+                self._shed_callers(root)
+    
+    def remove_dependency(self, caller_id: str, dependency_id: str) -> None:
+        """Forget a dependency, lifting any shedding that reached the caller through it"""
+        with self._lock:
+            callers = self._callers.get(dependency_id)
+            if callers is None or callers.pop(caller_id, None) is None:
+                return
+            for root in list(self._causes.get(caller_id, {})):
+                self._shed_callers(root)
+    
+    def isolate_component(self, component_id: str) -> List[str]:
+        """
+        Isolate a component
+        
+        Returns:
+            Callers newly put into FAST_FAIL or DEGRADED mode
+        """
+        with self._lock:
+            if component_id in self._isolated_components:
+                return []
+            self._isolated_components[component_id] = datetime.now(timezone.utc)
+            self._modes[component_id] = IsolationMode.ISOLATED
+            if not self.dependency_aware:
+                return []
+            return self._shed_callers(component_id)
     
     def is_component_isolated(self, component_id: str) -> bool:
         """Check if component is isolated"""
         return component_id in self._isolated_components
     
-    def release_component(self, component_id: str) -> None:
-        """Release a component from isolation"""
-        if component_id in self._isolated_components:
+    def get_isolation_mode(self, component_id: str) -> Optional[IsolationMode]:
+        """Effective mode of a component, None when calls are unrestricted"""
+        return self._modes.get(component_id)
+    
+    def release_component(self, component_id: str) -> List[str]:
+        """
+        Release a component from isolation
+        
+        Returns:
+            Callers that left FAST_FAIL or DEGRADED mode as a result
+        """
+        with self._lock:
+            if component_id not in self._isolated_components:
+                return []
             del self._isolated_components[component_id]
+            self._refresh_mode(component_id)
+            
+            restored = []
+            for caller in self._shed.pop(component_id, []):
+                causes = self._causes[caller]
+                del causes[component_id]
+                if not causes:
+                    del self._causes[caller]
+                if self._refresh_mode(caller) is None:
+                    restored.append(caller)
+            return restored
     
     def get_isolated_components(self) -> List[str]:
         """Get list of isolated components"""
         return list(self._isolated_components.keys())
+    
+    def get_isolation_modes(self) -> Dict[str, str]:
+        """Get the effective mode of every restricted component"""
+        return {component_id: mode.value for component_id, mode in list(self._modes.items())}
+    
+    # Private helper methods
+    
+    def _shed_callers(self, component_id: str) -> List[str]:
+        """
+        Bring the callers shed by an isolated component in line with the current edges
+        
+        Applies FAST_FAIL / DEGRADED to every caller now reached from
+        component_id and lifts it from callers that are no longer reached.
+        
+        Returns:
+            Callers newly put into a restricted mode
+        """
+        reached: Dict[str, IsolationMode] = {}
+        stack = [component_id]
+        while stack:
+            current = stack.pop()
+            for caller, critical in self._callers.get(current, {}).items():
+                if caller == component_id:
+                    continue
+                mode = IsolationMode.FAST_FAIL if critical else IsolationMode.DEGRADED
+                previous = reached.get(caller)
+                if previous is not None and _MODE_RANK[previous] >= _MODE_RANK[mode]:
+                    continue
+                reached[caller] = mode
+                if mode == IsolationMode.FAST_FAIL:
+                    stack.append(caller)
+        
+        for caller in self._shed.get(component_id, []):
+            if caller not in reached:
+                causes = self._causes[caller]
+                del causes[component_id]
+                if not causes:
+                    del self._causes[caller]
+                self._refresh_mode(caller)
+        
+        shed = []
+        for caller, mode in reached.items():
+            self._causes.setdefault(caller, {})[component_id] = mode
+            before = self._modes.get(caller)
+            if self._refresh_mode(caller) is not None and before is None:
+                shed.append(caller)
+        self._shed[component_id] = list(reached)
+        return shed
+    
+    def _refresh_mode(self, component_id: str) -> Optional[IsolationMode]:
+        """Recompute one component's effective mode from its direct isolation and causes"""
+        if component_id in self._isolated_components:
+            mode: Optional[IsolationMode] = IsolationMode.ISOLATED
+        else:
+            causes = self._causes.get(component_id)
+            mode = max(causes.values(), key=_MODE_RANK.__getitem__) if causes else None
+        if mode is None:
+            self._modes.pop(component_id, None)
+        else:
+            self._modes[component_id] = mode
+        return mode
 
 
 @dataclass
@@ -163,16 +277,48 @@ class CascadingFailureHandler:
     - Detect cascading failures
     - Activate circuit breakers
     - Isolate failed components
+    - Shed load at the callers of isolated components
     - Escalate critical failures
+    
+    A component is isolated as soon as its breaker opens. Handlers of one
+    organisation can share an isolation_manager so that every handler sees
+    the same isolation registry.
     """
     
-    def __init__(self, organisation_id: str):
+    def __init__(
+        self,
+        organisation_id: str,
+        breaker_config: Optional[CircuitBreakerConfig] = None,
+        isolation_manager: Optional[ComponentIsolationManager] = None
+    ):
         self.organisation_id = organisation_id
+        self._breaker_config = breaker_config or DEFAULT_BREAKER_CONFIG
         self._failure_records: List[FailureRecord] = []
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
-        self._isolation_manager = ComponentIsolationManager()
+        self._isolation_manager = isolation_manager or ComponentIsolationManager()
         self._escalator = FailureEscalator()
     
+    def register_dependency(self, caller_id: str, dependency_id: str, critical: bool = True) -> None:
+        """Record that caller_id calls dependency_id"""
+        self._isolation_manager.register_dependency(caller_id, dependency_id, critical)
+    
+    def acquire_call_permission(self, component_id: str) -> Tuple[bool, Optional[IsolationMode]]:
+        """
+        Check whether a call to a component may proceed
+        
+        FAST_FAIL components reject without touching a breaker. An
+        ISOLATED component admits only its breaker's half-open trial calls.
+        
+        Returns:
+            (allowed, isolation mode or None)
+        """
+        mode = self._isolation_manager.get_isolation_mode(component_id)
+        if mode is None or mode == IsolationMode.DEGRADED:
+            return True, mode
+        if mode == IsolationMode.FAST_FAIL:
+            return False, mode
+        return self._get_or_create_circuit_breaker(component_id).can_attempt(), mode
+    
     def record_failure(self, component_id: str, failure_message: str) -> None:
         """Record a component failure"""
         record = FailureRecord(
@@ -186,6 +332,17 @@ class CascadingFailureHandler:
         # Update circuit breaker
         circuit_breaker = self._get_or_create_circuit_breaker(component_id)
         circuit_breaker.record_failure()
+        self._isolate_if_open(component_id, circuit_breaker)
+    
+    def record_success(self, component_id: str, duration_ms: Optional[float] = None) -> None:
+        """Record a successful call to a component, releasing it once its breaker closes"""
+        circuit_breaker = self._get_or_create_circuit_breaker(component_id)
+        circuit_breaker.record_success(duration_ms)
+        if (
+            self._isolation_manager.is_component_isolated(component_id)
+            and circuit_breaker.state == CircuitState.CLOSED
+        ):
+            self._isolation_manager.release_component(component_id)
     
     def record_cascading_failure(
         self,
@@ -202,10 +359,12 @@ class CascadingFailureHandler:
             caused_by=caused_by
         )
         self._failure_records.append(record)
+        self._isolation_manager.register_dependency(component_id, caused_by)
         
         # Update circuit breaker
         circuit_breaker = self._get_or_create_circuit_breaker(component_id)
         circuit_breaker.record_failure()
+        self._isolate_if_open(component_id, circuit_breaker)
         
         # Check if cascading failure threshold reached
         if self.is_cascading_failure_detected():
@@ -231,9 +390,7 @@ class CascadingFailureHandler:
             # Open circuit breakers for all components in cascade
             circuit_breaker = self._get_or_create_circuit_breaker(record.component_id)
             # Force circuit to open for cascading failures
-            if circuit_breaker.state != CircuitState.OPEN:
-                circuit_breaker.failure_count = circuit_breaker.failure_threshold
-                circuit_breaker.state = CircuitState.OPEN
+            circuit_breaker.force_open()
     
     def _escalate_cascading_failure(self) -> None:
         """Escalate cascading failure"""
@@ -252,13 +409,23 @@ class CascadingFailureHandler:
             }
         )
     
+    def _isolate_if_open(self, component_id: str, circuit_breaker: CircuitBreaker) -> None:
+        """Isolate a component whose breaker has just opened"""
+        if (
+            circuit_breaker.state == CircuitState.OPEN
+            and not self._isolation_manager.is_component_isolated(component_id)
+        ):
+            self._isolation_manager.isolate_component(component_id)
+    
     def _get_or_create_circuit_breaker(self, component_id: str) -> CircuitBreaker:
         """Get or create circuit breaker for component"""
-        if component_id not in self._circuit_breakers:
-            self._circuit_breakers[component_id] = CircuitBreaker(
-                component_id=component_id
+        circuit_breaker = self._circuit_breakers.get(component_id)
+        if circuit_breaker is None:
+            circuit_breaker = self._circuit_breakers.setdefault(
+                component_id,
+                CircuitBreaker(component_id, self._breaker_config, organisation_id=self.organisation_id)
             )
-        return self._circuit_breakers[component_id]
+        return circuit_breaker
     
     def get_circuit_breaker(self, component_id: str) -> CircuitBreaker:
         """Get circuit breaker for component"""
@@ -0,0 +1,366 @@
+"""
+Circuit Breaker
+
+Purpose: Sliding-window circuit breaker shared by the resilience and cascading failure handlers
+Authority: Wave 2.0 Subwave 2.8/2.12 - Full Watchdog Coverage (QA-396), Complex Failure Modes Phase 2 (QA-266)
+Tenant Isolation: One breaker per protected resource; owners scope breakers by organisation_id
+
+The breaker trips on the failure rate and slow-call rate over a ring
+buffer of the last N calls (count-based) or the last N seconds in
+one-second buckets (time-based), rather than on a raw failure count.
+Recording a call is O(1) under the breaker's own lock.
+"""
+
+from enum import Enum
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import threading
+import time
+
+
+class CircuitState(Enum):
+    """Circuit breaker states"""
+    CLOSED = "closed"  # Normal operation
+    OPEN = "open"  # Failure or slow-call rate exceeded threshold
+    HALF_OPEN = "half_open"  # Testing recovery
+
+
+class SlidingWindowType(Enum):
+    """How the breaker's window is measured"""
+    COUNT_BASED = "count_based"  # Last window_size calls
+    TIME_BASED = "time_based"  # Calls in the last window_size seconds
+
+
+# Outcome bits stored per call
+_FAILURE = 1
+_SLOW = 2
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Circuit breaker configuration"""
+    window_type: SlidingWindowType = SlidingWindowType.COUNT_BASED
+    window_size: int = 100  # Calls, or seconds for a time-based window
+    minimum_calls: int = 10  # Calls in the window before rates are evaluated
+    failure_rate_threshold: float = 50.0  # Percent
+    slow_call_rate_threshold: float = 100.0  # Percent
+    slow_call_duration_ms: float = 60000.0
+    wait_duration_open_seconds: float = 60.0  # Time OPEN before HALF_OPEN
+    permitted_half_open_calls: int = 1  # Trial calls allowed, and evaluated, in HALF_OPEN
+    max_wait_half_open_seconds: float = 60.0  # Unreported trials this old reopen the breaker; 0 waits forever
+
+    def validate(self) -> bool:
+        """Validate circuit breaker configuration"""
+        return (
+            self.window_size >= 1
+            and self.minimum_calls >= 1
+            and 0 < self.failure_rate_threshold <= 100
+            and 0 < self.slow_call_rate_threshold <= 100
+            and self.slow_call_duration_ms > 0
+            and self.wait_duration_open_seconds >= 0
+            and self.permitted_half_open_calls >= 1
+            and self.max_wait_half_open_seconds >= 0
+        )
+
+
+class _CountWindow:
+    """Ring buffer of the last size call outcomes with per-outcome totals"""
+
+    __slots__ = ("outcomes", "index", "counts")
+
+    def __init__(self, size: int):
+        self.outcomes: List[Optional[int]] = [None] * size
+        self.index = 0
+        self.counts = [0, 0, 0, 0]  # Calls per outcome code
+
+    def record(self, outcome: int, now: float) -> None:
+        index = self.index
+        evicted = self.outcomes[index]
+        if evicted is not None:
+            self.counts[evicted] -= 1
+        self.outcomes[index] = outcome
+        self.counts[outcome] += 1
+        index += 1
+        self.index = 0 if index == len(self.outcomes) else index
+
+    def totals(self, now: float) -> Tuple[int, int, int]:
+        return _totals(self.counts)
+
+
+class _TimeWindow:
+    """Ring of one-second buckets covering the last size seconds"""
+
+    __slots__ = ("epochs", "buckets", "counts", "swept")
+
+    def __init__(self, size: int):
+        self.epochs: List[int] = [-1] * size  # Second each bucket currently holds
+        self.buckets: List[List[int]] = [[0, 0, 0, 0] for _ in range(size)]  # Calls per outcome code
+        self.counts = [0, 0, 0, 0]
+        self.swept = -1  # Second of the last eviction sweep
+
+    def record(self, outcome: int, now: float) -> None:
+        second = int(now)
+        index = second % len(self.epochs)
+        if self.epochs[index] != second:
+            self._evict(index)
+            self.epochs[index] = second
+        self.buckets[index][outcome] += 1
+        self.counts[outcome] += 1
+
+    def totals(self, now: float) -> Tuple[int, int, int]:
+        second = int(now)
+        if second != self.swept:
+            self.swept = second
+            size = len(self.epochs)
+            for index in range(size):
+                if self.epochs[index] != -1 and second - self.epochs[index] >= size:
+                    self._evict(index)
+        return _totals(self.counts)
+
+    def _evict(self, index: int) -> None:
+        bucket = self.buckets[index]
+        for outcome in range(4):
+            self.counts[outcome] -= bucket[outcome]
+            bucket[outcome] = 0
+        self.epochs[index] = -1
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker over a sliding window of call outcomes
+
+    CLOSED trips to OPEN once the window holds at least minimum_calls and
+    the failure rate or slow-call rate reaches its threshold. After
+    wait_duration_open_seconds the breaker is HALF_OPEN and grants
+    permitted_half_open_calls trial permissions; once every trial has
+    reported, it closes if their failure and slow-call rates are below the
+    thresholds and reopens otherwise. Only outcomes against an outstanding
+    trial permission count, and trials still unreported after
+    max_wait_half_open_seconds reopen the breaker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        config: Optional[CircuitBreakerConfig] = None,
+        organisation_id: Optional[str] = None,
+        clock: Optional[Callable[[], float]] = None
+    ):
+        """
+        Initialize circuit breaker
+
+        Args:
+            name: Protected resource or component
+            config: Window and threshold configuration
+            organisation_id: Owning organisation
+            clock: Monotonic time source in seconds (defaults to time.monotonic)
+        """
+        self.name = name
+        self.config = config or CircuitBreakerConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid circuit breaker configuration")
+
+        self.organisation_id = organisation_id
+        self.last_failure_time: Optional[datetime] = None
+        self._clock = clock or time.monotonic
+        self._timed = self.config.window_type == SlidingWindowType.TIME_BASED
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._window = self._new_window()
+        self._opened_at: Optional[float] = None
+        self._trials_started_at: Optional[float] = None  # When the first trial permission was granted
+        self._trial_permits = 0  # Trial permissions granted in HALF_OPEN
+        self._trial_results: List[int] = []
+        self._rejected_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; OPEN becomes HALF_OPEN once the wait has elapsed"""
+        with self._lock:
+            self._check_timeouts()
+            return self._state
+
+    @property
+    def failure_count(self) -> int:
+        """Failures in the current window"""
+        with self._lock:
+            return self._window.totals(self._clock())[1]
+
+    def can_attempt(self) -> bool:
+        """
+        Ask permission for a call
+
+        In HALF_OPEN each granted permission is one of the limited trial
+        calls, so the caller must report its outcome.
+
+        Returns:
+            True if the call may proceed
+        """
+        return self.acquire_permission()[0]
+
+    def acquire_permission(self) -> Tuple[bool, CircuitState]:
+        """
+        Ask permission for a call
+
+        Returns:
+            (allowed, state the decision was made in)
+        """
+        with self._lock:
+            self._check_timeouts()
+            if self._state == CircuitState.CLOSED:
+                return True, self._state
+            if self._state == CircuitState.HALF_OPEN and self._trial_permits < self.config.permitted_half_open_calls:
+                if not self._trial_permits:
+                    self._trials_started_at = self._clock()
+                self._trial_permits += 1
+                return True, self._state
+            self._rejected_calls += 1
+            return False, self._state
+
+    def record_success(
+        self,
+        duration_ms: Optional[float] = None,
+        admitted_in: Optional[CircuitState] = None
+    ) -> None:
+        """
+        Record a successful call
+
+        Args:
+            duration_ms: Call duration, for slow-call tracking
+            admitted_in: State acquire_permission admitted the call in; in
+                HALF_OPEN, outcomes of calls admitted in another state are
+                ignored
+        """
+        self._record(0, duration_ms, admitted_in)
+
+    def record_failure(
+        self,
+        duration_ms: Optional[float] = None,
+        admitted_in: Optional[CircuitState] = None
+    ) -> None:
+        """
+        Record a failed call
+
+        Args:
+            duration_ms: Call duration, for slow-call tracking
+            admitted_in: State acquire_permission admitted the call in; in
+                HALF_OPEN, outcomes of calls admitted in another state are
+                ignored
+        """
+        self.last_failure_time = datetime.now(timezone.utc)
+        self._record(_FAILURE, duration_ms, admitted_in)
+
+    def force_open(self) -> None:
+        """Trip the breaker regardless of the window"""
+        with self._lock:
+            if self._state != CircuitState.OPEN:
+                self._transition(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """Close the breaker and clear its window"""
+        with self._lock:
+            self._transition(CircuitState.CLOSED)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get state and window rates"""
+        with self._lock:
+            self._check_timeouts()
+            calls, failures, slow = self._window.totals(self._clock())
+            return {
+                "name": self.name,
+                "state": self._state.value,
+                "window_type": self.config.window_type.value,
+                "buffered_calls": calls,
+                "failure_count": failures,
+                "slow_call_count": slow,
+                "failure_rate": _rate(failures, calls),
+                "slow_call_rate": _rate(slow, calls),
+                "rejected_calls": self._rejected_calls,
+                "half_open_permits": self._trial_permits,
+                "organisation_id": self.organisation_id
+            }
+
+    # Private helper methods (caller holds self._lock unless noted)
+
+    def _record(self, outcome: int, duration_ms: Optional[float], admitted_in: Optional[CircuitState]) -> None:
+        """Add one call outcome and re-evaluate the state (acquires self._lock)"""
+        if duration_ms is not None and duration_ms >= self.config.slow_call_duration_ms:
+            outcome |= _SLOW
+
+        with self._lock:
+            if self._state is not CircuitState.CLOSED:
+                self._check_timeouts()
+            if self._state is CircuitState.HALF_OPEN:
+                # Stragglers admitted before the trials, or beyond them, are not evidence of recovery
+                if len(self._trial_results) >= self._trial_permits or (
+                    admitted_in is not None and admitted_in is not CircuitState.HALF_OPEN
+                ):
+                    return
+                self._trial_results.append(outcome)
+                if len(self._trial_results) >= self.config.permitted_half_open_calls:
+                    trials = len(self._trial_results)
+                    failures = sum(result & _FAILURE for result in self._trial_results)
+                    slow = sum((result & _SLOW) >> 1 for result in self._trial_results)
+                    tripped = self._exceeds_thresholds(trials, failures, slow)
+                    self._transition(CircuitState.OPEN if tripped else CircuitState.CLOSED)
+                return
+
+            now = self._clock() if self._timed else 0.0
+            self._window.record(outcome, now)
+            # A clean success can only lower the rates, so only bad outcomes are evaluated
+            if outcome and self._state is CircuitState.CLOSED:
+                calls, failures, slow = self._window.totals(now)
+                if calls >= self.config.minimum_calls and self._exceeds_thresholds(calls, failures, slow):
+                    self._transition(CircuitState.OPEN)
+
+    def _exceeds_thresholds(self, calls: int, failures: int, slow: int) -> bool:
+        """Whether either rate has reached its threshold"""
+        return (
+            _rate(failures, calls) >= self.config.failure_rate_threshold
+            or _rate(slow, calls) >= self.config.slow_call_rate_threshold
+        )
+
+    def _check_timeouts(self) -> None:
+        """Move OPEN to HALF_OPEN once the wait has elapsed, and HALF_OPEN back to OPEN when trials go unreported"""
+        if self._state == CircuitState.OPEN:
+            if self._clock() - self._opened_at >= self.config.wait_duration_open_seconds:
+                self._transition(CircuitState.HALF_OPEN)
+        elif (
+            self._state == CircuitState.HALF_OPEN
+            and self.config.max_wait_half_open_seconds
+            and self._trial_permits > len(self._trial_results)
+            and self._clock() - self._trials_started_at >= self.config.max_wait_half_open_seconds
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> None:
+        """Enter a state and reset what it starts from"""
+        self._state = state
+        self._trial_permits = 0
+        self._trial_results = []
+        self._trials_started_at = None
+        if state == CircuitState.OPEN:
+            self._opened_at = self._clock()
+        elif state == CircuitState.CLOSED:
+            self._window = self._new_window()
+
+    def _new_window(self):
+        """Empty window of the configured type"""
+        if self._timed:
+            return _TimeWindow(self.config.window_size)
+        return _CountWindow(self.config.window_size)
+
+
+def _totals(counts: List[int]) -> Tuple[int, int, int]:
+    """(calls, failures, slow calls) from per-outcome counts"""
+    return (
+        counts[0] + counts[_FAILURE] + counts[_SLOW] + counts[_FAILURE | _SLOW],
+        counts[_FAILURE] + counts[_FAILURE | _SLOW],
+        counts[_SLOW] + counts[_FAILURE | _SLOW]
+    )
+
+
+def _rate(part: int, total: int) -> float:
+    """Percentage of total"""
+    return part * 100.0 / total if total else 0.0
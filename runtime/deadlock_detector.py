@@ -7,7 +7,7 @@ Tenant Isolation: All operations scoped by organisation_id
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Set, Any
+from typing import Dict, List, Optional, Set, Any, Callable, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 import threading
@@ -87,26 +87,42 @@ class DeadlockRecovery:
     
     def recover_from_deadlock(
         self,
-        resources: List[str],
-        holders: List[str]
+        resources: Optional[List[str]] = None,
+        holders: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
         Recover from deadlock by releasing locks
         
-        Strategy: Release all locks in deadlock cycle
+        Strategy: With resources and holders, release each listed resource
+        held by a listed holder. Otherwise break every detected cycle by
+        aborting its minimum-cost holder: the victim releases all of its
+        locks and stops waiting.
         """
         recovery_id = f"recovery_{int(datetime.now(timezone.utc).timestamp())}"
         
-        # Release all locks
-        for resource_id in resources:
-            for holder_id in holders:
-                self._detector.release_lock(resource_id, holder_id)
+        if resources is not None and holders is not None:
+            holder_set = set(holders)
+            for resource_id in resources:
+                holder_id = self._detector.get_lock_holder(resource_id)
+                if holder_id in holder_set:
+                    self._detector.release_lock(resource_id, holder_id)
+            victims: List[str] = []
+            released = resources
+        else:
+            victims = []
+            released = []
+            for cycle in iter(self._detector.next_deadlock, None):
+                victim = min(cycle, key=self._detector.victim_cost)
+                released.extend(self._detector.abort_holder(victim))
+                victims.append(victim)
+            holders = victims
         
         recovery_record = {
             "recovery_id": recovery_id,
             "status": "recovered",
-            "resources_released": resources,
+            "resources_released": released,
             "holders_released": holders,
+            "victims": victims,
             "timestamp": datetime.now(timezone.utc).isoformat()
         }
         
@@ -124,13 +140,32 @@ class DeadlockDetector:
     - Manage timeouts
     - Coordinate recovery
     - Escalate unrecoverable deadlocks
+    
+    The holder wait-for graph (waiter -> holder of a resource it waits on)
+    is updated on every request, acquire and release. Inserting an edge
+    searches only what the new target can reach; a path back to the waiter
+    is recorded as a deadlock cycle. Removing an edge drops the cycles it
+    broke and re-checks their surviving edges, so detect_deadlock is O(1).
     """
     
-    def __init__(self, organisation_id: str, timeout_seconds: int = 30):
+    def __init__(
+        self,
+        organisation_id: str,
+        timeout_seconds: int = 30,
+        victim_cost: Optional[Callable[[str], float]] = None
+    ):
         self.organisation_id = organisation_id
         self.timeout_seconds = timeout_seconds
         self._locks: Dict[str, ResourceLock] = {}
-        self._lock_requests: Dict[str, List[str]] = {}  # resource -> list of waiting holders
+        self._lock_requests: Dict[str, Dict[str, None]] = {}  # resource -> ordered set of waiting holders
+        self._held: Dict[str, Set[str]] = {}  # holder -> resources held
+        self._waiting: Dict[str, Set[str]] = {}  # holder -> resources waited on
+        self._wait_for: Dict[str, Dict[str, int]] = {}  # waiter -> {holder -> resources in common}
+        self._cycles: Dict[int, List[str]] = {}  # cycle id -> holders in wait order
+        self._cycle_ids: Dict[Tuple[str, ...], int] = {}  # canonical rotation -> cycle id
+        self._edge_cycles: Dict[Tuple[str, str], Set[int]] = {}  # wait-for edge -> ids of cycles using it
+        self._cycle_counter = 0
+        self._victim_cost = victim_cost
         self._timeout_manager = TimeoutManager(timeout_seconds)
         self._recovery = DeadlockRecovery(self)
         self._escalations: List[Escalation] = []
@@ -165,17 +200,25 @@ class DeadlockDetector:
                 acquired_at=datetime.now(timezone.utc),
                 organisation_id=self.organisation_id
             )
+            self._held.setdefault(holder_id, set()).add(resource_id)
+            
+            # A granted request is no longer a wait; everyone else now waits on this holder
+            self._remove_waiter(resource_id, holder_id)
+            for waiter in self._lock_requests.get(resource_id, ()):
+                self._add_edge(waiter, holder_id)
             
             return lock_id
     
     def request_lock(self, resource_id: str, holder_id: str) -> None:
         """Record a lock request (waiting)"""
         with self._lock:
-            if resource_id not in self._lock_requests:
-                self._lock_requests[resource_id] = []
-            
-            if holder_id not in self._lock_requests[resource_id]:
-                self._lock_requests[resource_id].append(holder_id)
+            waiters = self._lock_requests.setdefault(resource_id, {})
+            if holder_id not in waiters:
+                waiters[holder_id] = None
+                self._waiting.setdefault(holder_id, set()).add(resource_id)
+                lock = self._locks.get(resource_id)
+                if lock is not None and lock.holder_id != holder_id:
+                    self._add_edge(holder_id, lock.holder_id)
         
         self._timeout_manager.record_request(resource_id, holder_id)
     
@@ -190,14 +233,19 @@ class DeadlockDetector:
             if self._locks[lock_key].holder_id != holder_id:
                 return False
             
-            del self._locks[lock_key]
+            self._release(resource_id, holder_id)
             
             # Remove from waiting list if present
-            if resource_id in self._lock_requests and holder_id in self._lock_requests[resource_id]:
-                self._lock_requests[resource_id].remove(holder_id)
+            self._remove_waiter(resource_id, holder_id)
             
             return True
     
+    def get_lock_holder(self, resource_id: str) -> Optional[str]:
+        """Get the holder of a resource, if locked"""
+        with self._lock:
+            lock = self._locks.get(resource_id)
+            return lock.holder_id if lock else None
+    
     def is_lock_held(self, resource_id: str, holder_id: str) -> bool:
         """Check if a lock is held by holder"""
         with self._lock:
@@ -213,50 +261,65 @@ class DeadlockDetector:
         Uses cycle detection in wait-for graph
         """
         with self._lock:
-            # Build wait-for graph
-            # holder -> list of resources they're waiting for
-            wait_for: Dict[str, Set[str]] = {}
-            
-            # holder -> list of resources they hold
-            holds: Dict[str, Set[str]] = {}
-            
-            # Build holds mapping
-            for lock_key, lock in self._locks.items():
-                if lock.holder_id not in holds:
-                    holds[lock.holder_id] = set()
-                holds[lock.holder_id].add(lock.resource_id)
-            
-            # Build wait-for mapping
-            for resource_id, waiting_holders in self._lock_requests.items():
-                for holder_id in waiting_holders:
-                    if holder_id not in wait_for:
-                        wait_for[holder_id] = set()
-                    wait_for[holder_id].add(resource_id)
-            
-            # Check for cycles
-            # If holder A waits for resource X held by holder B,
-            # and holder B waits for resource Y held by holder A,
-            # we have a deadlock
-            
-            for waiting_holder, waited_resources in wait_for.items():
-                for resource in waited_resources:
-                    # Find who holds this resource
-                    holder = None
-                    for h, resources in holds.items():
-                        if resource in resources:
-                            holder = h
-                            break
-                    
-                    if holder and holder in wait_for:
-                        # Check if holder waits for something that waiting_holder holds
-                        holder_waiting_for = wait_for[holder]
-                        if waiting_holder in holds:
-                            waiting_holder_resources = holds[waiting_holder]
-                            if holder_waiting_for & waiting_holder_resources:
-                                # Cycle detected!
-                                return DeadlockStatus.DETECTED
-            
-            return DeadlockStatus.NONE
+            return DeadlockStatus.DETECTED if self._cycles else DeadlockStatus.NONE
+    
+    def get_deadlocks(self) -> List[Dict[str, Any]]:
+        """
+        Get the recorded deadlock cycles
+        
+        Each cycle lists its holders in wait order (each waits on a
+        resource held by the next; the last waits on the first) and the
+        resources involved.
+        """
+        with self._lock:
+            return [
+                {
+                    "holders": list(cycle),
+                    "resources": sorted({
+                        resource
+                        for waiter, holder in zip(cycle, cycle[1:] + cycle[:1])
+                        for resource in self._waiting.get(waiter, ())
+                        if resource in self._held.get(holder, ())
+                    })
+                }
+                for cycle in self._cycles.values()
+            ]
+    
+    def next_deadlock(self) -> Optional[List[str]]:
+        """Get the holders of one recorded deadlock cycle, or None"""
+        with self._lock:
+            return list(next(iter(self._cycles.values()))) if self._cycles else None
+    
+    def victim_cost(self, holder_id: str) -> Tuple[float, float]:
+        """
+        Cost of aborting a holder to break a deadlock (lower is cheaper)
+        
+        Uses the configured victim_cost, else the number of locks held;
+        ties go to the holder whose newest lock is youngest.
+        """
+        with self._lock:
+            held = self._held.get(holder_id, set())
+            newest = max(
+                (self._locks[resource].acquired_at.timestamp() for resource in held),
+                default=0.0
+            )
+        cost = self._victim_cost(holder_id) if self._victim_cost else float(len(held))
+        return cost, -newest
+    
+    def abort_holder(self, holder_id: str) -> List[str]:
+        """
+        Release every lock a holder has and cancel its waits
+        
+        Returns:
+            Resources released
+        """
+        with self._lock:
+            released = sorted(self._held.get(holder_id, ()))
+            for resource_id in released:
+                self._release(resource_id, holder_id)
+            for resource_id in list(self._waiting.get(holder_id, ())):
+                self._remove_waiter(resource_id, holder_id)
+            return released
     
     def get_timeout_manager(self) -> TimeoutManager:
         """Get timeout manager"""
@@ -293,3 +356,102 @@ class DeadlockDetector:
             }
             for e in self._escalations
         ]
+    
+    # Private helper methods (caller holds self._lock)
+    def _release(self, resource_id: str, holder_id: str) -> None:
+        """Drop a lock and the wait-for edges into its holder"""
+        del self._locks[resource_id]
+        held = self._held.get(holder_id)
+        if held is not None:
+            held.discard(resource_id)
+            if not held:
+                del self._held[holder_id]
+        for waiter in self._lock_requests.get(resource_id, ()):
+            if waiter != holder_id:
+                self._remove_edge(waiter, holder_id)
+    
+    def _remove_waiter(self, resource_id: str, holder_id: str) -> None:
+        """Cancel a holder's wait on a resource"""
+        waiters = self._lock_requests.get(resource_id)
+        if waiters is None or holder_id not in waiters:
+            return
+        del waiters[holder_id]
+        if not waiters:
+            del self._lock_requests[resource_id]
+        waiting = self._waiting[holder_id]
+        waiting.discard(resource_id)
+        if not waiting:
+            del self._waiting[holder_id]
+        lock = self._locks.get(resource_id)
+        if lock is not None and lock.holder_id != holder_id:
+            self._remove_edge(holder_id, lock.holder_id)
+    
+    def _add_edge(self, waiter: str, holder: str) -> None:
+        """Count one more resource waiter waits on that holder holds"""
+        edges = self._wait_for.setdefault(waiter, {})
+        edges[holder] = edges.get(holder, 0) + 1
+        if edges[holder] == 1:
+            self._check_edge(waiter, holder)
+    
+    def _remove_edge(self, waiter: str, holder: str) -> None:
+        """Count one fewer shared resource; drop the edge at zero"""
+        edges = self._wait_for.get(waiter)
+        if not edges or holder not in edges:
+            return
+        edges[holder] -= 1
+        if edges[holder] > 0:
+            return
+        del edges[holder]
+        if not edges:
+            del self._wait_for[waiter]
+        
+        broken = self._edge_cycles.pop((waiter, holder), set())
+        survivors = set()
+        for cycle_id in broken:
+            cycle = self._cycles.pop(cycle_id)
+            del self._cycle_ids[_canonical(cycle)]
+            for pair in zip(cycle, cycle[1:] + cycle[:1]):
+                if pair != (waiter, holder):
+                    self._edge_cycles.get(pair, set()).discard(cycle_id)
+                    survivors.add(pair)
+        
+        # Another cycle may share a surviving edge with a broken one
+        for pair in survivors:
+            if pair[1] in self._wait_for.get(pair[0], ()):
+                self._check_edge(*pair)
+    
+    def _check_edge(self, waiter: str, holder: str) -> None:
+        """Record a cycle if waiter is reachable from holder"""
+        parents: Dict[str, Optional[str]] = {holder: None}
+        stack = [holder]
+        while stack:
+            node = stack.pop()
+            if node == waiter:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = parents[node]
+                self._record_cycle(path[::-1])  # holder ... waiter
+                return
+            for successor in self._wait_for.get(node, ()):
+                if successor not in parents:
+                    parents[successor] = node
+                    stack.append(successor)
+    
+    def _record_cycle(self, path: List[str]) -> None:
+        """Record a cycle given as holder -> ... -> waiter (waiter waits on holder)"""
+        cycle = path[-1:] + path[:-1]  # waiter first, in wait order
+        key = _canonical(cycle)
+        if key in self._cycle_ids:
+            return
+        self._cycle_counter += 1
+        self._cycle_ids[key] = self._cycle_counter
+        self._cycles[self._cycle_counter] = cycle
+        for pair in zip(cycle, cycle[1:] + cycle[:1]):
+            self._edge_cycles.setdefault(pair, set()).add(self._cycle_counter)
+
+
+def _canonical(cycle: List[str]) -> Tuple[str, ...]:
+    """Rotation of a cycle starting at its smallest holder, for de-duplication"""
+    start = cycle.index(min(cycle))
+    return tuple(cycle[start:] + cycle[:start])
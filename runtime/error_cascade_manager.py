@@ -12,13 +12,25 @@ Error Cascade Management:
 - QA-253: Build blocking cascade (IN_PROGRESS → BLOCKED with escalation)
 - QA-254: Build unblocking cascade (BLOCKED → IN_PROGRESS with state restoration)
 - QA-255: Build completion cascade (IN_PROGRESS → COMPLETED with validation)
+
+Requirements, builds and tasks are kept in a persistent CascadeGraph.
+Blocking or unblocking a build touches only the entities that depend on it.
+Task IDs are scoped to their build: in the graph a task is the entity
+"<build_id>/<task_id>" (see task_entity_id).
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 
+from .cascade_graph import CascadeGraph
+
+
+def task_entity_id(build_id: str, task_id: str) -> str:
+    """Graph entity ID of a build's task"""
+    return f"{build_id}/{task_id}"
+
 
 class CascadeType(Enum):
     """Types of error cascades"""
@@ -89,6 +101,7 @@ class ErrorCascadeManager:
         self._active_cascades: Dict[str, CascadeChain] = {}
         self._cascade_history: List[CascadeChain] = []
         self._immutable_entities: Dict[str, Dict[str, Any]] = {}  # For QA-251
+        self._graph = CascadeGraph()  # Requirements → builds → tasks
         
     def enforce_requirement_freeze(
         self,
@@ -143,6 +156,7 @@ class ErrorCascadeManager:
         
         # Store as immutable
         self._immutable_entities[requirement_id] = frozen_data
+        self._graph.add_node(requirement_id, "requirement", current_state)
         
         return {
             "frozen": True,
@@ -184,7 +198,8 @@ class ErrorCascadeManager:
         build_id: str,
         builder_assignments: List[Dict[str, Any]],
         tasks: List[Dict[str, Any]],
-        monitoring_config: Dict[str, Any]
+        monitoring_config: Dict[str, Any],
+        requirement_id: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         QA-252: Handle build initiation cascade (INITIATED → IN_PROGRESS)
@@ -194,11 +209,16 @@ class ErrorCascadeManager:
         - Task creation
         - Monitoring activation
         
+        The build and its tasks join the cascade graph. Tasks depend on the
+        build, and on the tasks of the same build listed in their
+        "depends_on".
+        
         Args:
             build_id: Build identifier
             builder_assignments: List of builder assignments
             tasks: List of tasks to create
             monitoring_config: Monitoring configuration
+            requirement_id: Requirement the build implements (becomes its prerequisite)
             
         Returns:
             Dict with:
@@ -207,9 +227,17 @@ class ErrorCascadeManager:
                 - tasks_created: Boolean
                 - monitoring_started: Boolean
                 - state_transition: State transition details
+                
+        Raises:
+            ValueError: If a task has no task_id or task dependencies would
+                form a cycle
         """
         import uuid
         
+        for task in tasks:
+            if not task.get("task_id"):
+                raise ValueError(f"Task without a task_id in build {build_id}")
+        
         # Create cascade chain
         chain_id = str(uuid.uuid4())
         
@@ -232,6 +260,12 @@ class ErrorCascadeManager:
         cascade.all_events.append(root_event)
         cascade.affected_components.add(build_id)
         
+        self._graph.add_node(build_id, "build", "IN_PROGRESS")
+        if requirement_id is not None:
+            if requirement_id not in self._graph:
+                self._graph.add_node(requirement_id, "requirement", "APPROVED")
+            self._graph.add_dependency(requirement_id, build_id)
+        
         # Execute cascade steps
         builders_assigned = self._assign_builders(cascade, build_id, builder_assignments)
         tasks_created = self._create_tasks(cascade, build_id, tasks)
@@ -277,6 +311,9 @@ class ErrorCascadeManager:
         - Escalation trigger
         - Pause propagation
         
+        The pause reaches every entity that depends on the build. Blocking
+        an already blocked build only records the extra blocker.
+        
         Args:
             build_id: Build identifier
             blocker_details: Details about the blocker
@@ -288,6 +325,7 @@ class ErrorCascadeManager:
                 - blocker_detected: Boolean
                 - escalation_triggered: Boolean
                 - pause_propagated: Boolean
+                - paused_components: Entities newly paused by this blocker
         """
         import uuid
         
@@ -316,7 +354,9 @@ class ErrorCascadeManager:
         # Execute blocking cascade
         blocker_detected = True  # Already detected
         escalation_triggered = self._trigger_escalation(cascade, build_id, blocker_details) if escalation_required else False
-        pause_propagated = self._propagate_pause(cascade, build_id)
+        pause_propagated, paused = self._propagate_pause(
+            cascade, build_id, blocker_details.get("blocker_id", "unspecified")
+        )
         
         # Mark as contained
         cascade.state = CascadeState.CONTAINED
@@ -338,6 +378,7 @@ class ErrorCascadeManager:
             "blocker_detected": blocker_detected,
             "escalation_triggered": escalation_triggered,
             "pause_propagated": pause_propagated,
+            "paused_components": paused,
             "chain_id": chain_id,
             "organisation_id": self.organisation_id
         }
@@ -356,6 +397,10 @@ class ErrorCascadeManager:
         - Resume trigger
         - State restoration
         
+        Removes the blocker named in resolution_details["blocker_id"], or
+        every blocker when none is named. Dependents resume once no blocked
+        prerequisite reaches them, with the state they had before.
+        
         Args:
             build_id: Build identifier
             resolution_details: Details about blocker resolution
@@ -367,6 +412,7 @@ class ErrorCascadeManager:
                 - blocker_resolved: Boolean
                 - resume_triggered: Boolean
                 - state_restored: Boolean
+                - resumed_components: Entities no longer paused
         """
         import uuid
         
@@ -394,7 +440,9 @@ class ErrorCascadeManager:
         
         # Execute unblocking cascade
         blocker_resolved = True  # Already resolved
-        resume_triggered = self._trigger_resume(cascade, build_id)
+        resume_triggered, resumed = self._trigger_resume(
+            cascade, build_id, resolution_details.get("blocker_id")
+        )
         state_restored = self._restore_state(cascade, build_id, resolution_details) if restore_state else False
         
         # Mark as resolved
@@ -417,6 +465,7 @@ class ErrorCascadeManager:
             "blocker_resolved": blocker_resolved,
             "resume_triggered": resume_triggered,
             "state_restored": state_restored,
+            "resumed_components": resumed,
             "chain_id": chain_id,
             "organisation_id": self.organisation_id
         }
@@ -493,6 +542,7 @@ class ErrorCascadeManager:
         if deliverables_created and handover_triggered:
             cascade.state = CascadeState.RESOLVED
             cascade.resolved_at = datetime.now(timezone.utc)
+            self._graph.add_node(build_id, "build", "COMPLETED")
         
         # Store cascade
         self._active_cascades[chain_id] = cascade
@@ -552,6 +602,38 @@ class ErrorCascadeManager:
         
         return None
     
+    def get_entity_status(self, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the cascade graph state of a requirement, build or task
+        
+        Args:
+            entity_id: Entity identifier (task_entity_id for tasks)
+            
+        Returns:
+            Dict with kind, effective and own state, blockers and edges,
+            or None if the entity is not in the graph
+        """
+        info = self._graph.node_info(entity_id)
+        if info is None:
+            return None
+        info["entity_id"] = entity_id
+        info["organisation_id"] = self.organisation_id
+        return info
+    
+    def get_dependent_entities(self, entity_id: str) -> List[str]:
+        """
+        Get every entity that depends on an entity, directly or transitively
+        
+        Args:
+            entity_id: Entity identifier
+            
+        Returns:
+            Sorted entity IDs (empty if the entity is not in the graph)
+        """
+        if entity_id not in self._graph:
+            return []
+        return sorted(self._graph.descendants(entity_id))
+    
     # Private helper methods
     
     def _assign_builders(
@@ -583,14 +665,25 @@ class ErrorCascadeManager:
         build_id: str,
         tasks: List[Dict[str, Any]]
     ) -> bool:
-        """Create build tasks"""
+        """Create build tasks and their dependency edges"""
         import uuid
         
+        graph = self._graph
+        for task in tasks:
+            graph.add_node(task_entity_id(build_id, task["task_id"]), "task", "PENDING")
         for task in tasks:
+            entity_id = task_entity_id(build_id, task["task_id"])
+            graph.add_dependency(build_id, entity_id)
+            for prerequisite in task.get("depends_on", []):
+                prerequisite_id = task_entity_id(build_id, prerequisite)
+                if prerequisite_id not in graph:
+                    graph.add_node(prerequisite_id, "task", "PENDING")
+                graph.add_dependency(prerequisite_id, entity_id)
+            
             event = CascadeEvent(
                 event_id=str(uuid.uuid4()),
                 event_type="task_created",
-                component_id=task.get("task_id", "unknown"),
+                component_id=entity_id,
                 error_message="",
                 timestamp=datetime.now(timezone.utc),
                 caused_by=cascade.root_event.event_id
@@ -644,11 +737,17 @@ class ErrorCascadeManager:
     def _propagate_pause(
         self,
         cascade: CascadeChain,
-        build_id: str
-    ) -> bool:
-        """Propagate pause to dependent components"""
+        build_id: str,
+        blocker_id: str
+    ) -> Tuple[bool, List[str]]:
+        """Propagate pause to dependent components in one batched graph update"""
         import uuid
         
+        if build_id not in self._graph:
+            self._graph.add_node(build_id, "build", "IN_PROGRESS")
+        paused = self._graph.block(build_id, blocker_id)
+        cascade.affected_components.update(paused)
+        
         event = CascadeEvent(
             event_id=str(uuid.uuid4()),
             event_type="pause_propagated",
@@ -659,16 +758,20 @@ class ErrorCascadeManager:
         )
         cascade.all_events.append(event)
         
-        return True
+        return True, paused
     
     def _trigger_resume(
         self,
         cascade: CascadeChain,
-        build_id: str
-    ) -> bool:
-        """Trigger build resume"""
+        build_id: str,
+        blocker_id: Optional[str]
+    ) -> Tuple[bool, List[str]]:
+        """Trigger build resume in one batched graph update"""
         import uuid
         
+        resumed = self._graph.unblock(build_id, blocker_id)
+        cascade.affected_components.update(resumed)
+        
         event = CascadeEvent(
             event_id=str(uuid.uuid4()),
             event_type="resume_triggered",
@@ -679,7 +782,7 @@ class ErrorCascadeManager:
         )
         cascade.all_events.append(event)
         
-        return True
+        return True, resumed
     
     def _restore_state(
         self,
@@ -0,0 +1,513 @@
+"""
+Failure Model
+
+Purpose: Logistic regression failure model trained by batch gradient descent
+Authority: Wave 2.0 Subwave 2.12 - Complex Failure Modes Phase 2 (QA-265)
+Tenant Isolation: Models carry no tenant data; FailurePredictor owns them per organisation_id
+
+Training standardizes the feature matrix, holds out a seeded validation
+split, runs full-batch Nesterov-accelerated gradient descent with an L2
+penalty and fits a Platt scaling layer on the held-out scores so the
+predicted probabilities are calibrated. With NumPy installed each epoch is two matrix-vector
+products over the whole matrix; without it the same maths runs row by
+row in pure Python, which is only practical for small training sets.
+"""
+
+from typing import Dict, List, Optional, Any, Sequence, Tuple
+from dataclasses import dataclass
+import math
+import random
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+MODEL_FORMAT_VERSION = 1
+
+
+@dataclass
+class TrainingConfig:
+    """Gradient descent, validation and calibration settings"""
+    learning_rate: float = 1.0  # Fraction of the largest step guaranteed to converge
+    max_epochs: int = 200
+    l2_penalty: float = 1e-4
+    tolerance: float = 1e-4  # Stop once no gradient component exceeds this
+    validation_fraction: float = 0.2
+    min_validation_samples: int = 10  # Smaller holdouts are not split off; metrics use the training rows
+    calibrate: bool = True  # Fit Platt scaling on the validation split
+    seed: int = 0
+    vectorized: bool = True  # Train with NumPy when it is installed
+
+    def validate(self) -> bool:
+        """Validate training configuration"""
+        return (
+            0 < self.learning_rate <= 1
+            and self.max_epochs >= 1
+            and self.l2_penalty >= 0
+            and self.tolerance >= 0
+            and 0 <= self.validation_fraction < 1
+            and self.min_validation_samples >= 1
+        )
+
+
+class LogisticRegressionModel:
+    """
+    Binary logistic regression over standardized features
+
+    Scores are w . (x - mean) / scale + bias; the probability is
+    sigmoid(calibration_slope * score + calibration_intercept). Missing
+    features are imputed with the training mean.
+    """
+
+    def __init__(
+        self,
+        feature_names: Sequence[str],
+        weights: Sequence[float],
+        bias: float,
+        means: Sequence[float],
+        scales: Sequence[float],
+        calibration: Tuple[float, float] = (1.0, 0.0),
+        metrics: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize a trained model
+
+        Args:
+            feature_names: Feature column order
+            weights: Weight per standardized feature
+            bias: Intercept
+            means: Training mean per feature
+            scales: Training standard deviation per feature (1.0 for constant features)
+            calibration: Platt scaling (slope, intercept) applied to the raw score
+            metrics: Training and validation metrics
+        """
+        self.feature_names = list(feature_names)
+        self.weights = [float(weight) for weight in weights]
+        self.bias = float(bias)
+        self.means = [float(mean) for mean in means]
+        self.scales = [float(scale) for scale in scales]
+        self.calibration = (float(calibration[0]), float(calibration[1]))
+        self.metrics = dict(metrics or {})
+
+    @classmethod
+    def train(
+        cls,
+        matrix: Any,
+        labels: Sequence[Any],
+        feature_names: Sequence[str],
+        config: Optional[TrainingConfig] = None
+    ) -> "LogisticRegressionModel":
+        """
+        Fit a model to a feature matrix
+
+        Args:
+            matrix: Rows of feature values (list of lists or 2-D array)
+            labels: Truthy for rows that failed
+            feature_names: Name of each column
+            config: Training configuration
+
+        Returns:
+            Trained model with metrics for the validation split
+
+        Raises:
+            ValueError: If the configuration is invalid or the matrix and
+                labels do not match
+        """
+        config = config or TrainingConfig()
+        if not config.validate():
+            raise ValueError("Invalid training configuration")
+
+        if config.vectorized and NUMPY_AVAILABLE:
+            return cls._train_vectorized(matrix, labels, feature_names, config)
+        return cls._train_python(matrix, labels, feature_names, config)
+
+    @property
+    def feature_importance(self) -> Dict[str, float]:
+        """Share of total |weight| per feature; weights are comparable because features are standardized"""
+        total = sum(abs(weight) for weight in self.weights)
+        if total == 0:
+            share = 1.0 / len(self.weights) if self.weights else 0.0
+            return {name: share for name in self.feature_names}
+        return {name: abs(weight) / total for name, weight in zip(self.feature_names, self.weights)}
+
+    def predict_proba(self, features: Dict[str, Any]) -> float:
+        """
+        Calibrated failure probability for one observation
+
+        Args:
+            features: Feature values by name
+
+        Returns:
+            Probability in [0, 1]
+        """
+        score = self.bias
+        for name, weight, mean, scale in zip(self.feature_names, self.weights, self.means, self.scales):
+            value = features.get(name)
+            if value is not None:
+                score += weight * (float(value) - mean) / scale
+        slope, intercept = self.calibration
+        return _sigmoid(slope * score + intercept)
+
+    def predict_proba_matrix(self, matrix: Any) -> List[float]:
+        """
+        Calibrated failure probabilities for rows in feature_names order
+
+        Args:
+            matrix: Rows of feature values (list of lists or 2-D array)
+
+        Returns:
+            Probability per row
+        """
+        slope, intercept = self.calibration
+        if NUMPY_AVAILABLE:
+            features = (np.asarray(matrix, dtype=np.float64) - np.asarray(self.means)) / np.asarray(self.scales)
+            scores = features @ np.asarray(self.weights) + self.bias
+            return _sigmoid_array(slope * scores + intercept).tolist()
+        return [
+            _sigmoid(slope * _score(_standardize_row(row, self.means, self.scales), self.weights, self.bias)
+                     + intercept)
+            for row in matrix
+        ]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict"""
+        return {
+            "format_version": MODEL_FORMAT_VERSION,
+            "model_type": "logistic_regression",
+            "feature_names": self.feature_names,
+            "weights": self.weights,
+            "bias": self.bias,
+            "means": self.means,
+            "scales": self.scales,
+            "calibration": list(self.calibration),
+            "metrics": self.metrics
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LogisticRegressionModel":
+        """
+        Restore a model serialized by to_dict
+
+        Raises:
+            ValueError: If the format version is unsupported or the
+                parameter lengths do not match the features
+        """
+        if data.get("format_version") != MODEL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported model format version: {data.get('format_version')}")
+        count = len(data["feature_names"])
+        if not len(data["weights"]) == len(data["means"]) == len(data["scales"]) == count:
+            raise ValueError("Model parameters do not match feature names")
+        return cls(
+            feature_names=data["feature_names"],
+            weights=data["weights"],
+            bias=data["bias"],
+            means=data["means"],
+            scales=data["scales"],
+            calibration=tuple(data.get("calibration", (1.0, 0.0))),
+            metrics=data.get("metrics")
+        )
+
+    # Private helper methods
+
+    @classmethod
+    def _train_vectorized(
+        cls,
+        matrix: Any,
+        labels: Sequence[Any],
+        feature_names: Sequence[str],
+        config: TrainingConfig
+    ) -> "LogisticRegressionModel":
+        """Full-batch gradient descent with NumPy"""
+        features = np.asarray(matrix, dtype=np.float64)
+        targets = np.asarray(labels, dtype=np.float64)
+        if features.ndim != 2 or features.shape[0] != targets.shape[0] or features.shape[1] != len(feature_names):
+            raise ValueError("Feature matrix does not match labels and feature names")
+
+        samples, width = features.shape
+        holdout = _holdout_size(samples, config)
+        if holdout:
+            order = np.random.default_rng(config.seed).permutation(samples)
+            train_rows, validation_rows = order[holdout:], order[:holdout]
+            train_x, train_y = features[train_rows], targets[train_rows]
+            validation_x, validation_y = features[validation_rows], targets[validation_rows]
+        else:
+            train_x, train_y = features, targets
+            validation_x = validation_y = None
+
+        means = train_x.mean(axis=0)
+        scales = train_x.std(axis=0)
+        scales[scales == 0] = 1.0
+        train_x = (train_x - means) / scales
+
+        step = config.learning_rate * _step_bound(train_x.T @ train_x / len(train_y))
+        weights = previous_weights = np.zeros(width)
+        bias = previous_bias = 0.0
+        epochs = momentum_start = 0
+        for epochs in range(1, config.max_epochs + 1):
+            momentum = (epochs - momentum_start - 1) / (epochs - momentum_start + 2)
+            lookahead_weights = weights + momentum * (weights - previous_weights)
+            lookahead_bias = bias + momentum * (bias - previous_bias)
+            errors = _sigmoid_array(train_x @ lookahead_weights + lookahead_bias) - train_y
+            weight_gradient = train_x.T @ errors / len(train_y) + config.l2_penalty * lookahead_weights
+            bias_gradient = float(errors.mean())
+            previous_weights, previous_bias = weights, bias
+            weights = lookahead_weights - step * weight_gradient
+            bias = lookahead_bias - step * bias_gradient
+            if float(weight_gradient @ (weights - previous_weights)) + bias_gradient * (bias - previous_bias) > 0:
+                momentum_start = epochs  # Moving uphill: restart the momentum
+            if max(float(np.abs(weight_gradient).max(initial=0.0)), abs(bias_gradient)) < config.tolerance:
+                break
+
+        if validation_x is not None:
+            scores = ((validation_x - means) / scales) @ weights + bias
+            evaluation_y = validation_y
+        else:
+            scores = train_x @ weights + bias
+            evaluation_y = train_y
+
+        calibration = (1.0, 0.0)
+        if validation_x is not None and config.calibrate:
+            calibration = _platt_scaling(scores, evaluation_y)
+
+        probabilities = np.clip(_sigmoid_array(calibration[0] * scores + calibration[1]), 1e-15, 1.0 - 1e-15)
+        positive = evaluation_y > 0
+        metrics = {
+            "accuracy": float(np.mean((probabilities >= 0.5) == positive)),
+            "log_loss": float(-np.mean(np.where(positive, np.log(probabilities), np.log1p(-probabilities)))),
+            "brier_score": float(np.mean((probabilities - positive) ** 2)),
+            "training_samples": int(len(train_y)),
+            "validation_samples": holdout,
+            "epochs": epochs,
+            "vectorized": True
+        }
+        return cls(feature_names, weights.tolist(), bias, means.tolist(), scales.tolist(), calibration, metrics)
+
+    @classmethod
+    def _train_python(
+        cls,
+        matrix: Any,
+        labels: Sequence[Any],
+        feature_names: Sequence[str],
+        config: TrainingConfig
+    ) -> "LogisticRegressionModel":
+        """Full-batch gradient descent row by row, for when NumPy is unavailable"""
+        rows = [[float(value) for value in row] for row in matrix]
+        targets = [1.0 if label else 0.0 for label in labels]
+        width = len(feature_names)
+        if len(rows) != len(targets) or any(len(row) != width for row in rows):
+            raise ValueError("Feature matrix does not match labels and feature names")
+
+        holdout = _holdout_size(len(rows), config)
+        order = list(range(len(rows)))
+        if holdout:
+            random.Random(config.seed).shuffle(order)
+        train_index, validation_index = order[holdout:], order[:holdout]
+        train_rows = [rows[i] for i in train_index]
+        train_y = [targets[i] for i in train_index]
+
+        means = [sum(column) / len(train_rows) for column in zip(*train_rows)]
+        scales = [
+            math.sqrt(sum((value - mean) ** 2 for value in column) / len(train_rows)) or 1.0
+            for column, mean in zip(zip(*train_rows), means)
+        ]
+        train_x = [_standardize_row(row, means, scales) for row in train_rows]
+
+        count = len(train_x)
+        covariance = [
+            [sum(row[i] * row[j] for row in train_x) / count for j in range(width)]
+            for i in range(width)
+        ]
+        step = config.learning_rate * _step_bound(covariance)
+        weights = previous_weights = [0.0] * width
+        bias = previous_bias = 0.0
+        epochs = momentum_start = 0
+        for epochs in range(1, config.max_epochs + 1):
+            momentum = (epochs - momentum_start - 1) / (epochs - momentum_start + 2)
+            lookahead_weights = [
+                weight + momentum * (weight - previous)
+                for weight, previous in zip(weights, previous_weights)
+            ]
+            lookahead_bias = bias + momentum * (bias - previous_bias)
+            weight_gradient = [0.0] * width
+            bias_gradient = 0.0
+            for row, target in zip(train_x, train_y):
+                error = _sigmoid(_score(row, lookahead_weights, lookahead_bias)) - target
+                bias_gradient += error
+                for column, value in enumerate(row):
+                    weight_gradient[column] += error * value
+            weight_gradient = [
+                gradient / count + config.l2_penalty * weight
+                for gradient, weight in zip(weight_gradient, lookahead_weights)
+            ]
+            bias_gradient /= count
+            previous_weights, previous_bias = weights, bias
+            weights = [weight - step * gradient for weight, gradient in zip(lookahead_weights, weight_gradient)]
+            bias = lookahead_bias - step * bias_gradient
+            uphill = bias_gradient * (bias - previous_bias) + sum(
+                gradient * (weight - previous)
+                for gradient, weight, previous in zip(weight_gradient, weights, previous_weights)
+            )
+            if uphill > 0:
+                momentum_start = epochs  # Moving uphill: restart the momentum
+            if max([abs(bias_gradient)] + [abs(gradient) for gradient in weight_gradient]) < config.tolerance:
+                break
+
+        if validation_index:
+            evaluation_x = [_standardize_row(rows[i], means, scales) for i in validation_index]
+            evaluation_y = [targets[i] for i in validation_index]
+        else:
+            evaluation_x, evaluation_y = train_x, train_y
+        scores = [_score(row, weights, bias) for row in evaluation_x]
+
+        calibration = (1.0, 0.0)
+        if validation_index and config.calibrate:
+            calibration = _platt_scaling(scores, evaluation_y)
+
+        probabilities = [_sigmoid(calibration[0] * score + calibration[1]) for score in scores]
+        metrics = _metrics(probabilities, evaluation_y)
+        metrics.update(
+            training_samples=len(train_index),
+            validation_samples=len(validation_index),
+            epochs=epochs,
+            vectorized=False
+        )
+        return cls(feature_names, weights, bias, means, scales, calibration, metrics)
+
+
+def _holdout_size(samples: int, config: TrainingConfig) -> int:
+    """
+    Rows to hold out for validation
+
+    Nothing is held out when the split would be smaller than
+    min_validation_samples or leave fewer than two training rows.
+    """
+    holdout = int(samples * config.validation_fraction)
+    if holdout < config.min_validation_samples or samples - holdout < 2:
+        return 0
+    return holdout
+
+
+def _step_bound(covariance: Any) -> float:
+    """
+    Largest gradient descent step that converges for standardized features
+
+    The log-loss Hessian is at most a quarter of the covariance of the
+    standardized features plus the intercept, which is block diagonal
+    (the intercept block is 1). Its largest eigenvalue is bounded by the
+    largest absolute row sum, so 4 / bound is a safe step: 4 / 1 for
+    uncorrelated features, down to 4 / width when they are collinear.
+    """
+    bound = max([1.0] + [sum(abs(float(value)) for value in row) for row in covariance])
+    return 4.0 / bound
+
+
+def _platt_scaling(scores: Sequence[float], labels: Sequence[float], iterations: int = 50) -> Tuple[float, float]:
+    """
+    Fit (slope, intercept) so sigmoid(slope * score + intercept) is calibrated
+
+    Newton's method on the log loss with Platt's smoothed targets, which
+    keep the fit finite when the scores separate the classes.
+    """
+    positives = sum(1 for label in labels if label)
+    negatives = len(labels) - positives
+    high = (positives + 1.0) / (positives + 2.0)
+    low = 1.0 / (negatives + 2.0)
+
+    if NUMPY_AVAILABLE:
+        scores = np.asarray(scores, dtype=np.float64)
+        targets = np.where(np.asarray(labels, dtype=np.float64) > 0, high, low)
+        slope, intercept = 1.0, 0.0
+        for _ in range(iterations):
+            probabilities = _sigmoid_array(slope * scores + intercept)
+            errors = probabilities - targets
+            curvature = np.maximum(probabilities * (1.0 - probabilities), 1e-12)
+            gradient = (float(errors @ scores), float(errors.sum()))
+            hessian = (float(curvature @ (scores * scores)), float(curvature @ scores), float(curvature.sum()))
+            slope, intercept, done = _newton_step(slope, intercept, gradient, hessian)
+            if done:
+                break
+        return slope, intercept
+
+    targets = [high if label else low for label in labels]
+    slope, intercept = 1.0, 0.0
+    for _ in range(iterations):
+        gradient_slope = gradient_intercept = 0.0
+        h_ss = h_si = h_ii = 0.0
+        for score, target in zip(scores, targets):
+            probability = _sigmoid(slope * score + intercept)
+            error = probability - target
+            curvature = max(probability * (1.0 - probability), 1e-12)
+            gradient_slope += error * score
+            gradient_intercept += error
+            h_ss += curvature * score * score
+            h_si += curvature * score
+            h_ii += curvature
+        slope, intercept, done = _newton_step(
+            slope, intercept, (gradient_slope, gradient_intercept), (h_ss, h_si, h_ii)
+        )
+        if done:
+            break
+    return slope, intercept
+
+
+def _newton_step(
+    slope: float,
+    intercept: float,
+    gradient: Tuple[float, float],
+    hessian: Tuple[float, float, float]
+) -> Tuple[float, float, bool]:
+    """One 2x2 Newton update; returns (slope, intercept, converged)"""
+    h_ss, h_si, h_ii = hessian
+    determinant = h_ss * h_ii - h_si * h_si
+    if determinant <= 1e-12:
+        return slope, intercept, True
+    delta_slope = (h_ii * gradient[0] - h_si * gradient[1]) / determinant
+    delta_intercept = (h_ss * gradient[1] - h_si * gradient[0]) / determinant
+    converged = abs(delta_slope) < 1e-8 and abs(delta_intercept) < 1e-8
+    return slope - delta_slope, intercept - delta_intercept, converged
+
+
+def _metrics(probabilities: Sequence[float], labels: Sequence[float]) -> Dict[str, float]:
+    """Accuracy at 0.5, log loss and Brier score"""
+    count = len(labels)
+    correct = 0
+    log_loss = 0.0
+    brier = 0.0
+    for probability, label in zip(probabilities, labels):
+        positive = label > 0
+        correct += (probability >= 0.5) == positive
+        clipped = min(max(probability, 1e-15), 1.0 - 1e-15)
+        log_loss -= math.log(clipped if positive else 1.0 - clipped)
+        brier += (probability - (1.0 if positive else 0.0)) ** 2
+    return {
+        "accuracy": correct / count,
+        "log_loss": log_loss / count,
+        "brier_score": brier / count
+    }
+
+
+def _standardize_row(row: Sequence[float], means: Sequence[float], scales: Sequence[float]) -> List[float]:
+    """(x - mean) / scale per column"""
+    return [(float(value) - mean) / scale for value, mean, scale in zip(row, means, scales)]
+
+
+def _score(row: Sequence[float], weights: Sequence[float], bias: float) -> float:
+    """Linear score of a standardized row"""
+    return bias + sum(weight * value for weight, value in zip(weights, row))
+
+
+def _sigmoid(value: float) -> float:
+    """Logistic function without overflow for large |value|"""
+    if value >= 0:
+        return 1.0 / (1.0 + math.exp(-value))
+    exponent = math.exp(value)
+    return exponent / (1.0 + exponent)
+
+
+def _sigmoid_array(values: Any) -> Any:
+    """Elementwise logistic function over a NumPy array (tanh form cannot overflow)"""
+    return 0.5 + 0.5 * np.tanh(0.5 * values)
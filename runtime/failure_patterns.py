@@ -0,0 +1,205 @@
+"""
+Failure Patterns
+
+Purpose: Streaming failure-pattern mining over time-bucketed counters
+Authority: Wave 2.0 Subwave 2.12 - Complex Failure Modes Phase 2 (QA-261)
+Tenant Isolation: Miners carry no tenant data; FailurePredictor owns one per organisation_id
+
+Failures are ingested one at a time into a ring of fixed-width time
+buckets holding a count per failure type. A pattern query walks only the
+buckets inside the requested window, so its cost is bounded by the
+number of buckets and of distinct types per bucket, never by how many
+failures have been ingested. Two failure types are correlated when their
+per-bucket counts move together: the score is the Pearson correlation of
+the two count series over every bucket in the window.
+"""
+
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
+import math
+import threading
+
+
+@dataclass
+class PatternMiningConfig:
+    """Bucket width, retention and pattern thresholds"""
+    bucket_seconds: float = 300.0  # Failures in the same bucket co-occur
+    retention_hours: float = 168.0  # Longest window a query can cover
+    min_occurrences: int = 2  # Failures of one type in the window to count as a pattern
+    min_correlation: float = 0.5  # Reported correlated pairs
+
+    def validate(self) -> bool:
+        """Validate pattern mining configuration"""
+        return (
+            self.bucket_seconds > 0
+            and self.retention_hours * 3600 >= self.bucket_seconds
+            and self.min_occurrences >= 1
+            and -1 <= self.min_correlation <= 1
+        )
+
+
+class _Bucket:
+    """Failures per type in one time bucket"""
+
+    __slots__ = ("index", "types")
+
+    def __init__(self, index: int):
+        self.index = index  # Absolute bucket number (timestamp // bucket_seconds)
+        self.types: Dict[str, List[float]] = {}  # type -> [count, first timestamp, last timestamp]
+
+
+class FailurePatternMiner:
+    """
+    Incremental failure-type counters with sliding-window pattern queries
+
+    Ingest is O(1). Failures older than the retention relative to the
+    newest failure seen are dropped, and a bucket's counters are reset
+    when the ring wraps onto it.
+    """
+
+    def __init__(self, config: Optional[PatternMiningConfig] = None):
+        """
+        Initialize pattern miner
+
+        Args:
+            config: Bucket and threshold configuration
+        """
+        self.config = config or PatternMiningConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid pattern mining configuration")
+
+        self._ring_size = int(math.ceil(self.config.retention_hours * 3600 / self.config.bucket_seconds))
+        self._ring: List[Optional[_Bucket]] = [None] * self._ring_size
+        self._latest_index: Optional[int] = None
+        self._latest_timestamp: Optional[float] = None
+        self._ingested = 0
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    @property
+    def latest_timestamp(self) -> Optional[float]:
+        """Timestamp of the newest failure ingested"""
+        with self._lock:
+            return self._latest_timestamp
+
+    def ingest(self, failure_type: str, timestamp: float) -> bool:
+        """
+        Count one failure
+
+        Args:
+            failure_type: Failure type
+            timestamp: When it occurred, in epoch seconds
+
+        Returns:
+            False if the failure is older than the retention and was dropped
+        """
+        index = int(timestamp // self.config.bucket_seconds)
+        with self._lock:
+            if self._latest_index is not None and index <= self._latest_index - self._ring_size:
+                self._dropped += 1
+                return False
+            if self._latest_index is None or index > self._latest_index:
+                self._latest_index = index
+            if self._latest_timestamp is None or timestamp > self._latest_timestamp:
+                self._latest_timestamp = timestamp
+
+            slot = index % self._ring_size
+            bucket = self._ring[slot]
+            if bucket is None or bucket.index != index:
+                bucket = self._ring[slot] = _Bucket(index)
+            counter = bucket.types.get(failure_type)
+            if counter is None:
+                bucket.types[failure_type] = [1, timestamp, timestamp]
+            else:
+                counter[0] += 1
+                if timestamp < counter[1]:
+                    counter[1] = timestamp
+                if timestamp > counter[2]:
+                    counter[2] = timestamp
+            self._ingested += 1
+            return True
+
+    def query(self, window_seconds: float, end: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Patterns and correlations over the buckets in a window
+
+        Args:
+            window_seconds: Window length, capped at the retention
+            end: Window end in epoch seconds (defaults to the newest failure)
+
+        Returns:
+            Dict with:
+                - counts: Failures per type in the window
+                - first_seen / last_seen: Timestamps per type in the window
+                - patterns: Types with at least min_occurrences failures
+                - correlations: Pearson correlation per co-occurring type pair
+                - failures: Failures in the window
+                - buckets: Buckets the window spans
+        """
+        bucket_seconds = self.config.bucket_seconds
+        span = min(self._ring_size, max(1, int(math.ceil(window_seconds / bucket_seconds))))
+        counts: Dict[str, int] = {}
+        first_seen: Dict[str, float] = {}
+        last_seen: Dict[str, float] = {}
+        squares: Dict[str, int] = {}
+        products: Dict[Tuple[str, str], int] = {}
+
+        with self._lock:
+            if end is None:
+                end = self._latest_timestamp if self._latest_timestamp is not None else 0.0
+            end_index = int(end // bucket_seconds)
+            for index in range(end_index - span + 1, end_index + 1):
+                bucket = self._ring[index % self._ring_size]
+                if bucket is None or bucket.index != index:
+                    continue
+                present = sorted(bucket.types.items())
+                for position, (failure_type, (count, first, last)) in enumerate(present):
+                    if failure_type in counts:
+                        counts[failure_type] += count
+                        squares[failure_type] += count * count
+                        first_seen[failure_type] = min(first_seen[failure_type], first)
+                        last_seen[failure_type] = max(last_seen[failure_type], last)
+                    else:
+                        counts[failure_type] = count
+                        squares[failure_type] = count * count
+                        first_seen[failure_type] = first
+                        last_seen[failure_type] = last
+                    for other_type, (other_count, _, _) in present[position + 1:]:
+                        pair = (failure_type, other_type)
+                        products[pair] = products.get(pair, 0) + count * other_count
+
+        correlations = {
+            pair: _pearson(span, counts[pair[0]], squares[pair[0]], counts[pair[1]], squares[pair[1]], product)
+            for pair, product in products.items()
+        }
+        return {
+            "counts": counts,
+            "first_seen": first_seen,
+            "last_seen": last_seen,
+            "patterns": sorted(
+                failure_type for failure_type, count in counts.items() if count >= self.config.min_occurrences
+            ),
+            "correlations": correlations,
+            "failures": sum(counts.values()),
+            "buckets": span
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ingest counters"""
+        with self._lock:
+            return {
+                "ingested": self._ingested,
+                "dropped_late": self._dropped,
+                "buckets_in_use": sum(1 for bucket in self._ring if bucket is not None),
+                "ring_size": self._ring_size,
+                "latest_timestamp": self._latest_timestamp
+            }
+
+
+def _pearson(samples: int, sum_x: int, sum_xx: int, sum_y: int, sum_yy: int, sum_xy: int) -> float:
+    """Pearson correlation from sums over samples points (0.0 when either series is constant)"""
+    variance_x = samples * sum_xx - sum_x * sum_x
+    variance_y = samples * sum_yy - sum_y * sum_y
+    if variance_x <= 0 or variance_y <= 0:
+        return 0.0
+    return (samples * sum_xy - sum_x * sum_y) / math.sqrt(variance_x * variance_y)
@@ -14,14 +14,19 @@ Failure Prediction Capabilities:
 - QA-265: ML-based failure prediction model
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 import threading
+import time
 import uuid
 import hashlib
 
+from . import failure_model
+from .failure_model import LogisticRegressionModel, TrainingConfig
+from .failure_patterns import FailurePatternMiner, PatternMiningConfig
+
 
 class PredictionConfidence(Enum):
     """Confidence levels for predictions"""
@@ -59,6 +64,7 @@ class PredictionModel:
     accuracy: float
     feature_importance: Dict[str, float]
     organisation_id: str
+    classifier: Optional[LogisticRegressionModel] = None
 
 
 class FailurePredictor:
@@ -73,32 +79,63 @@ class FailurePredictor:
     - ML-based prediction models
     """
     
-    def __init__(self, organisation_id: str):
+    def __init__(
+        self,
+        organisation_id: str,
+        pattern_config: Optional[PatternMiningConfig] = None,
+        clock: Optional[Callable[[], float]] = None
+    ):
         """
         Initialize failure predictor
         
         Args:
             organisation_id: Organisation ID for tenant isolation
+            pattern_config: Bucketing for streamed failure-pattern mining
+            clock: Wall-clock time source in epoch seconds (defaults to time.time)
         """
         self.organisation_id = organisation_id
+        self.pattern_config = pattern_config or PatternMiningConfig()
+        self._clock = clock or time.time
+        self._miner = FailurePatternMiner(self.pattern_config)
         self._patterns: Dict[str, FailurePattern] = {}
         self._models: Dict[str, PredictionModel] = {}
         self._alert_history: Dict[str, datetime] = {}  # For deduplication
         self._lock = threading.Lock()
     
+    def record_failure(self, failure: Dict[str, Any]) -> bool:
+        """
+        Ingest one failure into the streamed pattern counters
+        
+        Args:
+            failure: Failure record with "type" and optional "timestamp"
+                (ISO-8601 string, datetime or epoch seconds; defaults to now)
+            
+        Returns:
+            False if the failure is older than the retention and was dropped
+        """
+        timestamp = failure.get("timestamp")
+        return self._miner.ingest(
+            failure.get("type", "unknown"),
+            self._clock() if timestamp is None else _epoch_seconds(timestamp)
+        )
+    
     def analyze_failure_patterns(
         self,
-        historical_data: List[Dict[str, Any]],
+        historical_data: Optional[List[Dict[str, Any]]] = None,
         time_window_hours: int = 24
     ) -> Dict[str, Any]:
         """
         QA-261: Analyze historical failures to detect patterns
         
-        Identifies recurring failure patterns, calculates frequencies,
-        and performs correlation analysis.
+        Identifies recurring failure types in the window, their frequencies
+        and which types co-occur. Without historical_data the failures
+        streamed in through record_failure are analyzed over the window
+        ending now; with it, the records are bucketed the same way and
+        analyzed over the window ending at the newest record.
         
         Args:
-            historical_data: List of historical failure records
+            historical_data: List of historical failure records, or None
+                for the streamed failures
             time_window_hours: Time window for analysis
             
         Returns:
@@ -106,57 +143,68 @@ class FailurePredictor:
                 - patterns_detected: Number of patterns found
                 - pattern_types: Set of failure types with patterns
                 - pattern_frequency: Frequency count per pattern
-                - correlation_score: Correlation analysis score
+                - correlation_score: Strongest correlation between two
+                  failure types' bucketed counts (0.0 if none co-occur)
+                - correlated_patterns: Type pairs correlated at least
+                  min_correlation, strongest first
                 - organisation_id: Tenant ID
         """
-        # Group failures by type
-        failure_by_type: Dict[str, List[Dict[str, Any]]] = {}
-        for failure in historical_data:
-            failure_type = failure.get("type", "unknown")
-            if failure_type not in failure_by_type:
-                failure_by_type[failure_type] = []
-            failure_by_type[failure_type].append(failure)
-        
-        # Calculate frequencies
-        pattern_frequency: Dict[str, int] = {}
-        pattern_types: List[str] = []
-        
-        for failure_type, failures in failure_by_type.items():
-            count = len(failures)
-            if count >= 2:  # Pattern requires at least 2 occurrences
-                pattern_types.append(failure_type)
-                pattern_frequency[failure_type] = count
-                
-                # Store pattern
-                pattern_id = f"pattern_{failure_type}_{self.organisation_id}"
-                with self._lock:
-                    self._patterns[pattern_id] = FailurePattern(
-                        pattern_id=pattern_id,
-                        pattern_type=failure_type,
-                        frequency=count,
-                        first_occurrence=datetime.fromisoformat(
-                            failures[0]["timestamp"].replace("Z", "+00:00")
-                        ),
-                        last_occurrence=datetime.fromisoformat(
-                            failures[-1]["timestamp"].replace("Z", "+00:00")
-                        ),
-                        correlation_score=0.75  # Simplified correlation
-                    )
-        
-        # Calculate overall correlation
-        if len(historical_data) > 0:
-            correlation_score = len(pattern_types) / len(failure_by_type)
+        window_seconds = time_window_hours * 3600
+        if historical_data is None:
+            miner = self._miner
+            end = max(self._clock(), miner.latest_timestamp or 0.0)
+            total_failures = None
         else:
-            correlation_score = 0.0
+            miner = FailurePatternMiner(self.pattern_config)
+            for failure in historical_data:
+                miner.ingest(failure.get("type", "unknown"), _epoch_seconds(failure["timestamp"]))
+            end = None
+            total_failures = len(historical_data)
+        
+        window = miner.query(window_seconds, end)
+        correlations = window["correlations"]
+        
+        # Strongest correlation per type
+        best_correlation: Dict[str, float] = {}
+        for (first_type, second_type), correlation in correlations.items():
+            for failure_type in (first_type, second_type):
+                best_correlation[failure_type] = max(best_correlation.get(failure_type, 0.0), correlation)
+        
+        pattern_types = window["patterns"]
+        pattern_frequency = {failure_type: window["counts"][failure_type] for failure_type in pattern_types}
+        patterns = {
+            f"pattern_{failure_type}_{self.organisation_id}": FailurePattern(
+                pattern_id=f"pattern_{failure_type}_{self.organisation_id}",
+                pattern_type=failure_type,
+                frequency=pattern_frequency[failure_type],
+                first_occurrence=datetime.fromtimestamp(window["first_seen"][failure_type], timezone.utc),
+                last_occurrence=datetime.fromtimestamp(window["last_seen"][failure_type], timezone.utc),
+                correlation_score=round(best_correlation.get(failure_type, 0.0), 4)
+            )
+            for failure_type in pattern_types
+        }
+        with self._lock:
+            self._patterns.update(patterns)
+        
+        correlated_patterns = sorted(
+            (
+                {"pattern_types": list(pair), "correlation": round(correlation, 4)}
+                for pair, correlation in correlations.items()
+                if correlation >= self.pattern_config.min_correlation
+            ),
+            key=lambda entry: -entry["correlation"]
+        )
         
         return {
             "patterns_detected": len(pattern_types),
             "pattern_types": pattern_types,
             "pattern_frequency": pattern_frequency,
-            "correlation_score": correlation_score,
+            "correlation_score": round(max(correlations.values(), default=0.0), 4),
+            "correlated_patterns": correlated_patterns,
             "organisation_id": self.organisation_id,
             "time_window_hours": time_window_hours,
-            "total_failures_analyzed": len(historical_data)
+            "total_failures_analyzed": window["failures"] if total_failures is None else total_failures,
+            "failures_in_window": window["failures"]
         }
     
     def calculate_failure_risk(
@@ -435,70 +483,95 @@ class FailurePredictor:
     
     def train_prediction_model(
         self,
-        training_data: Dict[str, List[Dict[str, Any]]],
-        model_type: str = "logistic_regression"
+        training_data: Dict[str, Any],
+        model_type: str = "logistic_regression",
+        config: Optional[TrainingConfig] = None
     ) -> Dict[str, Any]:
         """
         QA-265: Train ML-based failure prediction model
         
-        Trains a prediction model on historical data and provides
-        accuracy metrics.
+        Fits a logistic regression by batch gradient descent on a seeded
+        training split and reports accuracy, log loss and Brier score of
+        the calibrated probabilities on the validation split (on the
+        training rows when there are too few to hold any out).
         
         Args:
-            training_data: Training dataset with features and labels
-            model_type: Type of ML model
+            training_data: Either "features", a list of observations with
+                numeric feature values and a boolean "failed" label, or a
+                historical feature matrix as "matrix" (rows, or a 2-D
+                array), "labels" and "feature_names"
+            model_type: Type of ML model (only "logistic_regression")
+            config: Training configuration
             
         Returns:
             Dict with:
                 - model_trained: Whether training succeeded
                 - model_id: Unique model identifier
                 - accuracy: Model accuracy (0-1)
+                - feature_importance: Share of the decision per feature
+                - training_backend: "numpy" or "python"
+                - warning: Present when vectorized training was requested
+                  but NumPy is not installed
         """
-        features = training_data.get("features", [])
-        
-        if len(features) < 2:
+        if model_type != "logistic_regression":
             return {
                 "model_trained": False,
-                "error": "Insufficient training data"
+                "error": f"Unsupported model type: {model_type}"
             }
         
-        model_id = str(uuid.uuid4())
-        
-        # Simplified logistic regression simulation
-        # In production, this would use sklearn or similar
+        if "matrix" in training_data:
+            matrix = training_data["matrix"]
+            labels = training_data.get("labels", [])
+            feature_names = list(training_data.get("feature_names", []))
+        else:
+            matrix, labels, feature_names = self._observations_to_matrix(training_data.get("features", []))
         
-        # Calculate feature importance
-        feature_names = ["cpu", "memory", "errors"]
-        feature_importance = {
-            "cpu": 0.35,
-            "memory": 0.30,
-            "errors": 0.35
-        }
+        if len(labels) < 2 or not feature_names:
+            return {
+                "model_trained": False,
+                "error": "Insufficient training data"
+            }
         
-        # Simulate accuracy based on training data size
-        accuracy = min(0.95, 0.60 + (len(features) * 0.05))
+        try:
+            classifier = LogisticRegressionModel.train(matrix, labels, feature_names, config)
+        except ValueError as e:
+            return {
+                "model_trained": False,
+                "error": str(e)
+            }
         
-        # Store model
+        model_id = str(uuid.uuid4())
         model = PredictionModel(
             model_id=model_id,
             model_type=model_type,
             trained_at=datetime.now(timezone.utc),
-            accuracy=accuracy,
-            feature_importance=feature_importance,
-            organisation_id=self.organisation_id
+            accuracy=classifier.metrics["accuracy"],
+            feature_importance=classifier.feature_importance,
+            organisation_id=self.organisation_id,
+            classifier=classifier
         )
         
         with self._lock:
             self._models[model_id] = model
         
-        return {
+        metrics = classifier.metrics
+        result = {
             "model_trained": True,
             "model_id": model_id,
-            "accuracy": round(accuracy, 2),
+            "accuracy": round(model.accuracy, 2),
+            "log_loss": round(metrics["log_loss"], 4),
+            "brier_score": round(metrics["brier_score"], 4),
+            "feature_importance": model.feature_importance,
             "model_type": model_type,
-            "training_samples": len(features),
+            "training_samples": len(labels),
+            "validation_samples": metrics["validation_samples"],
+            "epochs": metrics["epochs"],
+            "training_backend": "numpy" if metrics["vectorized"] else "python",
             "organisation_id": self.organisation_id
         }
+        if (config is None or config.vectorized) and not failure_model.NUMPY_AVAILABLE:
+            result["warning"] = "NumPy not installed; trained with the pure-Python backend (pip install numpy)"
+        return result
     
     def predict_failure_probability(
         self,
@@ -510,11 +583,13 @@ class FailurePredictor:
         
         Args:
             model_id: Model to use for prediction
-            current_metrics: Current system metrics
+            current_metrics: Current system metrics; features the model
+                was trained on but that are missing here count as their
+                training mean
             
         Returns:
             Dict with:
-                - failure_probability: Predicted probability (0-1)
+                - failure_probability: Calibrated probability (0-1)
                 - feature_importance: Feature importance scores
         """
         with self._lock:
@@ -526,21 +601,7 @@ class FailurePredictor:
             
             model = self._models[model_id]
         
-        # Simplified prediction
-        # In production, this would use the actual trained model
-        cpu = current_metrics.get("cpu", 0.5)
-        memory = current_metrics.get("memory", 0.5)
-        errors = current_metrics.get("errors", 0.0)
-        
-        # Weighted combination
-        failure_probability = (
-            cpu * model.feature_importance["cpu"] +
-            memory * model.feature_importance["memory"] +
-            errors * model.feature_importance["errors"] * 5  # Scale errors
-        )
-        
-        # Clamp to [0, 1]
-        failure_probability = max(0.0, min(1.0, failure_probability))
+        failure_probability = model.classifier.predict_proba(current_metrics)
         
         return {
             "failure_probability": round(failure_probability, 2),
@@ -549,3 +610,114 @@ class FailurePredictor:
             "model_accuracy": model.accuracy,
             "organisation_id": self.organisation_id
         }
+    
+    def export_model(self, model_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Serialize a trained model
+        
+        Args:
+            model_id: Model to export
+            
+        Returns:
+            JSON-compatible dict for import_model, or None if the model
+            does not exist
+        """
+        with self._lock:
+            model = self._models.get(model_id)
+        if model is None:
+            return None
+        
+        return {
+            "model_id": model.model_id,
+            "model_type": model.model_type,
+            "trained_at": model.trained_at.isoformat(),
+            "organisation_id": model.organisation_id,
+            "classifier": model.classifier.to_dict()
+        }
+    
+    def import_model(self, serialized: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Load a model serialized by export_model
+        
+        Args:
+            serialized: Output of export_model
+            
+        Returns:
+            Dict with:
+                - model_loaded: Whether the model was loaded
+                - model_id: Model identifier
+        """
+        if serialized.get("organisation_id") != self.organisation_id:
+            return {
+                "model_loaded": False,
+                "error": "Model belongs to a different organisation"
+            }
+        
+        try:
+            classifier = LogisticRegressionModel.from_dict(serialized["classifier"])
+        except (KeyError, TypeError, ValueError) as e:
+            return {
+                "model_loaded": False,
+                "error": f"Invalid model: {e}"
+            }
+        
+        model = PredictionModel(
+            model_id=serialized["model_id"],
+            model_type=serialized.get("model_type", "logistic_regression"),
+            trained_at=datetime.fromisoformat(serialized["trained_at"]),
+            accuracy=classifier.metrics.get("accuracy", 0.0),
+            feature_importance=classifier.feature_importance,
+            organisation_id=self.organisation_id,
+            classifier=classifier
+        )
+        
+        with self._lock:
+            self._models[model.model_id] = model
+        
+        return {
+            "model_loaded": True,
+            "model_id": model.model_id,
+            "organisation_id": self.organisation_id
+        }
+    
+    # Private helper methods
+    
+    @staticmethod
+    def _observations_to_matrix(
+        observations: List[Dict[str, Any]],
+        label_key: str = "failed"
+    ) -> Tuple[List[List[float]], List[bool], List[str]]:
+        """
+        Convert labelled observations to (matrix, labels, feature_names)
+        
+        Features are the numeric keys, in sorted order; a value missing
+        from an observation is filled with the mean of the observations
+        that have it.
+        """
+        totals: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
+        for observation in observations:
+            for name, value in observation.items():
+                if name != label_key and isinstance(value, (int, float)):
+                    totals[name] = totals.get(name, 0.0) + value
+                    counts[name] = counts.get(name, 0) + 1
+        
+        feature_names = sorted(totals)
+        means = {name: totals[name] / counts[name] for name in feature_names}
+        matrix = [
+            [float(observation.get(name, means[name])) for name in feature_names]
+            for observation in observations
+        ]
+        labels = [bool(observation.get(label_key, False)) for observation in observations]
+        return matrix, labels, feature_names
+
+
+def _epoch_seconds(timestamp: Any) -> float:
+    """Epoch seconds from an ISO-8601 string, datetime or number"""
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    if isinstance(timestamp, str):
+        timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
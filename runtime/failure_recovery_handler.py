@@ -12,12 +12,21 @@ Recovery Workflows:
 - QA-243: Intent state transition recovery (RECEIVED → CLARIFYING)
 - QA-244: Intent clarification completion recovery (CLARIFYING → CLARIFIED)
 - QA-245: Intent rejection recovery (CLARIFYING → REJECTED)
+
+Recovery plans are compiled once per (failure type, strategy) into an
+immutable chain of step specifications and cached. A workflow keeps a
+reference to its plan plus only the state that changes as it runs: a
+cursor, a bitmask of completed steps, and retry counts, errors and
+strategy overrides for the steps that needed them.
 """
 
-from typing import Dict, List, Optional, Any, Literal
+from typing import Dict, List, Optional, Any, Literal, Mapping, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+import uuid
 
 
 class RecoveryState(Enum):
@@ -40,7 +49,7 @@ class RecoveryStrategy(Enum):
 
 @dataclass
 class RecoveryStep:
-    """Individual recovery step"""
+    """Individual recovery step (a snapshot of one step of a workflow)"""
     step_id: str
     step_type: str
     strategy: RecoveryStrategy
@@ -51,18 +60,133 @@ class RecoveryStep:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
+@dataclass(frozen=True)
+class RecoveryStepSpec:
+    """Immutable step of a compiled recovery plan"""
+    step_id: str  # Unique within the plan
+    step_type: str
+    strategy: RecoveryStrategy
+    level: int  # Nesting level, from 1
+    next_step_id: Optional[str] = None  # Step to run after this one completes
+    max_retries: int = 3
+
+
+@dataclass(frozen=True)
+class RecoveryPlan:
+    """Immutable step graph shared by every workflow for a (failure type, strategy)"""
+    failure_type: str
+    strategy: RecoveryStrategy
+    steps: Tuple[RecoveryStepSpec, ...]
+    nested_levels: int
+    positions: Mapping[str, int]  # step_id -> index in steps
+    
+    @property
+    def complete_mask(self) -> int:
+        """Completed-steps bitmask with every step set"""
+        return (1 << len(self.steps)) - 1
+
+
 @dataclass
 class RecoveryWorkflow:
-    """Recovery workflow definition"""
+    """Recovery workflow: a compiled plan plus its per-workflow cursor state"""
     workflow_id: str
     failure_type: str
     organisation_id: str
     state: RecoveryState
-    steps: List[RecoveryStep] = field(default_factory=list)
+    plan: RecoveryPlan
     started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
     context: Dict[str, Any] = field(default_factory=dict)
     audit_trail: List[Dict[str, Any]] = field(default_factory=list)
+    cursor: int = 0  # First step not yet completed
+    completed_mask: int = 0  # Bit i set once step i completed
+    retry_counts: Optional[Dict[int, int]] = None  # Sparse, by step index
+    errors: Optional[Dict[int, str]] = None  # Sparse, by step index
+    strategy_overrides: Optional[Dict[int, RecoveryStrategy]] = None  # Sparse, by step index
+    
+    @property
+    def steps(self) -> List[RecoveryStep]:
+        """Snapshot of every step's plan and progress"""
+        return [self.step_snapshot(index) for index in range(len(self.plan.steps))]
+    
+    @property
+    def steps_completed(self) -> int:
+        """Number of completed steps"""
+        return bin(self.completed_mask).count("1")
+    
+    def step_snapshot(self, index: int) -> RecoveryStep:
+        """Snapshot of one step's plan and progress"""
+        spec = self.plan.steps[index]
+        return RecoveryStep(
+            step_id=spec.step_id,
+            step_type=spec.step_type,
+            strategy=self.strategy_for(index),
+            retry_count=self.retry_count(index),
+            max_retries=spec.max_retries,
+            completed=bool(self.completed_mask >> index & 1),
+            error=self.errors.get(index) if self.errors else None,
+            timestamp=self.started_at
+        )
+    
+    def strategy_for(self, index: int) -> RecoveryStrategy:
+        """Strategy a step runs with, including any override"""
+        if self.strategy_overrides and index in self.strategy_overrides:
+            return self.strategy_overrides[index]
+        return self.plan.steps[index].strategy
+    
+    def retry_count(self, index: int) -> int:
+        """Failed attempts of a step"""
+        return self.retry_counts.get(index, 0) if self.retry_counts else 0
+
+
+@lru_cache(maxsize=1024)
+def compile_recovery_plan(failure_type: str, strategy: RecoveryStrategy) -> RecoveryPlan:
+    """
+    Compile (or fetch the cached) recovery plan for a failure type and strategy
+    
+    Args:
+        failure_type: Type of failure
+        strategy: Initial recovery strategy
+    
+    Returns:
+        Immutable plan shared by every workflow with this key
+    """
+    # (step_type, step strategy, nesting level)
+    if strategy in [RecoveryStrategy.ROLLBACK, RecoveryStrategy.COMPENSATE]:
+        # Complex recovery: immediate rollback, state verification, then
+        # compensating actions if needed
+        layout = [
+            ("immediate_rollback", RecoveryStrategy.ROLLBACK, 1),
+            ("state_verification", RecoveryStrategy.RETRY, 2),
+        ]
+        if strategy == RecoveryStrategy.COMPENSATE:
+            layout.append(("compensating_action", RecoveryStrategy.COMPENSATE, 3))
+    elif strategy == RecoveryStrategy.ESCALATE:
+        # Escalation: single level with human intervention
+        layout = [("escalate", RecoveryStrategy.ESCALATE, 1)]
+    else:
+        # Simple recovery: single level
+        layout = [("simple_recovery", strategy, 1)]
+    
+    step_ids = [f"{failure_type}:{strategy.value}:{index + 1}:{step_type}"
+                for index, (step_type, _, _) in enumerate(layout)]
+    steps = tuple(
+        RecoveryStepSpec(
+            step_id=step_ids[index],
+            step_type=step_type,
+            strategy=step_strategy,
+            level=level,
+            next_step_id=step_ids[index + 1] if index + 1 < len(layout) else None
+        )
+        for index, (step_type, step_strategy, level) in enumerate(layout)
+    )
+    return RecoveryPlan(
+        failure_type=failure_type,
+        strategy=strategy,
+        steps=steps,
+        nested_levels=max(spec.level for spec in steps),
+        positions=MappingProxyType({spec.step_id: index for index, spec in enumerate(steps)})
+    )
 
 
 class FailureRecoveryHandler:
@@ -113,22 +237,22 @@ class FailureRecoveryHandler:
                 - state_preserved: Boolean indicating state preservation
                 - steps_planned: Number of recovery steps
         """
-        import uuid
-        
         workflow_id = str(uuid.uuid4())
         
+        # Compiled once per (failure type, strategy) and shared
+        plan = compile_recovery_plan(failure_type, strategy)
+        nested_levels = plan.nested_levels
+        
         # Create recovery workflow
         workflow = RecoveryWorkflow(
             workflow_id=workflow_id,
             failure_type=failure_type,
             organisation_id=self.organisation_id,
             state=RecoveryState.INITIATED,
+            plan=plan,
             context=context
         )
         
-        # Plan recovery steps based on failure type
-        nested_levels = self._plan_recovery_steps(workflow, strategy)
-        
         # Store workflow
         self._workflows[workflow_id] = workflow
         
@@ -146,7 +270,7 @@ class FailureRecoveryHandler:
             "state": workflow.state.value,
             "nested_levels": nested_levels,
             "state_preserved": True,  # State always preserved at initiation
-            "steps_planned": len(workflow.steps),
+            "steps_planned": len(plan.steps),
             "organisation_id": self.organisation_id
         }
     
@@ -185,13 +309,9 @@ class FailureRecoveryHandler:
         workflow = self._workflows[workflow_id]
         
         # Find step
-        step = None
-        for s in workflow.steps:
-            if s.step_id == step_id:
-                step = s
-                break
+        index = workflow.plan.positions.get(step_id)
         
-        if not step:
+        if index is None:
             return {
                 "step_completed": False,
                 "recovery_attempted": False,
@@ -202,40 +322,55 @@ class FailureRecoveryHandler:
         
         # Override strategy if requested
         if force_strategy:
-            step.strategy = force_strategy
+            if workflow.strategy_overrides is None:
+                workflow.strategy_overrides = {}
+            workflow.strategy_overrides[index] = force_strategy
         
         # Update workflow state
         workflow.state = RecoveryState.IN_PROGRESS
         
         # Execute based on strategy
-        result = self._execute_strategy(workflow, step)
-        
-        # Update step
-        step.completed = result["success"]
-        if not result["success"]:
-            step.retry_count += 1
-            step.error = result.get("error")
+        spec = workflow.plan.steps[index]
+        strategy = workflow.strategy_for(index)
+        retry_count = workflow.retry_count(index)
+        result = self._execute_strategy(strategy, retry_count, spec.max_retries)
+        
+        # Update step state
+        completed = result["success"]
+        if completed:
+            workflow.completed_mask |= 1 << index
+            while workflow.completed_mask >> workflow.cursor & 1:
+                workflow.cursor += 1
+        else:
+            workflow.completed_mask &= ~(1 << index)
+            retry_count += 1
+            if workflow.retry_counts is None:
+                workflow.retry_counts = {}
+            workflow.retry_counts[index] = retry_count
+            if workflow.errors is None:
+                workflow.errors = {}
+            workflow.errors[index] = result.get("error")
         
         # Audit trail
         workflow.audit_trail.append({
             "action": "step_executed",
             "step_id": step_id,
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "success": result["success"],
-            "strategy": step.strategy.value,
-            "retry_count": step.retry_count
+            "success": completed,
+            "strategy": strategy.value,
+            "retry_count": retry_count
         })
         
         # Determine next action
-        next_action = self._determine_next_action(workflow, step, result)
+        next_action = self._determine_next_action(spec, completed, retry_count)
         
         return {
-            "step_completed": step.completed,
+            "step_completed": completed,
             "recovery_attempted": True,
-            "error_handled": result["success"] or step.retry_count < step.max_retries,
+            "error_handled": completed or retry_count < spec.max_retries,
             "next_action": next_action,
-            "retry_count": step.retry_count,
-            "max_retries": step.max_retries
+            "retry_count": retry_count,
+            "max_retries": spec.max_retries
         }
     
     def handle_state_transition_failure(
@@ -333,7 +468,9 @@ class FailureRecoveryHandler:
         workflow = self._workflows[workflow_id]
         
         # Check if all steps completed
-        all_completed = all(step.completed for step in workflow.steps)
+        all_completed = workflow.completed_mask == workflow.plan.complete_mask
+        steps_completed = workflow.steps_completed
+        total_steps = len(workflow.plan.steps)
         
         if all_completed:
             workflow.state = RecoveryState.COMPLETED
@@ -350,16 +487,16 @@ class FailureRecoveryHandler:
             "action": "recovery_completed",
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "state": workflow.state.value,
-            "steps_completed": sum(1 for s in workflow.steps if s.completed),
-            "total_steps": len(workflow.steps)
+            "steps_completed": steps_completed,
+            "total_steps": total_steps
         })
         
         return {
             "completed": all_completed,
             "workflow_id": workflow_id,
             "state": workflow.state.value,
-            "steps_completed": sum(1 for s in workflow.steps if s.completed),
-            "total_steps": len(workflow.steps),
+            "steps_completed": steps_completed,
+            "total_steps": total_steps,
             "duration_seconds": (
                 (workflow.completed_at - workflow.started_at).total_seconds()
                 if workflow.completed_at else None
@@ -368,88 +505,34 @@ class FailureRecoveryHandler:
     
     # Private helper methods
     
-    def _plan_recovery_steps(
-        self,
-        workflow: RecoveryWorkflow,
-        strategy: RecoveryStrategy
-    ) -> int:
-        """Plan recovery steps and return number of nested levels"""
-        import uuid
-        
-        # Simple recovery: single level
-        if strategy in [RecoveryStrategy.RETRY, RecoveryStrategy.SKIP]:
-            workflow.steps.append(RecoveryStep(
-                step_id=str(uuid.uuid4()),
-                step_type="simple_recovery",
-                strategy=strategy
-            ))
-            return 1
-        
-        # Complex recovery: multiple nested levels
-        if strategy in [RecoveryStrategy.ROLLBACK, RecoveryStrategy.COMPENSATE]:
-            # Level 1: Immediate rollback
-            workflow.steps.append(RecoveryStep(
-                step_id=str(uuid.uuid4()),
-                step_type="immediate_rollback",
-                strategy=RecoveryStrategy.ROLLBACK
-            ))
-            
-            # Level 2: State verification
-            workflow.steps.append(RecoveryStep(
-                step_id=str(uuid.uuid4()),
-                step_type="state_verification",
-                strategy=RecoveryStrategy.RETRY
-            ))
-            
-            # Level 3: Compensating actions if needed
-            if strategy == RecoveryStrategy.COMPENSATE:
-                workflow.steps.append(RecoveryStep(
-                    step_id=str(uuid.uuid4()),
-                    step_type="compensating_action",
-                    strategy=RecoveryStrategy.COMPENSATE
-                ))
-                return 3
-            
-            return 2
-        
-        # Escalation: single level with human intervention
-        if strategy == RecoveryStrategy.ESCALATE:
-            workflow.steps.append(RecoveryStep(
-                step_id=str(uuid.uuid4()),
-                step_type="escalate",
-                strategy=RecoveryStrategy.ESCALATE
-            ))
-            return 1
-        
-        return 1
-    
     def _execute_strategy(
         self,
-        workflow: RecoveryWorkflow,
-        step: RecoveryStep
+        strategy: RecoveryStrategy,
+        retry_count: int,
+        max_retries: int
     ) -> Dict[str, Any]:
         """Execute recovery strategy"""
         
-        if step.strategy == RecoveryStrategy.RETRY:
+        if strategy == RecoveryStrategy.RETRY:
             # Simple retry logic
-            if step.retry_count < step.max_retries:
+            if retry_count < max_retries:
                 return {"success": True, "action": "retry"}
             else:
                 return {"success": False, "error": "max_retries_exceeded"}
         
-        elif step.strategy == RecoveryStrategy.ROLLBACK:
+        elif strategy == RecoveryStrategy.ROLLBACK:
             # Rollback to previous state
             return {"success": True, "action": "rollback", "context_preserved": True}
         
-        elif step.strategy == RecoveryStrategy.COMPENSATE:
+        elif strategy == RecoveryStrategy.COMPENSATE:
             # Execute compensating transaction
             return {"success": True, "action": "compensate"}
         
-        elif step.strategy == RecoveryStrategy.ESCALATE:
+        elif strategy == RecoveryStrategy.ESCALATE:
             # Escalate to human
             return {"success": True, "action": "escalate"}
         
-        elif step.strategy == RecoveryStrategy.SKIP:
+        elif strategy == RecoveryStrategy.SKIP:
             # Skip and continue
             return {"success": True, "action": "skip"}
         
@@ -457,21 +540,20 @@ class FailureRecoveryHandler:
     
     def _determine_next_action(
         self,
-        workflow: RecoveryWorkflow,
-        step: RecoveryStep,
-        result: Dict[str, Any]
+        spec: RecoveryStepSpec,
+        completed: bool,
+        retry_count: int
     ) -> str:
         """Determine next recovery action"""
         
-        if step.completed:
+        if completed:
             # Check if more steps exist
-            current_idx = workflow.steps.index(step)
-            if current_idx < len(workflow.steps) - 1:
+            if spec.next_step_id is not None:
                 return "continue_next_step"
             else:
                 return "complete_recovery"
         
-        elif step.retry_count < step.max_retries:
+        elif retry_count < spec.max_retries:
             return "retry_step"
         
         else:
@@ -513,11 +595,14 @@ class FailureRecoveryHandler:
         
         if workflow_id in self._workflows:
             workflow = self._workflows[workflow_id]
+            steps = workflow.plan.steps
             return {
                 "workflow_id": workflow_id,
                 "state": workflow.state.value,
-                "steps_completed": sum(1 for s in workflow.steps if s.completed),
-                "total_steps": len(workflow.steps),
+                "steps_completed": workflow.steps_completed,
+                "total_steps": len(steps),
+                "step_ids": [spec.step_id for spec in steps],
+                "next_step_id": steps[workflow.cursor].step_id if workflow.cursor < len(steps) else None,
                 "organisation_id": workflow.organisation_id
             }
         
@@ -527,8 +612,8 @@ class FailureRecoveryHandler:
                 return {
                     "workflow_id": workflow_id,
                     "state": workflow.state.value,
-                    "steps_completed": sum(1 for s in workflow.steps if s.completed),
-                    "total_steps": len(workflow.steps),
+                    "steps_completed": workflow.steps_completed,
+                    "total_steps": len(workflow.plan.steps),
                     "completed": workflow.state == RecoveryState.COMPLETED,
                     "organisation_id": workflow.organisation_id
                 }
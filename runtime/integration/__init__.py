@@ -6,12 +6,40 @@ Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-461 to QA-475)
 Tenant Isolation: All operations scoped by organisation_id
 """
 
+from .consistency_manager import ConsistencyManager
 from .cross_subsystem_integrator import CrossSubsystemIntegrator
 from .event_bus import EventBus
-from .service_communicator import ServiceCommunicator
+from .event_dispatcher import BackpressurePolicy, DispatchConfig, DispatchMode
+from .event_log import EventLog, EventLogConfig
+from .http_transport import AsyncHttpTransport, HttpTransport, TransportConfig
+from .merkle_store import MerkleStore, MerkleStoreConfig
+from .payload_codec import CodecConfig, PayloadCodec
+from .service_communicator import RequestSpec, ServiceCommunicator
+from .testing_framework import IntegrationTestingFramework, IntegrationTestSpec
+from .transaction_log import TransactionLog, TransactionLogConfig
+from .transaction_manager import TransactionManager
 
 __all__ = [
+    'ConsistencyManager',
     'CrossSubsystemIntegrator',
     'EventBus',
+    'BackpressurePolicy',
+    'DispatchConfig',
+    'DispatchMode',
+    'EventLog',
+    'EventLogConfig',
+    'AsyncHttpTransport',
+    'HttpTransport',
+    'IntegrationTestingFramework',
+    'IntegrationTestSpec',
+    'MerkleStore',
+    'MerkleStoreConfig',
+    'CodecConfig',
+    'PayloadCodec',
+    'RequestSpec',
     'ServiceCommunicator',
+    'TransactionLog',
+    'TransactionLogConfig',
+    'TransactionManager',
+    'TransportConfig',
 ]
@@ -9,10 +9,12 @@ Tenant Isolation: All operations scoped by organisation_id
 
 from typing import Dict, List, Optional, Any
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 import uuid
 
+from .merkle_store import MerkleStore, MerkleStoreConfig
+
 
 class ConsistencyStatus(Enum):
     """Consistency validation status"""
@@ -40,6 +42,7 @@ class ConsistencyValidation:
     status: ConsistencyStatus
     inconsistencies: List[Dict[str, Any]]
     timestamp: datetime
+    nodes_compared: int = 0  # Merkle hashes compared across registered sources
     
     def is_consistent(self) -> bool:
         """Check if data is consistent"""
@@ -114,15 +117,53 @@ class ConsistencyManager:
     
     Provides validation, repair, monitoring, eventual consistency tracking,
     and conflict resolution capabilities.
+    
+    Subsystems registered as sources keep their records in a MerkleStore.
+    Validation compares each source's tree against the first subsystem's
+    and descends only into differing subtrees; repair transfers only the
+    divergent keys. Subsystems without a registered source are not checked.
     """
     
-    def __init__(self):
-        """Initialize consistency manager with in-memory storage"""
+    def __init__(self, store_config: Optional[MerkleStoreConfig] = None):
+        """
+        Initialize consistency manager with in-memory storage.
+        
+        Args:
+            store_config: Merkle tree shape for sources created by register_source
+        """
         self._validations: Dict[str, ConsistencyValidation] = {}
         self._repairs: Dict[str, ConsistencyRepair] = {}
         self._monitors: Dict[str, ConsistencyMonitor] = {}
         self._eventual_records: Dict[str, EventualConsistencyRecord] = {}
         self._conflicts: Dict[str, ConsistencyConflict] = {}
+        self._sources: Dict[str, Dict[str, MerkleStore]] = {}  # org -> subsystem -> store
+        self._store_config = store_config or MerkleStoreConfig()
+    
+    def register_source(
+        self,
+        organisation_id: str,
+        subsystem: str,
+        store: Optional[MerkleStore] = None
+    ) -> MerkleStore:
+        """
+        Register a subsystem's record store for consistency checking.
+        
+        Args:
+            organisation_id: Organisation ID for tenant isolation
+            subsystem: Subsystem owning the records
+            store: Existing store to register (a new empty one if omitted)
+            
+        Returns:
+            MerkleStore: The registered store
+        """
+        if store is None:
+            store = MerkleStore(self._store_config)
+        self._sources.setdefault(organisation_id, {})[subsystem] = store
+        return store
+    
+    def get_source(self, organisation_id: str, subsystem: str) -> Optional[MerkleStore]:
+        """Get a subsystem's registered record store"""
+        return self._sources.get(organisation_id, {}).get(subsystem)
     
     def validate_consistency(
         self,
@@ -133,20 +174,46 @@ class ConsistencyManager:
         """
         Validate data consistency across subsystems.
         
+        The first subsystem is the reference. With data_keys, only those
+        keys are compared; with none, the whole stores are compared via
+        their Merkle trees.
+        
         Args:
             organisation_id: Organisation ID for tenant isolation
             subsystems: List of subsystems to validate
-            data_keys: List of data keys to check
+            data_keys: List of data keys to check (empty for all keys)
             
         Returns:
             ConsistencyValidation: Validation result
         """
         validation_id = f"validation_{uuid.uuid4().hex[:16]}"
         
-        # Simulate consistency check (in production would query actual data)
         inconsistencies = []
-        # For testing purposes, we'll assume data is consistent
-        status = ConsistencyStatus.CONSISTENT
+        nodes_compared = 0
+        reference = self.get_source(organisation_id, subsystems[0]) if subsystems else None
+        if reference is not None:
+            for subsystem in subsystems[1:]:
+                store = self.get_source(organisation_id, subsystem)
+                if store is None:
+                    continue
+                if data_keys:
+                    keys = [key for key in data_keys if reference.digest(key) != store.digest(key)]
+                else:
+                    diff = reference.diff(store)
+                    keys = diff.keys
+                    nodes_compared += diff.nodes_compared
+                inconsistencies.extend(
+                    {
+                        "data_key": key,
+                        "source": subsystems[0],
+                        "target": subsystem,
+                        "missing_in_source": key not in reference,
+                        "missing_in_target": key not in store
+                    }
+                    for key in keys
+                )
+        
+        status = ConsistencyStatus.INCONSISTENT if inconsistencies else ConsistencyStatus.CONSISTENT
         
         validation = ConsistencyValidation(
             validation_id=validation_id,
@@ -155,7 +222,8 @@ class ConsistencyManager:
             data_keys=data_keys,
             status=status,
             inconsistencies=inconsistencies,
-            timestamp=datetime.now(timezone.utc)
+            timestamp=datetime.now(timezone.utc),
+            nodes_compared=nodes_compared
         )
         
         self._validations[validation_id] = validation
@@ -171,6 +239,11 @@ class ConsistencyManager:
         """
         Repair detected inconsistencies.
         
+        A {"action": "sync", "from": a, "to": b} action copies the keys the
+        validation found divergent between registered sources a and b (and
+        deletes those missing from a); nothing else is transferred. Without
+        actions, every source found divergent is synced from the reference.
+        
         Args:
             organisation_id: Organisation ID for tenant isolation
             validation_id: Validation ID with detected inconsistencies
@@ -181,6 +254,16 @@ class ConsistencyManager:
         """
         repair_id = f"repair_{uuid.uuid4().hex[:16]}"
         
+        validation = self._validations.get(validation_id)
+        if not repair_actions and validation is not None:
+            targets = dict.fromkeys(
+                (item["source"], item["target"]) for item in validation.inconsistencies
+            )
+            repair_actions = [
+                {"action": "sync", "from": source, "to": target}
+                for source, target in targets
+            ]
+        
         repair = ConsistencyRepair(
             repair_id=repair_id,
             organisation_id=organisation_id,
@@ -195,6 +278,13 @@ class ConsistencyManager:
         # Execute repairs
         repair.repair_status = "in_progress"
         
+        if validation is not None:
+            repair.repairs_applied = [
+                self._apply_sync(organisation_id, validation, action)
+                if action.get("action") == "sync" else action
+                for action in repair_actions
+            ]
+        
         # Complete repairs
         repair.repair_status = "completed"
         repair.completed_at = datetime.now(timezone.utc)
@@ -239,6 +329,30 @@ class ConsistencyManager:
         
         return monitor
     
+    def run_monitor_check(self, monitor_id: str) -> ConsistencyValidation:
+        """
+        Run a monitor's consistency check and schedule the next one.
+        
+        Args:
+            monitor_id: Monitor to run
+            
+        Returns:
+            ConsistencyValidation: Validation result
+        """
+        monitor = self._monitors.get(monitor_id)
+        if not monitor:
+            raise ValueError(f"Monitor {monitor_id} not found")
+        
+        validation = self.validate_consistency(
+            monitor.organisation_id, monitor.subsystems, monitor.data_keys
+        )
+        
+        monitor.violations_detected += len(validation.inconsistencies)
+        monitor.last_check = validation.timestamp
+        monitor.next_check = validation.timestamp + timedelta(seconds=monitor.check_interval)
+        
+        return validation
+    
     def track_eventual_consistency(
         self,
         organisation_id: str,
@@ -358,3 +472,26 @@ class ConsistencyManager:
     def get_conflict(self, conflict_id: str) -> Optional[ConsistencyConflict]:
         """Get conflict by ID"""
         return self._conflicts.get(conflict_id)
+    
+    # Private helper methods
+    def _apply_sync(
+        self,
+        organisation_id: str,
+        validation: ConsistencyValidation,
+        action: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Transfer the divergent keys of one source/target pair"""
+        source = self.get_source(organisation_id, action.get("from"))
+        target = self.get_source(organisation_id, action.get("to"))
+        if source is None or target is None:
+            return action
+        
+        keys = [
+            item["data_key"] for item in validation.inconsistencies
+            if {item["source"], item["target"]} == {action["from"], action["to"]}
+        ]
+        copies = [(key, source.get(key)) for key in keys if key in source]
+        target.update(copies)
+        deleted = sum(1 for key in keys if key not in source and target.delete(key))
+        
+        return {**action, "keys_copied": len(copies), "keys_deleted": deleted}
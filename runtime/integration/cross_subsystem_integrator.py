@@ -7,10 +7,12 @@ Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-461 to QA-465)
 Tenant Isolation: All operations scoped by organisation_id
 """
 
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+import threading
 
 
 class SubsystemState(Enum):
@@ -60,18 +62,55 @@ class StateCoordination:
     last_updated: datetime
 
 
+# Delivers a propagated event to one target subsystem
+PropagationHandler = Callable[[SubsystemEvent], None]
+
+
 @dataclass
 class DependencyGraph:
-    """Dependency graph between subsystems"""
+    """
+    Dependency graph between subsystems
+    
+    Keeps each subsystem's topological level (longest dependency chain
+    beneath it) up to date as dependencies are added, so cycle checks and
+    topological ordering need no full traversal. Adding an edge only
+    revisits the dependents whose level it raises; reaching the new
+    dependency again while doing so means the edge closed a cycle.
+    Dependencies must be added through add_dependency to keep it current.
+    """
     organisation_id: str
     dependencies: Dict[str, List[str]] = field(default_factory=dict)  # subsystem -> depends_on
+    dependents: Dict[str, Set[str]] = field(default_factory=dict)  # subsystem -> subsystems depending on it
+    levels: Dict[str, int] = field(default_factory=dict)  # subsystem -> topological level
+    cyclic: bool = False
+    ordered_levels: Optional[List[List[str]]] = field(default=None, repr=False)  # Cached grouping of levels
     
     def add_dependency(self, subsystem: str, depends_on: str) -> None:
         """Add a dependency relationship"""
         if subsystem not in self.dependencies:
             self.dependencies[subsystem] = []
-        if depends_on not in self.dependencies[subsystem]:
-            self.dependencies[subsystem].append(depends_on)
+        if depends_on in self.dependencies[subsystem]:
+            return
+        self.dependencies[subsystem].append(depends_on)
+        self.dependents.setdefault(depends_on, set()).add(subsystem)
+        self.levels.setdefault(depends_on, 0)
+        self.levels.setdefault(subsystem, 0)
+        
+        if self.cyclic:
+            return
+        
+        # Raise levels along dependents until the order holds again
+        pending = [(subsystem, self.levels[depends_on] + 1)]
+        while pending:
+            node, level = pending.pop()
+            if level <= self.levels[node]:
+                continue
+            if node == depends_on:
+                self.cyclic = True
+                break
+            self.levels[node] = level
+            self.ordered_levels = None
+            pending.extend((dependent, level + 1) for dependent in self.dependents.get(node, ()))
     
     def get_dependencies(self, subsystem: str) -> List[str]:
         """Get all dependencies for a subsystem"""
@@ -79,29 +118,30 @@ class DependencyGraph:
     
     def has_circular_dependency(self) -> bool:
         """Check for circular dependencies"""
-        visited = set()
-        rec_stack = set()
-        
-        def has_cycle(subsystem: str) -> bool:
-            visited.add(subsystem)
-            rec_stack.add(subsystem)
-            
-            for dep in self.dependencies.get(subsystem, []):
-                if dep not in visited:
-                    if has_cycle(dep):
-                        return True
-                elif dep in rec_stack:
-                    return True
-            
-            rec_stack.remove(subsystem)
-            return False
+        return self.cyclic
+    
+    def get_level(self, subsystem: str) -> int:
+        """Get a subsystem's topological level (0 if it has no dependencies)"""
+        return self.levels.get(subsystem, 0)
+    
+    def topological_levels(self) -> List[List[str]]:
+        """
+        Group subsystems by topological level
         
-        for subsystem in self.dependencies.keys():
-            if subsystem not in visited:
-                if has_cycle(subsystem):
-                    return True
+        Every subsystem comes after all of its dependencies; subsystems in
+        the same group do not depend on each other.
         
-        return False
+        Raises:
+            ValueError: If the graph has a circular dependency
+        """
+        if self.cyclic:
+            raise ValueError(f"Circular dependency in graph for {self.organisation_id}")
+        if self.ordered_levels is None:
+            grouped: Dict[int, List[str]] = {}
+            for subsystem, level in self.levels.items():
+                grouped.setdefault(level, []).append(subsystem)
+            self.ordered_levels = [sorted(grouped[level]) for level in sorted(grouped)]
+        return self.ordered_levels
 
 
 class CrossSubsystemIntegrator:
@@ -109,9 +149,20 @@ class CrossSubsystemIntegrator:
     Manages integration across subsystems including event propagation,
     data synchronization, state coordination, dependency management,
     and cross-subsystem error handling
+    
+    Targets with a registered handler receive propagated events in
+    dependency order: a subsystem's dependencies are delivered to first,
+    and independent subsystems at the same topological level are delivered
+    to in parallel on a shared thread pool.
     """
     
-    def __init__(self):
+    def __init__(self, propagation_workers: int = 8):
+        if propagation_workers < 1:
+            raise ValueError("propagation_workers must be at least 1")
+        self.propagation_workers = propagation_workers
+        self.propagation_executor: Optional[ThreadPoolExecutor] = None
+        self.executor_lock = threading.Lock()
+        self.handlers: Dict[str, Dict[str, PropagationHandler]] = {}  # org_id -> {subsystem -> handler}
         self.events: Dict[str, List[SubsystemEvent]] = {}  # org_id -> events
         self.sync_records: Dict[str, List[DataSyncRecord]] = {}  # org_id -> records
         self.state_coordinations: Dict[str, List[StateCoordination]] = {}  # org_id -> coordinations
@@ -158,13 +209,58 @@ class CrossSubsystemIntegrator:
             self.events[organisation_id] = []
         self.events[organisation_id].append(event)
         
-        # Propagate to each target
-        for target in target_subsystems:
-            event.mark_propagated(target)
-            # In real implementation, this would trigger the target subsystem
+        # Propagate level by level, dependencies first
+        handlers = self.handlers.get(organisation_id, {})
+        for level in self._propagation_levels(organisation_id, target_subsystems):
+            deliveries = [target for target in level if target in handlers]
+            if len(deliveries) > 1:
+                executor = self._get_propagation_executor()
+                futures = {
+                    target: executor.submit(handlers[target], event)
+                    for target in deliveries
+                }
+                failures = {
+                    target: future.exception()
+                    for target, future in futures.items()
+                }
+            else:
+                failures = {target: self._deliver(handlers[target], event) for target in deliveries}
+            
+            for target in level:
+                error = failures.get(target)
+                if error is None:
+                    event.mark_propagated(target)
+                else:
+                    self.handle_cross_subsystem_error(
+                        organisation_id, source_subsystem, [target],
+                        "propagation_failed", str(error)
+                    )
         
         return event
     
+    def register_handler(
+        self,
+        organisation_id: str,
+        subsystem: str,
+        handler: PropagationHandler
+    ) -> None:
+        """
+        Register the callback that delivers propagated events to a subsystem
+        
+        Args:
+            organisation_id: Tenant identifier for isolation
+            subsystem: Subsystem receiving events
+            handler: Called with each SubsystemEvent propagated to it
+        """
+        self.handlers.setdefault(organisation_id, {})[subsystem] = handler
+    
+    def shutdown(self) -> None:
+        """Stop the propagation thread pool"""
+        with self.executor_lock:
+            if self.propagation_executor is not None:
+                self.propagation_executor.shutdown(wait=True)
+                self.propagation_executor = None
+    
     def get_propagated_events(
         self,
         organisation_id: str,
@@ -312,10 +408,8 @@ class CrossSubsystemIntegrator:
         for dependency in depends_on:
             graph.add_dependency(subsystem, dependency)
         
-        # Check for circular dependencies
-        if graph.has_circular_dependency():
-            # In real implementation, this would trigger an error or warning
-            pass
+        # Circular dependencies are tracked by the graph as edges are added;
+        # propagation falls back to sequential delivery while one exists
         
         return graph
     
@@ -415,3 +509,39 @@ class CrossSubsystemIntegrator:
         if organisation_id in self.subsystem_states:
             return self.subsystem_states[organisation_id].get(subsystem, SubsystemState.READY)
         return SubsystemState.READY
+    
+    # Private helper methods
+    def _propagation_levels(
+        self,
+        organisation_id: str,
+        target_subsystems: List[str]
+    ) -> List[List[str]]:
+        """Group targets by topological level, keeping their given order"""
+        graph = self.dependency_graphs.get(organisation_id)
+        if graph is None:
+            return [list(target_subsystems)]
+        if graph.cyclic:
+            return [[target] for target in target_subsystems]
+        
+        grouped: Dict[int, List[str]] = {}
+        for target in target_subsystems:
+            grouped.setdefault(graph.get_level(target), []).append(target)
+        return [grouped[level] for level in sorted(grouped)]
+    
+    def _deliver(self, handler: PropagationHandler, event: SubsystemEvent) -> Optional[Exception]:
+        """Deliver an event on the calling thread, returning any error"""
+        try:
+            handler(event)
+        except Exception as e:
+            return e
+        return None
+    
+    def _get_propagation_executor(self) -> ThreadPoolExecutor:
+        """Create the propagation thread pool on first use"""
+        with self.executor_lock:
+            if self.propagation_executor is None:
+                self.propagation_executor = ThreadPoolExecutor(
+                    max_workers=self.propagation_workers,
+                    thread_name_prefix="subsystem-propagation"
+                )
+            return self.propagation_executor
@@ -6,13 +6,19 @@ Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-466 to QA-470)
 Tenant Isolation: All operations scoped by organisation_id
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from collections import deque
+from contextlib import contextmanager
 from enum import Enum
+import heapq
+import itertools
 import threading
 
+from .event_dispatcher import AsyncEventDispatcher, DispatchConfig, DispatchMode
+from .event_log import EventLog
+
 
 class EventBusState(Enum):
     """Event bus operational states"""
@@ -37,6 +43,29 @@ class Event:
         """Mark event as delivered to a subscriber"""
         if subscriber_id not in self.delivered_to:
             self.delivered_to.append(subscriber_id)
+    
+    def to_record(self) -> Dict[str, Any]:
+        """Serialise event for the durable event log"""
+        return {
+            "event_id": self.event_id,
+            "event_type": self.event_type,
+            "payload": self.payload,
+            "timestamp": self.timestamp.isoformat(),
+            "organisation_id": self.organisation_id,
+            "sequence_number": self.sequence_number,
+        }
+    
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Event":
+        """Rebuild an event read back from the durable event log"""
+        return cls(
+            event_id=record["event_id"],
+            event_type=record["event_type"],
+            payload=record["payload"],
+            timestamp=datetime.fromisoformat(record["timestamp"]),
+            organisation_id=record["organisation_id"],
+            sequence_number=record["sequence_number"],
+        )
 
 
 @dataclass
@@ -47,6 +76,8 @@ class Subscription:
     callback: Callable[[Event], None]
     organisation_id: str
     active: bool = True
+    order: int = 0  # Registration order, preserved across index buckets
+    batch_callback: Optional[Callable[[List[Event]], None]] = None  # Receives deliveries as lists
     
     def matches(self, event: Event) -> bool:
         """Check if subscription matches an event"""
@@ -63,12 +94,14 @@ class EventQueue:
     organisation_id: str
     events: deque = field(default_factory=deque)
     next_sequence: int = 1
+    retain: bool = True  # False when events are held by the durable event log
     
     def enqueue(self, event: Event) -> None:
         """Add event to queue with sequence number"""
         event.sequence_number = self.next_sequence
         self.next_sequence += 1
-        self.events.append(event)
+        if self.retain:
+            self.events.append(event)
     
     def dequeue(self) -> Optional[Event]:
         """Remove and return next event"""
@@ -91,16 +124,44 @@ class EventBus:
     """
     Event bus for publish/subscribe messaging with ordering guarantees
     and failure handling
+    
+    By default callbacks run inline on the publisher's thread. With an ASYNC
+    DispatchConfig, events are queued per subscriber and delivered by a
+    worker pool; each subscriber still sees its tenant's events in order.
+    
+    With an EventLog, published events are persisted to disk, only a recent
+    window is kept in memory, and subscribers resume from committed offsets.
+    
+    Each tenant has its own lock and id/sequence counter, so tenants never
+    contend. Subscription lists are copy-on-write: writers replace them under
+    the tenant lock and delivery reads a snapshot without locking.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        dispatch_config: Optional[DispatchConfig] = None,
+        event_log: Optional[EventLog] = None
+    ):
+        self.event_log = event_log
+        self.dispatch_config = dispatch_config or DispatchConfig()
+        self.dispatcher: Optional[AsyncEventDispatcher] = None
+        if self.dispatch_config.mode == DispatchMode.ASYNC:
+            self.dispatcher = AsyncEventDispatcher(self._deliver_to, self.dispatch_config)
+            self.dispatcher.start()
         self.state = EventBusState.INITIALIZING
         self.subscriptions: Dict[str, List[Subscription]] = {}  # org_id -> subscriptions
+        self.subscription_index: Dict[str, Dict[str, List[Subscription]]] = {}  # org_id -> event_type -> subscriptions
+        self.wildcard_subscriptions: Dict[str, List[Subscription]] = {}  # org_id -> subscriptions to all types
         self.event_queues: Dict[str, EventQueue] = {}  # org_id -> queue
         self.published_events: Dict[str, List[Event]] = {}  # org_id -> events
         self.failed_deliveries: Dict[str, List[Dict[str, Any]]] = {}  # org_id -> failures
-        self.lock = threading.Lock()
-        self.next_event_id = 1
+        self.lock = threading.Lock()  # Guards tenant registration only
+        self.tenant_locks: Dict[str, threading.Lock] = {}  # org_id -> lock
+        self.dispatch_turns: Dict[str, threading.Condition] = {}  # org_id -> dispatch ordering (ASYNC mode)
+        self.dispatch_tickets: Dict[str, List[int]] = {}  # org_id -> [tickets issued, tickets dispatched]
+        self.delivery_holds: Dict[Tuple[str, str], int] = {}  # (org_id, subscriber_id) -> first undelivered sequence
+        self.offset_lock = threading.Lock()  # Guards delivery_holds and the commits they gate
+        self.subscription_order = itertools.count(1)
     
     # QA-466: Event Bus Initialization
     def initialize(self, organisation_id: str) -> bool:
@@ -114,14 +175,38 @@ class EventBus:
             True if initialization successful
         """
         with self.lock:
+            if organisation_id not in self.tenant_locks:
+                self.tenant_locks[organisation_id] = threading.Lock()
+            
             if organisation_id not in self.event_queues:
-                self.event_queues[organisation_id] = EventQueue(organisation_id=organisation_id)
+                if self.event_log:
+                    # Continue the tenant's sequence from what is already on disk
+                    self.event_queues[organisation_id] = EventQueue(
+                        organisation_id=organisation_id,
+                        next_sequence=self.event_log.last_sequence(organisation_id) + 1,
+                        retain=False
+                    )
+                else:
+                    self.event_queues[organisation_id] = EventQueue(organisation_id=organisation_id)
+                self.dispatch_turns[organisation_id] = threading.Condition()
+                self.dispatch_tickets[organisation_id] = [0, 0]
             
             if organisation_id not in self.subscriptions:
                 self.subscriptions[organisation_id] = []
             
+            if organisation_id not in self.subscription_index:
+                self.subscription_index[organisation_id] = {}
+            
+            if organisation_id not in self.wildcard_subscriptions:
+                self.wildcard_subscriptions[organisation_id] = []
+            
             if organisation_id not in self.published_events:
-                self.published_events[organisation_id] = []
+                if self.event_log:
+                    self.published_events[organisation_id] = deque(
+                        maxlen=self.event_log.config.memory_window
+                    )
+                else:
+                    self.published_events[organisation_id] = []
             
             if organisation_id not in self.failed_deliveries:
                 self.failed_deliveries[organisation_id] = []
@@ -162,12 +247,11 @@ class EventBus:
         if not self.is_initialized(organisation_id):
             self.initialize(organisation_id)
         
-        with self.lock:
-            event_id = f"evt_{self.next_event_id}_{organisation_id}"
-            self.next_event_id += 1
+        with self.tenant_locks[organisation_id]:
+            queue = self.event_queues[organisation_id]
             
             event = Event(
-                event_id=event_id,
+                event_id=f"evt_{queue.next_sequence}_{organisation_id}",
                 event_type=event_type,
                 payload=payload,
                 timestamp=datetime.now(timezone.utc),
@@ -176,24 +260,90 @@ class EventBus:
             )
             
             # Add to queue (which assigns sequence number)
-            queue = self.event_queues[organisation_id]
             queue.enqueue(event)
             
             # Store in published events
             self.published_events[organisation_id].append(event)
+            
+            if self.event_log:
+                self.event_log.append(organisation_id, event.sequence_number, event.to_record())
+            
+            ticket = self._take_dispatch_ticket(organisation_id)
         
         # Trigger delivery to subscribers (outside lock to prevent deadlock)
-        self._deliver_event(event)
+        with self._dispatch_turn(organisation_id, ticket):
+            self._deliver_event(event)
         
         return event
     
+    def publish_batch(
+        self,
+        organisation_id: str,
+        events: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Event]:
+        """
+        Publish several events with one lock acquisition
+        
+        Event ids and sequence numbers are reserved as a contiguous range.
+        Each subscriber receives its matching events in sequence order, as a
+        single call to its batch_callback when it has one.
+        
+        Args:
+            organisation_id: Tenant identifier for isolation
+            events: (event_type, payload) pairs in publish order
+            
+        Returns:
+            Published Events in sequence order
+        """
+        if not events:
+            return []
+        
+        if not self.is_initialized(organisation_id):
+            self.initialize(organisation_id)
+        
+        timestamp = datetime.now(timezone.utc)
+        
+        with self.tenant_locks[organisation_id]:
+            queue = self.event_queues[organisation_id]
+            first_id = queue.next_sequence
+            published = []
+            for offset, (event_type, payload) in enumerate(events):
+                event = Event(
+                    event_id=f"evt_{first_id + offset}_{organisation_id}",
+                    event_type=event_type,
+                    payload=payload,
+                    timestamp=timestamp,
+                    organisation_id=organisation_id,
+                    sequence_number=0  # Will be set by queue
+                )
+                queue.enqueue(event)
+                published.append(event)
+            
+            self.published_events[organisation_id].extend(published)
+            
+            if self.event_log:
+                self.event_log.append_batch(
+                    organisation_id,
+                    [(event.sequence_number, event.to_record()) for event in published]
+                )
+            
+            ticket = self._take_dispatch_ticket(organisation_id)
+        
+        with self._dispatch_turn(organisation_id, ticket):
+            self._deliver_batch(organisation_id, published)
+        
+        return published
+    
     def get_published_events(
         self,
         organisation_id: str,
         event_type: Optional[str] = None
     ) -> List[Event]:
         """Get published events, optionally filtered by type"""
-        events = self.published_events.get(organisation_id, [])
+        if self.event_log:
+            events = self._read_log(organisation_id)
+        else:
+            events = self.published_events.get(organisation_id, [])
         
         if event_type:
             return [e for e in events if e.event_type == event_type]
@@ -206,7 +356,8 @@ class EventBus:
         organisation_id: str,
         subscriber_id: str,
         event_types: List[str],
-        callback: Optional[Callable[[Event], None]] = None
+        callback: Optional[Callable[[Event], None]] = None,
+        batch_callback: Optional[Callable[[List[Event]], None]] = None
     ) -> Subscription:
         """
         Subscribe to events
@@ -216,6 +367,8 @@ class EventBus:
             subscriber_id: Unique identifier for subscriber
             event_types: List of event types to subscribe to (empty = all)
             callback: Optional callback function for event delivery
+            batch_callback: Optional callback receiving events as a list; when
+                given it replaces callback (single publishes deliver one-element lists)
             
         Returns:
             Subscription object
@@ -234,11 +387,22 @@ class EventBus:
             event_types=event_types,
             callback=callback,
             organisation_id=organisation_id,
-            active=True
+            active=True,
+            batch_callback=batch_callback
         )
         
-        with self.lock:
-            self.subscriptions[organisation_id].append(subscription)
+        with self.tenant_locks[organisation_id]:
+            if self.event_log and self.event_log.get_offset(organisation_id, subscriber_id) is None:
+                # New consumers start at the head of the log, not at its beginning
+                self.event_log.commit_offset(
+                    organisation_id,
+                    subscriber_id,
+                    self.event_queues[organisation_id].next_sequence - 1
+                )
+            subscription.order = next(self.subscription_order)
+            # Copy-on-write so lock-free readers always see a complete list
+            self.subscriptions[organisation_id] = self.subscriptions[organisation_id] + [subscription]
+            self._index_subscription(subscription)
         
         return subscription
     
@@ -257,12 +421,19 @@ class EventBus:
         Returns:
             True if unsubscribed successfully
         """
-        with self.lock:
+        tenant_lock = self.tenant_locks.get(organisation_id)
+        if tenant_lock is None:
+            return False
+        
+        with tenant_lock:
             if organisation_id in self.subscriptions:
                 subscriptions = self.subscriptions[organisation_id]
                 for sub in subscriptions:
-                    if sub.subscriber_id == subscriber_id:
+                    if sub.subscriber_id == subscriber_id and sub.active:
                         sub.active = False
+                        self._unindex_subscription(sub)
+                        if self.dispatcher:
+                            self.dispatcher.remove_subscription(sub)
                         return True
         return False
     
@@ -276,6 +447,28 @@ class EventBus:
             if sub.active
         ]
     
+    def get_subscribers_for(
+        self,
+        organisation_id: str,
+        event_type: str
+    ) -> List[Subscription]:
+        """
+        Get subscriptions interested in an event type, in registration order
+        
+        Uses the per-tenant event type index so the cost is proportional to
+        the number of interested subscribers, not all subscribers. Reads a
+        copy-on-write snapshot, so no lock is taken.
+        """
+        typed = self.subscription_index.get(organisation_id, {}).get(event_type, [])
+        wildcard = self.wildcard_subscriptions.get(organisation_id, [])
+        
+        if not wildcard:
+            return list(typed)
+        if not typed:
+            return list(wildcard)
+        
+        return list(heapq.merge(typed, wildcard, key=lambda sub: sub.order))
+    
     # QA-469: Event Ordering Guarantees
     def get_events_in_order(
         self,
@@ -294,6 +487,9 @@ class EventBus:
         Returns:
             List of events in sequence order
         """
+        if self.event_log:
+            return self._read_log(organisation_id, start_sequence, limit)
+        
         events = self.published_events.get(organisation_id, [])
         
         # Filter by sequence
@@ -368,7 +564,7 @@ class EventBus:
             "recovered": False
         }
         
-        with self.lock:
+        with self.tenant_locks[organisation_id]:
             self.failed_deliveries[organisation_id].append(failure_record)
         
         # Attempt recovery only if requested (to prevent infinite recursion)
@@ -410,6 +606,12 @@ class EventBus:
             # Pause bus
             self.state = EventBusState.PAUSED
             
+            if self.event_log:
+                # Replay from disk for every subscriber from its committed offset
+                for subscription in self.get_subscriptions(organisation_id):
+                    self.replay_events(organisation_id, subscription.subscriber_id)
+                self.event_log.flush()
+            
             # Verify data integrity
             if organisation_id in self.event_queues:
                 queue = self.event_queues[organisation_id]
@@ -428,25 +630,309 @@ class EventBus:
             self.state = EventBusState.FAILED
             return False
     
+    def replay_events(
+        self,
+        organisation_id: str,
+        subscriber_id: str,
+        from_sequence: Optional[int] = None
+    ) -> int:
+        """
+        Redeliver logged events to a subscriber
+        
+        The subscriber's offset is committed only up to the last event
+        delivered with nothing failed before it, so events that fail
+        again are replayed on the next attempt.
+        
+        Args:
+            organisation_id: Tenant identifier
+            subscriber_id: Subscriber to replay to
+            from_sequence: First sequence to replay (default: after committed offset)
+            
+        Returns:
+            Number of events redelivered
+        """
+        if not self.event_log:
+            return 0
+        
+        subscription = next(
+            (s for s in self.get_subscriptions(organisation_id) if s.subscriber_id == subscriber_id),
+            None
+        )
+        if subscription is None:
+            return 0
+        
+        if from_sequence is None:
+            from_sequence = (self.event_log.get_offset(organisation_id, subscriber_id) or 0) + 1
+        
+        replayed = 0
+        contiguous = from_sequence - 1  # Highest sequence with nothing undelivered before it
+        failed_sequence = None
+        for record in self.event_log.read(organisation_id, from_sequence):
+            event = Event.from_record(record)
+            if subscription.matches(event):
+                delivered = self._deliver_events_to(subscription, [event], commit=False)
+                replayed += 1
+                if not delivered and failed_sequence is None:
+                    failed_sequence = event.sequence_number
+            # Events this subscriber is not interested in are skipped past
+            if failed_sequence is None:
+                contiguous = event.sequence_number
+        
+        with self.offset_lock:
+            if failed_sequence is None:
+                self.delivery_holds.pop((organisation_id, subscriber_id), None)
+            else:
+                self.delivery_holds[(organisation_id, subscriber_id)] = failed_sequence
+            if contiguous > 0:
+                self.event_log.commit_offset(organisation_id, subscriber_id, contiguous)
+        
+        return replayed
+    
+    # Asynchronous dispatch
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for asynchronously dispatched events to be delivered
+        
+        Returns:
+            True if all subscriber queues drained (always True in SYNC mode)
+        """
+        if self.dispatcher is None:
+            return True
+        return self.dispatcher.flush(timeout)
+    
+    def get_dispatch_metrics(
+        self,
+        organisation_id: str,
+        subscriber_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get per-subscriber queue depth and lag metrics (ASYNC mode)"""
+        if self.dispatcher is None:
+            return []
+        
+        metrics = self.dispatcher.get_metrics(organisation_id)
+        if subscriber_id:
+            return [m for m in metrics if m["subscriber_id"] == subscriber_id]
+        return metrics
+    
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop the dispatcher worker pool and close the event log, if any"""
+        if self.dispatcher is not None:
+            self.dispatcher.shutdown(timeout)
+        if self.event_log is not None:
+            self.event_log.close()
+    
     # Private helper methods
+    def _take_dispatch_ticket(self, organisation_id: str) -> int:
+        """Number a publish for dispatch, in sequence order (caller holds tenant lock)"""
+        tickets = self.dispatch_tickets[organisation_id]
+        tickets[0] += 1
+        return tickets[0]
+    
+    @contextmanager
+    def _dispatch_turn(self, organisation_id: str, ticket: int) -> Iterator[None]:
+        """
+        Hand published events to the dispatcher in sequence order
+        
+        Sequences are reserved under the tenant lock but dispatched after
+        it is released, so in ASYNC mode a publisher waits here until every
+        earlier publish has been queued. The tenant lock is not held while
+        waiting, so workers can still record failures.
+        """
+        if self.dispatcher is None:
+            yield
+            return
+        
+        turn = self.dispatch_turns[organisation_id]
+        tickets = self.dispatch_tickets[organisation_id]
+        with turn:
+            while tickets[1] < ticket - 1:
+                turn.wait()
+        try:
+            yield
+        finally:
+            with turn:
+                tickets[1] = ticket
+                turn.notify_all()
+    
+    def _read_log(
+        self,
+        organisation_id: str,
+        start_sequence: int = 0,
+        limit: Optional[int] = None
+    ) -> List[Event]:
+        """Read events back from the durable event log"""
+        return [
+            Event.from_record(record)
+            for record in self.event_log.read(organisation_id, start_sequence, limit)
+        ]
+    
+    def _index_subscription(self, subscription: Subscription) -> None:
+        """Add subscription to the tenant event type index (caller holds tenant lock)"""
+        org_id = subscription.organisation_id
+        
+        # Buckets are replaced, never mutated, so readers need no lock
+        if not subscription.event_types:
+            self.wildcard_subscriptions[org_id] = (
+                self.wildcard_subscriptions.get(org_id, []) + [subscription]
+            )
+            return
+        
+        index = self.subscription_index.setdefault(org_id, {})
+        for event_type in dict.fromkeys(subscription.event_types):
+            index[event_type] = index.get(event_type, []) + [subscription]
+    
+    def _unindex_subscription(self, subscription: Subscription) -> None:
+        """Remove subscription from the tenant event type index (caller holds tenant lock)"""
+        org_id = subscription.organisation_id
+        
+        # Identity checks: dataclass equality could match a twin subscription
+        if not subscription.event_types:
+            wildcard = self.wildcard_subscriptions.get(org_id, [])
+            self.wildcard_subscriptions[org_id] = [
+                sub for sub in wildcard if sub is not subscription
+            ]
+            return
+        
+        index = self.subscription_index.get(org_id, {})
+        for event_type in dict.fromkeys(subscription.event_types):
+            bucket = index.get(event_type)
+            if bucket is None:
+                continue
+            index[event_type] = [sub for sub in bucket if sub is not subscription]
+            if not index[event_type]:
+                del index[event_type]
+    
     def _deliver_event(self, event: Event) -> None:
         """Deliver event to all matching subscribers"""
-        subscriptions = self.subscriptions.get(event.organisation_id, [])
+        subscriptions = self.get_subscribers_for(event.organisation_id, event.event_type)
         
         for subscription in subscriptions:
-            if subscription.matches(event):
-                try:
-                    subscription.callback(event)
-                    event.mark_delivered(subscription.subscriber_id)
-                except Exception as e:
-                    # Log delivery failure without retry to prevent recursion
+            if not subscription.matches(event):
+                continue
+            
+            if self.dispatcher is None:
+                self._deliver_to(subscription, event)
+            elif not self.dispatcher.dispatch(subscription, event):
+                self.handle_failure(
+                    event.organisation_id,
+                    event,
+                    subscription.subscriber_id,
+                    "Subscriber queue full (backpressure timeout)",
+                    attempt_retry=False
+                )
+    
+    def _deliver_batch(self, organisation_id: str, events: List[Event]) -> None:
+        """Deliver a batch, grouping each subscriber's matching events"""
+        # Group per subscription, keeping registration order and sequence order
+        pending: Dict[int, List[Event]] = {}
+        subscriptions: Dict[int, Subscription] = {}
+        subscribers_by_type: Dict[str, List[Subscription]] = {}
+        for event in events:
+            interested = subscribers_by_type.get(event.event_type)
+            if interested is None:
+                interested = self.get_subscribers_for(organisation_id, event.event_type)
+                subscribers_by_type[event.event_type] = interested
+            for subscription in interested:
+                if subscription.matches(event):
+                    key = id(subscription)
+                    subscriptions[key] = subscription
+                    pending.setdefault(key, []).append(event)
+        
+        for key in sorted(pending, key=lambda k: subscriptions[k].order):
+            subscription = subscriptions[key]
+            if self.dispatcher is None:
+                self._deliver_events_to(subscription, pending[key])
+                continue
+            for event in pending[key]:
+                if not self.dispatcher.dispatch(subscription, event):
+                    self.handle_failure(
+                        organisation_id,
+                        event,
+                        subscription.subscriber_id,
+                        "Subscriber queue full (backpressure timeout)",
+                        attempt_retry=False
+                    )
+    
+    def _deliver_to(self, subscription: Subscription, event: Event) -> None:
+        """Invoke one subscriber callback, recording failures"""
+        self._deliver_events_to(subscription, [event])
+    
+    def _deliver_events_to(self, subscription: Subscription, events: List[Event], commit: bool = True) -> bool:
+        """
+        Invoke a subscriber for events in order, recording failures
+        
+        With commit, the subscriber's offset follows successful deliveries
+        and stops below the first failed event (replay_events commits
+        for itself).
+        
+        Returns:
+            True if every event was delivered
+        """
+        if not subscription.active:
+            return False
+        
+        if subscription.batch_callback is not None:
+            try:
+                subscription.batch_callback(events)
+            except Exception as e:
+                for event in events:
                     self.handle_failure(
                         event.organisation_id,
                         event,
                         subscription.subscriber_id,
                         str(e),
-                        attempt_retry=False  # Don't retry during delivery to prevent infinite loop
+                        attempt_retry=False
                     )
+                if commit:
+                    self._hold_offset(subscription, events[0])
+                return False
+            for event in events:
+                event.mark_delivered(subscription.subscriber_id)
+            if commit:
+                self._commit_delivery(subscription, events[-1])
+            return True
+        
+        delivered = True
+        for event in events:
+            try:
+                subscription.callback(event)
+                event.mark_delivered(subscription.subscriber_id)
+                if commit:
+                    self._commit_delivery(subscription, event)
+            except Exception as e:
+                # Log delivery failure without retry to prevent recursion
+                self.handle_failure(
+                    event.organisation_id,
+                    event,
+                    subscription.subscriber_id,
+                    str(e),
+                    attempt_retry=False  # Don't retry during delivery to prevent infinite loop
+                )
+                if commit:
+                    self._hold_offset(subscription, event)
+                delivered = False
+        return delivered
+    
+    def _commit_delivery(self, subscription: Subscription, event: Event) -> None:
+        """Advance the subscriber's durable offset past a delivered event, unless an earlier one failed"""
+        if self.event_log:
+            with self.offset_lock:
+                if (event.organisation_id, subscription.subscriber_id) in self.delivery_holds:
+                    return
+                self.event_log.commit_offset(
+                    event.organisation_id,
+                    subscription.subscriber_id,
+                    event.sequence_number
+                )
+    
+    def _hold_offset(self, subscription: Subscription, event: Event) -> None:
+        """Keep the subscriber's offset below a failed event until a replay delivers it"""
+        if self.event_log:
+            key = (event.organisation_id, subscription.subscriber_id)
+            with self.offset_lock:
+                held = self.delivery_holds.get(key)
+                if held is None or event.sequence_number < held:
+                    self.delivery_holds[key] = event.sequence_number
     
     def _retry_delivery(self, event: Event, subscriber_id: str) -> None:
         """Retry event delivery to a subscriber"""
@@ -0,0 +1,383 @@
+"""
+Event Dispatcher
+
+Purpose: Asynchronous worker-pool delivery of event bus events with per-subscriber backpressure
+Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-466 to QA-470)
+Tenant Isolation: One queue per subscription; subscriptions are tenant scoped
+"""
+
+from typing import Dict, List, Optional, Any, Callable
+from dataclasses import dataclass
+from collections import deque
+from enum import Enum
+import os
+import pickle
+import queue
+import struct
+import tempfile
+import threading
+import time
+
+
+class DispatchMode(Enum):
+    """Event delivery modes"""
+    SYNC = "sync"  # Callbacks run inline on the publisher's thread
+    ASYNC = "async"  # Callbacks run on the dispatcher worker pool
+
+
+class BackpressurePolicy(Enum):
+    """Behaviour when a subscriber queue is full"""
+    BLOCK = "block"  # Publisher waits for space
+    DROP_OLDEST = "drop_oldest"  # Oldest pending event is discarded
+    SPILL_TO_DISK = "spill_to_disk"  # Overflow is written to a spill file
+
+
+@dataclass
+class DispatchConfig:
+    """Event dispatch configuration"""
+    mode: DispatchMode = DispatchMode.SYNC
+    worker_count: int = 4
+    queue_capacity: int = 1000
+    backpressure_policy: BackpressurePolicy = BackpressurePolicy.BLOCK
+    block_timeout_seconds: Optional[float] = None  # None = wait indefinitely
+    spill_directory: Optional[str] = None  # None = system temp directory
+    max_batch_size: int = 64  # Events drained per worker turn before yielding
+
+    def validate(self) -> bool:
+        """Validate dispatch configuration"""
+        return (
+            self.worker_count > 0 and
+            self.queue_capacity > 0 and
+            self.max_batch_size > 0 and
+            (self.block_timeout_seconds is None or self.block_timeout_seconds >= 0)
+        )
+
+
+_RECORD_HEADER = struct.Struct(">I")
+
+
+class SubscriberQueue:
+    """
+    Bounded FIFO of pending events for one subscription
+
+    At most one worker drains a queue at a time, so each subscriber sees
+    its tenant's events in sequence order.
+    """
+
+    def __init__(self, subscription: Any, config: DispatchConfig):
+        self.subscription = subscription
+        self.config = config
+        self.events: deque = deque()
+        self.condition = threading.Condition()
+        self.scheduled = False
+        self.in_flight = 0
+
+        # Spill file state (SPILL_TO_DISK only)
+        self.spill_path: Optional[str] = None
+        self.spill_writer = None
+        self.spill_reader = None
+        self.spilled_pending = 0
+
+        # Metrics
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.rejected = 0
+        self.max_depth = 0
+        self.last_delivery_lag_seconds = 0.0
+
+    def depth(self) -> int:
+        """Number of events waiting for delivery (memory and spill)"""
+        return len(self.events) + self.spilled_pending
+
+    def put(self, event: Any) -> bool:
+        """
+        Enqueue an event applying the configured backpressure policy
+
+        Returns:
+            True if the event was queued, False if it was rejected
+        """
+        policy = self.config.backpressure_policy
+        capacity = self.config.queue_capacity
+
+        with self.condition:
+            if policy == BackpressurePolicy.SPILL_TO_DISK:
+                # Once spilling, keep spilling until the file drains to preserve order
+                if self.spilled_pending or len(self.events) >= capacity:
+                    self._spill(event)
+                else:
+                    self.events.append(event)
+            elif policy == BackpressurePolicy.DROP_OLDEST:
+                if len(self.events) >= capacity:
+                    self.events.popleft()
+                    self.dropped += 1
+                self.events.append(event)
+            else:
+                has_space = self.condition.wait_for(
+                    lambda: len(self.events) < capacity,
+                    timeout=self.config.block_timeout_seconds
+                )
+                if not has_space:
+                    self.rejected += 1
+                    return False
+                self.events.append(event)
+
+            self.enqueued += 1
+            self.max_depth = max(self.max_depth, self.depth())
+            return True
+
+    def take(self) -> Optional[Any]:
+        """Remove and return the next pending event"""
+        with self.condition:
+            if not self.events and self.spilled_pending:
+                self._refill_from_spill()
+            if not self.events:
+                return None
+            event = self.events.popleft()
+            self.in_flight += 1
+            self.condition.notify_all()
+            return event
+
+    def task_done(self, event: Any) -> None:
+        """Record completion of an event returned by take()"""
+        with self.condition:
+            self.in_flight -= 1
+            self.delivered += 1
+            self.last_delivery_lag_seconds = _age_seconds(event)
+
+    def lag_seconds(self) -> float:
+        """Age of the oldest event still waiting in memory"""
+        with self.condition:
+            if not self.events:
+                return 0.0
+            return _age_seconds(self.events[0])
+
+    def is_idle(self) -> bool:
+        """True when nothing is pending or being delivered"""
+        with self.condition:
+            return not self.scheduled and self.depth() == 0 and self.in_flight == 0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth, lag and throughput counters"""
+        lag = self.lag_seconds()
+        with self.condition:
+            return {
+                "subscriber_id": self.subscription.subscriber_id,
+                "organisation_id": self.subscription.organisation_id,
+                "queue_depth": self.depth(),
+                "max_queue_depth": self.max_depth,
+                "spilled_pending": self.spilled_pending,
+                "enqueued": self.enqueued,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "spilled": self.spilled,
+                "rejected": self.rejected,
+                "lag_seconds": lag,
+                "last_delivery_lag_seconds": self.last_delivery_lag_seconds,
+            }
+
+    def close(self) -> None:
+        """Discard pending events and remove the spill file"""
+        with self.condition:
+            self.events.clear()
+            self.spilled_pending = 0
+            self._close_spill()
+            self.condition.notify_all()
+
+    # Private helper methods
+    def _spill(self, event: Any) -> None:
+        """Append a length-prefixed record to the spill file (caller holds condition)"""
+        if self.spill_writer is None:
+            fd, self.spill_path = tempfile.mkstemp(
+                prefix=f"event_spill_{self.subscription.subscriber_id}_",
+                suffix=".bin",
+                dir=self.config.spill_directory
+            )
+            self.spill_writer = os.fdopen(fd, "ab")
+            self.spill_reader = open(self.spill_path, "rb")
+
+        record = pickle.dumps(event, protocol=pickle.HIGHEST_PROTOCOL)
+        self.spill_writer.write(_RECORD_HEADER.pack(len(record)))
+        self.spill_writer.write(record)
+        self.spilled_pending += 1
+        self.spilled += 1
+
+    def _refill_from_spill(self) -> None:
+        """Load up to one queue's worth of events back from disk (caller holds condition)"""
+        self.spill_writer.flush()
+
+        while self.spilled_pending and len(self.events) < self.config.queue_capacity:
+            (length,) = _RECORD_HEADER.unpack(self.spill_reader.read(_RECORD_HEADER.size))
+            self.events.append(pickle.loads(self.spill_reader.read(length)))
+            self.spilled_pending -= 1
+
+        if not self.spilled_pending:
+            # File fully consumed; start a fresh one on the next overflow
+            self._close_spill()
+
+    def _close_spill(self) -> None:
+        """Close and delete the spill file (caller holds condition)"""
+        if self.spill_writer is not None:
+            self.spill_writer.close()
+            self.spill_reader.close()
+            os.remove(self.spill_path)
+        self.spill_writer = None
+        self.spill_reader = None
+        self.spill_path = None
+
+
+class AsyncEventDispatcher:
+    """
+    Worker pool that delivers events from per-subscriber queues
+
+    Subscriber queues are scheduled onto a shared ready queue; a worker
+    drains up to max_batch_size events from one subscriber before yielding,
+    so a slow subscriber occupies a single worker and never the publisher.
+    """
+
+    def __init__(
+        self,
+        deliver: Callable[[Any, Any], None],
+        config: Optional[DispatchConfig] = None
+    ):
+        """
+        Args:
+            deliver: Function called as deliver(subscription, event) on a worker
+            config: Dispatch configuration (uses defaults if not provided)
+        """
+        self.config = config or DispatchConfig(mode=DispatchMode.ASYNC)
+        if not self.config.validate():
+            raise ValueError("Invalid dispatch configuration")
+
+        self.deliver = deliver
+        self.queues: Dict[int, SubscriberQueue] = {}  # id(subscription) -> queue
+        self.ready: queue.Queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.workers: List[threading.Thread] = []
+        self.running = False
+
+    def start(self) -> None:
+        """Start worker threads"""
+        with self.lock:
+            if self.running:
+                return
+            self.running = True
+            for i in range(self.config.worker_count):
+                worker = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"event-dispatch-{i}",
+                    daemon=True
+                )
+                worker.start()
+                self.workers.append(worker)
+
+    def shutdown(self, timeout: Optional[float] = None) -> None:
+        """Stop workers after they finish their current batch"""
+        with self.lock:
+            if not self.running:
+                return
+            self.running = False
+            workers = self.workers
+            self.workers = []
+
+        for _ in workers:
+            self.ready.put(None)
+        for worker in workers:
+            worker.join(timeout)
+
+    def dispatch(self, subscription: Any, event: Any) -> bool:
+        """
+        Queue an event for asynchronous delivery to a subscription
+
+        Returns:
+            True if queued, False if rejected by backpressure
+        """
+        subscriber_queue = self._get_queue(subscription)
+        if not subscriber_queue.put(event):
+            return False
+
+        with subscriber_queue.condition:
+            if subscriber_queue.scheduled:
+                return True
+            subscriber_queue.scheduled = True
+        self.ready.put(subscriber_queue)
+        return True
+
+    def remove_subscription(self, subscription: Any) -> None:
+        """Drop the queue for a subscription, discarding pending events"""
+        with self.lock:
+            subscriber_queue = self.queues.pop(id(subscription), None)
+        if subscriber_queue is not None:
+            subscriber_queue.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued event has been delivered
+
+        Returns:
+            True if all queues drained before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.lock:
+                queues = list(self.queues.values())
+            if all(q.is_idle() for q in queues):
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.001)
+
+    def get_metrics(
+        self,
+        organisation_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get per-subscriber queue metrics, optionally for one tenant"""
+        with self.lock:
+            queues = list(self.queues.values())
+
+        return [
+            q.get_metrics() for q in queues
+            if organisation_id is None or q.subscription.organisation_id == organisation_id
+        ]
+
+    # Private helper methods
+    def _get_queue(self, subscription: Any) -> SubscriberQueue:
+        """Get or create the queue for a subscription"""
+        key = id(subscription)
+        subscriber_queue = self.queues.get(key)
+        if subscriber_queue is None:
+            with self.lock:
+                subscriber_queue = self.queues.get(key)
+                if subscriber_queue is None:
+                    subscriber_queue = SubscriberQueue(subscription, self.config)
+                    self.queues[key] = subscriber_queue
+        return subscriber_queue
+
+    def _worker_loop(self) -> None:
+        """Drain scheduled subscriber queues until shutdown"""
+        while True:
+            subscriber_queue = self.ready.get()
+            if subscriber_queue is None:
+                return
+
+            for _ in range(self.config.max_batch_size):
+                event = subscriber_queue.take()
+                if event is None:
+                    break
+                try:
+                    self.deliver(subscriber_queue.subscription, event)
+                finally:
+                    subscriber_queue.task_done(event)
+
+            with subscriber_queue.condition:
+                if subscriber_queue.depth() == 0:
+                    subscriber_queue.scheduled = False
+                    continue
+            # More pending: requeue behind other subscribers for fairness
+            self.ready.put(subscriber_queue)
+
+
+def _age_seconds(event: Any) -> float:
+    """Seconds elapsed since an event was published"""
+    return max(0.0, time.time() - event.timestamp.timestamp())
@@ -0,0 +1,465 @@
+"""
+Event Log
+
+Purpose: Durable, segmented append-only event log with consumer offsets for the event bus
+Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-466 to QA-470)
+Tenant Isolation: One log directory and offset table per organisation_id
+"""
+
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from dataclasses import dataclass
+import json
+import os
+import re
+import struct
+import threading
+import time
+import zlib
+
+
+# Record: length (uint32), crc32 (uint32), JSON body
+RECORD_HEADER = struct.Struct(">II")
+# Index entry: sequence number (uint64), byte position in segment (uint64)
+INDEX_ENTRY = struct.Struct(">QQ")
+
+SEGMENT_SUFFIX = ".log"
+INDEX_SUFFIX = ".idx"
+OFFSETS_FILE = "offsets.json"
+
+
+@dataclass
+class EventLogConfig:
+    """Event log configuration"""
+    directory: str
+    segment_max_bytes: int = 64 * 1024 * 1024
+    retention_max_bytes: Optional[int] = None  # None = keep all segments
+    retention_max_age_seconds: Optional[float] = None  # None = keep all segments
+    fsync: bool = False  # fsync every append (durable against power loss)
+    offset_flush_interval: int = 100  # Offset commits between offset file writes
+    memory_window: int = 1000  # Recent events the bus keeps in RAM per tenant
+
+    def validate(self) -> bool:
+        """Validate event log configuration"""
+        return (
+            bool(self.directory) and
+            self.segment_max_bytes > 0 and
+            (self.retention_max_bytes is None or self.retention_max_bytes > 0) and
+            (self.retention_max_age_seconds is None or self.retention_max_age_seconds > 0) and
+            self.offset_flush_interval > 0 and
+            self.memory_window >= 0
+        )
+
+
+class LogSegment:
+    """One segment file plus its sequence -> position index"""
+
+    def __init__(self, directory: str, base_sequence: int):
+        self.base_sequence = base_sequence
+        name = f"{base_sequence:020d}"
+        self.data_path = os.path.join(directory, name + SEGMENT_SUFFIX)
+        self.index_path = os.path.join(directory, name + INDEX_SUFFIX)
+        self.index = bytearray()
+        self.size = 0
+        self.data_file = None
+        self.index_file = None
+
+        if os.path.exists(self.data_path):
+            self._load()
+
+    def entry_count(self) -> int:
+        """Number of records in the segment"""
+        return len(self.index) // INDEX_ENTRY.size
+
+    def last_sequence(self) -> Optional[int]:
+        """Sequence number of the last record, if any"""
+        count = self.entry_count()
+        if count == 0:
+            return None
+        return INDEX_ENTRY.unpack_from(self.index, (count - 1) * INDEX_ENTRY.size)[0]
+
+    def open_for_append(self) -> None:
+        """Open data and index files for appending"""
+        if self.data_file is None:
+            self.data_file = open(self.data_path, "ab")
+            self.index_file = open(self.index_path, "ab")
+
+    def append(self, sequence: int, body: bytes, fsync: bool) -> None:
+        """Append a record and its index entry"""
+        self.write(sequence, body)
+        self.flush(fsync)
+
+    def write(self, sequence: int, body: bytes) -> None:
+        """Buffer a record and its index entry; visible to readers after flush()"""
+        self.open_for_append()
+        position = self.size
+        header = RECORD_HEADER.pack(len(body), zlib.crc32(body))
+        self.data_file.write(header + body)
+
+        entry = INDEX_ENTRY.pack(sequence, position)
+        self.index_file.write(entry)
+
+        self.index.extend(entry)
+        self.size = position + len(header) + len(body)
+
+    def flush(self, fsync: bool) -> None:
+        """Flush buffered records to the OS, optionally to stable storage"""
+        if self.data_file is None:
+            return
+        self.data_file.flush()
+        self.index_file.flush()
+        if fsync:
+            os.fsync(self.data_file.fileno())
+            os.fsync(self.index_file.fileno())
+
+    def find_position(self, sequence: int) -> Optional[int]:
+        """Byte position of the first record with sequence >= given sequence"""
+        low, high = 0, self.entry_count()
+        while low < high:
+            mid = (low + high) // 2
+            if INDEX_ENTRY.unpack_from(self.index, mid * INDEX_ENTRY.size)[0] < sequence:
+                low = mid + 1
+            else:
+                high = mid
+        if low == self.entry_count():
+            return None
+        return INDEX_ENTRY.unpack_from(self.index, low * INDEX_ENTRY.size)[1]
+
+    def read_from(self, position: int, end: int) -> Iterator[Dict[str, Any]]:
+        """Yield decoded records from position up to byte offset end"""
+        with open(self.data_path, "rb") as data_file:
+            data_file.seek(position)
+            while position < end:
+                length, _ = RECORD_HEADER.unpack(data_file.read(RECORD_HEADER.size))
+                body = data_file.read(length)
+                position += RECORD_HEADER.size + length
+                yield json.loads(body)
+
+    def close(self) -> None:
+        """Close open file handles"""
+        if self.data_file is not None:
+            self.data_file.close()
+            self.index_file.close()
+        self.data_file = None
+        self.index_file = None
+
+    def delete(self) -> None:
+        """Close and remove segment files"""
+        self.close()
+        for path in (self.data_path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    # Private helper methods
+    def _load(self) -> None:
+        """Load the index and repair a torn tail left by a crash"""
+        data_size = os.path.getsize(self.data_path)
+        index = bytearray()
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as index_file:
+                index = bytearray(index_file.read())
+        del index[len(index) - len(index) % INDEX_ENTRY.size:]
+
+        # Drop index entries that point past the data actually written
+        valid_end = 0
+        count = len(index) // INDEX_ENTRY.size
+        while count:
+            sequence, position = INDEX_ENTRY.unpack_from(index, (count - 1) * INDEX_ENTRY.size)
+            record_end = self._record_end(position, data_size)
+            if record_end is not None:
+                valid_end = record_end
+                break
+            count -= 1
+        del index[count * INDEX_ENTRY.size:]
+
+        # Re-index complete records written after the last index entry
+        position = valid_end
+        with open(self.data_path, "rb") as data_file:
+            while True:
+                record_end = self._record_end(position, data_size)
+                if record_end is None:
+                    break
+                data_file.seek(position + RECORD_HEADER.size)
+                record = json.loads(data_file.read(record_end - position - RECORD_HEADER.size))
+                index.extend(INDEX_ENTRY.pack(record["sequence_number"], position))
+                position = record_end
+
+        if position < data_size:
+            with open(self.data_path, "r+b") as data_file:
+                data_file.truncate(position)
+        with open(self.index_path, "wb") as index_file:
+            index_file.write(index)
+
+        self.index = index
+        self.size = position
+
+    def _record_end(self, position: int, data_size: int) -> Optional[int]:
+        """End offset of a checksum-valid record at position, or None"""
+        if position + RECORD_HEADER.size > data_size:
+            return None
+        with open(self.data_path, "rb") as data_file:
+            data_file.seek(position)
+            length, crc = RECORD_HEADER.unpack(data_file.read(RECORD_HEADER.size))
+            end = position + RECORD_HEADER.size + length
+            if end > data_size:
+                return None
+            if zlib.crc32(data_file.read(length)) != crc:
+                return None
+        return end
+
+
+class TenantLog:
+    """Segments and consumer offsets for one tenant"""
+
+    def __init__(self, directory: str, config: EventLogConfig):
+        self.directory = directory
+        self.config = config
+        self.lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+        bases = sorted(
+            int(name[:-len(SEGMENT_SUFFIX)])
+            for name in os.listdir(directory)
+            if name.endswith(SEGMENT_SUFFIX)
+        )
+        self.segments: List[LogSegment] = [LogSegment(directory, base) for base in bases]
+
+        self.offsets: Dict[str, int] = {}
+        self.pending_offset_commits = 0
+        offsets_path = os.path.join(directory, OFFSETS_FILE)
+        if os.path.exists(offsets_path):
+            with open(offsets_path) as offsets_file:
+                self.offsets = json.load(offsets_file)
+
+    def last_sequence(self) -> int:
+        """Highest sequence number stored (0 when empty)"""
+        for segment in reversed(self.segments):
+            last = segment.last_sequence()
+            if last is not None:
+                return last
+        return 0
+
+    def append(self, sequence: int, body: bytes) -> None:
+        """Append a record, rolling to a new segment when full"""
+        self.append_batch([(sequence, body)])
+
+    def append_batch(self, records: List[Tuple[int, bytes]]) -> None:
+        """Append records in order with one flush per touched segment"""
+        with self.lock:
+            for sequence, body in records:
+                active = self.segments[-1] if self.segments else None
+                if active is None or active.size >= self.config.segment_max_bytes:
+                    if active is not None:
+                        active.flush(self.config.fsync)
+                        active.close()
+                    active = LogSegment(self.directory, sequence)
+                    self.segments.append(active)
+                    self._enforce_retention()
+                active.write(sequence, body)
+            if self.segments:
+                self.segments[-1].flush(self.config.fsync)
+
+    def read(self, from_sequence: int, limit: Optional[int]) -> Iterator[Dict[str, Any]]:
+        """Yield records with sequence >= from_sequence in order"""
+        with self.lock:
+            # Snapshot segment extents so concurrent appends are not observed mid-record
+            extents = [(segment, segment.size) for segment in self.segments]
+
+        remaining = limit
+        for i, (segment, end) in enumerate(extents):
+            next_base = extents[i + 1][0].base_sequence if i + 1 < len(extents) else None
+            if next_base is not None and next_base <= from_sequence:
+                continue
+            position = segment.find_position(from_sequence)
+            if position is None or position >= end:
+                continue
+            for record in segment.read_from(position, end):
+                if remaining is not None:
+                    if remaining <= 0:
+                        return
+                    remaining -= 1
+                yield record
+
+    def commit_offset(self, consumer_id: str, sequence: int) -> None:
+        """Record the last sequence a consumer has processed"""
+        with self.lock:
+            if sequence <= self.offsets.get(consumer_id, 0):
+                return
+            self.offsets[consumer_id] = sequence
+            self.pending_offset_commits += 1
+            if self.pending_offset_commits >= self.config.offset_flush_interval:
+                self._write_offsets()
+
+    def flush_offsets(self) -> None:
+        """Persist consumer offsets"""
+        with self.lock:
+            if self.pending_offset_commits:
+                self._write_offsets()
+
+    def size_bytes(self) -> int:
+        """Total bytes across segment data files"""
+        return sum(segment.size for segment in self.segments)
+
+    def enforce_retention(self) -> int:
+        """Apply retention rules, returning the number of segments removed"""
+        with self.lock:
+            return self._enforce_retention()
+
+    def close(self) -> None:
+        """Persist offsets and close segment files"""
+        self.flush_offsets()
+        with self.lock:
+            for segment in self.segments:
+                segment.close()
+
+    # Private helper methods
+    def _enforce_retention(self) -> int:
+        """Delete oldest closed segments beyond size/age limits (caller holds lock)"""
+        removed = 0
+        now = time.time()
+        max_bytes = self.config.retention_max_bytes
+        max_age = self.config.retention_max_age_seconds
+
+        # The active (last) segment is never removed
+        while len(self.segments) > 1:
+            oldest = self.segments[0]
+            too_big = max_bytes is not None and self.size_bytes() > max_bytes
+            too_old = (
+                max_age is not None and
+                now - os.path.getmtime(oldest.data_path) > max_age
+            )
+            if not (too_big or too_old):
+                break
+            oldest.delete()
+            self.segments.pop(0)
+            removed += 1
+        return removed
+
+    def _write_offsets(self) -> None:
+        """Atomically rewrite the offsets file (caller holds lock)"""
+        path = os.path.join(self.directory, OFFSETS_FILE)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as offsets_file:
+            json.dump(self.offsets, offsets_file)
+            offsets_file.flush()
+            if self.config.fsync:
+                os.fsync(offsets_file.fileno())
+        os.replace(tmp_path, path)
+        self.pending_offset_commits = 0
+
+
+class EventLog:
+    """
+    Durable append-only event log
+
+    Each tenant has a directory of segments named by their first sequence
+    number. Records are length-prefixed, CRC-checked JSON; every segment has
+    a sequence -> position index so reads seek directly to an offset.
+    """
+
+    def __init__(self, config: EventLogConfig):
+        if not config.validate():
+            raise ValueError("Invalid event log configuration")
+        self.config = config
+        self.tenants: Dict[str, TenantLog] = {}
+        self.lock = threading.Lock()
+        os.makedirs(config.directory, exist_ok=True)
+
+    def append(self, organisation_id: str, sequence: int, record: Dict[str, Any]) -> None:
+        """
+        Append a record for a tenant
+
+        Args:
+            organisation_id: Tenant identifier for isolation
+            sequence: Tenant sequence number (must be increasing)
+            record: JSON-serialisable record; must include sequence_number
+        """
+        self._tenant(organisation_id).append(sequence, _encode(record))
+
+    def append_batch(
+        self,
+        organisation_id: str,
+        records: List[Tuple[int, Dict[str, Any]]]
+    ) -> None:
+        """Append (sequence, record) pairs for a tenant with a single flush"""
+        self._tenant(organisation_id).append_batch(
+            [(sequence, _encode(record)) for sequence, record in records]
+        )
+
+    def read(
+        self,
+        organisation_id: str,
+        from_sequence: int = 0,
+        limit: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """Read a tenant's records in sequence order starting at from_sequence"""
+        return self._tenant(organisation_id).read(from_sequence, limit)
+
+    def last_sequence(self, organisation_id: str) -> int:
+        """Highest stored sequence for a tenant (0 when empty)"""
+        return self._tenant(organisation_id).last_sequence()
+
+    def commit_offset(self, organisation_id: str, consumer_id: str, sequence: int) -> None:
+        """Record that a consumer has processed everything up to sequence"""
+        self._tenant(organisation_id).commit_offset(consumer_id, sequence)
+
+    def get_offset(self, organisation_id: str, consumer_id: str) -> Optional[int]:
+        """Last committed sequence for a consumer, or None if never committed"""
+        return self._tenant(organisation_id).offsets.get(consumer_id)
+
+    def enforce_retention(self, organisation_id: str) -> int:
+        """Apply size/age retention to a tenant's log"""
+        return self._tenant(organisation_id).enforce_retention()
+
+    def get_log_stats(self, organisation_id: str) -> Dict[str, Any]:
+        """Get segment count, size and sequence range for a tenant"""
+        tenant = self._tenant(organisation_id)
+        with tenant.lock:
+            segments = list(tenant.segments)
+        return {
+            "organisation_id": organisation_id,
+            "segment_count": len(segments),
+            "size_bytes": sum(s.size for s in segments),
+            "first_sequence": segments[0].base_sequence if segments else 0,
+            "last_sequence": tenant.last_sequence(),
+        }
+
+    def flush(self) -> None:
+        """Persist all consumer offsets"""
+        with self.lock:
+            tenants = list(self.tenants.values())
+        for tenant in tenants:
+            tenant.flush_offsets()
+
+    def close(self) -> None:
+        """Persist offsets and close all files"""
+        with self.lock:
+            tenants = list(self.tenants.values())
+            self.tenants = {}
+        for tenant in tenants:
+            tenant.close()
+
+    # Private helper methods
+    def _tenant(self, organisation_id: str) -> TenantLog:
+        """Get or open the log for a tenant"""
+        tenant = self.tenants.get(organisation_id)
+        if tenant is None:
+            with self.lock:
+                tenant = self.tenants.get(organisation_id)
+                if tenant is None:
+                    directory = os.path.join(self.config.directory, _tenant_dirname(organisation_id))
+                    tenant = TenantLog(directory, self.config)
+                    self.tenants[organisation_id] = tenant
+        return tenant
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    """Compact JSON encoding of a log record"""
+    return json.dumps(record, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def _tenant_dirname(organisation_id: str) -> str:
+    """Filesystem-safe, collision-free directory name for a tenant"""
+    if re.fullmatch(r"[A-Za-z0-9_.-]+", organisation_id) and organisation_id not in (".", ".."):
+        return organisation_id
+    # "+" never appears in a plain name, so encoded names cannot collide with them
+    return "+" + organisation_id.encode("utf-8").hex()
@@ -0,0 +1,605 @@
+"""
+HTTP Transport
+
+Purpose: Pooled keep-alive HTTP transport for service-to-service requests
+Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-471 to QA-475)
+Tenant Isolation: Connections are pooled per endpoint; tenant scoping is carried in request headers
+"""
+
+from typing import Dict, List, Optional, Any, Iterator, Tuple
+from dataclasses import dataclass
+import asyncio
+import http.client
+import socket
+import ssl
+import threading
+import time
+import weakref
+
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+class TransportError(Exception):
+    """Raised when a request cannot be completed at the transport level"""
+
+    def __init__(self, message: str, timed_out: bool = False):
+        super().__init__(message)
+        self.timed_out = timed_out
+
+
+@dataclass
+class TransportConfig:
+    """HTTP transport configuration"""
+    max_connections_per_host: int = 8  # Concurrent requests per endpoint
+    max_idle_per_host: int = 8  # Keep-alive connections retained per endpoint
+    connect_timeout_seconds: float = 5.0
+    read_timeout_seconds: float = 30.0
+    idle_timeout_seconds: float = 60.0  # Idle connections older than this are closed
+    pool_wait_timeout_seconds: Optional[float] = None  # None = use connect timeout
+    health_path: str = "/health"
+
+    def validate(self) -> bool:
+        """Validate transport configuration"""
+        return (
+            self.max_connections_per_host > 0 and
+            self.max_idle_per_host >= 0 and
+            self.connect_timeout_seconds > 0 and
+            self.read_timeout_seconds > 0 and
+            self.idle_timeout_seconds > 0
+        )
+
+
+@dataclass
+class TransportResponse:
+    """Fully read HTTP response"""
+    status_code: int
+    headers: Dict[str, str]
+    body: bytes
+    elapsed_ms: float
+
+
+@dataclass
+class PoolStats:
+    """Connection pool counters for one endpoint"""
+    host: str
+    port: int
+    created: int = 0
+    reused: int = 0
+    discarded: int = 0
+    in_use: int = 0
+    idle: int = 0
+    wait_timeouts: int = 0
+
+
+class ConnectionPool:
+    """
+    Keep-alive connections to one host:port
+
+    A semaphore caps concurrent requests; idle connections are kept on a
+    LIFO stack so the most recently used (least likely stale) is reused.
+    """
+
+    def __init__(self, host: str, port: int, protocol: str, config: TransportConfig):
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+        self.config = config
+        self.slots = threading.BoundedSemaphore(config.max_connections_per_host)
+        self.lock = threading.Lock()
+        self.idle: List[Tuple[http.client.HTTPConnection, float]] = []  # (connection, idle since)
+        self.stats = PoolStats(host=host, port=port)
+
+    def acquire(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """
+        Take a connection slot
+
+        Returns:
+            (connection, reused) where reused is True for a pooled connection
+        """
+        wait = self.config.pool_wait_timeout_seconds
+        if wait is None:
+            wait = self.config.connect_timeout_seconds
+        if not self.slots.acquire(timeout=wait):
+            with self.lock:
+                self.stats.wait_timeouts += 1
+            raise TransportError(
+                f"Connection pool for {self.host}:{self.port} exhausted", timed_out=True
+            )
+
+        now = time.monotonic()
+        with self.lock:
+            self.stats.in_use += 1
+            while self.idle:
+                connection, idle_since = self.idle.pop()
+                if now - idle_since <= self.config.idle_timeout_seconds:
+                    self.stats.reused += 1
+                    self.stats.idle = len(self.idle)
+                    return connection, True
+                connection.close()
+                self.stats.discarded += 1
+            self.stats.idle = 0
+            self.stats.created += 1
+
+        return self._new_connection(), False
+
+    def release(self, connection: http.client.HTTPConnection, reusable: bool) -> None:
+        """Return a connection slot, keeping the connection if reusable"""
+        with self.lock:
+            self.stats.in_use -= 1
+            if reusable and len(self.idle) < self.config.max_idle_per_host:
+                self.idle.append((connection, time.monotonic()))
+            else:
+                connection.close()
+                self.stats.discarded += 1
+            self.stats.idle = len(self.idle)
+        self.slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self.lock:
+            for connection, _ in self.idle:
+                connection.close()
+            self.idle = []
+            self.stats.idle = 0
+
+    # Private helper methods
+    def _new_connection(self) -> http.client.HTTPConnection:
+        """Create an unconnected HTTP(S) connection"""
+        if self.protocol == "https":
+            return http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.config.connect_timeout_seconds
+            )
+        return http.client.HTTPConnection(
+            self.host, self.port, timeout=self.config.connect_timeout_seconds
+        )
+
+
+class StreamingResponse:
+    """
+    HTTP response whose body is read incrementally
+
+    The pooled connection is returned when the body is exhausted or the
+    response is closed; use as a context manager.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool,
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+        elapsed_ms: float
+    ):
+        self.pool = pool
+        self.connection = connection
+        self.response = response
+        self.status_code = response.status
+        self.headers = dict(response.getheaders())
+        self.elapsed_ms = elapsed_ms
+        self.closed = False
+
+    def iter_content(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yield body chunks as they arrive"""
+        try:
+            while True:
+                chunk = self.response.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        except (OSError, http.client.HTTPException) as e:
+            self._finish(reusable=False)
+            raise TransportError(str(e), timed_out=isinstance(e, socket.timeout)) from e
+        self._finish(reusable=not self.response.will_close)
+
+    def read(self) -> bytes:
+        """Read the remaining body"""
+        return b"".join(self.iter_content())
+
+    def close(self) -> None:
+        """Release the connection, discarding any unread body"""
+        self._finish(reusable=False)
+
+    def __enter__(self) -> "StreamingResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _finish(self, reusable: bool) -> None:
+        """Return the connection to its pool once"""
+        if self.closed:
+            return
+        self.closed = True
+        self.pool.release(self.connection, reusable and self.response.isclosed())
+
+
+class HttpTransport:
+    """
+    Pooled HTTP/1.1 transport
+
+    Keeps one ConnectionPool per (protocol, host, port). An idempotent
+    request that fails on a reused keep-alive connection before any response
+    is received is retried once on a fresh connection, since the server may
+    have closed it. Other methods are not resent: the server may already
+    have acted on the body.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid transport configuration")
+        self.pools: Dict[Tuple[str, str, int], ConnectionPool] = {}
+        self.lock = threading.Lock()
+
+    def request(
+        self,
+        endpoint: Any,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        read_timeout_seconds: Optional[float] = None
+    ) -> TransportResponse:
+        """
+        Send a request and read the whole response
+
+        Args:
+            endpoint: ServiceEndpoint (host, port, protocol)
+            method: HTTP method
+            path: Request path
+            body: Request body bytes
+            headers: Request headers
+            read_timeout_seconds: Override for the configured read timeout
+
+        Returns:
+            TransportResponse
+
+        Raises:
+            TransportError on connection failure or timeout
+        """
+        with self.stream(endpoint, method, path, body, headers, read_timeout_seconds) as response:
+            payload = response.read()
+            return TransportResponse(
+                status_code=response.status_code,
+                headers=response.headers,
+                body=payload,
+                elapsed_ms=response.elapsed_ms
+            )
+
+    def stream(
+        self,
+        endpoint: Any,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        read_timeout_seconds: Optional[float] = None
+    ) -> StreamingResponse:
+        """Send a request and return once headers arrive; the body is streamed"""
+        pool = self._get_pool(endpoint)
+        read_timeout = read_timeout_seconds or self.config.read_timeout_seconds
+        retry_stale = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(2):
+            connection, reused = pool.acquire()
+            start = time.monotonic()
+            try:
+                if connection.sock is None:
+                    connection.connect()
+                    # Headers and body go out in separate writes; avoid Nagle/delayed-ACK stalls
+                    connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                connection.sock.settimeout(read_timeout)
+                connection.request(method, path, body=body, headers=headers or {})
+                response = connection.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as e:
+                pool.release(connection, reusable=False)
+                if reused and retry_stale and attempt == 0:
+                    continue  # Stale keep-alive connection; retry on a fresh one
+                raise TransportError(str(e)) from e
+            except (OSError, http.client.HTTPException) as e:
+                pool.release(connection, reusable=False)
+                raise TransportError(str(e), timed_out=isinstance(e, socket.timeout)) from e
+            except BaseException:
+                pool.release(connection, reusable=False)  # e.g. invalid header value
+                raise
+
+            elapsed_ms = (time.monotonic() - start) * 1000
+            return StreamingResponse(pool, connection, response, elapsed_ms)
+
+        raise TransportError(f"Request to {endpoint.host}:{endpoint.port} failed")
+
+    def get_pool_stats(self) -> List[PoolStats]:
+        """Get connection counters for every endpoint pool"""
+        with self.lock:
+            pools = list(self.pools.values())
+        stats = []
+        for pool in pools:
+            with pool.lock:
+                stats.append(PoolStats(**vars(pool.stats)))
+        return stats
+
+    def close(self) -> None:
+        """Close all idle pooled connections"""
+        with self.lock:
+            pools = list(self.pools.values())
+        for pool in pools:
+            pool.close()
+
+    # Private helper methods
+    def _get_pool(self, endpoint: Any) -> ConnectionPool:
+        """Get or create the pool for an endpoint"""
+        key = (endpoint.protocol, endpoint.host, endpoint.port)
+        pool = self.pools.get(key)
+        if pool is None:
+            with self.lock:
+                pool = self.pools.get(key)
+                if pool is None:
+                    pool = ConnectionPool(endpoint.host, endpoint.port, endpoint.protocol, self.config)
+                    self.pools[key] = pool
+        return pool
+
+
+class AsyncConnectionPool:
+    """
+    Keep-alive asyncio stream connections to one host:port
+
+    Same slot and LIFO idle rules as ConnectionPool. A pool belongs to the
+    event loop it was created on and is only touched from that loop.
+    """
+
+    def __init__(self, host: str, port: int, protocol: str, config: TransportConfig):
+        self.host = host
+        self.port = port
+        self.protocol = protocol
+        self.config = config
+        self.slots = asyncio.Semaphore(config.max_connections_per_host)
+        # (reader, writer, idle since)
+        self.idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter, float]] = []
+        self.stats = PoolStats(host=host, port=port)
+
+    async def acquire(self) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter, bool]:
+        """
+        Take a connection slot
+
+        Returns:
+            (reader, writer, reused) where reused is True for a pooled connection
+        """
+        wait = self.config.pool_wait_timeout_seconds
+        if wait is None:
+            wait = self.config.connect_timeout_seconds
+        try:
+            await asyncio.wait_for(self.slots.acquire(), timeout=wait)
+        except TimeoutError:
+            self.stats.wait_timeouts += 1
+            raise TransportError(
+                f"Connection pool for {self.host}:{self.port} exhausted", timed_out=True
+            )
+
+        self.stats.in_use += 1
+        now = time.monotonic()
+        while self.idle:
+            reader, writer, idle_since = self.idle.pop()
+            if (now - idle_since <= self.config.idle_timeout_seconds and
+                    not reader.at_eof() and not writer.is_closing()):
+                self.stats.reused += 1
+                self.stats.idle = len(self.idle)
+                return reader, writer, True
+            writer.close()
+            self.stats.discarded += 1
+        self.stats.idle = 0
+        self.stats.created += 1
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(
+                    self.host,
+                    self.port,
+                    ssl=ssl.create_default_context() if self.protocol == "https" else None
+                ),
+                timeout=self.config.connect_timeout_seconds
+            )
+        except BaseException as e:
+            self.stats.in_use -= 1
+            self.slots.release()
+            if isinstance(e, asyncio.TimeoutError):
+                raise TransportError(f"Connect to {self.host}:{self.port} timed out", timed_out=True) from e
+            if isinstance(e, OSError):
+                raise TransportError(str(e)) from e
+            raise
+        return reader, writer, False
+
+    def release(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, reusable: bool) -> None:
+        """Return a connection slot, keeping the connection if reusable"""
+        self.stats.in_use -= 1
+        if reusable and len(self.idle) < self.config.max_idle_per_host:
+            self.idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+            self.stats.discarded += 1
+        self.stats.idle = len(self.idle)
+        self.slots.release()
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        for _, writer, _ in self.idle:
+            writer.close()
+        self.idle = []
+        self.stats.idle = 0
+
+
+class AsyncHttpTransport:
+    """
+    Pooled HTTP/1.1 transport for asyncio callers
+
+    asyncio streams cannot be shared between event loops, so pools are kept
+    per loop; pools of loops that have since closed are dropped. Response
+    bodies are read in full (Content-Length, chunked, or until close). As
+    with HttpTransport, an idempotent request on a reused connection the
+    server has already closed is retried once on a fresh connection.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid transport configuration")
+        self.loop_pools: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()  # event loop -> {(protocol, host, port) -> pool}
+        self.lock = threading.Lock()
+
+    async def request(
+        self,
+        endpoint: Any,
+        method: str,
+        path: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        read_timeout_seconds: Optional[float] = None
+    ) -> TransportResponse:
+        """
+        Send a request and read the whole response
+
+        Args:
+            endpoint: ServiceEndpoint (host, port, protocol)
+            method: HTTP method
+            path: Request path
+            body: Request body bytes
+            headers: Request headers
+            read_timeout_seconds: Override for the configured read timeout,
+                applied to the whole exchange
+
+        Returns:
+            TransportResponse
+
+        Raises:
+            TransportError on connection failure or timeout
+        """
+        pool = self._get_pool(endpoint)
+        read_timeout = read_timeout_seconds or self.config.read_timeout_seconds
+        retry_stale = method.upper() in IDEMPOTENT_METHODS
+
+        for attempt in range(2):
+            reader, writer, reused = await pool.acquire()
+            start = time.monotonic()
+            try:
+                async with asyncio.timeout(read_timeout):
+                    status_code, response_headers, payload, reusable = await self._exchange(
+                        reader, writer, endpoint, method, path, body, headers or {}
+                    )
+            except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError) as e:
+                pool.release(reader, writer, reusable=False)
+                if reused and retry_stale and attempt == 0:
+                    continue  # Stale keep-alive connection; retry on a fresh one
+                raise TransportError(str(e) or type(e).__name__) from e
+            except TimeoutError as e:
+                pool.release(reader, writer, reusable=False)
+                raise TransportError(f"Request to {pool.host}:{pool.port} timed out", timed_out=True) from e
+            except (OSError, ValueError) as e:
+                pool.release(reader, writer, reusable=False)
+                raise TransportError(str(e)) from e
+            except BaseException:
+                pool.release(reader, writer, reusable=False)  # Cancelled mid-exchange
+                raise
+
+            pool.release(reader, writer, reusable)
+            return TransportResponse(
+                status_code=status_code,
+                headers=response_headers,
+                body=payload,
+                elapsed_ms=(time.monotonic() - start) * 1000
+            )
+
+        raise TransportError(f"Request to {endpoint.host}:{endpoint.port} failed")
+
+    def get_pool_stats(self) -> List[PoolStats]:
+        """Get connection counters for every endpoint pool on every loop"""
+        with self.lock:
+            pools = [pool for pools in self.loop_pools.values() for pool in pools.values()]
+        return [PoolStats(**vars(pool.stats)) for pool in pools]
+
+    async def aclose(self) -> None:
+        """Close idle pooled connections belonging to the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self.lock:
+            pools = self.loop_pools.pop(loop, {})
+        for pool in pools.values():
+            pool.close()
+
+    # Private helper methods
+    def _get_pool(self, endpoint: Any) -> AsyncConnectionPool:
+        """Get or create the running loop's pool for an endpoint"""
+        loop = asyncio.get_running_loop()
+        key = (endpoint.protocol, endpoint.host, endpoint.port)
+        with self.lock:
+            pools = self.loop_pools.get(loop)
+            if pools is None:
+                for other in [other for other in self.loop_pools.keys() if other.is_closed()]:
+                    del self.loop_pools[other]
+                pools = self.loop_pools[loop] = {}
+            pool = pools.get(key)
+            if pool is None:
+                pool = pools[key] = AsyncConnectionPool(
+                    endpoint.host, endpoint.port, endpoint.protocol, self.config
+                )
+        return pool
+
+    async def _exchange(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+        endpoint: Any,
+        method: str,
+        path: str,
+        body: Optional[bytes],
+        headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, str], bytes, bool]:
+        """Write one request and read its response: (status, headers, body, reusable)"""
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {endpoint.host}:{endpoint.port}"]
+        lines.extend(f"{name}: {value}" for name, value in headers.items())
+        if body is not None or method in ("POST", "PUT", "PATCH"):
+            lines.append(f"Content-Length: {len(body or b'')}")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Remote end closed connection without response")
+        parts = status_line.decode("latin-1").split(None, 2)
+        if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+            raise ValueError(f"Malformed status line: {status_line!r}")
+        version, status_code = parts[0], int(parts[1])
+
+        response_headers: Dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            response_headers[name.strip()] = value.strip()
+        lowered = {name.lower(): value.lower() for name, value in response_headers.items()}
+        reusable = version == "HTTP/1.1" and lowered.get("connection") != "close"
+
+        if method == "HEAD" or status_code in (204, 304) or status_code < 200:
+            payload = b""
+        elif "chunked" in lowered.get("transfer-encoding", ""):
+            payload = await _read_chunked(reader)
+        elif "content-length" in lowered:
+            payload = await reader.readexactly(int(lowered["content-length"]))
+        else:
+            payload = await reader.read()  # Delimited by connection close
+            reusable = False
+        return status_code, response_headers, payload, reusable
+
+
+async def _read_chunked(reader: asyncio.StreamReader) -> bytes:
+    """Read a chunked transfer-encoded body"""
+    chunks = []
+    while True:
+        size_line = await reader.readline()
+        if not size_line:
+            raise asyncio.IncompleteReadError(b"".join(chunks), None)
+        size = int(size_line.split(b";", 1)[0].strip(), 16)
+        if size == 0:
+            while await reader.readline() not in (b"\r\n", b"\n", b""):
+                pass  # Discard trailers
+            return b"".join(chunks)
+        chunks.append(await reader.readexactly(size))
+        await reader.readexactly(2)  # CRLF after each chunk
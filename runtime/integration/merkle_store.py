@@ -0,0 +1,218 @@
+"""
+Merkle Store
+
+Purpose: Keyed record store with an incrementally maintained Merkle tree for anti-entropy
+Authority: Wave 2.0 Subwave 2.10 - Deep Integration Phase 2 (QA-481 to QA-485)
+Tenant Isolation: One store per organisation_id and subsystem, owned by the consistency manager
+"""
+
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Set, Tuple
+from dataclasses import dataclass, field
+import hashlib
+import json
+import threading
+import zlib
+
+
+DIGEST_SIZE = 16
+DIGEST_MODULUS = 1 << (8 * DIGEST_SIZE)
+_MISSING = object()
+
+
+@dataclass
+class MerkleStoreConfig:
+    """Merkle tree shape; stores can only be compared if their shapes match"""
+    fanout: int = 16
+    depth: int = 4  # fanout ** depth leaf buckets
+
+    @property
+    def leaf_count(self) -> int:
+        return self.fanout ** self.depth
+
+    def validate(self) -> bool:
+        """Validate Merkle store configuration"""
+        return self.fanout >= 2 and self.depth >= 1 and self.leaf_count <= 1 << 24
+
+
+@dataclass
+class MerkleDiff:
+    """Result of comparing two Merkle stores"""
+    keys: List[str] = field(default_factory=list)  # Keys whose records differ or exist on one side only
+    nodes_compared: int = 0  # Interior node hashes compared
+    buckets_compared: int = 0  # Leaf buckets whose keys were compared
+
+
+class MerkleStore:
+    """
+    Keyed records under a fixed-shape Merkle tree
+
+    Keys are hashed into fanout ** depth leaf buckets. A bucket's hash is
+    the sum of its record digests, so a put or delete updates it in O(1);
+    interior nodes above changed buckets are rehashed lazily, once, the next
+    time the tree is read. Comparing two stores descends only into subtrees
+    whose hashes differ, so the cost follows the divergence, not the size.
+    """
+
+    def __init__(self, config: Optional[MerkleStoreConfig] = None):
+        self.config = config or MerkleStoreConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid Merkle store configuration")
+
+        self.records: Dict[str, Any] = {}
+        self.buckets: List[Optional[Dict[str, int]]] = [None] * self.config.leaf_count  # key -> record digest
+        self.bucket_hashes: List[int] = [0] * self.config.leaf_count
+        self.dirty: Set[int] = set()  # Buckets changed since interior nodes were hashed
+        self.lock = threading.RLock()
+
+        # levels[0] is the root; levels[depth - 1] are the parents of the buckets
+        self.levels: List[List[bytes]] = []
+        empty = bytes(DIGEST_SIZE)
+        for level in range(self.config.depth - 1, -1, -1):
+            empty = _hash_children([empty] * self.config.fanout)
+            self.levels.insert(0, [empty] * self.config.fanout ** level)
+
+    def put(self, key: str, value: Any) -> None:
+        """Insert or replace a record"""
+        self.update([(key, value)])
+
+    def update(self, items: Iterable[Tuple[str, Any]]) -> None:
+        """Insert or replace many records"""
+        with self.lock:
+            for key, value in items:
+                index = _bucket_index(key, self.config.leaf_count)
+                bucket = self.buckets[index]
+                if bucket is None:
+                    bucket = self.buckets[index] = {}
+                digest = _record_digest(key, value)
+                previous = bucket.get(key, 0)
+                bucket[key] = digest
+                self.records[key] = value
+                self.bucket_hashes[index] = (self.bucket_hashes[index] - previous + digest) % DIGEST_MODULUS
+                self.dirty.add(index)
+
+    def delete(self, key: str) -> bool:
+        """
+        Remove a record
+
+        Returns:
+            True if the key existed
+        """
+        with self.lock:
+            if self.records.pop(key, _MISSING) is _MISSING:
+                return False
+            index = _bucket_index(key, self.config.leaf_count)
+            digest = self.buckets[index].pop(key)
+            self.bucket_hashes[index] = (self.bucket_hashes[index] - digest) % DIGEST_MODULUS
+            self.dirty.add(index)
+            return True
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a record value"""
+        return self.records.get(key, default)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.records))
+
+    def digest(self, key: str) -> Optional[int]:
+        """Get the digest of one record, or None if absent"""
+        with self.lock:
+            bucket = self.buckets[_bucket_index(key, self.config.leaf_count)]
+            return bucket.get(key) if bucket else None
+
+    def root_hash(self) -> str:
+        """Get the root hash as hex"""
+        with self.lock:
+            self._refresh()
+            return self.levels[0][0].hex()
+
+    def diff(self, other: "MerkleStore") -> MerkleDiff:
+        """
+        Find the keys whose records differ between two stores
+
+        Raises:
+            ValueError: If the stores have different tree shapes
+        """
+        if (self.config.fanout, self.config.depth) != (other.config.fanout, other.config.depth):
+            raise ValueError("Cannot compare Merkle stores with different shapes")
+
+        # Lock in a stable order so concurrent diffs cannot deadlock
+        first, second = sorted((self, other), key=id)
+        with first.lock, second.lock:
+            self._refresh()
+            other._refresh()
+
+            result = MerkleDiff(nodes_compared=1)
+            if self.levels[0][0] == other.levels[0][0]:
+                return result
+
+            fanout = self.config.fanout
+            differing = [0]
+            for level in range(1, self.config.depth):
+                mine, theirs = self.levels[level], other.levels[level]
+                children = []
+                for parent in differing:
+                    for child in range(parent * fanout, (parent + 1) * fanout):
+                        if mine[child] != theirs[child]:
+                            children.append(child)
+                result.nodes_compared += len(differing) * fanout
+                differing = children
+
+            for parent in differing:
+                for index in range(parent * fanout, (parent + 1) * fanout):
+                    if self.bucket_hashes[index] == other.bucket_hashes[index]:
+                        continue
+                    result.buckets_compared += 1
+                    mine, theirs = self.buckets[index] or {}, other.buckets[index] or {}
+                    for key in mine.keys() | theirs.keys():
+                        if mine.get(key) != theirs.get(key):
+                            result.keys.append(key)
+
+            result.keys.sort()
+            return result
+
+    # Private helper methods
+    def _refresh(self) -> None:
+        """Rehash interior nodes above dirty buckets (caller holds lock)"""
+        if not self.dirty:
+            return
+
+        fanout = self.config.fanout
+        parents = {index // fanout for index in self.dirty}
+        for parent in parents:
+            base = parent * fanout
+            self.levels[-1][parent] = _hash_children(
+                value.to_bytes(DIGEST_SIZE, "big")
+                for value in self.bucket_hashes[base:base + fanout]
+            )
+
+        for level in range(self.config.depth - 1, 0, -1):
+            nodes = self.levels[level]
+            parents = {index // fanout for index in parents}
+            for parent in parents:
+                base = parent * fanout
+                self.levels[level - 1][parent] = _hash_children(nodes[base:base + fanout])
+
+        self.dirty.clear()
+
+
+def _bucket_index(key: str, leaf_count: int) -> int:
+    """Map a key to its leaf bucket (stable across processes)"""
+    return zlib.crc32(key.encode("utf-8")) % leaf_count
+
+
+def _record_digest(key: str, value: Any) -> int:
+    """Digest of one key and its canonical JSON value"""
+    body = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    data = key.encode("utf-8") + b"\x00" + body.encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(data, digest_size=DIGEST_SIZE).digest(), "big")
+
+
+def _hash_children(children: Iterable[bytes]) -> bytes:
+    """Hash of an interior node from its children's hashes"""
+    return hashlib.blake2b(b"".join(children), digest_size=DIGEST_SIZE).digest()
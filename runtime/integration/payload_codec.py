@@ -0,0 +1,531 @@
+"""
+Payload Codec
+
+Purpose: Wire encoding for service payloads - negotiated compression, compact binary serialization and authenticated sealing
+Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-471 to QA-475)
+Tenant Isolation: Sealing keys are derived per organisation_id and bound into every authentication tag
+"""
+
+from typing import Dict, List, Optional, Any, FrozenSet, Iterable, Tuple
+from dataclasses import dataclass, field
+import hashlib
+import hmac
+import json
+import lzma
+import os
+import struct
+import zlib
+
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    AEAD_AVAILABLE = True
+except ImportError:
+    AESGCM = InvalidTag = None
+    AEAD_AVAILABLE = False
+
+
+JSON_CONTENT_TYPE = "application/json"
+BINARY_CONTENT_TYPE = "application/x-maturion-binary"
+
+# HTTP content-codings, listed in Content-Encoding in the order applied
+DEFLATE = "deflate"  # zlib stream
+XZ = "xz"  # lzma .xz container
+SEALED = "x-sealed"  # AES-256-GCM, or the keystream + HMAC fallback (see seal)
+COMPRESSION_CODINGS = (XZ, DEFLATE)  # Preference order
+
+SEAL_VERSION = 1  # Key derivation version, bound into the HKDF info
+SEAL_FRAME_STREAM = 1  # SHAKE-256 keystream + HMAC-SHA256 tag
+SEAL_FRAME_AEAD = 2  # AES-256-GCM
+SEAL_NONCE_BYTES = 16
+SEAL_TAG_BYTES = 32
+AEAD_NONCE_BYTES = 12
+AEAD_TAG_BYTES = 16
+
+
+class PayloadIntegrityError(ValueError):
+    """Raised when a sealed payload fails authentication or cannot be decoded"""
+
+
+@dataclass
+class CodecConfig:
+    """Payload codec configuration"""
+    zlib_threshold_bytes: int = 1024  # Deflate payloads at least this large
+    lzma_threshold_bytes: int = 256 * 1024  # Prefer xz from this size
+    zlib_level: int = 6
+    lzma_preset: int = 1  # Higher presets compress better but are much slower
+    binary_threshold_bytes: int = 64 * 1024  # Binary-encode JSON bodies at least this large
+    max_decoded_bytes: int = 64 * 1024 * 1024  # Largest body accepted after decompression
+
+    def validate(self) -> bool:
+        """Validate codec configuration"""
+        return (
+            self.zlib_threshold_bytes >= 0 and
+            self.lzma_threshold_bytes >= 0 and
+            0 <= self.zlib_level <= 9 and
+            0 <= self.lzma_preset <= 9 and
+            self.binary_threshold_bytes >= 0 and
+            self.max_decoded_bytes >= 1
+        )
+
+
+@dataclass
+class PeerCapabilities:
+    """Request encodings a peer has advertised it can decode"""
+    content_codings: FrozenSet[str] = frozenset()
+    binary: bool = False
+
+    @classmethod
+    def from_headers(cls, headers: Dict[str, str]) -> "PeerCapabilities":
+        """Read Accept-Encoding (RFC 7694) and Accept-Post from response headers"""
+        lowered = {name.lower(): value for name, value in headers.items()}
+        return cls(
+            content_codings=frozenset(_split_tokens(lowered.get("accept-encoding", ""))),
+            binary=BINARY_CONTENT_TYPE in _split_tokens(lowered.get("accept-post", ""))
+        )
+
+
+@dataclass
+class SealingKey:
+    """Encryption and MAC keys for one tenant secret"""
+    encryption_key: bytes
+    mac_key: bytes
+    associated_data: bytes  # Bound into every tag (tenant and purpose)
+
+
+@dataclass
+class EncodedPayload:
+    """A payload ready for the wire"""
+    body: bytes
+    content_type: str
+    content_encoding: List[str] = field(default_factory=list)
+    payload_bytes: int = 0  # Size of the plain JSON encoding
+
+
+def derive_sealing_key(secret: str, organisation_id: str, purpose: str = "payload") -> SealingKey:
+    """
+    Derive sealing keys from a tenant secret with HKDF-SHA256 (RFC 5869)
+
+    The organisation id is the salt, so the same secret yields unrelated
+    keys for different tenants. The salt is public (it travels in
+    X-Organisation-Id), so the secret must be a dedicated shared secret
+    that is never sent alongside sealed payloads - not an API key or
+    bearer token.
+    """
+    salt = organisation_id.encode("utf-8")
+    info = f"maturion-{purpose}-seal-v{SEAL_VERSION}".encode()
+    prk = hmac.new(salt, secret.encode("utf-8"), hashlib.sha256).digest()
+
+    okm = b""
+    block = b""
+    counter = 1
+    while len(okm) < 64:
+        block = hmac.new(prk, block + info + bytes([counter]), hashlib.sha256).digest()
+        okm += block
+        counter += 1
+
+    return SealingKey(
+        encryption_key=okm[:32],
+        mac_key=okm[32:64],
+        associated_data=salt + b"\x00" + info
+    )
+
+
+def seal(data: bytes, key: SealingKey) -> bytes:
+    """
+    Authenticated encryption of a byte string
+
+    With the cryptography package installed the frame is AES-256-GCM:
+    version (1) | nonce (12) | ciphertext | GCM tag (16), with the key's
+    associated data authenticated. Nonces are random, so one key should
+    seal well under 2**32 payloads before its secret is rotated.
+
+    Without it the frame falls back to encrypt-then-MAC: version (1) |
+    nonce (16) | ciphertext | HMAC-SHA256 tag (32), with a SHAKE-256
+    keystream over key and nonce and the tag covering the version, nonce,
+    associated data and ciphertext. This construction is not a
+    standardised AEAD and has had no independent review; its
+    confidentiality depends entirely on a nonce never repeating under one
+    key, which random 128-bit nonces make negligible. Peers without
+    cryptography cannot open AES-256-GCM frames.
+    """
+    if AEAD_AVAILABLE:
+        nonce = os.urandom(AEAD_NONCE_BYTES)
+        return bytes([SEAL_FRAME_AEAD]) + nonce + AESGCM(key.encryption_key).encrypt(nonce, data, key.associated_data)
+
+    nonce = os.urandom(SEAL_NONCE_BYTES)
+    header = bytes([SEAL_FRAME_STREAM]) + nonce
+    ciphertext = _xor(data, _keystream(key, nonce, len(data)))
+    tag = hmac.new(key.mac_key, header + key.associated_data + ciphertext, hashlib.sha256).digest()
+    return header + ciphertext + tag
+
+
+def unseal(frame: bytes, key: SealingKey) -> bytes:
+    """
+    Verify and decrypt a frame produced by seal()
+
+    Raises:
+        PayloadIntegrityError: If the frame is malformed, the tag does not
+            match, or it is an AES-256-GCM frame and cryptography is not installed
+    """
+    if frame[:1] == bytes([SEAL_FRAME_AEAD]):
+        return _unseal_aead(frame, key)
+    if len(frame) < 1 + SEAL_NONCE_BYTES + SEAL_TAG_BYTES or frame[0] != SEAL_FRAME_STREAM:
+        raise PayloadIntegrityError("Malformed sealed payload")
+
+    header = frame[:1 + SEAL_NONCE_BYTES]
+    ciphertext = frame[1 + SEAL_NONCE_BYTES:-SEAL_TAG_BYTES]
+    expected = hmac.new(key.mac_key, header + key.associated_data + ciphertext, hashlib.sha256).digest()
+    if not hmac.compare_digest(expected, frame[-SEAL_TAG_BYTES:]):
+        raise PayloadIntegrityError("Sealed payload failed authentication")
+
+    return _xor(ciphertext, _keystream(key, header[1:], len(ciphertext)))
+
+
+def _unseal_aead(frame: bytes, key: SealingKey) -> bytes:
+    """Open an AES-256-GCM frame"""
+    if not AEAD_AVAILABLE:
+        raise PayloadIntegrityError("AES-256-GCM sealed payload needs the cryptography package")
+    if len(frame) < 1 + AEAD_NONCE_BYTES + AEAD_TAG_BYTES:
+        raise PayloadIntegrityError("Malformed sealed payload")
+    nonce = frame[1:1 + AEAD_NONCE_BYTES]
+    try:
+        return AESGCM(key.encryption_key).decrypt(nonce, frame[1 + AEAD_NONCE_BYTES:], key.associated_data)
+    except InvalidTag as e:
+        raise PayloadIntegrityError("Sealed payload failed authentication") from e
+
+
+class PayloadCodec:
+    """
+    Encodes payload dicts for the wire and decodes them back
+
+    Encoding pipeline: JSON, or the compact binary format for large bodies
+    when the peer accepts it; then deflate or xz by size threshold when the
+    peer accepts it and it actually saves bytes; then sealing when a key is
+    given. Decoding reverses the Content-Encoding list.
+    """
+
+    def __init__(self, config: Optional[CodecConfig] = None):
+        self.config = config or CodecConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid codec configuration")
+
+    def encode(
+        self,
+        payload: Any,
+        peer: Optional[PeerCapabilities] = None,
+        sealing_key: Optional[SealingKey] = None
+    ) -> EncodedPayload:
+        """
+        Encode a payload for a peer
+
+        Args:
+            payload: JSON-serialisable data
+            peer: Encodings the receiver accepts (identity JSON if not provided)
+            sealing_key: Seal the result with this key
+
+        Returns:
+            EncodedPayload with body and content headers
+        """
+        peer = peer or PeerCapabilities()
+        body = json.dumps(payload).encode("utf-8")
+        encoded = EncodedPayload(body=body, content_type=JSON_CONTENT_TYPE, payload_bytes=len(body))
+
+        if peer.binary and len(body) >= self.config.binary_threshold_bytes:
+            encoded.body = binary_dumps(payload)
+            encoded.content_type = BINARY_CONTENT_TYPE
+
+        coding = self._choose_compression(len(encoded.body), peer.content_codings)
+        if coding:
+            compressed = self._compress(encoded.body, coding)
+            if len(compressed) < len(encoded.body):
+                encoded.body = compressed
+                encoded.content_encoding.append(coding)
+
+        if sealing_key is not None:
+            encoded.body = seal(encoded.body, sealing_key)
+            encoded.content_encoding.append(SEALED)
+
+        return encoded
+
+    def decode(
+        self,
+        body: bytes,
+        content_type: Optional[str] = None,
+        content_encoding: Iterable[str] = (),
+        sealing_key: Optional[SealingKey] = None
+    ) -> Tuple[Any, int]:
+        """
+        Decode a wire body
+
+        Returns:
+            (payload, decoded size in bytes before deserialisation)
+
+        Raises:
+            PayloadIntegrityError: On authentication failure, an unknown
+                coding, a sealed body without a key, a body larger than
+                max_decoded_bytes, or nesting too deep to deserialise
+        """
+        data = body
+        for coding in reversed(list(content_encoding)):
+            try:
+                if coding == SEALED:
+                    if sealing_key is None:
+                        raise PayloadIntegrityError("Sealed payload received without a sealing key")
+                    data = unseal(data, sealing_key)
+                elif coding == DEFLATE:
+                    data = self._decompress(zlib.decompressobj(), data, coding)
+                elif coding == XZ:
+                    data = self._decompress(lzma.LZMADecompressor(format=lzma.FORMAT_XZ), data, coding)
+                elif coding != "identity":
+                    raise PayloadIntegrityError(f"Unsupported content-coding: {coding}")
+            except (zlib.error, lzma.LZMAError) as e:
+                raise PayloadIntegrityError(f"Corrupt {coding} payload: {e}") from e
+        if len(data) > self.config.max_decoded_bytes:
+            raise PayloadIntegrityError(f"Payload exceeds {self.config.max_decoded_bytes} bytes")
+
+        if content_type and content_type.split(";")[0].strip() == BINARY_CONTENT_TYPE:
+            return binary_loads(data), len(data)
+        try:
+            return (json.loads(data) if data else {}), len(data)
+        except RecursionError as e:
+            raise PayloadIntegrityError("JSON payload is nested too deeply") from e
+
+    def request_headers(self, sealed: bool = False) -> Dict[str, str]:
+        """Headers a client sends to ask for encoded (and optionally sealed) responses"""
+        codings = (*COMPRESSION_CODINGS, SEALED) if sealed else COMPRESSION_CODINGS
+        return {
+            "Accept-Encoding": ", ".join(codings),
+            "Accept": f"{BINARY_CONTENT_TYPE}, {JSON_CONTENT_TYPE}",
+        }
+
+    def advertise_headers(self) -> Dict[str, str]:
+        """Headers a server sends to advertise the request encodings it accepts"""
+        return {
+            "Accept-Encoding": ", ".join((*COMPRESSION_CODINGS, SEALED)),
+            "Accept-Post": f"{JSON_CONTENT_TYPE}, {BINARY_CONTENT_TYPE}",
+        }
+
+    # Private helper methods
+    def _choose_compression(self, size: int, accepted: FrozenSet[str]) -> Optional[str]:
+        """Pick xz for very large bodies, deflate for large ones"""
+        if size >= self.config.lzma_threshold_bytes and XZ in accepted:
+            return XZ
+        if size >= self.config.zlib_threshold_bytes and DEFLATE in accepted:
+            return DEFLATE
+        return None
+
+    def _compress(self, data: bytes, coding: str) -> bytes:
+        """Apply one compression coding"""
+        if coding == XZ:
+            return lzma.compress(data, format=lzma.FORMAT_XZ, preset=self.config.lzma_preset)
+        return zlib.compress(data, self.config.zlib_level)
+
+    def _decompress(self, decompressor: Any, data: bytes, coding: str) -> bytes:
+        """Undo one compression coding, producing at most max_decoded_bytes"""
+        limit = self.config.max_decoded_bytes
+        if coding == XZ:
+            output = decompressor.decompress(data, max_length=limit + 1)
+        else:
+            output = decompressor.decompress(data, limit + 1)
+        if len(output) > limit:
+            raise PayloadIntegrityError(f"Decompressed {coding} payload exceeds {limit} bytes")
+        if not decompressor.eof:
+            raise PayloadIntegrityError(f"Corrupt {coding} payload: truncated stream")
+        return output
+
+
+def parse_content_encoding(value: Optional[str]) -> List[str]:
+    """Split a Content-Encoding header into codings in the order applied"""
+    return _split_tokens(value or "")
+
+
+# Compact binary format
+#
+# Tagged values; integers are zigzag varints, strings and bytes are
+# length-prefixed, and dict keys are interned: the first occurrence of a
+# key is written in full and later occurrences by table index, so lists of
+# records do not repeat their field names.
+
+_NONE, _FALSE, _TRUE, _INT, _FLOAT, _STR, _BYTES, _LIST, _DICT, _KEY, _KEY_REF = range(11)
+_DOUBLE = struct.Struct(">d")
+
+
+def binary_dumps(value: Any) -> bytes:
+    """Serialise JSON-like data (plus bytes) to the compact binary format"""
+    out = bytearray()
+    _write_value(out, value, {})
+    return bytes(out)
+
+
+def binary_loads(data: bytes) -> Any:
+    """
+    Deserialise data produced by binary_dumps
+
+    Raises:
+        PayloadIntegrityError: If the data is truncated or malformed
+    """
+    try:
+        value, position = _read_value(memoryview(data), 0, [])
+    except (IndexError, ValueError, UnicodeDecodeError, struct.error) as e:
+        raise PayloadIntegrityError(f"Malformed binary payload: {e}") from e
+    except RecursionError as e:
+        raise PayloadIntegrityError("Binary payload is nested too deeply") from e
+    if position != len(data):
+        raise PayloadIntegrityError("Trailing bytes after binary payload")
+    return value
+
+
+def _write_varint(out: bytearray, number: int) -> None:
+    while number > 0x7F:
+        out.append((number & 0x7F) | 0x80)
+        number >>= 7
+    out.append(number)
+
+
+def _write_str(out: bytearray, text: str) -> None:
+    encoded = text.encode("utf-8")
+    _write_varint(out, len(encoded))
+    out += encoded
+
+
+def _write_value(out: bytearray, value: Any, keys: Dict[str, int]) -> None:
+    if value is None:
+        out.append(_NONE)
+    elif value is True:
+        out.append(_TRUE)
+    elif value is False:
+        out.append(_FALSE)
+    elif isinstance(value, int):
+        out.append(_INT)
+        _write_varint(out, value * 2 if value >= 0 else -value * 2 - 1)
+    elif isinstance(value, float):
+        out.append(_FLOAT)
+        out += _DOUBLE.pack(value)
+    elif isinstance(value, str):
+        out.append(_STR)
+        _write_str(out, value)
+    elif isinstance(value, (bytes, bytearray)):
+        out.append(_BYTES)
+        _write_varint(out, len(value))
+        out += value
+    elif isinstance(value, (list, tuple)):
+        out.append(_LIST)
+        _write_varint(out, len(value))
+        for item in value:
+            _write_value(out, item, keys)
+    elif isinstance(value, dict):
+        out.append(_DICT)
+        _write_varint(out, len(value))
+        for key, item in value.items():
+            if not isinstance(key, str):
+                key = _json_key(key)
+            index = keys.get(key)
+            if index is None:
+                keys[key] = len(keys)
+                out.append(_KEY)
+                _write_str(out, key)
+            else:
+                out.append(_KEY_REF)
+                _write_varint(out, index)
+            _write_value(out, item, keys)
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not binary serialisable")
+
+
+def _json_key(key: Any) -> str:
+    """Coerce a non-str dict key the way json.dumps does"""
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, (int, float)):
+        return json.dumps(key)
+    raise TypeError(f"Binary payload keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _read_varint(data: memoryview, position: int) -> Tuple[int, int]:
+    number = 0
+    shift = 0
+    while True:
+        byte = data[position]
+        position += 1
+        number |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return number, position
+        shift += 7
+
+
+def _read_str(data: memoryview, position: int) -> Tuple[str, int]:
+    length, position = _read_varint(data, position)
+    end = position + length
+    if end > len(data):
+        raise ValueError("string runs past end of data")
+    return str(data[position:end], "utf-8"), end
+
+
+def _read_value(data: memoryview, position: int, keys: List[str]) -> Tuple[Any, int]:
+    tag = data[position]
+    position += 1
+
+    if tag == _NONE:
+        return None, position
+    if tag == _TRUE:
+        return True, position
+    if tag == _FALSE:
+        return False, position
+    if tag == _INT:
+        number, position = _read_varint(data, position)
+        return (number >> 1) if not number & 1 else -((number + 1) >> 1), position
+    if tag == _FLOAT:
+        return _DOUBLE.unpack_from(data, position)[0], position + _DOUBLE.size
+    if tag == _STR:
+        return _read_str(data, position)
+    if tag == _BYTES:
+        length, position = _read_varint(data, position)
+        if position + length > len(data):
+            raise ValueError("bytes run past end of data")
+        return bytes(data[position:position + length]), position + length
+    if tag == _LIST:
+        count, position = _read_varint(data, position)
+        items = []
+        for _ in range(count):
+            item, position = _read_value(data, position, keys)
+            items.append(item)
+        return items, position
+    if tag == _DICT:
+        count, position = _read_varint(data, position)
+        result = {}
+        for _ in range(count):
+            key_tag = data[position]
+            position += 1
+            if key_tag == _KEY:
+                key, position = _read_str(data, position)
+                keys.append(key)
+            elif key_tag == _KEY_REF:
+                index, position = _read_varint(data, position)
+                key = keys[index]
+            else:
+                raise ValueError(f"unexpected key tag {key_tag}")
+            result[key], position = _read_value(data, position, keys)
+        return result, position
+    raise ValueError(f"unknown tag {tag}")
+
+
+def _keystream(key: SealingKey, nonce: bytes, length: int) -> bytes:
+    """SHAKE-256 keystream for a key and nonce"""
+    return hashlib.shake_256(key.encryption_key + nonce).digest(length)
+
+
+def _xor(data: bytes, keystream: bytes) -> bytes:
+    """XOR two equal-length byte strings"""
+    if not data:
+        return b""
+    return (int.from_bytes(data, "big") ^ int.from_bytes(keystream, "big")).to_bytes(len(data), "big")
+
+
+def _split_tokens(value: str) -> List[str]:
+    """Split a comma-separated header value into lowercase tokens without parameters"""
+    return [token.split(";")[0].strip().lower() for token in value.split(",") if token.strip()]
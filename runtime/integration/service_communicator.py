@@ -9,9 +9,38 @@ Tenant Isolation: All operations scoped by organisation_id
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
 from enum import Enum
+import asyncio
+import base64
+import bisect
 import time
 import hashlib
+import json
+import secrets
+import threading
+
+from .http_transport import (
+    IDEMPOTENT_METHODS,
+    AsyncHttpTransport,
+    HttpTransport,
+    StreamingResponse,
+    TransportError,
+    TransportResponse,
+)
+from .payload_codec import (
+    COMPRESSION_CODINGS,
+    SEALED,
+    BINARY_CONTENT_TYPE,
+    EncodedPayload,
+    PayloadCodec,
+    PayloadIntegrityError,
+    PeerCapabilities,
+    SealingKey,
+    derive_sealing_key,
+    parse_content_encoding,
+)
 
 
 class ServiceState(Enum):
@@ -31,6 +60,10 @@ class SecurityLevel(Enum):
     MUTUAL_TLS = "mutual_tls"
 
 
+# Levels whose request and response bodies are sealed on the wire
+WIRE_SEALED_LEVELS = (SecurityLevel.ENCRYPTED,)
+
+
 @dataclass
 class ServiceEndpoint:
     """Service endpoint information"""
@@ -107,6 +140,131 @@ class RetryPolicy:
         )
 
 
+@dataclass
+class HedgingPolicy:
+    """
+    Hedged request policy for idempotent requests
+    
+    If the first attempt has not answered after the target's latency
+    percentile, a second attempt is sent and the first success wins.
+    """
+    latency_percentile: float = 95.0
+    default_delay_ms: float = 100.0  # Used until min_samples latencies are recorded
+    min_delay_ms: float = 5.0
+    min_samples: int = 20
+    methods: tuple = IDEMPOTENT_METHODS
+    
+    def applies_to(self, method: str) -> bool:
+        """Check if a method may be hedged"""
+        return method.upper() in self.methods
+
+
+# Upper bounds (ms) of latency histogram buckets; a final overflow bucket follows
+LATENCY_BUCKETS_MS = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000
+)
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one endpoint"""
+    counts: List[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    count: int = 0
+    total_ms: float = 0.0
+    min_ms: Optional[float] = None
+    max_ms: Optional[float] = None
+    errors: int = 0
+    
+    def record(self, latency_ms: float, success: bool = True) -> None:
+        """Add one observation"""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        self.min_ms = latency_ms if self.min_ms is None else min(self.min_ms, latency_ms)
+        self.max_ms = latency_ms if self.max_ms is None else max(self.max_ms, latency_ms)
+        if not success:
+            self.errors += 1
+    
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Estimate a percentile (0-100) as the upper bound of its bucket"""
+        if self.count == 0:
+            return None
+        
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for i, bucket_count in enumerate(self.counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count:
+                if i == len(LATENCY_BUCKETS_MS):
+                    return self.max_ms
+                # Never report more than was actually observed
+                return min(LATENCY_BUCKETS_MS[i], self.max_ms)
+        return self.max_ms
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarise the histogram"""
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": self.total_ms / self.count if self.count else None,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "buckets": dict(zip([*map(str, LATENCY_BUCKETS_MS), "inf"], self.counts)),
+        }
+
+
+@dataclass
+class WireStats:
+    """Body bytes sent and received for one endpoint"""
+    requests: int = 0
+    request_payload_bytes: int = 0  # Plain JSON size of request bodies
+    request_wire_bytes: int = 0  # Request body bytes actually sent
+    response_decoded_bytes: int = 0  # Response bodies after decompression/unsealing
+    response_wire_bytes: int = 0  # Response body bytes actually received
+    compressed_requests: int = 0
+    binary_requests: int = 0
+    sealed_requests: int = 0
+    
+    def record(self, encoded: Optional[EncodedPayload], response_wire_bytes: int, response_decoded_bytes: int) -> None:
+        """Add one request/response exchange"""
+        self.requests += 1
+        if encoded is not None:
+            self.request_payload_bytes += encoded.payload_bytes
+            self.request_wire_bytes += len(encoded.body)
+            if any(coding in COMPRESSION_CODINGS for coding in encoded.content_encoding):
+                self.compressed_requests += 1
+            if encoded.content_type == BINARY_CONTENT_TYPE:
+                self.binary_requests += 1
+            if SEALED in encoded.content_encoding:
+                self.sealed_requests += 1
+        self.response_wire_bytes += response_wire_bytes
+        self.response_decoded_bytes += response_decoded_bytes
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Summarise counters with savings ratios"""
+        def savings(wire: int, plain: int) -> float:
+            return 1 - wire / plain if plain else 0.0
+        
+        return {
+            **vars(self),
+            "request_savings_ratio": savings(self.request_wire_bytes, self.request_payload_bytes),
+            "response_savings_ratio": savings(self.response_wire_bytes, self.response_decoded_bytes),
+        }
+
+
+@dataclass
+class RequestSpec:
+    """One request of a gather_requests fan-out"""
+    target_service: str
+    method: str
+    endpoint: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    timeout_seconds: int = 30
+
+
 @dataclass
 class HealthCheckResult:
     """Result of a service health check"""
@@ -129,6 +287,7 @@ class SecurityContext:
     api_key: Optional[str] = None
     token: Optional[str] = None
     certificate_hash: Optional[str] = None
+    sealing_secret: Optional[str] = field(default=None, repr=False)  # Never sent on the wire
     
     def validate(self) -> bool:
         """Validate security context"""
@@ -147,15 +306,57 @@ class ServiceCommunicator:
     """
     Manages service-to-service communication including discovery, request/response,
     retry logic, health checking, and security
+    
+    Without a transport, requests to registered services are answered with a
+    simulated 200. With an HttpTransport, requests and health checks go over
+    pooled keep-alive HTTP connections to the registered endpoint.
+    
+    Request/response history is a per-tenant ring buffer of history_size
+    entries with an id index, so memory stays flat and get_response is O(1).
+    Latency is aggregated per target endpoint in fixed-bucket histograms.
+    
+    Coroutines use send/gather_requests, which share the registry, security
+    contexts and retry policies with the blocking methods and go over an
+    AsyncHttpTransport built from the same transport configuration.
+    
+    Request bodies are compressed or binary-encoded only once the target has
+    advertised support in a response (Accept-Encoding / Accept-Post), and
+    are always sealed for tenants whose security level requires it.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        transport: Optional[HttpTransport] = None,
+        history_size: int = 1000,
+        hedge_workers: int = 16,
+        async_transport: Optional[AsyncHttpTransport] = None,
+        codec: Optional[PayloadCodec] = None
+    ):
+        if history_size <= 0:
+            raise ValueError("history_size must be positive")
+        self.transport = transport
+        if async_transport is None and transport is not None:
+            async_transport = AsyncHttpTransport(transport.config)
+        self.async_transport = async_transport
+        self.codec = codec or PayloadCodec()
+        self.peer_capabilities: Dict[str, Dict[str, PeerCapabilities]] = {}  # org_id -> {service_id -> capabilities}
+        self.wire_stats: Dict[str, Dict[str, WireStats]] = {}  # org_id -> {service_id -> stats}
+        self.history_size = history_size
         self.service_registry: Dict[str, Dict[str, ServiceEndpoint]] = {}  # org_id -> {service_id -> endpoint}
-        self.requests: Dict[str, List[ServiceRequest]] = {}  # org_id -> requests
-        self.responses: Dict[str, List[ServiceResponse]] = {}  # org_id -> responses
+        self.requests: Dict[str, deque] = {}  # org_id -> recent requests (ring buffer)
+        self.responses: Dict[str, deque] = {}  # org_id -> recent responses (ring buffer)
+        self.response_index: Dict[str, Dict[str, ServiceResponse]] = {}  # org_id -> {request_id -> response}
+        self.in_flight: Dict[str, Dict[str, ServiceRequest]] = {}  # org_id -> {request_id -> request}
+        self.latency_histograms: Dict[str, Dict[str, LatencyHistogram]] = {}  # org_id -> {service_id -> histogram}
+        self.lock = threading.Lock()
+        self.coalescing: Dict[tuple, Future] = {}  # request key -> in-flight result
+        self.hedging_stats: Dict[str, Dict[str, int]] = {}  # org_id -> counters
+        self.hedge_workers = hedge_workers
+        self.hedge_executor: Optional[ThreadPoolExecutor] = None
         self.health_checks: Dict[str, Dict[str, HealthCheckResult]] = {}  # org_id -> {service_id -> result}
         self.retry_policies: Dict[str, RetryPolicy] = {}  # org_id -> policy
         self.security_contexts: Dict[str, SecurityContext] = {}  # org_id -> context
+        self.local_sealing_secrets: Dict[str, str] = {}  # org_id -> envelope secret when none is shared
         self.next_request_id = 1
     
     # QA-471: Service Discovery
@@ -259,75 +460,110 @@ class ServiceCommunicator:
         Returns:
             ServiceResponse with result
         """
-        request_id = f"req_{self.next_request_id}_{organisation_id}"
-        self.next_request_id += 1
-        
-        # Get security context
-        security_level = SecurityLevel.BASIC
-        if organisation_id in self.security_contexts:
-            security_level = self.security_contexts[organisation_id].security_level
-        
-        request = ServiceRequest(
-            request_id=request_id,
-            source_service=source_service,
-            target_service=target_service,
-            method=method,
-            endpoint=endpoint,
-            payload=payload,
-            timestamp=datetime.now(timezone.utc),
-            organisation_id=organisation_id,
-            security_level=security_level,
-            timeout_seconds=timeout_seconds
+        request = self._create_request(
+            organisation_id, source_service, target_service,
+            method, endpoint, payload, timeout_seconds
         )
-        
-        # Store request
-        if organisation_id not in self.requests:
-            self.requests[organisation_id] = []
-        self.requests[organisation_id].append(request)
-        
-        # Simulate request processing
         start_time = time.time()
         
         # Check if service exists
         target_endpoint = self.discover_service(organisation_id, target_service)
         if not target_endpoint:
-            response = ServiceResponse(
-                request_id=request_id,
-                status_code=404,
-                payload={"error": "Service not found"},
-                timestamp=datetime.now(timezone.utc),
-                response_time_ms=(time.time() - start_time) * 1000,
-                organisation_id=organisation_id
-            )
+            response = self._error_response(request, 404, "Service not found", start_time)
+        elif self.transport:
+            response = self._send_over_transport(request, target_endpoint)
         else:
-            # Simulate successful response
-            response = ServiceResponse(
-                request_id=request_id,
-                status_code=200,
-                payload={"success": True, "data": "Response data"},
-                timestamp=datetime.now(timezone.utc),
-                response_time_ms=(time.time() - start_time) * 1000,
-                organisation_id=organisation_id
-            )
+            response = self._simulated_response(request, start_time)
         
         # Store response
-        if organisation_id not in self.responses:
-            self.responses[organisation_id] = []
-        self.responses[organisation_id].append(response)
+        self._record_response(request, response, target_endpoint is not None)
         
         return response
     
+    def stream_request(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Optional[Dict[str, Any]] = None,
+        timeout_seconds: int = 30
+    ) -> StreamingResponse:
+        """
+        Send a request and stream the response body
+        
+        Use the result as a context manager; the pooled connection is
+        released when the body is consumed or the response is closed.
+        
+        Raises:
+            RuntimeError: If no transport is configured
+            ValueError: If the target service is not registered
+            TransportError: On connection failure or timeout
+        """
+        if self.transport is None:
+            raise RuntimeError("Streaming requires an HTTP transport")
+        
+        target_endpoint = self.discover_service(organisation_id, target_service)
+        if not target_endpoint:
+            raise ValueError(f"Service {target_service} not found")
+        
+        headers = self._build_headers(organisation_id, source_service)
+        body = None
+        if payload is not None:
+            encoded = self.codec.encode(payload, None, self._wire_sealing_key(organisation_id))
+            body = encoded.body
+            headers["Content-Type"] = encoded.content_type
+            if encoded.content_encoding:
+                headers["Content-Encoding"] = ", ".join(encoded.content_encoding)
+        
+        return self.transport.stream(
+            target_endpoint,
+            method,
+            endpoint,
+            body=body,
+            headers=headers,
+            read_timeout_seconds=timeout_seconds
+        )
+    
     def get_response(
         self,
         organisation_id: str,
         request_id: str
     ) -> Optional[ServiceResponse]:
-        """Get response for a specific request"""
-        responses = self.responses.get(organisation_id, [])
-        for response in responses:
-            if response.request_id == request_id:
-                return response
-        return None
+        """Get response for a specific request (None once evicted from history)"""
+        return self.response_index.get(organisation_id, {}).get(request_id)
+    
+    def get_in_flight_requests(
+        self,
+        organisation_id: str
+    ) -> List[ServiceRequest]:
+        """Get requests that have been sent but not yet answered"""
+        return list(self.in_flight.get(organisation_id, {}).values())
+    
+    def get_latency_stats(
+        self,
+        organisation_id: str,
+        service_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get aggregate latency statistics for requests to a service"""
+        histogram = self.latency_histograms.get(organisation_id, {}).get(service_id)
+        if histogram is None:
+            return None
+        with self.lock:
+            return histogram.to_dict()
+    
+    def get_wire_stats(
+        self,
+        organisation_id: str,
+        service_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """Get body bytes on the wire versus plain JSON for requests to a service"""
+        stats = self.wire_stats.get(organisation_id, {}).get(service_id)
+        if stats is None:
+            return None
+        with self.lock:
+            return stats.to_dict()
     
     # QA-473: Retry Logic
     def send_request_with_retry(
@@ -338,7 +574,9 @@ class ServiceCommunicator:
         method: str,
         endpoint: str,
         payload: Dict[str, Any],
-        retry_policy: Optional[RetryPolicy] = None
+        retry_policy: Optional[RetryPolicy] = None,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce: bool = False
     ) -> ServiceResponse:
         """
         Send request with automatic retry on failure
@@ -351,6 +589,8 @@ class ServiceCommunicator:
             endpoint: Endpoint path
             payload: Request data
             retry_policy: Optional retry policy (uses default if not provided)
+            hedging_policy: Optional hedging for idempotent methods on each attempt
+            coalesce: Share identical in-flight idempotent requests
             
         Returns:
             ServiceResponse with result after retries
@@ -365,14 +605,26 @@ class ServiceCommunicator:
             attempt += 1
             
             # Send request
-            response = self.send_request(
-                organisation_id=organisation_id,
-                source_service=source_service,
-                target_service=target_service,
-                method=method,
-                endpoint=endpoint,
-                payload=payload
-            )
+            if hedging_policy or coalesce:
+                response = self.send_idempotent_request(
+                    organisation_id=organisation_id,
+                    source_service=source_service,
+                    target_service=target_service,
+                    method=method,
+                    endpoint=endpoint,
+                    payload=payload,
+                    hedging_policy=hedging_policy,
+                    coalesce=coalesce
+                )
+            else:
+                response = self.send_request(
+                    organisation_id=organisation_id,
+                    source_service=source_service,
+                    target_service=target_service,
+                    method=method,
+                    endpoint=endpoint,
+                    payload=payload
+                )
             
             last_response = response
             
@@ -391,6 +643,85 @@ class ServiceCommunicator:
         
         return last_response
     
+    def send_idempotent_request(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: int = 30,
+        hedging_policy: Optional[HedgingPolicy] = None,
+        coalesce: bool = True
+    ) -> ServiceResponse:
+        """
+        Send an idempotent request with optional hedging and coalescing
+        
+        Identical concurrent requests (same tenant, target, method, path and
+        payload) share one in-flight result when coalesce is set. Hedging
+        fires a second attempt after the target's latency percentile, unless
+        the target's last health check found it unhealthy or offline.
+        Non-idempotent methods are sent once, like send_request.
+        
+        Returns:
+            First successful ServiceResponse, or the last failure
+        """
+        if method.upper() not in IDEMPOTENT_METHODS:
+            return self.send_request(
+                organisation_id, source_service, target_service,
+                method, endpoint, payload, timeout_seconds
+            )
+        
+        def send() -> ServiceResponse:
+            if hedging_policy and hedging_policy.applies_to(method):
+                return self._send_hedged(
+                    organisation_id, source_service, target_service,
+                    method, endpoint, payload, timeout_seconds, hedging_policy
+                )
+            return self.send_request(
+                organisation_id, source_service, target_service,
+                method, endpoint, payload, timeout_seconds
+            )
+        
+        if not coalesce:
+            return send()
+        
+        key = (
+            organisation_id,
+            target_service,
+            method.upper(),
+            endpoint,
+            json.dumps(payload, sort_keys=True, default=str)
+        )
+        with self.lock:
+            shared = self.coalescing.get(key)
+            if shared is None:
+                leader = Future()
+                self.coalescing[key] = leader
+        
+        if shared is not None:
+            self._count(organisation_id, "coalesced")
+            return shared.result()
+        
+        try:
+            response = send()
+            leader.set_result(response)
+            return response
+        except BaseException as e:
+            leader.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                self.coalescing.pop(key, None)
+    
+    def get_hedging_stats(self, organisation_id: str) -> Dict[str, int]:
+        """Get hedge and coalescing counters for a tenant"""
+        with self.lock:
+            stats = {"hedges_sent": 0, "hedge_wins": 0, "hedges_skipped_unhealthy": 0, "coalesced": 0}
+            stats.update(self.hedging_stats.get(organisation_id, {}))
+            return stats
+    
     def set_retry_policy(
         self,
         organisation_id: str,
@@ -406,6 +737,85 @@ class ServiceCommunicator:
         """Get retry policy for a tenant"""
         return self.retry_policies.get(organisation_id, RetryPolicy())
     
+    # Asynchronous requests
+    async def send(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: int = 30,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadline_seconds: Optional[float] = None
+    ) -> ServiceResponse:
+        """
+        Send a request from a coroutine with automatic retry
+        
+        Equivalent to send_request_with_retry, but backoff uses asyncio.sleep
+        and requests go over the async transport, so the event loop is never
+        blocked.
+        
+        Args:
+            organisation_id: Tenant identifier for isolation
+            source_service: Service making the request
+            target_service: Service receiving the request
+            method: HTTP method
+            endpoint: Endpoint path
+            payload: Request data
+            timeout_seconds: Per-attempt timeout
+            retry_policy: Optional retry policy (uses the tenant's if not provided)
+            deadline_seconds: Overall budget for all attempts and backoff
+            
+        Returns:
+            ServiceResponse after retries (504 if the deadline passed first)
+        """
+        deadline = None if deadline_seconds is None else time.monotonic() + deadline_seconds
+        return await self._send_async(
+            organisation_id, source_service, target_service, method,
+            endpoint, payload, timeout_seconds, retry_policy, deadline
+        )
+    
+    async def gather_requests(
+        self,
+        organisation_id: str,
+        source_service: str,
+        requests: List[RequestSpec],
+        max_concurrency: int = 10,
+        deadline_seconds: Optional[float] = None,
+        retry_policy: Optional[RetryPolicy] = None
+    ) -> List[ServiceResponse]:
+        """
+        Send several requests concurrently and wait for all of them
+        
+        Args:
+            organisation_id: Tenant identifier for isolation
+            source_service: Service making the requests
+            requests: Requests to send
+            max_concurrency: Maximum requests in flight at once
+            deadline_seconds: Overall budget; requests still queued or
+                running when it passes are answered with 504
+            retry_policy: Optional retry policy (uses the tenant's if not provided)
+            
+        Returns:
+            Responses in the same order as requests
+        """
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be positive")
+        
+        deadline = None if deadline_seconds is None else time.monotonic() + deadline_seconds
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run(spec: RequestSpec) -> ServiceResponse:
+            async with semaphore:
+                return await self._send_async(
+                    organisation_id, source_service, spec.target_service, spec.method,
+                    spec.endpoint, spec.payload, spec.timeout_seconds, retry_policy, deadline
+                )
+        
+        return list(await asyncio.gather(*(run(spec) for spec in requests)))
+    
     # QA-474: Health Checking
     def perform_health_check(
         self,
@@ -435,11 +845,21 @@ class ServiceCommunicator:
                 details={"error": "Service not registered"}
             )
         else:
-            # Simulate health check (in real implementation, would make actual HTTP request)
+            status_code = None
+            if self.transport:
+                try:
+                    status_code = self.transport.request(
+                        endpoint, "GET", self.transport.config.health_path
+                    ).status_code
+                except TransportError:
+                    status_code = 0
+            
             response_time_ms = (time.time() - start_time) * 1000
             
-            # Determine health based on response time
-            if response_time_ms < 100:
+            # Determine health based on status and response time
+            if status_code is not None and not 200 <= status_code < 300:
+                state = ServiceState.UNHEALTHY
+            elif response_time_ms < 100:
                 state = ServiceState.HEALTHY
             elif response_time_ms < 500:
                 state = ServiceState.DEGRADED
@@ -491,17 +911,24 @@ class ServiceCommunicator:
         security_level: SecurityLevel,
         api_key: Optional[str] = None,
         token: Optional[str] = None,
-        certificate: Optional[str] = None
+        certificate: Optional[str] = None,
+        sealing_secret: Optional[str] = None
     ) -> SecurityContext:
         """
         Configure security for service communication
         
+        Credentials are sent with every request, so payload sealing keys
+        are never derived from them. Sealing on the wire (level ENCRYPTED)
+        needs a sealing_secret shared with the peer out of band; without
+        one, encrypt_payload seals with a secret local to this communicator.
+        
         Args:
             organisation_id: Tenant identifier for isolation
             security_level: Level of security to apply
             api_key: API key for basic security
             token: Token for encrypted security
             certificate: Certificate for mutual TLS
+            sealing_secret: Shared secret payload sealing keys are derived from
             
         Returns:
             SecurityContext with configuration
@@ -515,7 +942,8 @@ class ServiceCommunicator:
             security_level=security_level,
             api_key=api_key,
             token=token,
-            certificate_hash=certificate_hash
+            certificate_hash=certificate_hash,
+            sealing_secret=sealing_secret
         )
         
         self.security_contexts[organisation_id] = context
@@ -553,24 +981,35 @@ class ServiceCommunicator:
         """
         Encrypt payload based on security level
         
+        The payload is serialised, compressed when large, and sealed with
+        a key derived from the tenant's sealing secret (see
+        payload_codec.seal). Without a shared sealing secret only this
+        communicator can open the envelope.
+        
         Args:
             organisation_id: Tenant identifier
             payload: Data to encrypt
             
         Returns:
-            Encrypted payload (in real implementation)
+            Envelope with the sealed payload, or the payload unchanged at level NONE
+            
         """
         context = self.security_contexts.get(organisation_id)
         
         if not context or context.security_level == SecurityLevel.NONE:
             return payload
         
-        # In real implementation, would perform actual encryption
-        # For now, just wrap payload to indicate encryption
+        encoded = self.codec.encode(
+            payload,
+            PeerCapabilities(content_codings=frozenset(COMPRESSION_CODINGS), binary=True),
+            self._envelope_sealing_key(organisation_id, context)
+        )
         return {
             "encrypted": True,
             "security_level": context.security_level.value,
-            "data": payload  # Would be encrypted in real implementation
+            "content_type": encoded.content_type,
+            "content_encoding": encoded.content_encoding,
+            "data": base64.b64encode(encoded.body).decode("ascii")
         }
     
     def decrypt_payload(
@@ -587,9 +1026,458 @@ class ServiceCommunicator:
             
         Returns:
             Decrypted payload
+            
+        Raises:
+            ValueError: If the tenant has no security context
+            PayloadIntegrityError: If the envelope was tampered with or sealed
+                under a different tenant or sealing secret
         """
         if not encrypted_payload.get("encrypted"):
             return encrypted_payload
         
-        # In real implementation, would perform actual decryption
-        return encrypted_payload.get("data", {})
+        context = self.security_contexts.get(organisation_id)
+        if context is None:
+            raise ValueError(f"No security context configured for {organisation_id}")
+        
+        payload, _ = self.codec.decode(
+            base64.b64decode(encrypted_payload["data"]),
+            encrypted_payload.get("content_type"),
+            encrypted_payload.get("content_encoding", []),
+            self._envelope_sealing_key(organisation_id, context)
+        )
+        return payload
+    
+    def close(self) -> None:
+        """Close pooled transport connections and the hedging executor"""
+        if self.hedge_executor:
+            self.hedge_executor.shutdown(wait=False)
+            self.hedge_executor = None
+        if self.transport:
+            self.transport.close()
+    
+    async def aclose(self) -> None:
+        """Close pooled async connections belonging to the running event loop"""
+        if self.async_transport:
+            await self.async_transport.aclose()
+    
+    # Private helper methods
+    def _send_hedged(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: int,
+        policy: HedgingPolicy
+    ) -> ServiceResponse:
+        """Send with a delayed backup attempt, returning the first success"""
+        executor = self._get_hedge_executor()
+        args = (
+            organisation_id, source_service, target_service,
+            method, endpoint, payload, timeout_seconds
+        )
+        
+        primary = executor.submit(self.send_request, *args)
+        done, _ = wait([primary], timeout=self._hedge_delay_ms(organisation_id, target_service, policy) / 1000)
+        if done:
+            return primary.result()
+        
+        if not self._is_hedge_target_healthy(organisation_id, target_service):
+            self._count(organisation_id, "hedges_skipped_unhealthy")
+            return primary.result()
+        
+        hedge = executor.submit(self.send_request, *args)
+        self._count(organisation_id, "hedges_sent")
+        
+        pending = {primary, hedge}
+        last_response = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                response = future.result()
+                if response.is_successful():
+                    if future is hedge:
+                        self._count(organisation_id, "hedge_wins")
+                    return response
+                last_response = response
+        return last_response
+    
+    def _hedge_delay_ms(
+        self,
+        organisation_id: str,
+        target_service: str,
+        policy: HedgingPolicy
+    ) -> float:
+        """Delay before hedging: the target's latency percentile once known"""
+        histogram = self.latency_histograms.get(organisation_id, {}).get(target_service)
+        delay = policy.default_delay_ms
+        if histogram is not None and histogram.count >= policy.min_samples:
+            with self.lock:
+                delay = histogram.percentile(policy.latency_percentile)
+        return max(policy.min_delay_ms, delay)
+    
+    def _is_hedge_target_healthy(self, organisation_id: str, service_id: str) -> bool:
+        """Hedge unless the last health check found the target unhealthy or offline"""
+        result = self.get_health_status(organisation_id, service_id)
+        return result is None or result.state not in (ServiceState.UNHEALTHY, ServiceState.OFFLINE)
+    
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        """Create the hedging thread pool on first use"""
+        with self.lock:
+            if self.hedge_executor is None:
+                self.hedge_executor = ThreadPoolExecutor(
+                    max_workers=self.hedge_workers,
+                    thread_name_prefix="service-hedge"
+                )
+            return self.hedge_executor
+    
+    def _count(self, organisation_id: str, counter: str) -> None:
+        """Increment a hedging/coalescing counter"""
+        with self.lock:
+            counters = self.hedging_stats.setdefault(organisation_id, {})
+            counters[counter] = counters.get(counter, 0) + 1
+    
+    async def _send_async(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: int,
+        retry_policy: Optional[RetryPolicy],
+        deadline: Optional[float]
+    ) -> ServiceResponse:
+        """Retry loop shared by send and gather_requests"""
+        if retry_policy is None:
+            retry_policy = self.retry_policies.get(organisation_id, RetryPolicy())
+        
+        attempt = 0
+        last_response = None
+        
+        while attempt <= retry_policy.max_retries:
+            attempt += 1
+            last_response = await self._send_once_async(
+                organisation_id, source_service, target_service,
+                method, endpoint, payload, timeout_seconds, deadline
+            )
+            if last_response.is_successful():
+                return last_response
+            if not retry_policy.should_retry(last_response.status_code, attempt):
+                break
+            
+            delay = retry_policy.get_delay(attempt)
+            if deadline is not None and time.monotonic() + delay >= deadline:
+                break
+            await asyncio.sleep(delay)
+        
+        return last_response
+    
+    async def _send_once_async(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: int,
+        deadline: Optional[float]
+    ) -> ServiceResponse:
+        """Asynchronous counterpart of send_request, bounded by the deadline"""
+        request = self._create_request(
+            organisation_id, source_service, target_service,
+            method, endpoint, payload, timeout_seconds
+        )
+        start_time = time.time()
+        target_endpoint = self.discover_service(organisation_id, target_service)
+        remaining = None if deadline is None else deadline - time.monotonic()
+        sent = False
+        
+        try:
+            if remaining is not None and remaining <= 0:
+                response = self._error_response(request, 504, "Deadline exceeded", start_time)
+            elif not target_endpoint:
+                response = self._error_response(request, 404, "Service not found", start_time)
+            elif self.async_transport:
+                timeout = timeout_seconds if remaining is None else min(timeout_seconds, remaining)
+                sent = True
+                response = await self._send_over_async_transport(request, target_endpoint, timeout)
+            else:
+                sent = True
+                response = self._simulated_response(request, start_time)
+        except asyncio.CancelledError:
+            self._record_response(
+                request, self._error_response(request, 503, "Request cancelled", start_time), False
+            )
+            raise
+        
+        self._record_response(request, response, sent)
+        return response
+    
+    def _create_request(
+        self,
+        organisation_id: str,
+        source_service: str,
+        target_service: str,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any],
+        timeout_seconds: int
+    ) -> ServiceRequest:
+        """Allocate an id, apply the tenant's security level and record the request"""
+        with self.lock:
+            request_id = f"req_{self.next_request_id}_{organisation_id}"
+            self.next_request_id += 1
+        
+        # Get security context
+        security_level = SecurityLevel.BASIC
+        if organisation_id in self.security_contexts:
+            security_level = self.security_contexts[organisation_id].security_level
+        
+        request = ServiceRequest(
+            request_id=request_id,
+            source_service=source_service,
+            target_service=target_service,
+            method=method,
+            endpoint=endpoint,
+            payload=payload,
+            timestamp=datetime.now(timezone.utc),
+            organisation_id=organisation_id,
+            security_level=security_level,
+            timeout_seconds=timeout_seconds
+        )
+        
+        # Store request
+        self._record_request(request)
+        return request
+    
+    def _error_response(
+        self,
+        request: ServiceRequest,
+        status_code: int,
+        error: str,
+        start_time: float
+    ) -> ServiceResponse:
+        """Build a failure response that never reached the target"""
+        return ServiceResponse(
+            request_id=request.request_id,
+            status_code=status_code,
+            payload={"error": error},
+            timestamp=datetime.now(timezone.utc),
+            response_time_ms=(time.time() - start_time) * 1000,
+            organisation_id=request.organisation_id
+        )
+    
+    def _simulated_response(
+        self,
+        request: ServiceRequest,
+        start_time: float
+    ) -> ServiceResponse:
+        """Simulate a successful response when no transport is configured"""
+        return ServiceResponse(
+            request_id=request.request_id,
+            status_code=200,
+            payload={"success": True, "data": "Response data"},
+            timestamp=datetime.now(timezone.utc),
+            response_time_ms=(time.time() - start_time) * 1000,
+            organisation_id=request.organisation_id
+        )
+    
+    def _record_request(self, request: ServiceRequest) -> None:
+        """Add a request to the ring buffer and the in-flight map"""
+        org_id = request.organisation_id
+        with self.lock:
+            if org_id not in self.requests:
+                self.requests[org_id] = deque(maxlen=self.history_size)
+                self.responses[org_id] = deque(maxlen=self.history_size)
+                self.response_index[org_id] = {}
+                self.in_flight[org_id] = {}
+            self.requests[org_id].append(request)
+            self.in_flight[org_id][request.request_id] = request
+    
+    def _record_response(
+        self,
+        request: ServiceRequest,
+        response: ServiceResponse,
+        record_latency: bool
+    ) -> None:
+        """Correlate a response, evicting the oldest entry when the buffer is full"""
+        org_id = request.organisation_id
+        with self.lock:
+            self.in_flight[org_id].pop(request.request_id, None)
+            
+            responses = self.responses[org_id]
+            if len(responses) == responses.maxlen:
+                self.response_index[org_id].pop(responses[0].request_id, None)
+            responses.append(response)
+            self.response_index[org_id][response.request_id] = response
+            
+            if record_latency:
+                histograms = self.latency_histograms.setdefault(org_id, {})
+                histogram = histograms.get(request.target_service)
+                if histogram is None:
+                    histogram = histograms[request.target_service] = LatencyHistogram()
+                histogram.record(response.response_time_ms, response.is_successful())
+    
+    def _build_headers(
+        self,
+        organisation_id: str,
+        source_service: str,
+        request_id: Optional[str] = None
+    ) -> Dict[str, str]:
+        """Build tenant, tracing and credential headers"""
+        headers = {
+            "X-Organisation-Id": organisation_id,
+            "X-Source-Service": source_service,
+        }
+        if request_id:
+            headers["X-Request-Id"] = request_id
+        
+        context = self.security_contexts.get(organisation_id)
+        if context:
+            if context.api_key:
+                headers["X-Api-Key"] = context.api_key
+            if context.token:
+                headers["Authorization"] = f"Bearer {context.token}"
+        
+        return headers
+    
+    def _send_over_transport(
+        self,
+        request: ServiceRequest,
+        target_endpoint: ServiceEndpoint
+    ) -> ServiceResponse:
+        """Send a request over HTTP, mapping transport failures to 503/504"""
+        headers, encoded = self._encode_request(request)
+        body = encoded.body if encoded else None
+        start_time = time.time()
+        try:
+            result = self.transport.request(
+                target_endpoint,
+                request.method,
+                request.endpoint,
+                body=body,
+                headers=headers,
+                read_timeout_seconds=request.timeout_seconds
+            )
+        except TransportError as e:
+            return self._error_response(request, 504 if e.timed_out else 503, str(e), start_time)
+        return self._decode_response(request, result, encoded, start_time)
+    
+    async def _send_over_async_transport(
+        self,
+        request: ServiceRequest,
+        target_endpoint: ServiceEndpoint,
+        timeout_seconds: float
+    ) -> ServiceResponse:
+        """Asynchronous counterpart of _send_over_transport"""
+        headers, encoded = self._encode_request(request)
+        body = encoded.body if encoded else None
+        start_time = time.time()
+        try:
+            result = await self.async_transport.request(
+                target_endpoint,
+                request.method,
+                request.endpoint,
+                body=body,
+                headers=headers,
+                read_timeout_seconds=timeout_seconds
+            )
+        except TransportError as e:
+            return self._error_response(request, 504 if e.timed_out else 503, str(e), start_time)
+        return self._decode_response(request, result, encoded, start_time)
+    
+    def _encode_request(self, request: ServiceRequest) -> tuple:
+        """Build headers and the encoded body (None for bodiless requests)"""
+        sealing_key = self._wire_sealing_key(request.organisation_id)
+        headers = self._build_headers(
+            request.organisation_id, request.source_service, request.request_id
+        )
+        headers.update(self.codec.request_headers(sealed=sealing_key is not None))
+        
+        encoded = None
+        if request.payload or request.method not in ("GET", "HEAD", "DELETE"):
+            peer = self.peer_capabilities.get(request.organisation_id, {}).get(request.target_service)
+            encoded = self.codec.encode(request.payload, peer, sealing_key)
+            headers["Content-Type"] = encoded.content_type
+            if encoded.content_encoding:
+                headers["Content-Encoding"] = ", ".join(encoded.content_encoding)
+        return headers, encoded
+    
+    def _decode_response(
+        self,
+        request: ServiceRequest,
+        result: TransportResponse,
+        encoded: Optional[EncodedPayload],
+        start_time: float
+    ) -> ServiceResponse:
+        """Decode a response body, learn the peer's encodings and count wire bytes"""
+        org_id = request.organisation_id
+        headers = {name.lower(): value for name, value in result.headers.items()}
+        content_encoding = parse_content_encoding(headers.get("content-encoding"))
+        sealing_key = self._wire_sealing_key(org_id)
+        
+        status_code = result.status_code
+        decoded_bytes = 0
+        try:
+            if sealing_key is not None and result.body and SEALED not in content_encoding:
+                raise PayloadIntegrityError("Response was not sealed")
+            payload, decoded_bytes = self.codec.decode(
+                result.body, headers.get("content-type"), content_encoding, sealing_key
+            )
+        except PayloadIntegrityError as e:
+            # Status lines are not sealed anyway; only a success needs turning into a failure
+            if 200 <= status_code < 300:
+                status_code = 502
+            payload = {"error": str(e)}
+        except ValueError:
+            payload = {"raw": result.body.decode("utf-8", errors="replace")}
+            decoded_bytes = len(result.body)
+        if not isinstance(payload, dict):
+            payload = {"data": payload}
+        
+        with self.lock:
+            peers = self.peer_capabilities.setdefault(org_id, {})
+            if "accept-encoding" in headers or "accept-post" in headers:
+                peers[request.target_service] = PeerCapabilities.from_headers(headers)
+            elif result.status_code == 415:
+                peers.pop(request.target_service, None)  # Fall back to identity JSON
+            
+            stats = self.wire_stats.setdefault(org_id, {})
+            if request.target_service not in stats:
+                stats[request.target_service] = WireStats()
+            stats[request.target_service].record(encoded, len(result.body), decoded_bytes)
+        
+        return ServiceResponse(
+            request_id=request.request_id,
+            status_code=status_code,
+            payload=payload,
+            timestamp=datetime.now(timezone.utc),
+            response_time_ms=(time.time() - start_time) * 1000,
+            organisation_id=org_id
+        )
+    
+    def _envelope_sealing_key(self, organisation_id: str, context: SecurityContext) -> SealingKey:
+        """Sealing key for encrypt_payload: the shared secret, or one local to this communicator"""
+        secret = context.sealing_secret
+        if not secret:
+            with self.lock:
+                secret = self.local_sealing_secrets.get(organisation_id)
+                if secret is None:
+                    secret = self.local_sealing_secrets[organisation_id] = secrets.token_hex(32)
+        return derive_sealing_key(secret, organisation_id)
+    
+    def _wire_sealing_key(self, organisation_id: str) -> Optional[SealingKey]:
+        """Sealing key for request/response bodies, if the tenant's level requires it"""
+        context = self.security_contexts.get(organisation_id)
+        if context is None or context.security_level not in WIRE_SEALED_LEVELS:
+            return None
+        if not context.sealing_secret:
+            raise ValueError(
+                f"Security level {context.security_level.value} for {organisation_id} has no sealing secret"
+            )
+        return derive_sealing_key(context.sealing_secret, organisation_id)
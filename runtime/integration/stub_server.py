@@ -0,0 +1,208 @@
+"""
+Stub Service Server
+
+Purpose: Local HTTP/1.1 keep-alive server standing in for subsystem services in tests and benchmarks
+Authority: Wave 2.0 Subwave 2.9 - Deep Integration Phase 1 (QA-471 to QA-475)
+Tenant Isolation: Echoes the X-Organisation-Id header; sealing secrets are looked up per organisation_id
+"""
+
+from typing import Dict, Optional, Any, Callable, Tuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+
+from .payload_codec import (
+    SEALED,
+    BINARY_CONTENT_TYPE,
+    PayloadCodec,
+    PayloadIntegrityError,
+    PeerCapabilities,
+    derive_sealing_key,
+    parse_content_encoding,
+)
+
+
+# Route handler: (method, path, headers, body) -> (status_code, response body)
+StubHandler = Callable[[str, str, Dict[str, str], bytes], Tuple[int, Any]]
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Dispatches requests to the owning StubServiceServer"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def do_PUT(self) -> None:
+        self._handle()
+
+    def do_DELETE(self) -> None:
+        self._handle()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence per-request logging"""
+
+    def _handle(self) -> None:
+        stub: StubServiceServer = self.server.stub
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        headers = dict(self.headers.items())
+
+        stub.record_request(self.command, self.path, len(body))
+        if stub.delay_seconds:
+            time.sleep(stub.delay_seconds)
+
+        sealing_key = None
+        secret = stub.sealing_secrets.get(self.headers.get("X-Organisation-Id", ""))
+        if secret is not None:
+            sealing_key = derive_sealing_key(secret, self.headers["X-Organisation-Id"])
+
+        if stub.codec is not None and body:
+            # Handlers always see plain JSON
+            try:
+                payload, _ = stub.codec.decode(
+                    body,
+                    self.headers.get("Content-Type"),
+                    parse_content_encoding(self.headers.get("Content-Encoding")),
+                    sealing_key
+                )
+            except PayloadIntegrityError as e:
+                self._respond(400, {"error": str(e)})
+                return
+            body = json.dumps(payload).encode("utf-8")
+
+        handler = stub.routes.get((self.command, self.path), stub.default_handler)
+        status_code, response_body = handler(self.command, self.path, headers, body)
+        self._respond(status_code, response_body, sealing_key)
+
+    def _respond(self, status_code: int, response_body: Any, sealing_key: Any = None) -> None:
+        stub: StubServiceServer = self.server.stub
+        extra_headers: Dict[str, str] = {}
+
+        if isinstance(response_body, (bytes, bytearray)):
+            data = bytes(response_body)
+            content_type = "application/octet-stream"
+        elif stub.codec is not None:
+            # Encode as the client asked: Accept-Encoding and Accept
+            accepted = parse_content_encoding(self.headers.get("Accept-Encoding"))
+            accept = parse_content_encoding(self.headers.get("Accept"))
+            encoded = stub.codec.encode(
+                response_body,
+                PeerCapabilities(content_codings=frozenset(accepted), binary=BINARY_CONTENT_TYPE in accept),
+                sealing_key if SEALED in accepted else None
+            )
+            data = encoded.body
+            content_type = encoded.content_type
+            if encoded.content_encoding:
+                extra_headers["Content-Encoding"] = ", ".join(encoded.content_encoding)
+            extra_headers.update(stub.codec.advertise_headers())
+        else:
+            data = json.dumps(response_body).encode("utf-8")
+            content_type = "application/json"
+
+        self.send_response(status_code)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in extra_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class StubServiceServer:
+    """
+    In-process HTTP server for offline integration tests
+
+    Binds to an ephemeral localhost port. By default every request is
+    answered with 200 and a JSON echo; routes can be overridden per
+    (method, path) and a fixed delay can simulate slow services.
+
+    With a PayloadCodec the stub decodes compressed, binary and sealed
+    request bodies, encodes responses as the client's Accept headers allow,
+    and advertises the encodings it accepts. Sealing needs the tenant's
+    secret in sealing_secrets (organisation_id -> shared sealing secret).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        delay_seconds: float = 0.0,
+        codec: Optional[PayloadCodec] = None,
+        sealing_secrets: Optional[Dict[str, str]] = None
+    ):
+        self.routes: Dict[Tuple[str, str], StubHandler] = {}
+        self.delay_seconds = delay_seconds
+        self.codec = codec
+        self.sealing_secrets = sealing_secrets or {}
+        self.request_count = 0
+        self.bytes_received = 0  # Request body bytes as sent on the wire
+        self.request_log: Dict[Tuple[str, str], int] = {}
+        self.lock = threading.Lock()
+
+        self.server = ThreadingHTTPServer((host, port), _StubRequestHandler)
+        self.server.daemon_threads = True
+        self.server.stub = self
+        self.host, self.port = self.server.server_address[:2]
+        self.thread: Optional[threading.Thread] = None
+
+    def add_route(self, method: str, path: str, handler: StubHandler) -> None:
+        """Override the response for one method and path"""
+        self.routes[(method.upper(), path)] = handler
+
+    def default_handler(
+        self,
+        method: str,
+        path: str,
+        headers: Dict[str, str],
+        body: bytes
+    ) -> Tuple[int, Any]:
+        """Echo the request back as JSON"""
+        try:
+            payload = json.loads(body) if body else {}
+        except ValueError:
+            payload = {"raw_bytes": len(body)}
+        return 200, {
+            "success": True,
+            "method": method,
+            "path": path,
+            "organisation_id": headers.get("X-Organisation-Id"),
+            "echo": payload,
+        }
+
+    def record_request(self, method: str, path: str, body_bytes: int = 0) -> None:
+        """Count a received request"""
+        with self.lock:
+            self.request_count += 1
+            self.bytes_received += body_bytes
+            key = (method, path)
+            self.request_log[key] = self.request_log.get(key, 0) + 1
+
+    def start(self) -> "StubServiceServer":
+        """Serve in a background thread"""
+        self.thread = threading.Thread(
+            target=self.server.serve_forever,
+            name=f"stub-server-{self.port}",
+            daemon=True
+        )
+        self.thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self.server.shutdown()
+        self.server.server_close()
+        if self.thread is not None:
+            self.thread.join()
+
+    def __enter__(self) -> "StubServiceServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
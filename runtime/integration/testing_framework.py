@@ -7,10 +7,16 @@ Authority: Wave 2.0 Subwave 2.10 - Deep Integration Phase 2 (QA-486 to QA-490)
 Tenant Isolation: All operations scoped by organisation_id
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import util as multiprocessing_util
+import math
+import os
+import threading
+import time
 import uuid
 
 
@@ -45,6 +51,8 @@ class TestFixture:
     timestamp: datetime
     setup_completed: bool = False
     cleanup_completed: bool = False
+    provider: Optional[Callable[[Dict[str, Any]], Any]] = None  # Builds the live fixture from resources
+    teardown: Optional[Callable[[Any], None]] = None  # Disposes of what provider built
     
     def is_ready(self) -> bool:
         """Check if fixture is ready for test execution"""
@@ -119,12 +127,47 @@ class FailureAnalysis:
     timestamp: datetime
 
 
+@dataclass
+class IntegrationTestSpec:
+    """One test to schedule with run_tests"""
+    test_name: str
+    fixture_id: str
+    test_func: Optional[Callable] = None  # Must be picklable (module level) for process workers
+    subsystems: List[str] = field(default_factory=list)  # Subsystems the test exercises
+    integration_points: int = 1
+
+
+@dataclass
+class IntegrationTestRun:
+    """Aggregated result of a scheduled test run"""
+    run_id: str
+    organisation_id: str
+    executions: List[TestExecution]
+    coverage: CoverageMetrics
+    failure_analyses: List[FailureAnalysis]
+    workers: int
+    fixture_setups: int  # Provider calls across all workers
+    wall_clock_ms: float
+    serial_estimate_ms: float  # Sum of test and fixture setup durations
+    
+    def speedup(self) -> float:
+        """Estimated speedup over running the same work serially"""
+        if self.wall_clock_ms <= 0:
+            return 1.0
+        return self.serial_estimate_ms / self.wall_clock_ms
+
+
 class IntegrationTestingFramework:
     """
     Framework for managing integration test lifecycle.
     
     Provides fixture setup, test execution, cleanup, coverage metrics,
     and failure analysis capabilities.
+    
+    run_tests schedules many tests at once: tests are grouped by fixture,
+    groups are split into chunks and chunks run on a process (or thread)
+    pool. Each worker builds a fixture once and reuses it for every chunk
+    of that fixture it receives, tearing it down when the worker exits.
     """
     
     def __init__(self):
@@ -141,17 +184,25 @@ class IntegrationTestingFramework:
         name: str,
         setup_actions: List[Dict[str, Any]],
         cleanup_actions: List[Dict[str, Any]],
-        resources: Optional[Dict[str, Any]] = None
+        resources: Optional[Dict[str, Any]] = None,
+        provider: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        teardown: Optional[Callable[[Any], None]] = None
     ) -> TestFixture:
         """
         Set up test fixture.
         
+        A provider is called where tests run (in each worker for run_tests)
+        with the fixture's resources; tests then receive its return value
+        as their only argument.
+        
         Args:
             organisation_id: Organisation ID for tenant isolation
             name: Fixture name
             setup_actions: List of setup actions to execute
             cleanup_actions: List of cleanup actions to execute
             resources: Optional resources to provision
+            provider: Optional picklable callable building the live fixture
+            teardown: Optional picklable callable disposing of it
             
         Returns:
             TestFixture: Configured fixture
@@ -165,7 +216,9 @@ class IntegrationTestingFramework:
             setup_actions=setup_actions,
             cleanup_actions=cleanup_actions,
             resources=resources or {},
-            timestamp=datetime.now(timezone.utc)
+            timestamp=datetime.now(timezone.utc),
+            provider=provider,
+            teardown=teardown
         )
         
         self._fixtures[fixture_id] = fixture
@@ -190,6 +243,9 @@ class IntegrationTestingFramework:
         """
         Execute integration test.
         
+        If the fixture has a provider, it is set up for this test alone,
+        passed to test_func and torn down afterwards.
+        
         Args:
             organisation_id: Organisation ID for tenant isolation
             fixture_id: Fixture ID to use for test
@@ -215,10 +271,19 @@ class IntegrationTestingFramework:
         # Execute test
         execution.status = IntegrationTestStatus.RUNNING
         
+        fixture = self._fixtures.get(fixture_id)
         try:
             # Execute test function if provided
             if test_func:
-                test_func()
+                if fixture is not None and fixture.provider is not None:
+                    value = fixture.provider(fixture.resources)
+                    try:
+                        test_func(value)
+                    finally:
+                        if fixture.teardown is not None:
+                            fixture.teardown(value)
+                else:
+                    test_func()
             
             # Mark as passed
             execution.mark_completed(IntegrationTestStatus.PASSED)
@@ -228,6 +293,131 @@ class IntegrationTestingFramework:
         
         return execution
     
+    def run_tests(
+        self,
+        organisation_id: str,
+        tests: List[IntegrationTestSpec],
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+        chunk_size: Optional[int] = None
+    ) -> IntegrationTestRun:
+        """
+        Run many tests in parallel, grouped by fixture.
+        
+        Args:
+            organisation_id: Organisation ID for tenant isolation
+            tests: Tests to run; fixtures must exist
+            max_workers: Worker count (default: CPU count); 1 runs inline
+            use_processes: Run on a process pool (False: thread pool)
+            chunk_size: Tests per task (default: split each fixture's
+                tests only as far as needed to keep every worker busy)
+            
+        Returns:
+            IntegrationTestRun: Executions plus aggregated coverage and
+            failure analyses
+        """
+        workers = max_workers or os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
+        # Group by fixture, largest groups first so they start earliest
+        groups: Dict[str, List[Tuple[int, IntegrationTestSpec]]] = {}
+        for index, spec in enumerate(tests):
+            if spec.fixture_id not in self._fixtures:
+                raise ValueError(f"Fixture {spec.fixture_id} not found")
+            groups.setdefault(spec.fixture_id, []).append((index, spec))
+        
+        chunks = []
+        chunks_per_group = max(1, workers // max(1, len(groups)))
+        for fixture_id, members in sorted(groups.items(), key=lambda item: -len(item[1])):
+            fixture = self._fixtures[fixture_id]
+            fixture_spec = (fixture_id, fixture.provider, fixture.teardown, fixture.resources)
+            size = chunk_size or math.ceil(len(members) / chunks_per_group)
+            for start in range(0, len(members), size):
+                batch = members[start:start + size]
+                chunks.append((
+                    fixture_spec,
+                    [(index, spec.test_name, spec.test_func) for index, spec in batch]
+                ))
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tests)
+        fixture_setups = 0
+        start_time = time.perf_counter()
+        
+        if workers == 1:
+            cache = _FixtureCache()
+            for chunk in chunks:
+                fixture_setups += self._collect_chunk(results, chunk, _run_chunk(chunk, cache))
+            cache.teardown_all()
+        else:
+            cache = None if use_processes else _FixtureCache()
+            executor: Executor = (
+                ProcessPoolExecutor(max_workers=workers, initializer=_init_process_worker)
+                if use_processes else
+                ThreadPoolExecutor(max_workers=workers, thread_name_prefix="integration-test")
+            )
+            with executor:
+                futures = [(chunk, executor.submit(_run_chunk, chunk, cache)) for chunk in chunks]
+                for chunk, future in futures:
+                    try:
+                        outcome = future.result()
+                    except Exception as e:
+                        # The chunk never ran (e.g. a test could not be pickled)
+                        outcome = _failed_chunk(chunk, FailureCategory.INFRASTRUCTURE, e)
+                    fixture_setups += self._collect_chunk(results, chunk, outcome)
+            if cache is not None:
+                cache.teardown_all()
+        
+        wall_clock_ms = (time.perf_counter() - start_time) * 1000
+        
+        executions = []
+        analyses = []
+        subsystems_covered = set()
+        integration_points = 0
+        serial_estimate_ms = 0.0
+        for spec, result in zip(tests, results):
+            execution = TestExecution(
+                execution_id=f"exec_{uuid.uuid4().hex[:16]}",
+                organisation_id=organisation_id,
+                fixture_id=spec.fixture_id,
+                test_name=spec.test_name,
+                status=result["status"],
+                started_at=result["started_at"],
+                completed_at=result["completed_at"],
+                duration_ms=int(result["elapsed_ms"]),
+                error_message=result["error"]
+            )
+            self._executions[execution.execution_id] = execution
+            executions.append(execution)
+            serial_estimate_ms += result["elapsed_ms"] + result["setup_ms"]
+            subsystems_covered.update(spec.subsystems)
+            integration_points += spec.integration_points
+            
+            if execution.status == IntegrationTestStatus.FAILED:
+                analyses.append(self.analyze_failure(
+                    organisation_id,
+                    execution.execution_id,
+                    result["category"],
+                    result["error"] or "",
+                    list(spec.subsystems)
+                ))
+        
+        coverage = self.calculate_coverage(
+            organisation_id, executions, sorted(subsystems_covered), integration_points
+        )
+        
+        return IntegrationTestRun(
+            run_id=f"run_{uuid.uuid4().hex[:16]}",
+            organisation_id=organisation_id,
+            executions=executions,
+            coverage=coverage,
+            failure_analyses=analyses,
+            workers=workers,
+            fixture_setups=fixture_setups,
+            wall_clock_ms=wall_clock_ms,
+            serial_estimate_ms=serial_estimate_ms
+        )
+    
     def cleanup_test(
         self,
         organisation_id: str,
@@ -397,3 +587,135 @@ class IntegrationTestingFramework:
     def get_analysis(self, analysis_id: str) -> Optional[FailureAnalysis]:
         """Get analysis by ID"""
         return self._analyses.get(analysis_id)
+    
+    # Private helper methods
+    def _collect_chunk(
+        self,
+        results: List[Optional[Dict[str, Any]]],
+        chunk: Tuple[Any, List[Tuple[int, str, Optional[Callable]]]],
+        outcome: Tuple[int, List[Dict[str, Any]]]
+    ) -> int:
+        """Store a chunk's results by test index; return its fixture setups"""
+        setups, chunk_results = outcome
+        for (index, _, _), result in zip(chunk[1], chunk_results):
+            results[index] = result
+        return setups
+
+
+class _FixtureCache:
+    """Live fixtures built by one worker, reused across its chunks"""
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.fixtures: Dict[Tuple[int, str], Tuple[Any, Optional[BaseException], Optional[Callable]]] = {}
+    
+    def get(self, fixture_spec: Tuple[str, Optional[Callable], Optional[Callable], Dict[str, Any]]):
+        """
+        Get (value, setup error, setup ms, built) for the calling worker thread
+        
+        built is False (and setup ms 0) when this worker already had it.
+        """
+        fixture_id, provider, teardown, resources = fixture_spec
+        key = (threading.get_ident(), fixture_id)
+        with self.lock:
+            cached = self.fixtures.get(key)
+        if cached is not None:
+            return cached[0], cached[1], 0.0, False
+        
+        start = time.perf_counter()
+        value, error = None, None
+        if provider is not None:
+            try:
+                value = provider(resources)
+            except Exception as e:
+                error = e
+        setup_ms = (time.perf_counter() - start) * 1000
+        
+        with self.lock:
+            self.fixtures[key] = (value, error, teardown if error is None else None)
+        return value, error, setup_ms, provider is not None
+    
+    def teardown_all(self) -> None:
+        """Tear down every fixture this cache built"""
+        with self.lock:
+            fixtures, self.fixtures = self.fixtures, {}
+        for value, _, teardown in fixtures.values():
+            if teardown is not None:
+                try:
+                    teardown(value)
+                except Exception:
+                    pass  # Teardown failures must not mask test results
+
+
+# Fixtures built by this process when it is a run_tests worker
+_process_fixtures: Optional[_FixtureCache] = None
+
+
+def _init_process_worker() -> None:
+    """Create the worker's fixture cache and tear it down at worker exit"""
+    global _process_fixtures
+    _process_fixtures = _FixtureCache()
+    multiprocessing_util.Finalize(None, _process_fixtures.teardown_all, exitpriority=10)
+
+
+def _run_chunk(
+    chunk: Tuple[Any, List[Tuple[int, str, Optional[Callable]]]],
+    cache: Optional[_FixtureCache] = None
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Run one chunk of same-fixture tests in a worker"""
+    fixture_spec, tests = chunk
+    cache = cache or _process_fixtures
+    provider = fixture_spec[1]
+    value, setup_error, setup_ms, built = cache.get(fixture_spec)
+    if setup_error is not None:
+        return (1 if built else 0), _failed_chunk(chunk, FailureCategory.SETUP, setup_error)[1]
+    
+    results = []
+    for position, (_, _, test_func) in enumerate(tests):
+        started_at = datetime.now(timezone.utc)
+        start = time.perf_counter()
+        status, error, category = IntegrationTestStatus.PASSED, None, None
+        try:
+            if test_func:
+                if provider is not None:
+                    test_func(value)
+                else:
+                    test_func()
+        except AssertionError as e:
+            status, error, category = IntegrationTestStatus.FAILED, str(e), FailureCategory.ASSERTION
+        except TimeoutError as e:
+            status, error, category = IntegrationTestStatus.FAILED, str(e), FailureCategory.TIMEOUT
+        except Exception as e:
+            status, error, category = IntegrationTestStatus.FAILED, str(e), FailureCategory.EXECUTION
+        results.append({
+            "status": status,
+            "error": error,
+            "category": category,
+            "started_at": started_at,
+            "completed_at": datetime.now(timezone.utc),
+            "elapsed_ms": (time.perf_counter() - start) * 1000,
+            "setup_ms": setup_ms if position == 0 else 0.0,
+        })
+    
+    return (1 if built else 0), results
+
+
+def _failed_chunk(
+    chunk: Tuple[Any, List[Tuple[int, str, Optional[Callable]]]],
+    category: FailureCategory,
+    error: BaseException
+) -> Tuple[int, List[Dict[str, Any]]]:
+    """Results for a chunk whose tests could not run"""
+    now = datetime.now(timezone.utc)
+    return 0, [
+        {
+            "status": IntegrationTestStatus.FAILED,
+            "error": f"{type(error).__name__}: {error}",
+            "category": category,
+            "started_at": now,
+            "completed_at": now,
+            "elapsed_ms": 0.0,
+            "setup_ms": 0.0,
+        }
+        for _ in chunk[1]
+    ]
@@ -0,0 +1,244 @@
+"""
+Transaction Log
+
+Purpose: Write-ahead log with group commit for distributed transaction state
+Authority: Wave 2.0 Subwave 2.10 - Deep Integration Phase 2 (QA-476 to QA-480)
+Tenant Isolation: Records carry organisation_id; one log serves one transaction manager
+"""
+
+from typing import Dict, List, Any, Iterable, Iterator
+from dataclasses import dataclass
+import json
+import os
+import threading
+import zlib
+
+from .event_log import RECORD_HEADER
+
+
+LOG_FILE = "transactions.wal"
+
+
+@dataclass
+class TransactionLogConfig:
+    """Transaction write-ahead log configuration"""
+    directory: str
+    fsync: bool = True  # fsync before durable appends return
+    group_commit: bool = True  # Share one fsync between concurrent committers
+    group_commit_delay_ms: float = 0.0  # Extra wait for followers before a group is flushed
+
+    def validate(self) -> bool:
+        """Validate transaction log configuration"""
+        return bool(self.directory) and self.group_commit_delay_ms >= 0
+
+
+class TransactionLog:
+    """
+    Append-only, checksummed log of transaction state changes
+
+    Records use the event log framing (length, crc32, JSON body). A torn
+    tail left by a crash is truncated when the log is opened.
+
+    With group commit, a durable append queues its record and waits; the
+    first waiter becomes the leader, writes every queued record and fsyncs
+    once for the whole group while later appends queue behind it.
+    Non-durable appends are queued and reach disk with the next group.
+    """
+
+    def __init__(self, config: TransactionLogConfig):
+        if not config.validate():
+            raise ValueError("Invalid transaction log configuration")
+        self.config = config
+        os.makedirs(config.directory, exist_ok=True)
+        self.path = os.path.join(config.directory, LOG_FILE)
+
+        self.condition = threading.Condition()
+        self.pending: List[bytes] = []  # Encoded records waiting for the next flush
+        self.last_sequence = 0  # Records accepted by append
+        self.durable_sequence = 0  # Records known to be on disk
+        self.flushing = False
+
+        # Metrics
+        self.appends = 0
+        self.syncs = 0
+        self.max_group_size = 0
+
+        self._repair()
+        self.file = open(self.path, "ab")
+
+    def append(self, record: Dict[str, Any], durable: bool = True) -> None:
+        """
+        Append a record
+
+        Args:
+            record: JSON-serialisable record
+            durable: Wait until the record (and everything before it) is on disk
+
+        Raises:
+            OSError: If the log cannot be written
+        """
+        data = _encode(record)
+
+        with self.condition:
+            self.pending.append(data)
+            self.last_sequence += 1
+            self.appends += 1
+            sequence = self.last_sequence
+            if not durable:
+                return
+
+            if not self.config.group_commit:
+                self._flush_pending()
+                return
+
+            while self.durable_sequence < sequence:
+                if self.flushing:
+                    self.condition.wait()
+                    continue
+                self._lead_group()
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Yield every record appended so far, in append order"""
+        with self.condition:
+            while self.flushing:
+                self.condition.wait()
+            if self.pending:
+                self._flush_pending()
+            end = os.fstat(self.file.fileno()).st_size
+
+        position = 0
+        with open(self.path, "rb") as log_file:
+            while position < end:
+                length, _ = RECORD_HEADER.unpack(log_file.read(RECORD_HEADER.size))
+                yield json.loads(log_file.read(length))
+                position += RECORD_HEADER.size + length
+
+    def flush(self) -> None:
+        """Write and sync any queued non-durable records"""
+        with self.condition:
+            while self.flushing:
+                self.condition.wait()
+            if self.pending:
+                self._flush_pending()
+
+    def rewrite(self, records: Iterable[Dict[str, Any]]) -> None:
+        """
+        Atomically replace the log with the given records (checkpoint)
+
+        Appends block until the new log is in place.
+        """
+        with self.condition:
+            while self.flushing:
+                self.condition.wait()
+            if self.pending:
+                self._flush_pending()
+
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "wb") as temp_file:
+                for record in records:
+                    temp_file.write(_encode(record))
+                temp_file.flush()
+                if self.config.fsync:
+                    os.fsync(temp_file.fileno())
+
+            self.file.close()
+            os.replace(temp_path, self.path)
+            self._sync_directory()
+            self.file = open(self.path, "ab")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get append and fsync counters"""
+        with self.condition:
+            return {
+                "appends": self.appends,
+                "syncs": self.syncs,
+                "max_group_size": self.max_group_size,
+                "average_group_size": self.appends / self.syncs if self.syncs else 0.0,
+                "size_bytes": os.path.getsize(self.path),
+            }
+
+    def close(self) -> None:
+        """Flush queued records and close the log file"""
+        self.flush()
+        with self.condition:
+            self.file.close()
+
+    # Private helper methods
+    def _lead_group(self) -> None:
+        """Flush the queued group outside the lock (caller holds condition)"""
+        self.flushing = True
+        if self.config.group_commit_delay_ms:
+            # Let concurrent committers join this group
+            self.condition.wait(timeout=self.config.group_commit_delay_ms / 1000)
+
+        batch = self.pending
+        self.pending = []
+        upto = self.last_sequence
+
+        self.condition.release()
+        try:
+            self._write(batch)
+        except BaseException:
+            self.condition.acquire()
+            self.pending = batch + self.pending  # Keep order; the next leader retries
+            self.flushing = False
+            self.condition.notify_all()
+            raise
+        self.condition.acquire()
+
+        self.flushing = False
+        self.durable_sequence = max(self.durable_sequence, upto)
+        self.syncs += 1
+        self.max_group_size = max(self.max_group_size, len(batch))
+        self.condition.notify_all()
+
+    def _flush_pending(self) -> None:
+        """Write and sync queued records while holding the lock"""
+        batch = self.pending
+        self.pending = []
+        self._write(batch)
+        self.durable_sequence = self.last_sequence
+        self.syncs += 1
+        self.max_group_size = max(self.max_group_size, len(batch))
+
+    def _write(self, batch: List[bytes]) -> None:
+        """Write records and sync to stable storage"""
+        self.file.write(b"".join(batch))
+        self.file.flush()
+        if self.config.fsync:
+            os.fsync(self.file.fileno())
+
+    def _repair(self) -> None:
+        """Truncate a torn or corrupt tail left by a crash"""
+        if not os.path.exists(self.path):
+            return
+
+        size = os.path.getsize(self.path)
+        position = 0
+        with open(self.path, "rb") as log_file:
+            while position + RECORD_HEADER.size <= size:
+                length, crc = RECORD_HEADER.unpack(log_file.read(RECORD_HEADER.size))
+                body = log_file.read(length)
+                if len(body) < length or zlib.crc32(body) != crc:
+                    break
+                position += RECORD_HEADER.size + length
+
+        if position < size:
+            with open(self.path, "r+b") as log_file:
+                log_file.truncate(position)
+
+    def _sync_directory(self) -> None:
+        """Persist a rename in the log directory"""
+        if not self.config.fsync or not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(self.config.directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def _encode(record: Dict[str, Any]) -> bytes:
+    """Frame a record as length, crc32 and compact JSON"""
+    body = json.dumps(record, separators=(",", ":"), default=str).encode("utf-8")
+    return RECORD_HEADER.pack(len(body), zlib.crc32(body)) + body
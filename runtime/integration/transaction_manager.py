@@ -11,8 +11,11 @@ from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+import threading
 import uuid
 
+from .transaction_log import TransactionLog
+
 
 class TransactionState(Enum):
     """Transaction states"""
@@ -90,13 +93,33 @@ class TransactionManager:
     
     Provides transaction initialization, commit, rollback, distributed
     coordination, and failure recovery capabilities.
+    
+    With a TransactionLog, every state change is written ahead to the log:
+    commit, prepare and coordination decisions are durable before they take
+    effect, while begin and rollback records ride along with the next group
+    commit (an unlogged outcome is presumed aborted). State is replayed from
+    the log on construction.
     """
     
-    def __init__(self):
-        """Initialize transaction manager with in-memory storage"""
+    def __init__(self, transaction_log: Optional[TransactionLog] = None):
+        """
+        Initialize transaction manager.
+        
+        Args:
+            transaction_log: Optional write-ahead log; state is recovered from it
+        """
         self._transactions: Dict[str, Transaction] = {}
         self._coordinations: Dict[str, DistributedCoordination] = {}
         self._recoveries: Dict[str, FailureRecovery] = {}
+        self._log = transaction_log
+        self._lock = threading.Condition()
+        self._pending_outcomes: Set[str] = set()  # Transactions with a commit/rollback being logged
+        self._log_writers = 0  # Changes appended but not yet applied
+        self._checkpointing = False
+        self.last_recovery: Optional[Dict[str, List[str]]] = None
+        
+        if self._log is not None:
+            self.last_recovery = self.recover_from_log()
     
     def initialize_transaction(
         self,
@@ -126,7 +149,11 @@ class TransactionManager:
             timestamp=datetime.now(timezone.utc)
         )
         
-        self._transactions[transaction_id] = transaction
+        with self._lock:
+            self._wait_for_checkpoint()
+            self._transactions[transaction_id] = transaction
+            # Not durable: a begin without a commit is presumed aborted
+            self._append({"type": "begin", **_transaction_record(transaction)}, durable=False)
         
         # Transition to IN_PROGRESS
         transaction.state = TransactionState.IN_PROGRESS
@@ -146,19 +173,30 @@ class TransactionManager:
         Raises:
             ValueError: If transaction cannot be committed
         """
-        transaction = self._transactions.get(transaction_id)
-        if not transaction:
-            raise ValueError(f"Transaction {transaction_id} not found")
-        
-        if not transaction.can_commit():
-            raise ValueError(
-                f"Transaction {transaction_id} cannot be committed "
-                f"(current state: {transaction.state})"
-            )
+        with self._lock:
+            transaction = self._claim_outcome(transaction_id)
+            if not transaction.can_commit():
+                self._release_outcome(transaction_id)
+                raise ValueError(
+                    f"Transaction {transaction_id} cannot be committed "
+                    f"(current state: {transaction.state})"
+                )
         
-        # Execute commit
-        transaction.state = TransactionState.COMMITTED
-        transaction.committed_at = datetime.now(timezone.utc)
+        committed_at = datetime.now(timezone.utc)
+        try:
+            # The commit is decided once its record is durable
+            self._append({
+                "type": "commit",
+                "transaction_id": transaction_id,
+                "committed_at": committed_at.isoformat()
+            })
+            
+            # Execute commit
+            transaction.state = TransactionState.COMMITTED
+            transaction.committed_at = committed_at
+        finally:
+            with self._lock:
+                self._release_outcome(transaction_id)
         
         return transaction
     
@@ -180,21 +218,33 @@ class TransactionManager:
         Raises:
             ValueError: If transaction cannot be rolled back
         """
-        transaction = self._transactions.get(transaction_id)
-        if not transaction:
-            raise ValueError(f"Transaction {transaction_id} not found")
+        with self._lock:
+            transaction = self._claim_outcome(transaction_id)
+            if not transaction.can_rollback():
+                self._release_outcome(transaction_id)
+                raise ValueError(
+                    f"Transaction {transaction_id} cannot be rolled back "
+                    f"(current state: {transaction.state})"
+                )
         
-        if not transaction.can_rollback():
-            raise ValueError(
-                f"Transaction {transaction_id} cannot be rolled back "
-                f"(current state: {transaction.state})"
-            )
-        
-        # Execute rollback
-        transaction.state = TransactionState.ROLLED_BACK
-        transaction.rolled_back_at = datetime.now(timezone.utc)
-        if reason:
-            transaction.failure_reason = reason
+        rolled_back_at = datetime.now(timezone.utc)
+        try:
+            # Not durable: an unlogged rollback is presumed anyway
+            self._append({
+                "type": "rollback",
+                "transaction_id": transaction_id,
+                "rolled_back_at": rolled_back_at.isoformat(),
+                "reason": reason
+            }, durable=False)
+            
+            # Execute rollback
+            transaction.state = TransactionState.ROLLED_BACK
+            transaction.rolled_back_at = rolled_back_at
+            if reason:
+                transaction.failure_reason = reason
+        finally:
+            with self._lock:
+                self._release_outcome(transaction_id)
         
         return transaction
     
@@ -226,13 +276,29 @@ class TransactionManager:
             timestamp=datetime.now(timezone.utc)
         )
         
-        self._coordinations[coordination_id] = coordination
-        
-        # Transition to COORDINATING
-        coordination.status = CoordinationStatus.COORDINATING
+        with self._lock:
+            self._wait_for_checkpoint()
+            self._coordinations[coordination_id] = coordination
+            self._log_writers += 1
         
-        # Mark as coordinated (simplified - would involve 2PC in production)
-        coordination.mark_coordinated()
+        try:
+            # Prepare record: participants are known before any is asked to vote
+            self._append({"type": "prepare", **_coordination_record(coordination)})
+            
+            # Transition to COORDINATING
+            coordination.status = CoordinationStatus.COORDINATING
+            
+            # Mark as coordinated (simplified - would involve 2PC in production)
+            coordination.mark_coordinated()
+            self._append({
+                "type": "coordinated",
+                "coordination_id": coordination_id,
+                "coordinated_at": coordination.coordinated_at.isoformat()
+            })
+        finally:
+            with self._lock:
+                self._log_writers -= 1
+                self._lock.notify_all()
         
         return coordination
     
@@ -267,21 +333,124 @@ class TransactionManager:
             timestamp=datetime.now(timezone.utc)
         )
         
-        self._recoveries[recovery_id] = recovery
+        with self._lock:
+            self._wait_for_checkpoint()
+            self._recoveries[recovery_id] = recovery
+            self._log_writers += 1
+        
+        try:
+            # Execute recovery actions
+            recovery.recovery_status = "in_progress"
+            
+            # Mark transaction as recovering
+            transaction = self._transactions.get(transaction_id)
+            if transaction:
+                transaction.state = TransactionState.RECOVERING
+            
+            # Complete recovery
+            recovery.recovery_status = "completed"
+            recovery.completed_at = datetime.now(timezone.utc)
+            self._append({"type": "recovery", **_recovery_record(recovery)})
+        finally:
+            with self._lock:
+                self._log_writers -= 1
+                self._lock.notify_all()
         
-        # Execute recovery actions
-        recovery.recovery_status = "in_progress"
+        return recovery
+    
+    def recover_from_log(self) -> Dict[str, List[str]]:
+        """
+        Rebuild state by replaying the write-ahead log.
         
-        # Mark transaction as recovering
-        transaction = self._transactions.get(transaction_id)
-        if transaction:
-            transaction.state = TransactionState.RECOVERING
+        Transactions with a commit or rollback record get that outcome.
+        A transaction whose coordination reached COORDINATED but has no
+        outcome is in doubt and left IN_PROGRESS for the caller to finish.
+        Any other transaction without an outcome is presumed aborted and
+        rolled back; coordinations stuck before their decision are FAILED.
         
-        # Complete recovery
-        recovery.recovery_status = "completed"
-        recovery.completed_at = datetime.now(timezone.utc)
+        Returns:
+            Transaction IDs by outcome: committed, rolled_back, recovering,
+            in_doubt and presumed_aborted
+        """
+        if self._log is None:
+            raise ValueError("No transaction log configured")
         
-        return recovery
+        with self._lock:
+            self._wait_for_checkpoint()
+            self._transactions.clear()
+            self._coordinations.clear()
+            self._recoveries.clear()
+            for record in self._log.replay():
+                self._apply_record(record)
+            
+            coordinated = {
+                c.transaction_id for c in self._coordinations.values()
+                if c.status == CoordinationStatus.COORDINATED
+            }
+            for coordination in self._coordinations.values():
+                if coordination.status != CoordinationStatus.COORDINATED:
+                    coordination.status = CoordinationStatus.FAILED
+            
+            summary: Dict[str, List[str]] = {
+                "committed": [],
+                "rolled_back": [],
+                "recovering": [],
+                "in_doubt": [],
+                "presumed_aborted": [],
+            }
+            now = datetime.now(timezone.utc)
+            for transaction in self._transactions.values():
+                if transaction.state == TransactionState.IN_PROGRESS:
+                    if transaction.transaction_id in coordinated:
+                        summary["in_doubt"].append(transaction.transaction_id)
+                        continue
+                    transaction.state = TransactionState.ROLLED_BACK
+                    transaction.rolled_back_at = now
+                    transaction.failure_reason = "Presumed aborted: no commit record after restart"
+                    self._append({
+                        "type": "rollback",
+                        "transaction_id": transaction.transaction_id,
+                        "rolled_back_at": now.isoformat(),
+                        "reason": transaction.failure_reason
+                    }, durable=False)
+                    summary["presumed_aborted"].append(transaction.transaction_id)
+                elif transaction.state == TransactionState.COMMITTED:
+                    summary["committed"].append(transaction.transaction_id)
+                elif transaction.state == TransactionState.ROLLED_BACK:
+                    summary["rolled_back"].append(transaction.transaction_id)
+                elif transaction.state == TransactionState.RECOVERING:
+                    summary["recovering"].append(transaction.transaction_id)
+            
+            self._log.flush()
+            return summary
+    
+    def checkpoint(self) -> None:
+        """
+        Compact the write-ahead log to one snapshot record per object.
+        
+        Waits for in-flight logged changes to be applied and blocks new
+        ones until the compacted log is in place.
+        """
+        if self._log is None:
+            raise ValueError("No transaction log configured")
+        
+        with self._lock:
+            self._wait_for_checkpoint()
+            self._checkpointing = True
+            try:
+                self._lock.wait_for(lambda: self._log_writers == 0)
+                records = (
+                    [{"type": "snapshot_transaction", **_transaction_record(t)}
+                     for t in self._transactions.values()] +
+                    [{"type": "snapshot_coordination", **_coordination_record(c)}
+                     for c in self._coordinations.values()] +
+                    [{"type": "recovery", **_recovery_record(r)}
+                     for r in self._recoveries.values()]
+                )
+                self._log.rewrite(records)
+            finally:
+                self._checkpointing = False
+                self._lock.notify_all()
     
     def get_transaction(self, transaction_id: str) -> Optional[Transaction]:
         """Get transaction by ID"""
@@ -301,3 +470,150 @@ class TransactionManager:
             txn for txn in self._transactions.values()
             if txn.organisation_id == organisation_id
         ]
+    
+    # Private helper methods
+    def _append(self, record: Dict[str, Any], durable: bool = True) -> None:
+        """Write a record ahead to the log, if one is configured"""
+        if self._log is not None:
+            self._log.append(record, durable=durable)
+    
+    def _wait_for_checkpoint(self) -> None:
+        """Block while a checkpoint rewrites the log (caller holds lock)"""
+        self._lock.wait_for(lambda: not self._checkpointing)
+    
+    def _claim_outcome(self, transaction_id: str) -> Transaction:
+        """Reserve a transaction for commit/rollback (caller holds lock)"""
+        self._wait_for_checkpoint()
+        transaction = self._transactions.get(transaction_id)
+        if not transaction:
+            raise ValueError(f"Transaction {transaction_id} not found")
+        if transaction_id in self._pending_outcomes:
+            raise ValueError(f"Transaction {transaction_id} is already being committed or rolled back")
+        self._pending_outcomes.add(transaction_id)
+        self._log_writers += 1
+        return transaction
+    
+    def _release_outcome(self, transaction_id: str) -> None:
+        """Release a reservation taken by _claim_outcome (caller holds lock)"""
+        self._pending_outcomes.discard(transaction_id)
+        self._log_writers -= 1
+        self._lock.notify_all()
+    
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply one replayed log record to in-memory state"""
+        record_type = record["type"]
+        
+        if record_type in ("begin", "snapshot_transaction"):
+            transaction = Transaction(
+                transaction_id=record["transaction_id"],
+                organisation_id=record["organisation_id"],
+                state=TransactionState(record["state"]),
+                participating_subsystems=set(record["participating_subsystems"]),
+                operations=record["operations"],
+                timestamp=_parse_time(record["timestamp"]),
+                committed_at=_parse_time(record.get("committed_at")),
+                rolled_back_at=_parse_time(record.get("rolled_back_at")),
+                failure_reason=record.get("failure_reason")
+            )
+            if record_type == "begin":
+                transaction.state = TransactionState.IN_PROGRESS
+            self._transactions[transaction.transaction_id] = transaction
+        elif record_type == "commit":
+            transaction = self._transactions.get(record["transaction_id"])
+            if transaction:
+                transaction.state = TransactionState.COMMITTED
+                transaction.committed_at = _parse_time(record["committed_at"])
+        elif record_type == "rollback":
+            transaction = self._transactions.get(record["transaction_id"])
+            if transaction:
+                transaction.state = TransactionState.ROLLED_BACK
+                transaction.rolled_back_at = _parse_time(record["rolled_back_at"])
+                if record.get("reason"):
+                    transaction.failure_reason = record["reason"]
+        elif record_type in ("prepare", "snapshot_coordination"):
+            coordination = DistributedCoordination(
+                coordination_id=record["coordination_id"],
+                organisation_id=record["organisation_id"],
+                transaction_id=record["transaction_id"],
+                participating_nodes=record["participating_nodes"],
+                status=CoordinationStatus(record["status"]),
+                timestamp=_parse_time(record["timestamp"]),
+                coordinated_at=_parse_time(record.get("coordinated_at"))
+            )
+            if record_type == "prepare":
+                coordination.status = CoordinationStatus.COORDINATING
+            self._coordinations[coordination.coordination_id] = coordination
+        elif record_type == "coordinated":
+            coordination = self._coordinations.get(record["coordination_id"])
+            if coordination:
+                coordination.status = CoordinationStatus.COORDINATED
+                coordination.coordinated_at = _parse_time(record["coordinated_at"])
+        elif record_type == "recovery":
+            recovery = FailureRecovery(
+                recovery_id=record["recovery_id"],
+                organisation_id=record["organisation_id"],
+                transaction_id=record["transaction_id"],
+                failure_reason=record["failure_reason"],
+                recovery_actions=record["recovery_actions"],
+                recovery_status=record["recovery_status"],
+                timestamp=_parse_time(record["timestamp"]),
+                completed_at=_parse_time(record.get("completed_at"))
+            )
+            self._recoveries[recovery.recovery_id] = recovery
+            transaction = self._transactions.get(recovery.transaction_id)
+            if transaction and transaction.state not in (
+                TransactionState.COMMITTED, TransactionState.ROLLED_BACK
+            ):
+                transaction.state = TransactionState.RECOVERING
+
+
+def _transaction_record(transaction: Transaction) -> Dict[str, Any]:
+    """Serialise a transaction for the log"""
+    return {
+        "transaction_id": transaction.transaction_id,
+        "organisation_id": transaction.organisation_id,
+        "state": transaction.state.value,
+        "participating_subsystems": sorted(transaction.participating_subsystems),
+        "operations": transaction.operations,
+        "timestamp": transaction.timestamp.isoformat(),
+        "committed_at": _format_time(transaction.committed_at),
+        "rolled_back_at": _format_time(transaction.rolled_back_at),
+        "failure_reason": transaction.failure_reason,
+    }
+
+
+def _coordination_record(coordination: DistributedCoordination) -> Dict[str, Any]:
+    """Serialise a coordination for the log"""
+    return {
+        "coordination_id": coordination.coordination_id,
+        "organisation_id": coordination.organisation_id,
+        "transaction_id": coordination.transaction_id,
+        "participating_nodes": coordination.participating_nodes,
+        "status": coordination.status.value,
+        "timestamp": coordination.timestamp.isoformat(),
+        "coordinated_at": _format_time(coordination.coordinated_at),
+    }
+
+
+def _recovery_record(recovery: FailureRecovery) -> Dict[str, Any]:
+    """Serialise a failure recovery for the log"""
+    return {
+        "recovery_id": recovery.recovery_id,
+        "organisation_id": recovery.organisation_id,
+        "transaction_id": recovery.transaction_id,
+        "failure_reason": recovery.failure_reason,
+        "recovery_actions": recovery.recovery_actions,
+        "recovery_status": recovery.recovery_status,
+        "timestamp": recovery.timestamp.isoformat(),
+        "completed_at": _format_time(recovery.completed_at),
+    }
+
+
+def _format_time(value: Optional[datetime]) -> Optional[str]:
+    """Format an optional timestamp for the log"""
+    return value.isoformat() if value else None
+
+
+def _parse_time(value: Optional[str]) -> Optional[datetime]:
+    """Parse an optional timestamp from the log"""
+    return datetime.fromisoformat(value) if value else None
@@ -7,10 +7,12 @@ Tenant Isolation: All operations scoped by organisation_id
 """
 
 from enum import Enum
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Deque, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from collections import deque
 import threading
+import time
 
 
 @dataclass
@@ -33,47 +35,152 @@ class Escalation:
     details: Dict[str, Any]
 
 
-class RaceDetector:
-    """Detects race conditions on resources"""
+class _ResourceWindow:
+    """Recent writes to one resource and the gaps between them"""
+    
+    __slots__ = ("writes", "gaps")
     
     def __init__(self):
-        self._access_attempts: Dict[str, List[AccessAttempt]] = {}
-        self._lock = threading.Lock()
+        self.writes: Deque[float] = deque()  # Write times (seconds), in time order
+        self.gaps: Deque[Tuple[float, float]] = deque()  # (time, gap ms), both increasing: sliding minimum
+    
+    def add_write(self, at: float) -> None:
+        """Record a write and the gaps to its neighbours in time"""
+        writes = self.writes
+        if not writes or writes[-1] <= at:
+            if writes:
+                self._add_gap(at, (at - writes[-1]) * 1000)
+            writes.append(at)
+            return
+        
+        # Late arrival: slot it in by time and pair it with both neighbours
+        index = len(writes) - 1
+        while index and writes[index - 1] > at:
+            index -= 1
+        following = writes[index]
+        if index:
+            self._add_gap(at, (at - writes[index - 1]) * 1000)
+        self._add_gap(following, (following - at) * 1000)
+        writes.insert(index, at)
+    
+    def _add_gap(self, at: float, gap: float) -> None:
+        """Add a gap that expires with the write at, keeping the deque a sliding minimum"""
+        gaps = self.gaps
+        index = len(gaps)
+        while index and gaps[index - 1][0] > at:
+            index -= 1
+        if index < len(gaps) and gaps[index][1] <= gap:
+            return  # A gap no larger outlives this one
+        while index and gaps[index - 1][1] >= gap:
+            del gaps[index - 1]
+            index -= 1
+        gaps.insert(index, (at, gap))
+    
+    def evict(self, cutoff: float) -> None:
+        """Forget writes and gaps older than cutoff"""
+        while self.writes and self.writes[0] < cutoff:
+            self.writes.popleft()
+        while self.gaps and self.gaps[0][0] < cutoff:
+            self.gaps.popleft()
+    
+    def min_gap_ms(self) -> Optional[float]:
+        """Smallest gap between writes still in the window"""
+        return self.gaps[0][1] if self.gaps else None
+
+
+class RaceDetector:
+    """
+    Detects race conditions on resources
+    
+    Only writes from the last retention_ms are kept, per resource. Each
+    write is compared with its neighbour as it is recorded, and the
+    smallest gap in the window is kept in a sliding-minimum deque, so
+    recording and checking are O(1) amortized. Resources are spread over
+    striped locks so unrelated resources do not contend.
+    """
+    
+    SWEEP_INTERVAL = 1024  # Records per stripe between sweeps of idle resources
+    
+    def __init__(
+        self,
+        retention_ms: int = 10_000,
+        lock_stripes: int = 64,
+        clock: Optional[Callable[[], float]] = None
+    ):
+        if retention_ms <= 0 or lock_stripes <= 0:
+            raise ValueError("retention_ms and lock_stripes must be positive")
+        self.retention_ms = retention_ms
+        self._clock = clock or time.time
+        self._stripe_locks = [threading.Lock() for _ in range(lock_stripes)]
+        self._windows: List[Dict[str, _ResourceWindow]] = [{} for _ in range(lock_stripes)]
+        self._records_since_sweep = [0] * lock_stripes
     
     def record_access(self, attempt: AccessAttempt) -> None:
         """Record an access attempt"""
-        with self._lock:
-            if attempt.resource_id not in self._access_attempts:
-                self._access_attempts[attempt.resource_id] = []
-            self._access_attempts[attempt.resource_id].append(attempt)
+        if attempt.operation != "write":
+            return
+        
+        stripe = self._stripe(attempt.resource_id)
+        at = attempt.timestamp.timestamp()
+        cutoff = self._clock() - self.retention_ms / 1000
+        with self._stripe_locks[stripe]:
+            windows = self._windows[stripe]
+            window = windows.get(attempt.resource_id)
+            if window is None:
+                window = windows[attempt.resource_id] = _ResourceWindow()
+            window.evict(cutoff)
+            window.add_write(at)
+            
+            self._records_since_sweep[stripe] += 1
+            if self._records_since_sweep[stripe] >= self.SWEEP_INTERVAL:
+                self._sweep(stripe, cutoff)
     
     def is_race_detected(self, resource_id: str, time_window_ms: int = 100) -> bool:
         """
         Detect if race condition exists
         
-        Race detected if multiple write operations attempted concurrently
+        Race detected if multiple write operations attempted concurrently:
+        two writes less than time_window_ms apart within the retention window
         """
-        with self._lock:
-            if resource_id not in self._access_attempts:
+        stripe = self._stripe(resource_id)
+        cutoff = self._clock() - self.retention_ms / 1000
+        with self._stripe_locks[stripe]:
+            window = self._windows[stripe].get(resource_id)
+            if window is None:
                 return False
             
-            attempts = self._access_attempts[resource_id]
-            
-            # Check for concurrent write operations
-            write_attempts = [a for a in attempts if a.operation == "write"]
-            
-            if len(write_attempts) < 2:
+            window.evict(cutoff)
+            if not window.writes:
+                del self._windows[stripe][resource_id]
                 return False
             
-            # Check if they're within time window
-            write_attempts.sort(key=lambda a: a.timestamp)
-            
-            for i in range(len(write_attempts) - 1):
-                time_diff = (write_attempts[i + 1].timestamp - write_attempts[i].timestamp).total_seconds() * 1000
-                if time_diff < time_window_ms:
-                    return True
-            
-            return False
+            gap = window.min_gap_ms()
+            return gap is not None and gap < time_window_ms
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get the number of tracked resources and buffered writes"""
+        resources = 0
+        writes = 0
+        for lock, windows in zip(self._stripe_locks, self._windows):
+            with lock:
+                resources += len(windows)
+                writes += sum(len(window.writes) for window in windows.values())
+        return {"resources": resources, "buffered_writes": writes}
+    
+    # Private helper methods
+    def _stripe(self, resource_id: str) -> int:
+        """Lock stripe owning a resource"""
+        return hash(resource_id) % len(self._stripe_locks)
+    
+    def _sweep(self, stripe: int, cutoff: float) -> None:
+        """Drop resources with no writes in the window (caller holds stripe lock)"""
+        self._records_since_sweep[stripe] = 0
+        windows = self._windows[stripe]
+        for resource_id in list(windows):
+            window = windows[resource_id]
+            window.evict(cutoff)
+            if not window.writes:
+                del windows[resource_id]
 
 
 class RetryStrategy:
@@ -14,21 +14,28 @@ Resilience Patterns:
 - QA-270: Graceful degradation
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Deque, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
+from collections import deque
+from contextlib import contextmanager
 import threading
 import time
 import random
 import uuid
 
+from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitState
+from .timer_wheel import TimerWheel, get_timer_wheel
 
-class CircuitState(Enum):
-    """Circuit breaker states"""
-    CLOSED = "closed"  # Normal operation
-    OPEN = "open"  # Failures exceeded threshold
-    HALF_OPEN = "half_open"  # Testing recovery
+
+class BulkheadFullError(Exception):
+    """Raised when a bulkhead slot cannot be acquired within the wait limit"""
+
+    def __init__(self, message: str, bulkhead_id: str, waited_ms: float = 0.0):
+        super().__init__(message)
+        self.bulkhead_id = bulkhead_id
+        self.waited_ms = waited_ms
 
 
 class ResilienceStrategy(Enum):
@@ -40,20 +47,15 @@ class ResilienceStrategy(Enum):
     GRACEFUL_DEGRADATION = "graceful_degradation"
 
 
-@dataclass
-class CircuitBreaker:
-    """Circuit breaker configuration and state"""
-    circuit_id: str
-    resource_id: str
-    state: CircuitState
-    failure_count: int
-    failure_threshold: int
-    timeout_seconds: int
-    half_open_max_calls: int
-    half_open_calls: int
-    last_failure_time: Optional[datetime]
-    opened_at: Optional[datetime]
-    organisation_id: str
+class _BulkheadWaiter:
+    """A caller queued for a bulkhead slot"""
+    
+    __slots__ = ("request_id", "event", "granted")
+    
+    def __init__(self, request_id: str):
+        self.request_id = request_id
+        self.event = threading.Event()
+        self.granted = False
 
 
 @dataclass
@@ -66,6 +68,14 @@ class Bulkhead:
     max_wait_duration_ms: int
     active_requests: Dict[str, datetime]
     organisation_id: str
+    waiters: Deque[_BulkheadWaiter] = field(default_factory=deque)  # FIFO; slots are handed to the head
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    acquired_count: int = 0
+    rejected_count: int = 0
+    queued_count: int = 0  # Acquisitions that had to wait
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    peak_queue_depth: int = 0
 
 
 @dataclass
@@ -115,12 +125,13 @@ class ResilienceManager:
     - Graceful degradation for partial functionality
     """
     
-    def __init__(self, organisation_id: str):
+    def __init__(self, organisation_id: str, timer_wheel: Optional[TimerWheel] = None):
         """
         Initialize resilience manager
         
         Args:
             organisation_id: Organisation ID for tenant isolation
+            timer_wheel: Timer service for operation timeouts (defaults to the shared wheel)
         """
         self.organisation_id = organisation_id
         self._circuit_breakers: Dict[str, CircuitBreaker] = {}
@@ -128,6 +139,7 @@ class ResilienceManager:
         self._retry_policies: Dict[str, RetryPolicy] = {}
         self._timed_operations: Dict[str, TimedOperation] = {}
         self._degradation_configs: Dict[str, ServiceDegradation] = {}
+        self._timer_wheel = timer_wheel or get_timer_wheel()
         self._lock = threading.Lock()
     
     def initialize_circuit_breaker(
@@ -135,35 +147,36 @@ class ResilienceManager:
         resource_id: str,
         failure_threshold: int = 3,
         timeout_seconds: int = 10,
-        half_open_max_calls: int = 1
+        half_open_max_calls: int = 1,
+        config: Optional[CircuitBreakerConfig] = None
     ) -> str:
         """
         QA-266: Initialize circuit breaker for resource
         
+        Without a config the breaker uses a count-based window of the last
+        100 calls and opens once at least failure_threshold calls have been
+        recorded and half or more of them failed.
+        
         Args:
             resource_id: Resource to protect
-            failure_threshold: Failures before opening circuit
+            failure_threshold: Calls in the window before the failure rate is evaluated
             timeout_seconds: Time before attempting recovery
             half_open_max_calls: Test calls in half-open state
+            config: Full sliding-window configuration (overrides the above)
             
         Returns:
             circuit_id: Circuit breaker identifier
         """
         circuit_id = str(uuid.uuid4())
         
-        circuit = CircuitBreaker(
-            circuit_id=circuit_id,
-            resource_id=resource_id,
-            state=CircuitState.CLOSED,
-            failure_count=0,
-            failure_threshold=failure_threshold,
-            timeout_seconds=timeout_seconds,
-            half_open_max_calls=half_open_max_calls,
-            half_open_calls=0,
-            last_failure_time=None,
-            opened_at=None,
-            organisation_id=self.organisation_id
-        )
+        if config is None:
+            config = CircuitBreakerConfig(
+                window_size=max(100, failure_threshold),
+                minimum_calls=failure_threshold,
+                wait_duration_open_seconds=timeout_seconds,
+                permitted_half_open_calls=half_open_max_calls
+            )
+        circuit = CircuitBreaker(resource_id, config, organisation_id=self.organisation_id)
         
         with self._lock:
             self._circuit_breakers[circuit_id] = circuit
@@ -178,84 +191,73 @@ class ResilienceManager:
             circuit_id: Circuit breaker ID
             
         Returns:
-            Circuit status dict
+            Circuit status dict with window failure and slow-call rates
         """
-        with self._lock:
-            if circuit_id not in self._circuit_breakers:
-                return {"error": "Circuit not found"}
-            
-            circuit = self._circuit_breakers[circuit_id]
-            
-            # Check if timeout expired and transition to HALF_OPEN
-            if circuit.state == CircuitState.OPEN and circuit.opened_at:
-                elapsed = (datetime.now(timezone.utc) - circuit.opened_at).total_seconds()
-                if elapsed >= circuit.timeout_seconds:
-                    circuit.state = CircuitState.HALF_OPEN
-                    circuit.half_open_calls = 0
-            
-            return {
-                "state": circuit.state.value,
-                "failure_count": circuit.failure_count,
-                "resource_id": circuit.resource_id,
-                "organisation_id": circuit.organisation_id
-            }
+        circuit = self._circuit_breakers.get(circuit_id)
+        if circuit is None:
+            return {"error": "Circuit not found"}
+        
+        metrics = circuit.get_metrics()
+        return {
+            "state": metrics["state"],
+            "failure_count": metrics["failure_count"],
+            "failure_rate": metrics["failure_rate"],
+            "slow_call_rate": metrics["slow_call_rate"],
+            "buffered_calls": metrics["buffered_calls"],
+            "rejected_calls": metrics["rejected_calls"],
+            "resource_id": circuit.name,
+            "organisation_id": circuit.organisation_id
+        }
     
-    def record_call_failure(self, circuit_id: str) -> None:
+    def record_call_failure(self, circuit_id: str, duration_ms: Optional[float] = None) -> None:
         """
         QA-266: Record call failure for circuit breaker
         
         Args:
             circuit_id: Circuit breaker ID
+            duration_ms: Call duration, for slow-call tracking
         """
-        with self._lock:
-            if circuit_id not in self._circuit_breakers:
-                return
-            
-            circuit = self._circuit_breakers[circuit_id]
-            circuit.failure_count += 1
-            circuit.last_failure_time = datetime.now(timezone.utc)
-            
-            # Transition to OPEN if threshold exceeded
-            if circuit.failure_count >= circuit.failure_threshold:
-                circuit.state = CircuitState.OPEN
-                circuit.opened_at = datetime.now(timezone.utc)
+        circuit = self._circuit_breakers.get(circuit_id)
+        if circuit is not None:
+            circuit.record_failure(duration_ms)
+    
+    def record_call_success(self, circuit_id: str, duration_ms: Optional[float] = None) -> None:
+        """
+        QA-266: Record call success for circuit breaker
+        
+        Args:
+            circuit_id: Circuit breaker ID
+            duration_ms: Call duration, for slow-call tracking
+        """
+        circuit = self._circuit_breakers.get(circuit_id)
+        if circuit is not None:
+            circuit.record_success(duration_ms)
     
     def attempt_call(self, circuit_id: str) -> Dict[str, Any]:
         """
         QA-266: Attempt call through circuit breaker
         
+        An allowed call in half-open state is one of the limited trial
+        calls; report its outcome with record_call_success/failure.
+        
         Args:
             circuit_id: Circuit breaker ID
             
         Returns:
             Dict with allowed status and reason
         """
-        with self._lock:
-            if circuit_id not in self._circuit_breakers:
-                return {"allowed": False, "reason": "circuit_not_found"}
-            
-            circuit = self._circuit_breakers[circuit_id]
-            
-            if circuit.state == CircuitState.CLOSED:
-                return {"allowed": True, "reason": "circuit_closed"}
-            elif circuit.state == CircuitState.OPEN:
-                # Check if timeout expired
-                if circuit.opened_at:
-                    elapsed = (datetime.now(timezone.utc) - circuit.opened_at).total_seconds()
-                    if elapsed >= circuit.timeout_seconds:
-                        circuit.state = CircuitState.HALF_OPEN
-                        circuit.half_open_calls = 0
-                        return {"allowed": True, "reason": "circuit_half_open"}
-                
-                return {"allowed": False, "reason": "circuit_open"}
-            elif circuit.state == CircuitState.HALF_OPEN:
-                if circuit.half_open_calls < circuit.half_open_max_calls:
-                    circuit.half_open_calls += 1
-                    return {"allowed": True, "reason": "circuit_half_open"}
-                else:
-                    return {"allowed": False, "reason": "half_open_limit_reached"}
-        
-        return {"allowed": False, "reason": "unknown"}
+        circuit = self._circuit_breakers.get(circuit_id)
+        if circuit is None:
+            return {"allowed": False, "reason": "circuit_not_found"}
+        
+        allowed, state = circuit.acquire_permission()
+        if state == CircuitState.CLOSED:
+            return {"allowed": True, "reason": "circuit_closed"}
+        if state == CircuitState.OPEN:
+            return {"allowed": False, "reason": "circuit_open"}
+        if allowed:
+            return {"allowed": True, "reason": "circuit_half_open"}
+        return {"allowed": False, "reason": "half_open_limit_reached"}
     
     def create_bulkhead(
         self,
@@ -294,39 +296,187 @@ class ResilienceManager:
     def acquire_bulkhead_slot(
         self,
         bulkhead_id: str,
-        request_id: str
+        request_id: str,
+        max_wait_ms: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         QA-267: Acquire slot in bulkhead
         
+        When the bulkhead is full the caller queues behind earlier callers
+        and waits up to the bulkhead's max_wait_duration_ms for a slot to be
+        released. Slots are handed to waiters in arrival order, so a new
+        caller never overtakes a queued one.
+        
         Args:
             bulkhead_id: Bulkhead ID
             request_id: Request identifier
+            max_wait_ms: Wait limit overriding the bulkhead's (0 = do not wait)
             
         Returns:
-            Dict with acquired status
+            Dict with acquired status and wait_ms
         """
-        with self._lock:
-            if bulkhead_id not in self._bulkheads:
-                return {"acquired": False, "reason": "bulkhead_not_found"}
-            
-            bulkhead = self._bulkheads[bulkhead_id]
+        bulkhead = self._bulkheads.get(bulkhead_id)
+        if bulkhead is None:
+            return {"acquired": False, "reason": "bulkhead_not_found"}
+        
+        wait_ms = bulkhead.max_wait_duration_ms if max_wait_ms is None else max_wait_ms
+        with bulkhead.lock:
+            if request_id in bulkhead.active_requests:
+                return {"acquired": False, "reason": "duplicate_request", "request_id": request_id}
             
-            if bulkhead.current_calls < bulkhead.max_concurrent_calls:
+            if not bulkhead.waiters and bulkhead.current_calls < bulkhead.max_concurrent_calls:
                 bulkhead.current_calls += 1
                 bulkhead.active_requests[request_id] = datetime.now(timezone.utc)
+                bulkhead.acquired_count += 1
                 return {
                     "acquired": True,
                     "bulkhead_id": bulkhead_id,
-                    "request_id": request_id
+                    "request_id": request_id,
+                    "wait_ms": 0.0
                 }
+            
+            if wait_ms <= 0:
+                bulkhead.rejected_count += 1
+                return self._bulkhead_rejection(bulkhead, 0.0)
+            
+            waiter = _BulkheadWaiter(request_id)
+            bulkhead.waiters.append(waiter)
+            bulkhead.peak_queue_depth = max(bulkhead.peak_queue_depth, len(bulkhead.waiters))
+        
+        started = time.monotonic()
+        waiter.event.wait(wait_ms / 1000)
+        waited = (time.monotonic() - started) * 1000
+        
+        with bulkhead.lock:
+            if not waiter.granted:
+                # Timed out; a slot released from here on goes to the next waiter
+                bulkhead.waiters.remove(waiter)
+                bulkhead.rejected_count += 1
+                return self._bulkhead_rejection(bulkhead, waited)
+            
+            bulkhead.queued_count += 1
+            bulkhead.total_wait_ms += waited
+            bulkhead.max_wait_ms = max(bulkhead.max_wait_ms, waited)
+        
+        return {
+            "acquired": True,
+            "bulkhead_id": bulkhead_id,
+            "request_id": request_id,
+            "wait_ms": waited
+        }
+    
+    def release_bulkhead_slot(
+        self,
+        bulkhead_id: str,
+        request_id: str
+    ) -> Dict[str, Any]:
+        """
+        QA-267: Release a bulkhead slot, handing it to the longest waiter
+        
+        Args:
+            bulkhead_id: Bulkhead ID
+            request_id: Request that holds the slot
+            
+        Returns:
+            Dict with released status and the request the slot passed to, if any
+        """
+        bulkhead = self._bulkheads.get(bulkhead_id)
+        if bulkhead is None:
+            return {"released": False, "reason": "bulkhead_not_found"}
+        
+        with bulkhead.lock:
+            if bulkhead.active_requests.pop(request_id, None) is None:
+                return {"released": False, "reason": "slot_not_held", "request_id": request_id}
+            
+            handed_to = None
+            if bulkhead.waiters:
+                # Hand the slot over directly so current_calls never dips below capacity
+                waiter = bulkhead.waiters.popleft()
+                waiter.granted = True
+                bulkhead.active_requests[waiter.request_id] = datetime.now(timezone.utc)
+                bulkhead.acquired_count += 1
+                handed_to = waiter.request_id
+                waiter.event.set()
             else:
-                return {
-                    "acquired": False,
-                    "reason": "capacity_reached",
-                    "current_calls": bulkhead.current_calls,
-                    "max_calls": bulkhead.max_concurrent_calls
-                }
+                bulkhead.current_calls -= 1
+        
+        return {
+            "released": True,
+            "bulkhead_id": bulkhead_id,
+            "request_id": request_id,
+            "handed_to": handed_to
+        }
+    
+    @contextmanager
+    def bulkhead(
+        self,
+        bulkhead_id: str,
+        request_id: Optional[str] = None,
+        max_wait_ms: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        QA-267: Run the enclosed call inside a bulkhead slot
+        
+        Usage:
+            with manager.bulkhead(bulkhead_id):
+                call_database()
+        
+        Args:
+            bulkhead_id: Bulkhead ID
+            request_id: Request identifier (generated if omitted)
+            max_wait_ms: Wait limit overriding the bulkhead's
+            
+        Yields:
+            request_id holding the slot
+            
+        Raises:
+            BulkheadFullError: If no slot frees up within the wait limit
+            KeyError: If the bulkhead does not exist
+        """
+        request_id = request_id or str(uuid.uuid4())
+        result = self.acquire_bulkhead_slot(bulkhead_id, request_id, max_wait_ms)
+        if not result["acquired"]:
+            if result["reason"] == "bulkhead_not_found":
+                raise KeyError(bulkhead_id)
+            raise BulkheadFullError(
+                f"Bulkhead {bulkhead_id} rejected {request_id}: {result['reason']}",
+                bulkhead_id,
+                result.get("wait_ms", 0.0)
+            )
+        try:
+            yield request_id
+        finally:
+            self.release_bulkhead_slot(bulkhead_id, request_id)
+    
+    def get_bulkhead_metrics(self, bulkhead_id: str) -> Dict[str, Any]:
+        """
+        QA-267: Get bulkhead occupancy, queue and wait metrics
+        
+        Args:
+            bulkhead_id: Bulkhead ID
+            
+        Returns:
+            Metrics dict
+        """
+        bulkhead = self._bulkheads.get(bulkhead_id)
+        if bulkhead is None:
+            return {"error": "Bulkhead not found"}
+        
+        with bulkhead.lock:
+            return {
+                "bulkhead_id": bulkhead_id,
+                "name": bulkhead.name,
+                "current_calls": bulkhead.current_calls,
+                "max_concurrent_calls": bulkhead.max_concurrent_calls,
+                "queue_depth": len(bulkhead.waiters),
+                "peak_queue_depth": bulkhead.peak_queue_depth,
+                "acquired": bulkhead.acquired_count,
+                "rejected": bulkhead.rejected_count,
+                "queued": bulkhead.queued_count,
+                "avg_wait_ms": bulkhead.total_wait_ms / bulkhead.queued_count if bulkhead.queued_count else 0.0,
+                "max_wait_ms": bulkhead.max_wait_ms,
+                "organisation_id": bulkhead.organisation_id
+            }
     
     def configure_retry_policy(
         self,
@@ -464,20 +614,8 @@ class ResilienceManager:
         with self._lock:
             self._timed_operations[operation_id] = operation
         
-        # Start timeout monitoring thread
-        def monitor_timeout():
-            time.sleep(timeout_ms / 1000)  # Convert to seconds
-            with self._lock:
-                if operation_id in self._timed_operations:
-                    op = self._timed_operations[operation_id]
-                    if not op.cancelled:
-                        op.timed_out = True
-                        if op.cancellable:
-                            op.cancelled = True
-                        op.cleanup_executed = True
-        
-        timeout_thread = threading.Thread(target=monitor_timeout, daemon=True)
-        timeout_thread.start()
+        # Expire on the shared timer wheel
+        self._timer_wheel.schedule(timeout_ms / 1000, self._expire_timed_operation, operation_id)
         
         return operation_id
     
@@ -641,3 +779,26 @@ class ResilienceManager:
                 "service_name": service_name,
                 "organisation_id": config.organisation_id
             }
+    
+    # Private helper methods
+    
+    def _bulkhead_rejection(self, bulkhead: Bulkhead, waited_ms: float) -> Dict[str, Any]:
+        """Rejection result for a full bulkhead (caller holds bulkhead.lock)"""
+        return {
+            "acquired": False,
+            "reason": "capacity_reached",
+            "current_calls": bulkhead.current_calls,
+            "max_calls": bulkhead.max_concurrent_calls,
+            "queue_depth": len(bulkhead.waiters),
+            "wait_ms": waited_ms
+        }
+    
+    def _expire_timed_operation(self, operation_id: str) -> None:
+        """Timer wheel callback: mark a timed operation as timed out"""
+        with self._lock:
+            op = self._timed_operations.get(operation_id)
+            if op is not None and not op.cancelled:
+                op.timed_out = True
+                if op.cancellable:
+                    op.cancelled = True
+                op.cleanup_executed = True
@@ -14,12 +14,14 @@ Timeout Handling:
 - QA-250: Conditional approval timeout (PENDING_APPROVAL → CONDITIONAL)
 """
 
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 import threading
-import time
+
+from .timer_wheel import TimerHandle, TimerWheel, get_timer_wheel
 
 
 class TimeoutAction(Enum):
@@ -79,19 +81,36 @@ class TimeoutHandler:
     - Conditional timeout handling
     """
     
-    def __init__(self, organisation_id: str):
+    def __init__(
+        self,
+        organisation_id: str,
+        timer_wheel: Optional[TimerWheel] = None,
+        callback_workers: int = 2
+    ):
         """
         Initialize timeout handler
         
         Args:
             organisation_id: Organisation ID for tenant isolation
+            timer_wheel: Timer service for expiries (defaults to the shared wheel)
+            callback_workers: Threads running timeout callbacks off the wheel thread
+            
+        Raises:
+            ValueError: If callback_workers is less than 1
         """
+        if callback_workers < 1:
+            raise ValueError("callback_workers must be at least 1")
         self.organisation_id = organisation_id
+        self.callback_workers = callback_workers
         self._timeouts: Dict[str, TimeoutRecord] = {}
         self._configs: Dict[str, TimeoutConfig] = {}
         self._timeout_history: List[TimeoutRecord] = []
-        self._monitoring_threads: Dict[str, threading.Thread] = {}
-        self._stop_monitoring = threading.Event()
+        self._timer_wheel = timer_wheel or get_timer_wheel()
+        self._timers: Dict[str, Tuple[int, TimerHandle]] = {}  # operation -> (generation, handle)
+        self._timer_generation = 0
+        self._timer_lock = threading.Lock()  # Guards _timers against the wheel thread
+        self._callback_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         
     def start_timeout_monitoring(
         self,
@@ -142,14 +161,8 @@ class TimeoutHandler:
         self._timeouts[operation_id] = record
         self._configs[operation_id] = config
         
-        # Start monitoring thread
-        monitor_thread = threading.Thread(
-            target=self._monitor_timeout,
-            args=(operation_id,),
-            daemon=True
-        )
-        self._monitoring_threads[operation_id] = monitor_thread
-        monitor_thread.start()
+        # Schedule expiry on the timer wheel
+        self._schedule_timer(operation_id, record, config)
         
         # Audit trail
         record.audit_trail.append({
@@ -211,7 +224,8 @@ class TimeoutHandler:
         record = self._timeouts[operation_id]
         config = self._configs[operation_id]
         
-        # Mark as triggered
+        # Mark as triggered; monitoring is no longer needed
+        self._cancel_timer(operation_id)
         record.state = TimeoutState.TRIGGERED
         record.triggered_at = datetime.now(timezone.utc)
         
@@ -302,6 +316,8 @@ class TimeoutHandler:
         # Extend timeout
         config.timeout_seconds += additional_seconds
         config.extension_count += 1
+        if record.state == TimeoutState.ACTIVE:
+            self._schedule_timer(operation_id, record, config)
         
         # Audit trail
         record.audit_trail.append({
@@ -342,10 +358,8 @@ class TimeoutHandler:
         record = self._timeouts[operation_id]
         record.state = TimeoutState.CANCELLED
         
-        # Stop monitoring thread
-        if operation_id in self._monitoring_threads:
-            # Thread will exit on next check
-            pass
+        # Stop monitoring
+        self._cancel_timer(operation_id)
         
         # Move to history
         self._timeout_history.append(record)
@@ -409,57 +423,90 @@ class TimeoutHandler:
     
     # Private helper methods
     
-    def _monitor_timeout(self, operation_id: str):
-        """Monitor timeout in background thread"""
+    def _schedule_timer(
+        self,
+        operation_id: str,
+        record: TimeoutRecord,
+        config: TimeoutConfig
+    ):
+        """(Re)schedule the expiry for the configured timeout"""
         
-        if operation_id not in self._configs:
-            return
+        with self._timer_lock:
+            self._cancel_timer_locked(operation_id)
+            elapsed = (datetime.now(timezone.utc) - record.started_at).total_seconds()
+            self._timer_generation += 1
+            generation = self._timer_generation
+            self._timers[operation_id] = (generation, self._timer_wheel.schedule(
+                config.timeout_seconds - elapsed,
+                self._on_timer_expired,
+                operation_id,
+                generation
+            ))
+    
+    def _cancel_timer(self, operation_id: str):
+        """Cancel the pending expiry, if any"""
         
-        config = self._configs[operation_id]
+        with self._timer_lock:
+            self._cancel_timer_locked(operation_id)
+    
+    def _cancel_timer_locked(self, operation_id: str):
+        """Cancel the pending expiry (caller holds self._timer_lock)"""
         
-        # Wait for timeout
-        elapsed = 0
-        check_interval = 1  # Check every second
+        timer = self._timers.pop(operation_id, None)
+        if timer is not None:
+            timer[1].cancel()
+    
+    def _on_timer_expired(self, operation_id: str, generation: int):
+        """Timer wheel callback: the operation ran out of time"""
         
-        while elapsed < config.timeout_seconds:
-            if self._stop_monitoring.is_set():
+        with self._timer_lock:
+            # A timer replaced by extend_timeout may fire before it is cancelled
+            timer = self._timers.get(operation_id)
+            if timer is None or timer[0] != generation:
                 return
+            del self._timers[operation_id]
             
-            # Check if operation cancelled or completed
-            if operation_id not in self._timeouts:
+            # Operation cancelled or completed meanwhile
+            record = self._timeouts.get(operation_id)
+            if record is None or record.state != TimeoutState.ACTIVE:
                 return
-            
-            if self._timeouts[operation_id].state != TimeoutState.ACTIVE:
-                return
-            
-            time.sleep(check_interval)
-            elapsed += check_interval
+            record.state = TimeoutState.TRIGGERED
+            record.triggered_at = datetime.now(timezone.utc)
+            callback = self._configs[operation_id].callback
         
-        # Timeout occurred
-        if operation_id in self._timeouts:
-            record = self._timeouts[operation_id]
-            if record.state == TimeoutState.ACTIVE:
-                self._trigger_timeout(operation_id)
+        if callback is not None:
+            self._trigger_timeout(operation_id, record, callback)
     
-    def _trigger_timeout(self, operation_id: str):
-        """Trigger timeout handling"""
-        
-        if operation_id not in self._timeouts:
-            return
+    def _trigger_timeout(self, operation_id: str, record: TimeoutRecord, callback: Callable):
+        """Hand the timeout callback to the callback pool, off the shared wheel thread"""
         
-        record = self._timeouts[operation_id]
-        config = self._configs[operation_id]
-        
-        # Execute callback if provided
-        if config.callback:
-            try:
-                config.callback(operation_id)
-            except Exception as e:
-                record.audit_trail.append({
-                    "action": "callback_failed",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
-                    "error": str(e)
-                })
+        try:
+            self._get_callback_executor().submit(self._run_callback, operation_id, record, callback)
+        except RuntimeError:
+            pass  # Handler shut down
+    
+    def _run_callback(self, operation_id: str, record: TimeoutRecord, callback: Callable):
+        """Run a timeout callback, recording failures in the audit trail"""
+        
+        try:
+            callback(operation_id)
+        except Exception as e:
+            record.audit_trail.append({
+                "action": "callback_failed",
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "error": str(e)
+            })
+    
+    def _get_callback_executor(self) -> ThreadPoolExecutor:
+        """Create the callback thread pool on first use"""
+        
+        with self._executor_lock:
+            if self._callback_executor is None:
+                self._callback_executor = ThreadPoolExecutor(
+                    max_workers=self.callback_workers,
+                    thread_name_prefix="timeout-callback"
+                )
+            return self._callback_executor
     
     def _execute_timeout_action(
         self,
@@ -553,9 +600,11 @@ class TimeoutHandler:
     
     def shutdown(self):
         """Shutdown timeout handler and stop all monitoring"""
-        self._stop_monitoring.set()
-        
-        # Wait for threads to finish
-        for thread in self._monitoring_threads.values():
-            if thread.is_alive():
-                thread.join(timeout=5)
+        # The timer wheel is shared; only this handler's timers are cancelled
+        with self._timer_lock:
+            for operation_id in list(self._timers):
+                self._cancel_timer_locked(operation_id)
+        with self._executor_lock:
+            executor, self._callback_executor = self._callback_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
@@ -0,0 +1,310 @@
+"""
+Timer Wheel
+
+Purpose: Shared hierarchical timing wheel for operation timeouts
+Authority: Wave 2.0 Subwave 2.11/2.12 - Complex Failure Modes (QA-246 to QA-250, QA-269)
+Tenant Isolation: Timers carry no tenant data; callers scope their callbacks by organisation_id
+
+One scheduler thread serves every timeout in the process. Schedule and
+cancel are O(1); expiry costs O(1) per timer plus one cascade per level
+boundary, so thousands of pending timeouts cost memory, not threads.
+"""
+
+from typing import Dict, List, Optional, Any, Callable
+from dataclasses import dataclass
+import math
+import threading
+import time
+
+
+@dataclass
+class TimerWheelConfig:
+    """Timer wheel shape"""
+    tick_ms: float = 10.0  # Timer precision
+    wheel_size: int = 256  # Slots per level
+    levels: int = 4  # tick_ms * wheel_size ** levels is the horizon before overflow
+
+    def validate(self) -> bool:
+        """Validate timer wheel configuration"""
+        return self.tick_ms > 0 and self.wheel_size >= 2 and self.levels >= 1
+
+
+class TimerHandle:
+    """A scheduled timeout; cancel it through the handle or the wheel"""
+
+    __slots__ = ("expiry_tick", "deadline", "callback", "args", "cancelled", "fired", "_wheel", "_key", "_slot")
+
+    def __init__(self, wheel: "TimerWheel", key: int, expiry_tick: int, deadline: float, callback: Callable, args: tuple):
+        self.expiry_tick = expiry_tick
+        self.deadline = deadline  # Clock time the timer is due
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+        self.fired = False
+        self._wheel = wheel
+        self._key = key
+        self._slot: Optional[Dict[int, TimerHandle]] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether the timer is still pending"""
+        return not self.cancelled and not self.fired
+
+    def cancel(self) -> bool:
+        """
+        Cancel the timer
+
+        Returns:
+            True if the timer was pending
+        """
+        return self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel driven by a single scheduler thread
+
+    Level 0 has one slot per tick; each slot of level n spans
+    wheel_size ** n ticks. A timer is placed on the lowest level whose
+    range covers it and cascades down a level each time the wheel reaches
+    the start of its slot's span, until it fires from level 0. Timers
+    beyond the top level wait in an overflow slot that is re-examined once
+    per top-level revolution. Callbacks run on the scheduler thread, so
+    they must be short and must not block.
+    """
+
+    def __init__(
+        self,
+        config: Optional[TimerWheelConfig] = None,
+        clock: Optional[Callable[[], float]] = None,
+        background: bool = True
+    ):
+        """
+        Initialize timer wheel
+
+        Args:
+            config: Wheel shape
+            clock: Monotonic time source in seconds (defaults to time.monotonic)
+            background: Run the scheduler thread; when False, expire timers by calling advance()
+        """
+        self.config = config or TimerWheelConfig()
+        if not self.config.validate():
+            raise ValueError("Invalid timer wheel configuration")
+
+        self._clock = clock or time.monotonic
+        self._background = background
+        self._tick = self.config.tick_ms / 1000
+        self._size = self.config.wheel_size
+        self._spans = [self._size ** level for level in range(self.config.levels + 1)]
+        self._origin = self._clock()
+        self._current_tick = 0  # Last tick processed
+        self._wheels: List[List[Dict[int, TimerHandle]]] = [
+            [{} for _ in range(self._size)] for _ in range(self.config.levels)
+        ]
+        self._overflow: Dict[int, TimerHandle] = {}
+        self._pending = 0
+        self._next_key = 0
+        self._stats = {"scheduled": 0, "cancelled": 0, "fired": 0, "callback_errors": 0}
+
+        self._lock = threading.Condition(threading.Lock())
+        self._wakeup_tick: Optional[int] = None  # Tick the scheduler sleeps until; None while idle or busy
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = False
+
+    def schedule(self, delay_seconds: float, callback: Callable, *args: Any) -> TimerHandle:
+        """
+        Call callback(*args) once delay_seconds have elapsed
+
+        The callback never runs early; it runs at most one tick late plus
+        scheduling latency.
+
+        Args:
+            delay_seconds: Delay from now
+            callback: Function to call on expiry
+            *args: Arguments for callback
+
+        Returns:
+            Handle for cancelling the timer
+        """
+        with self._lock:
+            if self._stopped:
+                raise RuntimeError("Timer wheel is shut down")
+
+            deadline = self._clock() + max(0.0, delay_seconds)
+            expiry_tick = max(self._current_tick + 1, math.ceil((deadline - self._origin) / self._tick))
+            self._next_key += 1
+            handle = TimerHandle(self, self._next_key, expiry_tick, deadline, callback, args)
+            self._insert(handle)
+            self._pending += 1
+            self._stats["scheduled"] += 1
+
+            if self._background:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="timer-wheel", daemon=True)
+                    self._thread.start()
+                elif self._wakeup_tick is None or expiry_tick < self._wakeup_tick:
+                    self._lock.notify()
+            return handle
+
+    def cancel(self, handle: TimerHandle) -> bool:
+        """
+        Cancel a pending timer
+
+        Returns:
+            True if the timer was pending
+        """
+        with self._lock:
+            if handle._slot is None or not handle.active:
+                return False
+            del handle._slot[handle._key]
+            handle._slot = None
+            handle.cancelled = True
+            self._pending -= 1
+            self._stats["cancelled"] += 1
+            return True
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Fire every timer due by now
+
+        The scheduler thread calls this; wheels created with
+        background=False are driven by calling it directly.
+
+        Args:
+            now: Clock time to advance to (defaults to the clock)
+
+        Returns:
+            Number of callbacks run
+        """
+        with self._lock:
+            due = self._collect_due(self._clock() if now is None else now)
+        return self._fire(due)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get timer counts"""
+        with self._lock:
+            return {
+                **self._stats,
+                "pending": self._pending,
+                "tick_ms": self.config.tick_ms,
+                "scheduler_running": self._thread is not None and self._thread.is_alive()
+            }
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the scheduler thread; pending timers are dropped"""
+        with self._lock:
+            self._stopped = True
+            self._lock.notify()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    # Private helper methods (caller holds self._lock unless noted)
+
+    def _insert(self, handle: TimerHandle) -> None:
+        """Place a timer on the lowest level whose range covers it"""
+        delta = handle.expiry_tick - self._current_tick
+        for level in range(self.config.levels):
+            if delta < self._spans[level + 1]:
+                slot = self._wheels[level][(handle.expiry_tick // self._spans[level]) % self._size]
+                break
+        else:
+            slot = self._overflow
+        slot[handle._key] = handle
+        handle._slot = slot
+
+    def _collect_due(self, now: float) -> List[TimerHandle]:
+        """Advance the wheel to now and remove the timers that expired"""
+        target = int((now - self._origin) // self._tick)
+        if self._pending == 0:
+            # Nothing to cascade or fire: jump straight to the target
+            self._current_tick = max(self._current_tick, target)
+            return []
+
+        due: List[TimerHandle] = []
+        size = self._size
+        while self._current_tick < target:
+            tick = self._current_tick = self._current_tick + 1
+            if tick % self._spans[self.config.levels - 1] == 0 and self._overflow:
+                self._reinsert(self._overflow)
+            for level in range(self.config.levels - 1, 0, -1):
+                if tick % self._spans[level] == 0:
+                    self._reinsert(self._wheels[level][(tick // self._spans[level]) % size])
+
+            slot = self._wheels[0][tick % size]
+            if slot:
+                for handle in slot.values():
+                    handle._slot = None
+                    handle.fired = True
+                    due.append(handle)
+                slot.clear()
+
+            if len(due) == self._pending:
+                # Everything left has been collected
+                self._current_tick = target
+                break
+
+        self._pending -= len(due)
+        self._stats["fired"] += len(due)
+        return due
+
+    def _reinsert(self, slot: Dict[int, TimerHandle]) -> None:
+        """Cascade a slot's timers down to the levels that now cover them"""
+        handles = list(slot.values())
+        slot.clear()
+        for handle in handles:
+            self._insert(handle)
+
+    def _next_wakeup_tick(self) -> int:
+        """Earliest tick with work: a due level-0 slot or the next cascade"""
+        size = self._size
+        boundary = self._current_tick + size - self._current_tick % size
+        for tick in range(self._current_tick + 1, boundary):
+            if self._wheels[0][tick % size]:
+                return tick
+        return boundary
+
+    def _fire(self, due: List[TimerHandle]) -> int:
+        """Run expired callbacks (caller does not hold self._lock)"""
+        errors = 0
+        for handle in due:
+            try:
+                handle.callback(*handle.args)
+            except Exception:
+                errors += 1
+        if errors:
+            with self._lock:
+                self._stats["callback_errors"] += errors
+        return len(due)
+
+    def _run(self) -> None:
+        """Scheduler thread loop (acquires self._lock itself)"""
+        while True:
+            with self._lock:
+                if self._stopped:
+                    return
+                due = self._collect_due(self._clock())
+                if not due:
+                    if self._pending == 0:
+                        self._lock.wait()
+                    else:
+                        self._wakeup_tick = self._next_wakeup_tick()
+                        delay = self._origin + self._wakeup_tick * self._tick - self._clock()
+                        if delay > 0:
+                            self._lock.wait(delay)
+                        self._wakeup_tick = None
+                    continue
+            self._fire(due)
+
+
+_shared_wheel: Optional[TimerWheel] = None
+_shared_lock = threading.Lock()
+
+
+def get_timer_wheel() -> TimerWheel:
+    """Get the process-wide timer wheel shared by the timeout components"""
+    global _shared_wheel
+    with _shared_lock:
+        if _shared_wheel is None:
+            _shared_wheel = TimerWheel()
+        return _shared_wheel
@@ -0,0 +1,234 @@
+"""
+Tests for runtime AdvancedRecoveryHandler.
+
+Covers the runtime behaviour layered on top of the QA-257 and QA-260 suite:
+- Independent recoveries running concurrently on a bounded pool
+- Recoveries of the same resource serialized, within and across calls
+- Per-recovery deadlines and measured completion times
+- Recoveries still queued at their deadline cancelled rather than run late
+- Cascading recovery executed as waves of dependency levels
+"""
+
+import threading
+import time
+
+import pytest
+
+from runtime.advanced_recovery_handler import AdvancedRecoveryHandler
+
+
+ORG_ID = "org-recovery-1"
+
+
+class ConcurrencyProbe:
+    """Recovery action recording how many recoveries overlap"""
+
+    def __init__(self, hold_seconds: float = 0.02):
+        self.hold_seconds = hold_seconds
+        self.active = 0
+        self.peak = 0
+        self.order = []
+        self.lock = threading.Lock()
+
+    def __call__(self, failure: dict) -> bool:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.order.append(failure["id"])
+        time.sleep(self.hold_seconds)
+        with self.lock:
+            self.active -= 1
+        return True
+
+
+@pytest.fixture
+def handler():
+    """Handler whose pool is shut down after the test"""
+    recovery_handler = AdvancedRecoveryHandler(ORG_ID)
+    yield recovery_handler
+    recovery_handler.shutdown()
+
+
+class TestParallelRecovery:
+    """execute_parallel_recovery"""
+
+    def test_independent_recoveries_run_concurrently(self, handler):
+        barrier = threading.Barrier(3, timeout=5)
+        handler.register_recovery_action("cache_miss", lambda failure: barrier.wait() is not None)
+        failures = [{"id": f"f{i}", "type": "cache_miss", "resource": f"cache_{i}"} for i in range(3)]
+
+        result = handler.execute_parallel_recovery(failures, max_parallelism=3)
+
+        assert all(r["success"] for r in result["recovery_results"])
+        assert result["parallel_execution"] and result["resource_conflicts"] == 0
+
+    def test_max_parallelism_bounds_concurrency(self, handler):
+        probe = ConcurrencyProbe()
+        handler.register_recovery_action("cache_miss", probe)
+        failures = [{"id": f"f{i}", "type": "cache_miss", "resource": f"cache_{i}"} for i in range(8)]
+
+        handler.execute_parallel_recovery(failures, max_parallelism=2)
+
+        assert probe.peak == 2
+
+    def test_completion_times_are_measured(self, handler):
+        handler.register_recovery_action("slow", lambda failure: time.sleep(0.05))
+        failures = [{"id": "a", "type": "slow"}, {"id": "b", "type": "fast"}]
+
+        result = handler.execute_parallel_recovery(failures)
+
+        assert result["completion_times"][0] >= 45
+        assert result["completion_times"][1] < 45
+        assert [r["failure_id"] for r in result["recovery_results"]] == ["a", "b"]
+
+    def test_failed_actions_are_reported(self, handler):
+        def broken(failure: dict) -> None:
+            raise RuntimeError("restart failed")
+
+        handler.register_recovery_action("broken", broken)
+        handler.register_recovery_action("refused", lambda failure: False)
+
+        result = handler.execute_parallel_recovery([{"id": "a", "type": "broken"}, {"id": "b", "type": "refused"}])
+
+        errors = [r["error"] for r in result["recovery_results"]]
+        assert errors == ["restart failed", "recovery_action_failed"]
+
+
+class TestResourceExclusion:
+    """Recoveries of one resource never overlap"""
+
+    def test_same_resource_recoveries_serialize_in_order(self, handler):
+        probe = ConcurrencyProbe()
+        handler.register_recovery_action("reconnect", probe)
+        failures = [{"id": f"f{i}", "type": "reconnect", "resource": "db"} for i in range(4)]
+        failures.append({"id": "other", "type": "reconnect", "resource": "cache"})
+
+        result = handler.execute_parallel_recovery(failures, max_parallelism=5)
+
+        assert [fid for fid in probe.order if fid != "other"] == ["f0", "f1", "f2", "f3"]
+        assert probe.peak == 2  # One db recovery alongside the cache recovery
+        assert result["resource_conflicts"] == 3
+
+    def test_concurrent_calls_share_resource_locks(self, handler):
+        probe = ConcurrencyProbe(hold_seconds=0.03)
+        handler.register_recovery_action("reconnect", probe)
+
+        def call(prefix: str) -> None:
+            handler.execute_parallel_recovery(
+                [{"id": f"{prefix}{i}", "type": "reconnect", "resource": "db"} for i in range(3)]
+            )
+
+        callers = [threading.Thread(target=call, args=(prefix,)) for prefix in "ab"]
+        for caller in callers:
+            caller.start()
+        for caller in callers:
+            caller.join(timeout=10)
+
+        assert probe.peak == 1 and len(probe.order) == 6
+
+
+class TestDeadlines:
+    """Per-recovery deadlines"""
+
+    def test_overrunning_recovery_is_abandoned(self, handler):
+        release = threading.Event()
+        handler.register_recovery_action("hang", lambda failure: release.wait(5))
+        failures = [
+            {"id": "stuck", "type": "hang", "resource": "db"},
+            {"id": "behind", "type": "fast", "resource": "db"},
+            {"id": "elsewhere", "type": "fast", "resource": "cache"},
+        ]
+
+        started = time.monotonic()
+        result = handler.execute_parallel_recovery(failures, deadline_ms=50)
+        elapsed = time.monotonic() - started
+        release.set()
+
+        by_id = {r["failure_id"]: r for r in result["recovery_results"]}
+        assert elapsed < 1
+        assert by_id["stuck"]["error"] == "deadline_exceeded"
+        assert by_id["behind"]["error"] == "resource_busy"
+        assert by_id["elsewhere"]["success"]
+
+    def test_recovery_not_started_by_its_deadline_never_runs(self):
+        handler = AdvancedRecoveryHandler(ORG_ID, recovery_workers=1)
+        ran = []
+
+        def slow(failure):
+            ran.append(failure["id"])
+            time.sleep(0.3)
+
+        handler.register_recovery_action("slow", slow)
+        failures = [{"id": "first", "type": "slow"}, {"id": "second", "type": "slow"}]
+
+        result = handler.execute_parallel_recovery(failures, deadline_ms=100)
+        handler.shutdown()
+
+        by_id = {r["failure_id"]: r for r in result["recovery_results"]}
+        assert by_id["first"]["error"] == "deadline_exceeded"
+        assert by_id["second"]["error"] == "deadline_exceeded_before_start"
+        assert ran == ["first"]
+
+
+class TestCascadingRecovery:
+    """orchestrate_cascading_recovery"""
+
+    FAILURES = [
+        {"id": "db", "type": "database_connection", "depends_on": []},
+        {"id": "cache", "type": "cache_invalidation", "depends_on": ["db"]},
+        {"id": "search", "type": "index_rebuild", "depends_on": ["db"]},
+        {"id": "session", "type": "session_restoration", "depends_on": ["cache", "search"]},
+    ]
+
+    def test_dependency_levels_run_as_parallel_waves(self, handler):
+        probe = ConcurrencyProbe()
+        for failure_type in ("database_connection", "cache_invalidation", "index_rebuild", "session_restoration"):
+            handler.register_recovery_action(failure_type, probe)
+
+        result = handler.orchestrate_cascading_recovery(self.FAILURES, execution_mode="optimal")
+
+        assert result["execution_waves"] == [["db"], ["cache", "search"], ["session"]]
+        assert probe.order[0] == "db" and probe.order[-1] == "session"
+        assert probe.peak == 2
+        assert result["state"] == "success"
+        assert result["recovered"] == ["db", "cache", "search", "session"]
+
+    def test_sequential_mode_runs_one_at_a_time(self, handler):
+        probe = ConcurrencyProbe()
+        handler.register_recovery_action("cache_invalidation", probe)
+        handler.register_recovery_action("index_rebuild", probe)
+
+        result = handler.orchestrate_cascading_recovery(self.FAILURES, execution_mode="sequential")
+
+        assert probe.peak == 1
+        assert probe.order == ["cache", "search"]
+        assert result["execution_order"] == ["db", "cache", "search", "session"]
+
+    def test_dependents_of_failed_recoveries_are_skipped(self, handler):
+        handler.register_recovery_action("index_rebuild", lambda failure: False)
+
+        result = handler.orchestrate_cascading_recovery(self.FAILURES, execution_mode="optimal")
+
+        by_id = {r["failure_id"]: r for r in result["recovery_results"]}
+        assert result["state"] == "partially_recovered"
+        assert result["failed"] == ["search", "session"]
+        assert by_id["session"]["error"] == "dependency_failed: search"
+
+    def test_skipped_dependents_are_skipped_transitively(self, handler):
+        probe = ConcurrencyProbe()
+        handler.register_recovery_action("broken", lambda failure: False)
+        handler.register_recovery_action("step", probe)
+        failures = [
+            {"id": "a", "type": "broken", "depends_on": []},
+            {"id": "b", "type": "step", "depends_on": ["a"]},
+            {"id": "c", "type": "step", "depends_on": ["b"]},
+        ]
+
+        result = handler.orchestrate_cascading_recovery(failures, execution_mode="optimal")
+
+        by_id = {r["failure_id"]: r for r in result["recovery_results"]}
+        assert probe.order == []
+        assert result["state"] == "failed"
+        assert result["failed"] == ["a", "b", "c"] and result["recovered"] == []
+        assert by_id["b"]["error"] == "dependency_failed: a"
+        assert by_id["c"]["error"] == "dependency_failed: b"
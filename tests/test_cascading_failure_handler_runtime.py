@@ -0,0 +1,162 @@
+"""
+Tests for runtime CascadingFailureHandler.
+
+Covers the runtime behaviour layered on top of the QA-396 suite:
+- Components isolated as soon as their breaker opens
+- Callers shed through the isolation registry (fast-fail or degraded)
+- Fast-fail propagating through critical callers only
+- Release restoring callers once no isolated dependency reaches them
+- One registry shared by several handlers
+"""
+
+import time
+
+from runtime.cascading_failure_handler import (
+    CascadingFailureHandler,
+    ComponentIsolationManager,
+    IsolationMode,
+)
+from runtime.circuit_breaker import CircuitBreakerConfig
+
+
+ORG_ID = "org-isolation-1"
+
+
+def service_registry(dependency_aware: bool = True) -> ComponentIsolationManager:
+    """api → orders → db, api ⇢ recommendations (optional), reports → db"""
+    registry = ComponentIsolationManager(dependency_aware=dependency_aware)
+    registry.register_dependency("orders", "db")
+    registry.register_dependency("reports", "db")
+    registry.register_dependency("api", "orders")
+    registry.register_dependency("api", "recommendations", critical=False)
+    registry.register_dependency("web", "api", critical=False)
+    return registry
+
+
+class TestIsolationRegistry:
+    """Dependency-aware shedding"""
+
+    def test_critical_callers_fast_fail_transitively(self):
+        registry = service_registry()
+
+        shed = registry.isolate_component("db")
+
+        assert sorted(shed) == ["api", "orders", "reports", "web"]
+        assert registry.get_isolation_mode("db") == IsolationMode.ISOLATED
+        assert registry.get_isolation_mode("orders") == IsolationMode.FAST_FAIL
+        assert registry.get_isolation_mode("api") == IsolationMode.FAST_FAIL
+        assert registry.get_isolation_mode("web") == IsolationMode.DEGRADED
+        assert registry.get_isolation_mode("recommendations") is None
+        assert registry.get_isolated_components() == ["db"]
+
+    def test_optional_dependency_degrades_without_propagating(self):
+        registry = service_registry()
+
+        assert registry.isolate_component("recommendations") == ["api"]
+        assert registry.get_isolation_mode("api") == IsolationMode.DEGRADED
+        assert registry.get_isolation_mode("web") is None
+
+    def test_release_restores_callers_with_no_remaining_cause(self):
+        registry = service_registry()
+        registry.isolate_component("db")
+        registry.isolate_component("recommendations")
+
+        restored = registry.release_component("db")
+
+        assert sorted(restored) == ["orders", "reports", "web"]
+        assert registry.get_isolation_mode("api") == IsolationMode.DEGRADED
+        assert registry.release_component("recommendations") == ["api"]
+        assert registry.get_isolation_modes() == {}
+
+    def test_new_callers_of_an_isolated_component_are_shed(self):
+        registry = service_registry()
+        registry.isolate_component("db")
+
+        registry.register_dependency("billing", "orders")
+        registry.register_dependency("audit", "db", critical=False)
+
+        assert registry.get_isolation_mode("billing") == IsolationMode.FAST_FAIL
+        assert registry.get_isolation_mode("audit") == IsolationMode.DEGRADED
+        registry.release_component("db")
+        assert registry.get_isolation_modes() == {}
+
+    def test_removed_caller_is_not_left_shed(self):
+        registry = ComponentIsolationManager()
+        registry.register_dependency("api", "db")
+        registry.register_dependency("web", "db")
+        registry.isolate_component("db")
+
+        registry.remove_dependency("api", "db")
+        assert registry.get_isolation_mode("api") is None
+        registry.register_dependency("worker", "db")
+        registry.release_component("db")
+
+        assert registry.get_isolation_modes() == {}
+
+    def test_removed_edge_lifts_transitive_shedding(self):
+        registry = service_registry()
+        registry.register_dependency("api", "reports")
+        registry.isolate_component("db")
+
+        registry.remove_dependency("orders", "db")
+
+        assert registry.get_isolation_mode("orders") is None
+        assert registry.get_isolation_mode("api") == IsolationMode.FAST_FAIL  # Still reached via reports
+        registry.remove_dependency("api", "reports")
+        assert registry.get_isolation_modes() == {"db": "isolated", "reports": "fast_fail"}
+
+    def test_dependency_unaware_registry_isolates_one_component(self):
+        registry = service_registry(dependency_aware=False)
+
+        assert registry.isolate_component("db") == []
+        assert registry.get_isolation_modes() == {"db": "isolated"}
+
+
+class TestHandlerIsolation:
+    """CascadingFailureHandler on the isolation registry"""
+
+    def test_open_breaker_isolates_and_sheds_callers(self):
+        handler = CascadingFailureHandler(ORG_ID)
+        handler.register_dependency("orders", "db")
+
+        for _ in range(3):
+            handler.record_failure("db", "connection refused")
+
+        assert handler.get_isolation_manager().is_component_isolated("db")
+        assert handler.acquire_call_permission("orders") == (False, IsolationMode.FAST_FAIL)
+        assert handler.acquire_call_permission("db") == (False, IsolationMode.ISOLATED)
+        assert handler.acquire_call_permission("reports") == (True, None)
+
+    def test_closed_breaker_releases_isolation(self):
+        config = CircuitBreakerConfig(minimum_calls=3, wait_duration_open_seconds=0.05)
+        handler = CascadingFailureHandler(ORG_ID, breaker_config=config)
+        handler.register_dependency("orders", "db")
+        for _ in range(3):
+            handler.record_failure("db", "connection refused")
+        time.sleep(0.06)
+
+        assert handler.acquire_call_permission("db") == (True, IsolationMode.ISOLATED)
+        handler.record_success("db")
+
+        assert handler.acquire_call_permission("db") == (True, None)
+        assert handler.acquire_call_permission("orders") == (True, None)
+
+    def test_cascading_failures_register_dependencies(self):
+        handler = CascadingFailureHandler(ORG_ID)
+        handler.record_cascading_failure("orders", "db", "db unavailable")
+        handler.register_dependency("api", "orders")
+
+        handler.get_isolation_manager().isolate_component("db")
+
+        assert handler.acquire_call_permission("api") == (False, IsolationMode.FAST_FAIL)
+
+    def test_handlers_share_one_registry(self):
+        registry = ComponentIsolationManager()
+        first = CascadingFailureHandler(ORG_ID, isolation_manager=registry)
+        second = CascadingFailureHandler(ORG_ID, isolation_manager=registry)
+        second.register_dependency("orders", "db")
+
+        for _ in range(3):
+            first.record_failure("db", "connection refused")
+
+        assert second.acquire_call_permission("orders") == (False, IsolationMode.FAST_FAIL)
@@ -0,0 +1,249 @@
+"""
+Tests for runtime CircuitBreaker.
+
+Covers the runtime behaviour layered on top of the QA-266 and QA-396 suites:
+- Failure-rate and slow-call-rate thresholds over a count-based ring buffer
+- Time-based windows aging out old buckets
+- Half-open trial calls limited and evaluated as a group
+- Straggler outcomes ignored and unreported trials timed out in half-open
+- One breaker implementation behind ResilienceManager and CascadingFailureHandler
+"""
+
+import threading
+
+import pytest
+
+from runtime import cascading_failure_handler, resilience_manager
+from runtime.cascading_failure_handler import CascadingFailureHandler
+from runtime.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState,
+    SlidingWindowType,
+)
+from runtime.resilience_manager import ResilienceManager
+
+
+ORG_ID = "org-breaker-1"
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def breaker(clock: FakeClock = None, **config) -> CircuitBreaker:
+    """Create a breaker with the given config overrides"""
+    return CircuitBreaker("payments", CircuitBreakerConfig(**config), ORG_ID, clock=clock or FakeClock())
+
+
+class TestSlidingWindow:
+    """Rate thresholds over the window"""
+
+    def test_opens_on_failure_rate_not_failure_count(self):
+        circuit = breaker(window_size=10, minimum_calls=10, failure_rate_threshold=50)
+        # 40 failures in 100 calls: a count threshold would trip, a 50% rate does not
+        for i in range(100):
+            if i % 5 < 2:
+                circuit.record_failure()
+            else:
+                circuit.record_success()
+        assert circuit.state == CircuitState.CLOSED
+
+        for _ in range(5):
+            circuit.record_failure()
+
+        assert circuit.state == CircuitState.OPEN
+        assert circuit.get_metrics()["failure_rate"] >= 50
+
+    def test_minimum_calls_gate_low_volume(self):
+        circuit = breaker(window_size=100, minimum_calls=5)
+        for _ in range(4):
+            circuit.record_failure()
+        assert circuit.state == CircuitState.CLOSED
+
+        circuit.record_failure()
+
+        assert circuit.state == CircuitState.OPEN
+
+    def test_old_outcomes_leave_the_ring_buffer(self):
+        circuit = breaker(window_size=4, minimum_calls=4, failure_rate_threshold=75)
+        for _ in range(2):
+            circuit.record_failure()
+        for _ in range(6):
+            circuit.record_success()
+
+        metrics = circuit.get_metrics()
+        assert metrics["buffered_calls"] == 4
+        assert metrics["failure_count"] == 0
+
+    def test_slow_calls_trip_the_breaker(self):
+        circuit = breaker(minimum_calls=4, slow_call_duration_ms=100, slow_call_rate_threshold=50)
+        circuit.record_success(duration_ms=10)
+        circuit.record_success(duration_ms=10)
+        circuit.record_success(duration_ms=250)
+        assert circuit.state == CircuitState.CLOSED
+
+        circuit.record_success(duration_ms=300)
+
+        assert circuit.state == CircuitState.OPEN
+        assert circuit.get_metrics()["slow_call_rate"] == 50
+
+    def test_time_window_forgets_old_seconds(self):
+        clock = FakeClock()
+        circuit = breaker(clock, window_type=SlidingWindowType.TIME_BASED, window_size=10, minimum_calls=4)
+        for _ in range(3):
+            circuit.record_failure()
+
+        clock.now += 11
+        circuit.record_failure()
+
+        assert circuit.state == CircuitState.CLOSED
+        assert circuit.get_metrics()["buffered_calls"] == 1
+
+    def test_time_window_counts_calls_across_buckets(self):
+        clock = FakeClock()
+        circuit = breaker(clock, window_type=SlidingWindowType.TIME_BASED, window_size=10, minimum_calls=4)
+        for _ in range(4):
+            circuit.record_failure()
+            clock.now += 2
+
+        assert circuit.state == CircuitState.OPEN
+
+    def test_invalid_config_is_rejected(self):
+        with pytest.raises(ValueError):
+            breaker(failure_rate_threshold=0)
+
+
+class TestHalfOpen:
+    """Limited recovery trials"""
+
+    def test_trials_are_limited_and_all_must_pass(self):
+        clock = FakeClock()
+        circuit = breaker(clock, minimum_calls=1, wait_duration_open_seconds=5, permitted_half_open_calls=2)
+        circuit.record_failure()
+        assert not circuit.can_attempt()
+
+        clock.now += 5
+        assert circuit.state == CircuitState.HALF_OPEN
+        assert circuit.can_attempt() and circuit.can_attempt()
+        assert not circuit.can_attempt()
+
+        circuit.record_success()
+        assert circuit.state == CircuitState.HALF_OPEN
+        circuit.record_success()
+
+        assert circuit.state == CircuitState.CLOSED
+        assert circuit.get_metrics()["buffered_calls"] == 0
+
+    def test_failed_trials_reopen(self):
+        clock = FakeClock()
+        circuit = breaker(clock, minimum_calls=1, wait_duration_open_seconds=5, permitted_half_open_calls=2)
+        circuit.record_failure()
+        clock.now += 5
+        circuit.can_attempt()
+        circuit.can_attempt()
+
+        circuit.record_failure()
+        circuit.record_success()
+
+        assert circuit.state == CircuitState.OPEN
+        clock.now += 4
+        assert not circuit.can_attempt()
+
+    def test_stragglers_do_not_close_the_breaker(self):
+        clock = FakeClock()
+        circuit = breaker(clock, minimum_calls=1, wait_duration_open_seconds=5, permitted_half_open_calls=1)
+        _, state = circuit.acquire_permission()  # Still in flight when the breaker trips
+        circuit.record_failure()
+        clock.now += 5
+        circuit.record_success()  # No trial granted yet
+        assert circuit.acquire_permission() == (True, CircuitState.HALF_OPEN)
+
+        circuit.record_success(admitted_in=state)
+
+        assert state == CircuitState.CLOSED and circuit.state == CircuitState.HALF_OPEN
+        circuit.record_failure(admitted_in=CircuitState.HALF_OPEN)
+        assert circuit.state == CircuitState.OPEN
+
+    def test_unreported_trials_reopen_after_max_wait(self):
+        clock = FakeClock()
+        circuit = breaker(
+            clock, minimum_calls=1, wait_duration_open_seconds=5, max_wait_half_open_seconds=10
+        )
+        circuit.record_failure()
+        clock.now += 30  # Waiting in HALF_OPEN for a caller does not count
+        assert circuit.can_attempt()
+        clock.now += 9
+        assert circuit.state == CircuitState.HALF_OPEN
+
+        clock.now += 1
+        assert circuit.state == CircuitState.OPEN
+        clock.now += 5
+        assert circuit.can_attempt()
+        circuit.record_success()
+        assert circuit.state == CircuitState.CLOSED
+
+    def test_concurrent_trial_permits_never_exceed_limit(self):
+        clock = FakeClock()
+        circuit = breaker(clock, minimum_calls=1, wait_duration_open_seconds=0, permitted_half_open_calls=3)
+        circuit.record_failure()
+        granted = []
+        barrier = threading.Barrier(16)
+
+        def attempt() -> None:
+            barrier.wait()
+            if circuit.can_attempt():
+                granted.append(1)
+
+        workers = [threading.Thread(target=attempt) for _ in range(16)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert len(granted) == 3
+
+
+class TestUnifiedBreaker:
+    """Both failure handlers share the implementation"""
+
+    def test_modules_share_breaker_types(self):
+        assert resilience_manager.CircuitBreaker is CircuitBreaker
+        assert cascading_failure_handler.CircuitBreaker is CircuitBreaker
+        assert resilience_manager.CircuitState is cascading_failure_handler.CircuitState
+
+    def test_resilience_manager_reports_rates_and_trials(self):
+        manager = ResilienceManager(ORG_ID)
+        circuit_id = manager.initialize_circuit_breaker("api", failure_threshold=4, timeout_seconds=0)
+        manager.record_call_success(circuit_id)
+        manager.record_call_success(circuit_id)
+        manager.record_call_failure(circuit_id)
+        assert manager.get_circuit_status(circuit_id)["state"] == "closed"
+
+        manager.record_call_failure(circuit_id)
+
+        status = manager.get_circuit_status(circuit_id)
+        assert status["failure_rate"] == 50
+        assert manager.attempt_call(circuit_id) == {"allowed": True, "reason": "circuit_half_open"}
+        assert manager.attempt_call(circuit_id)["reason"] == "half_open_limit_reached"
+        manager.record_call_success(circuit_id)
+        assert manager.attempt_call(circuit_id)["reason"] == "circuit_closed"
+
+    def test_cascading_handler_successes_keep_breaker_closed(self):
+        handler = CascadingFailureHandler(ORG_ID)
+        for _ in range(6):
+            handler.record_success("component_a")
+        for _ in range(3):
+            handler.record_failure("component_a", "timeout")
+
+        assert handler.get_circuit_breaker("component_a").state == CircuitState.CLOSED
+        handler.record_failure("component_a", "timeout")
+        handler.record_failure("component_a", "timeout")
+        handler.record_failure("component_a", "timeout")
+        assert handler.get_circuit_breaker("component_a").state == CircuitState.OPEN
@@ -0,0 +1,153 @@
+"""
+Tests for runtime.integration ConsistencyManager.
+
+Covers the runtime behaviour layered on top of the QA-481 to QA-485 suite:
+- Incremental Merkle tree maintenance in MerkleStore
+- Merkle diff descending only into divergent subtrees
+- Validation and repair across registered sources
+- Monitor checks against registered sources
+"""
+
+import pytest
+
+from runtime.integration.consistency_manager import (
+    ConsistencyManager,
+    ConsistencyStatus,
+)
+from runtime.integration.merkle_store import MerkleStore, MerkleStoreConfig
+
+
+ORG_ID = "org-consistency-1"
+
+
+def filled_store(count: int, config: MerkleStoreConfig = None) -> MerkleStore:
+    """Create a store holding count records"""
+    store = MerkleStore(config)
+    store.update((f"key_{i}", {"value": i}) for i in range(count))
+    return store
+
+
+class TestMerkleStore:
+    """Incremental tree maintenance and diff"""
+
+    def test_root_depends_on_content_not_insertion_order(self):
+        forward = MerkleStore()
+        backward = MerkleStore()
+        forward.update((f"key_{i}", i) for i in range(100))
+        backward.update((f"key_{i}", i) for i in reversed(range(100)))
+
+        assert forward.root_hash() == backward.root_hash()
+        backward.put("key_5", "changed")
+        assert forward.root_hash() != backward.root_hash()
+        backward.put("key_5", 5)
+        assert forward.root_hash() == backward.root_hash()
+
+    def test_delete_restores_previous_root(self):
+        store = filled_store(50)
+        root = store.root_hash()
+        store.put("extra", 1)
+        assert store.delete("extra")
+        assert not store.delete("extra")
+
+        assert store.root_hash() == root
+        assert len(store) == 50
+
+    def test_diff_reports_changed_missing_and_extra_keys(self):
+        left = filled_store(1000)
+        right = filled_store(1000)
+        right.put("key_10", {"value": -1})
+        right.delete("key_20")
+        right.put("key_new", {"value": 0})
+
+        diff = left.diff(right)
+
+        assert diff.keys == ["key_10", "key_20", "key_new"]
+        assert diff.buckets_compared <= 3
+
+    def test_diff_descends_only_into_divergent_subtrees(self):
+        config = MerkleStoreConfig(fanout=16, depth=4)
+        left = filled_store(20000, config)
+        right = filled_store(20000, config)
+        assert left.diff(right).nodes_compared == 1
+
+        right.put("key_123", "changed")
+        diff = left.diff(right)
+
+        assert diff.keys == ["key_123"]
+        # One differing path: root, then one set of children per level
+        assert diff.nodes_compared == 1 + 16 * (config.depth - 1)
+        assert diff.buckets_compared == 1
+
+    def test_shape_mismatch_is_rejected(self):
+        with pytest.raises(ValueError):
+            MerkleStore(MerkleStoreConfig(depth=2)).diff(MerkleStore(MerkleStoreConfig(depth=3)))
+        with pytest.raises(ValueError):
+            MerkleStore(MerkleStoreConfig(fanout=1))
+
+
+class TestSourceValidation:
+    """Validation and repair across registered sources"""
+
+    def test_validation_finds_divergent_keys(self):
+        manager = ConsistencyManager()
+        primary = manager.register_source(ORG_ID, "memory", filled_store(500))
+        replica = manager.register_source(ORG_ID, "qa", filled_store(500))
+        replica.put("key_7", {"value": 70})
+        primary.put("key_only_primary", {"value": 1})
+
+        validation = manager.validate_consistency(ORG_ID, ["memory", "qa"], [])
+
+        assert validation.status == ConsistencyStatus.INCONSISTENT
+        assert [item["data_key"] for item in validation.inconsistencies] == ["key_7", "key_only_primary"]
+        assert validation.inconsistencies[1]["missing_in_target"]
+        assert validation.nodes_compared > 0
+
+    def test_data_keys_restrict_the_check(self):
+        manager = ConsistencyManager()
+        manager.register_source(ORG_ID, "memory", filled_store(100))
+        replica = manager.register_source(ORG_ID, "qa", filled_store(100))
+        replica.put("key_7", "changed")
+
+        assert manager.validate_consistency(ORG_ID, ["memory", "qa"], ["key_1", "key_2"]).is_consistent()
+        assert not manager.validate_consistency(ORG_ID, ["memory", "qa"], ["key_7"]).is_consistent()
+
+    def test_repair_transfers_only_divergent_keys(self):
+        manager = ConsistencyManager()
+        primary = manager.register_source(ORG_ID, "memory", filled_store(1000))
+        replica = manager.register_source(ORG_ID, "qa", filled_store(1000))
+        replica.put("key_3", "stale")
+        replica.put("key_orphan", "stale")
+        primary.delete("key_9")
+        validation = manager.validate_consistency(ORG_ID, ["memory", "qa"], [])
+
+        repair = manager.repair_inconsistency(ORG_ID, validation.validation_id, [])
+
+        assert repair.repairs_applied == [{
+            "action": "sync", "from": "memory", "to": "qa", "keys_copied": 1, "keys_deleted": 2
+        }]
+        assert primary.root_hash() == replica.root_hash()
+        assert manager.validate_consistency(ORG_ID, ["memory", "qa"], []).is_consistent()
+
+    def test_sources_are_tenant_scoped(self):
+        manager = ConsistencyManager()
+        manager.register_source(ORG_ID, "memory", filled_store(10))
+        manager.register_source("org-other", "qa", MerkleStore())
+
+        validation = manager.validate_consistency(ORG_ID, ["memory", "qa"], [])
+
+        assert validation.is_consistent()
+        assert manager.get_source("org-other", "memory") is None
+
+    def test_monitor_check_counts_violations(self):
+        manager = ConsistencyManager()
+        manager.register_source(ORG_ID, "memory", filled_store(100))
+        replica = manager.register_source(ORG_ID, "qa", filled_store(100))
+        replica.put("key_1", "changed")
+        monitor = manager.monitor_consistency(ORG_ID, ["memory", "qa"], [], check_interval=30)
+
+        validation = manager.run_monitor_check(monitor.monitor_id)
+
+        assert len(validation.inconsistencies) == 1
+        assert monitor.violations_detected == 1
+        assert not monitor.should_check()
+        assert (monitor.next_check - monitor.last_check).total_seconds() == 30
@@ -0,0 +1,151 @@
+"""
+Tests for runtime.integration CrossSubsystemIntegrator.
+
+Covers the runtime behaviour layered on top of the QA-461 to QA-465 suite:
+- Incrementally maintained topological levels and cycle detection
+- Dependency-ordered event propagation to registered handlers
+- Parallel delivery within a topological level
+- Delivery failures recorded as cross-subsystem errors
+"""
+
+import threading
+import time
+
+import pytest
+
+from runtime.integration.cross_subsystem_integrator import (
+    CrossSubsystemIntegrator,
+    DependencyGraph,
+    SubsystemState,
+)
+
+
+ORG_ID = "org-integrator-1"
+
+
+class TestDependencyGraph:
+    """Incremental topological ordering"""
+
+    def test_levels_follow_longest_dependency_chain(self):
+        graph = DependencyGraph(organisation_id=ORG_ID)
+        graph.add_dependency("dashboard", "analytics")
+        graph.add_dependency("analytics", "memory")
+        graph.add_dependency("reports", "memory")
+
+        assert graph.topological_levels() == [["memory"], ["analytics", "reports"], ["dashboard"]]
+
+        # Raising a dependency's level pushes its dependents down too
+        graph.add_dependency("memory", "governance")
+        assert graph.get_level("dashboard") == 3
+        assert graph.topological_levels()[0] == ["governance"]
+
+    def test_cycle_is_detected_when_edge_is_added(self):
+        graph = DependencyGraph(organisation_id=ORG_ID)
+        graph.add_dependency("a", "b")
+        graph.add_dependency("b", "c")
+        assert not graph.has_circular_dependency()
+
+        graph.add_dependency("c", "a")
+
+        assert graph.has_circular_dependency()
+        with pytest.raises(ValueError):
+            graph.topological_levels()
+
+    def test_self_dependency_is_a_cycle(self):
+        graph = DependencyGraph(organisation_id=ORG_ID)
+        graph.add_dependency("a", "a")
+
+        assert graph.has_circular_dependency()
+
+    def test_diamond_is_not_a_cycle(self):
+        graph = DependencyGraph(organisation_id=ORG_ID)
+        for subsystem, dependency in [("b", "a"), ("c", "a"), ("d", "b"), ("d", "c")]:
+            graph.add_dependency(subsystem, dependency)
+
+        assert not graph.has_circular_dependency()
+        assert graph.topological_levels() == [["a"], ["b", "c"], ["d"]]
+
+
+class TestPropagation:
+    """Dependency-ordered, parallel delivery"""
+
+    def test_dependencies_receive_events_first(self):
+        integrator = CrossSubsystemIntegrator()
+        integrator.manage_dependencies(ORG_ID, "dashboard", ["analytics"])
+        integrator.manage_dependencies(ORG_ID, "analytics", ["memory"])
+        delivered = []
+        for subsystem in ("dashboard", "analytics", "memory"):
+            integrator.register_handler(ORG_ID, subsystem, lambda event, s=subsystem: delivered.append(s))
+
+        event = integrator.propagate_event(
+            ORG_ID, "governance", ["dashboard", "analytics", "memory"], "policy_updated", {}
+        )
+
+        assert delivered == ["memory", "analytics", "dashboard"]
+        assert event.propagated_to == {"dashboard", "analytics", "memory"}
+        integrator.shutdown()
+
+    def test_same_level_targets_are_delivered_in_parallel(self):
+        integrator = CrossSubsystemIntegrator(propagation_workers=8)
+        targets = [f"consumer_{i}" for i in range(8)]
+        barrier = threading.Barrier(len(targets), timeout=5)
+        for target in targets:
+            integrator.manage_dependencies(ORG_ID, target, ["source"])
+            integrator.register_handler(ORG_ID, target, lambda event: barrier.wait())
+
+        # Only completes if all eight handlers run at the same time
+        event = integrator.propagate_event(ORG_ID, "source", targets, "data_updated", {})
+
+        assert event.propagated_to == set(targets)
+        integrator.shutdown()
+
+    def test_next_level_waits_for_previous_level(self):
+        integrator = CrossSubsystemIntegrator()
+        integrator.manage_dependencies(ORG_ID, "report", ["left", "right"])
+        finished = []
+
+        def slow(name):
+            def handler(event):
+                time.sleep(0.02)
+                finished.append(name)
+            return handler
+
+        integrator.register_handler(ORG_ID, "left", slow("left"))
+        integrator.register_handler(ORG_ID, "right", slow("right"))
+        integrator.register_handler(ORG_ID, "report", lambda event: finished.append("report"))
+
+        integrator.propagate_event(ORG_ID, "source", ["report", "left", "right"], "data_updated", {})
+
+        assert finished[-1] == "report"
+        integrator.shutdown()
+
+    def test_failed_delivery_is_recorded_as_error(self):
+        integrator = CrossSubsystemIntegrator()
+
+        def failing(event):
+            raise RuntimeError("subsystem offline")
+
+        integrator.register_handler(ORG_ID, "dashboard", failing)
+        integrator.register_handler(ORG_ID, "analytics", lambda event: None)
+
+        event = integrator.propagate_event(ORG_ID, "governance", ["dashboard", "analytics"], "update", {})
+
+        assert event.propagated_to == {"analytics"}
+        errors = integrator.get_errors_for_subsystem(ORG_ID, "dashboard")
+        assert errors[0]["error_type"] == "propagation_failed"
+        assert errors[0]["error_message"] == "subsystem offline"
+        assert integrator.get_subsystem_state(ORG_ID, "dashboard") == SubsystemState.DEGRADED
+        integrator.shutdown()
+
+    def test_cyclic_graph_falls_back_to_sequential_delivery(self):
+        integrator = CrossSubsystemIntegrator()
+        integrator.manage_dependencies(ORG_ID, "a", ["b"])
+        integrator.manage_dependencies(ORG_ID, "b", ["a"])
+        delivered = []
+        for subsystem in ("a", "b"):
+            integrator.register_handler(ORG_ID, subsystem, lambda event, s=subsystem: delivered.append(s))
+
+        integrator.propagate_event(ORG_ID, "source", ["b", "a"], "update", {})
+
+        assert integrator.has_circular_dependency(ORG_ID)
+        assert delivered == ["b", "a"]
@@ -0,0 +1,131 @@
+"""
+Tests for runtime DeadlockDetector.
+
+Covers the runtime behaviour layered on top of the QA-397 suite:
+- Incremental wait-for graph maintenance on request, acquire and release
+- Online detection of cycles of any length
+- Cycles surviving the removal of an edge of another cycle
+- Minimum-cost victim selection during recovery
+"""
+
+from runtime.deadlock_detector import DeadlockDetector, DeadlockStatus
+
+
+ORG_ID = "org-deadlock-1"
+
+
+def ring(detector: DeadlockDetector, holders: list) -> None:
+    """Each holder locks its own resource and waits on the next holder's"""
+    for holder in holders:
+        detector.acquire_lock(f"res_{holder}", holder)
+    for holder, following in zip(holders, holders[1:] + holders[:1]):
+        detector.request_lock(f"res_{following}", holder)
+
+
+class TestWaitForGraph:
+    """Incremental cycle detection"""
+
+    def test_long_cycle_is_detected_on_closing_request(self):
+        detector = DeadlockDetector(ORG_ID)
+        holders = [f"h{i}" for i in range(5)]
+        for holder in holders:
+            detector.acquire_lock(f"res_{holder}", holder)
+        for holder, following in zip(holders[:-1], holders[1:]):
+            detector.request_lock(f"res_{following}", holder)
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
+
+        detector.request_lock("res_h0", "h4")
+
+        assert detector.detect_deadlock() == DeadlockStatus.DETECTED
+        deadlock = detector.get_deadlocks()[0]
+        assert sorted(deadlock["holders"]) == holders
+        assert deadlock["resources"] == sorted(f"res_{h}" for h in holders)
+
+    def test_cycle_formed_by_acquire_is_detected(self):
+        detector = DeadlockDetector(ORG_ID)
+        detector.acquire_lock("a", "t1")
+        detector.request_lock("b", "t1")  # b is free: no edge yet
+        detector.request_lock("a", "t2")
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
+
+        detector.acquire_lock("b", "t2")
+
+        assert detector.detect_deadlock() == DeadlockStatus.DETECTED
+
+    def test_release_clears_deadlock(self):
+        detector = DeadlockDetector(ORG_ID)
+        ring(detector, ["t1", "t2"])
+
+        assert detector.release_lock("res_t1", "t1")
+
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
+        assert detector.get_deadlocks() == []
+
+    def test_cycle_sharing_an_edge_survives_other_cycle_breaking(self):
+        detector = DeadlockDetector(ORG_ID)
+        # Two cycles share the edge t1 -> t2
+        detector.acquire_lock("x", "t1")
+        detector.acquire_lock("y", "t2")
+        detector.acquire_lock("z", "t3")
+        detector.request_lock("y", "t1")
+        detector.request_lock("z", "t2")
+        detector.request_lock("x", "t3")  # Cycle t1 -> t2 -> t3 -> t1
+        detector.request_lock("x", "t2")  # Cycle t1 -> t2 -> t1
+        assert len(detector.get_deadlocks()) >= 1
+
+        # Breaking the three-holder cycle leaves the two-holder one
+        detector.abort_holder("t3")
+
+        assert detector.detect_deadlock() == DeadlockStatus.DETECTED
+        assert sorted(detector.get_deadlocks()[0]["holders"]) == ["t1", "t2"]
+
+    def test_waiting_on_free_or_own_resource_is_not_a_wait_edge(self):
+        detector = DeadlockDetector(ORG_ID)
+        detector.acquire_lock("a", "t1")
+        detector.request_lock("a", "t1")
+        detector.request_lock("free", "t2")
+
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
+
+
+class TestVictimRecovery:
+    """Minimum-cost victim selection"""
+
+    def test_victim_holds_fewest_locks(self):
+        detector = DeadlockDetector(ORG_ID)
+        ring(detector, ["t1", "t2", "t3"])
+        detector.acquire_lock("extra_1", "t1")
+        detector.acquire_lock("extra_3", "t3")
+
+        result = detector.get_recovery().recover_from_deadlock()
+
+        assert result["victims"] == ["t2"]
+        assert result["resources_released"] == ["res_t2"]
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
+        # Survivors keep their locks
+        assert detector.is_lock_held("res_t1", "t1")
+        assert detector.is_lock_held("res_t3", "t3")
+
+    def test_custom_cost_and_every_cycle_broken(self):
+        priorities = {"a1": 5, "a2": 1, "b1": 0, "b2": 9}
+        detector = DeadlockDetector(ORG_ID, victim_cost=priorities.__getitem__)
+        ring(detector, ["a1", "a2"])
+        ring(detector, ["b1", "b2"])
+
+        result = detector.get_recovery().recover_from_deadlock()
+
+        assert sorted(result["victims"]) == ["a2", "b1"]
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
+
+    def test_explicit_release_only_touches_listed_holders(self):
+        detector = DeadlockDetector(ORG_ID)
+        ring(detector, ["t1", "t2"])
+        detector.acquire_lock("other", "t3")
+
+        detector.get_recovery().recover_from_deadlock(
+            resources=["res_t1", "res_t2", "other"], holders=["t1", "t2"]
+        )
+
+        assert detector.get_lock_holder("res_t1") is None
+        assert detector.get_lock_holder("other") == "t3"
+        assert detector.detect_deadlock() == DeadlockStatus.NONE
@@ -0,0 +1,188 @@
+"""
+Tests for runtime ErrorCascadeManager.
+
+Covers the runtime behaviour layered on top of the QA-251 to QA-255 suite:
+- Persistent requirement → build → task graph with reverse edges
+- Memoized reachability invalidated only above a changed edge
+- Blocking and unblocking touching only dependents, with counted blockers
+- Own states restored once no blocked prerequisite reaches an entity
+- Task IDs scoped to their build
+"""
+
+import pytest
+
+from runtime.cascade_graph import BLOCKED, CascadeGraph
+from runtime.error_cascade_manager import ErrorCascadeManager, task_entity_id
+
+
+ORG_ID = "org-cascade-graph-1"
+
+
+def chain_graph() -> CascadeGraph:
+    """req → build → t1 → t2, build → t3"""
+    graph = CascadeGraph()
+    graph.add_node("req", "requirement", "APPROVED")
+    graph.add_node("build", "build", "IN_PROGRESS")
+    for task_id in ("t1", "t2", "t3"):
+        graph.add_node(task_id, "task", "PENDING")
+    for parent_id, child_id in [("req", "build"), ("build", "t1"), ("t1", "t2"), ("build", "t3")]:
+        graph.add_dependency(parent_id, child_id)
+    return graph
+
+
+class TestReachability:
+    """Memoized descendants"""
+
+    def test_descendants_follow_edges(self):
+        graph = chain_graph()
+
+        assert graph.descendants("req") == {"build", "t1", "t2", "t3"}
+        assert graph.descendants("t1") == {"t2"}
+        assert graph.descendants("t2") == frozenset()
+
+    def test_descendants_are_memoized(self):
+        graph = chain_graph()
+        first = graph.descendants("build")
+
+        assert graph.descendants("build") is first
+        assert graph.get_stats()["cache_hits"] == 1
+
+    def test_edge_change_invalidates_only_ancestors(self):
+        graph = chain_graph()
+        graph.add_node("t4", "task", "PENDING")
+        graph.add_node("other", "build", "IN_PROGRESS")
+        for node_id in ("req", "t3", "other"):
+            graph.descendants(node_id)
+
+        graph.add_dependency("t1", "t4")
+
+        assert graph.descendants("req") == {"build", "t1", "t2", "t3", "t4"}
+        memoized = graph._reachable
+        assert "t3" in memoized and "other" in memoized
+        graph.remove_dependency("t1", "t4")
+        assert graph.descendants("build") == {"t1", "t2", "t3"}
+
+    def test_cycles_are_rejected(self):
+        graph = chain_graph()
+
+        with pytest.raises(ValueError):
+            graph.add_dependency("t2", "req")
+        with pytest.raises(ValueError):
+            graph.add_dependency("t1", "t1")
+        assert graph.descendants("t2") == frozenset()
+
+
+class TestBlocking:
+    """Counted blocks over the graph"""
+
+    def test_block_touches_only_descendants(self):
+        graph = chain_graph()
+
+        paused = graph.block("t1", "blocker-1")
+
+        assert sorted(paused) == ["t1", "t2"]
+        assert graph.state("t2") == BLOCKED
+        assert graph.state("t3") == "PENDING" and graph.state("build") == "IN_PROGRESS"
+
+    def test_overlapping_blocks_release_independently(self):
+        graph = chain_graph()
+        graph.block("build", "blocker-1")
+        graph.block("t1", "blocker-2")
+
+        assert sorted(graph.unblock("build")) == ["build", "t3"]
+        assert graph.state("t1") == BLOCKED and graph.state("t2") == BLOCKED
+        assert sorted(graph.unblock("t1")) == ["t1", "t2"]
+        assert graph.get_stats()["blocked_nodes"] == 0
+
+    def test_node_stays_blocked_until_every_blocker_is_removed(self):
+        graph = chain_graph()
+        graph.block("build", "blocker-1")
+
+        assert graph.block("build", "blocker-2") == []
+        assert graph.unblock("build", "blocker-1") == []
+        assert graph.state("t2") == BLOCKED
+        assert sorted(graph.unblock("build", "blocker-2")) == ["build", "t1", "t2", "t3"]
+
+    def test_edges_added_under_a_blocked_node_inherit_the_block(self):
+        graph = chain_graph()
+        graph.add_node("t4", "task", "PENDING")
+        graph.block("build", "blocker-1")
+
+        graph.add_dependency("t2", "t4")
+        assert graph.state("t4") == BLOCKED
+
+        graph.remove_dependency("t2", "t4")
+        assert graph.state("t4") == "PENDING"
+        graph.unblock("build")
+        assert graph.get_stats()["blocked_nodes"] == 0
+
+
+class TestManagerGraph:
+    """ErrorCascadeManager cascades over the graph"""
+
+    def initiate(self, manager: ErrorCascadeManager) -> None:
+        manager.enforce_requirement_freeze("req-1", "APPROVED", {"title": "Requirement"})
+        manager.handle_build_initiation_cascade(
+            build_id="build-1",
+            builder_assignments=[{"builder_id": "api-builder"}],
+            tasks=[
+                {"task_id": "task-1"},
+                {"task_id": "task-2", "depends_on": ["task-1"]},
+            ],
+            monitoring_config={},
+            requirement_id="req-1"
+        )
+
+    def test_initiation_builds_the_graph(self):
+        manager = ErrorCascadeManager(ORG_ID)
+        self.initiate(manager)
+
+        assert manager.get_dependent_entities("req-1") == ["build-1", "build-1/task-1", "build-1/task-2"]
+        status = manager.get_entity_status(task_entity_id("build-1", "task-2"))
+        assert status["kind"] == "task"
+        assert status["prerequisites"] == ["build-1", "build-1/task-1"]
+        assert status["organisation_id"] == ORG_ID
+
+    def test_block_and_unblock_restore_states(self):
+        manager = ErrorCascadeManager(ORG_ID)
+        self.initiate(manager)
+
+        blocked = manager.handle_build_blocking_cascade("build-1", {"blocker_id": "blocker-1"})
+        assert sorted(blocked["paused_components"]) == ["build-1", "build-1/task-1", "build-1/task-2"]
+        assert manager.get_entity_status("build-1/task-2")["state"] == BLOCKED
+        assert manager.get_entity_status("req-1")["state"] == "APPROVED"
+
+        resumed = manager.handle_build_unblocking_cascade("build-1", {"blocker_id": "blocker-1"})
+        assert sorted(resumed["resumed_components"]) == ["build-1", "build-1/task-1", "build-1/task-2"]
+        assert manager.get_entity_status("build-1")["state"] == "IN_PROGRESS"
+        assert manager.get_entity_status("build-1/task-2")["state"] == "PENDING"
+
+    def test_task_ids_are_scoped_to_their_build(self):
+        manager = ErrorCascadeManager(ORG_ID)
+        for build_id in ("build-A", "build-B"):
+            manager.handle_build_initiation_cascade(
+                build_id=build_id,
+                builder_assignments=[],
+                tasks=[{"task_id": "task-001"}, {"task_id": "task-002", "depends_on": ["task-001"]}],
+                monitoring_config={}
+            )
+
+        manager.handle_build_blocking_cascade("build-A", {"blocker_id": "blocker-1"})
+
+        assert manager.get_entity_status("build-A/task-001")["state"] == BLOCKED
+        assert manager.get_entity_status("build-B/task-001")["state"] == "PENDING"
+        assert manager.get_entity_status("build-B/task-002")["prerequisites"] == ["build-B", "build-B/task-001"]
+
+    def test_task_without_id_is_rejected(self):
+        manager = ErrorCascadeManager(ORG_ID)
+
+        with pytest.raises(ValueError):
+            manager.handle_build_initiation_cascade("build-1", [], [{"type": "testing"}], {})
+        assert manager.get_entity_status("build-1") is None
+
+    def test_unknown_entities(self):
+        manager = ErrorCascadeManager(ORG_ID)
+
+        assert manager.get_entity_status("missing") is None
+        assert manager.get_dependent_entities("missing") == []
+        assert manager.handle_build_unblocking_cascade("missing", {})["resumed_components"] == []
@@ -0,0 +1,518 @@
+"""
+Tests for runtime.integration EventBus.
+
+Covers the runtime behaviour layered on top of the QA-466 to QA-470 suite:
+- Event type subscription index and wildcard subscriptions
+- Delivery order across indexed and wildcard subscribers
+- Tenant isolation of the index
+- Asynchronous worker-pool dispatch and backpressure policies
+- Durable segmented event log, consumer offsets and replay
+- Batched publishing
+- Per-tenant locking and id generation
+"""
+
+import os
+import threading
+import time
+
+from runtime.integration.event_bus import EventBus
+from runtime.integration.event_dispatcher import (
+    BackpressurePolicy,
+    DispatchConfig,
+    DispatchMode,
+)
+from runtime.integration.event_log import EventLog, EventLogConfig
+
+
+def async_bus(**overrides) -> EventBus:
+    """Create an EventBus in ASYNC dispatch mode"""
+    return EventBus(DispatchConfig(mode=DispatchMode.ASYNC, **overrides))
+
+
+class TestSubscriptionIndex:
+    """Per-tenant event type index"""
+
+    def test_delivery_only_reaches_interested_subscribers(self):
+        bus = EventBus()
+        org_id = "org-index-1"
+        received = {"build": [], "qa": []}
+
+        bus.subscribe(org_id, "build", ["build_started"], received["build"].append)
+        bus.subscribe(org_id, "qa", ["qa_failed"], received["qa"].append)
+
+        event = bus.publish(org_id, "build_started", {})
+
+        assert len(received["build"]) == 1
+        assert received["qa"] == []
+        assert event.delivered_to == ["build"]
+
+    def test_wildcard_and_typed_subscribers_keep_registration_order(self):
+        bus = EventBus()
+        org_id = "org-index-2"
+        order = []
+
+        bus.subscribe(org_id, "first", ["tick"], lambda e: order.append("first"))
+        bus.subscribe(org_id, "all", [], lambda e: order.append("all"))
+        bus.subscribe(org_id, "last", ["tick", "tock"], lambda e: order.append("last"))
+
+        bus.publish(org_id, "tick", {})
+        bus.publish(org_id, "other", {})
+
+        assert order == ["first", "all", "last", "all"]
+
+    def test_unsubscribe_removes_from_index(self):
+        bus = EventBus()
+        org_id = "org-index-3"
+
+        bus.subscribe(org_id, "sub", ["tick"])
+        bus.subscribe(org_id, "wild", [])
+        assert len(bus.get_subscribers_for(org_id, "tick")) == 2
+
+        assert bus.unsubscribe(org_id, "sub") is True
+        assert bus.unsubscribe(org_id, "wild") is True
+
+        assert bus.get_subscribers_for(org_id, "tick") == []
+        assert "tick" not in bus.subscription_index[org_id]
+
+    def test_index_is_tenant_scoped(self):
+        bus = EventBus()
+        received = []
+
+        bus.subscribe("org-a", "sub", ["tick"], received.append)
+        bus.publish("org-b", "tick", {})
+
+        assert received == []
+        assert bus.get_subscribers_for("org-b", "tick") == []
+
+
+class TestAsyncDispatch:
+    """Worker-pool dispatch with per-subscriber queues"""
+
+    def test_slow_subscriber_does_not_block_publisher(self):
+        bus = async_bus(worker_count=2)
+        org_id = "org-async-1"
+        release = threading.Event()
+        fast_received = []
+
+        bus.subscribe(org_id, "slow", ["tick"], lambda e: release.wait(5))
+        bus.subscribe(org_id, "fast", ["tick"], fast_received.append)
+
+        start = time.monotonic()
+        for i in range(10):
+            bus.publish(org_id, "tick", {"i": i})
+        assert time.monotonic() - start < 1.0
+
+        deadline = time.monotonic() + 5
+        while len(fast_received) < 10 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [e.payload["i"] for e in fast_received] == list(range(10))
+
+        release.set()
+        assert bus.flush(timeout=5) is True
+        bus.shutdown()
+
+    def test_each_subscriber_sees_tenant_order(self):
+        bus = async_bus(worker_count=4, max_batch_size=3)
+        received = {f"sub_{i}": [] for i in range(4)}
+
+        for sub_id, sink in received.items():
+            bus.subscribe("org-async-2", sub_id, [], sink.append)
+        events = [bus.publish("org-async-2", "tick", {}) for _ in range(200)]
+
+        assert bus.flush(timeout=5) is True
+        expected = [e.sequence_number for e in events]
+        for sink in received.values():
+            assert [e.sequence_number for e in sink] == expected
+        assert all(len(e.delivered_to) == 4 for e in events)
+        bus.shutdown()
+
+    def test_drop_oldest_keeps_newest_events(self):
+        bus = async_bus(
+            worker_count=1,
+            queue_capacity=5,
+            backpressure_policy=BackpressurePolicy.DROP_OLDEST
+        )
+        org_id = "org-async-3"
+        gate = threading.Event()
+        received = []
+
+        def callback(event):
+            gate.wait(5)
+            received.append(event.payload["i"])
+
+        bus.subscribe(org_id, "sub", ["tick"], callback)
+        bus.publish(org_id, "tick", {"i": 0})
+        time.sleep(0.05)  # Worker now holds event 0
+        for i in range(1, 21):
+            bus.publish(org_id, "tick", {"i": i})
+
+        gate.set()
+        assert bus.flush(timeout=5) is True
+        assert received == [0, 16, 17, 18, 19, 20]
+
+        metrics = bus.get_dispatch_metrics(org_id, "sub")[0]
+        assert metrics["dropped"] == 15
+        assert metrics["delivered"] == 6
+        assert metrics["queue_depth"] == 0
+        bus.shutdown()
+
+    def test_spill_to_disk_preserves_order(self, tmp_path):
+        bus = async_bus(
+            worker_count=1,
+            queue_capacity=4,
+            backpressure_policy=BackpressurePolicy.SPILL_TO_DISK,
+            spill_directory=str(tmp_path)
+        )
+        org_id = "org-async-4"
+        gate = threading.Event()
+        received = []
+
+        def callback(event):
+            gate.wait(5)
+            received.append(event.payload["i"])
+
+        bus.subscribe(org_id, "sub", ["tick"], callback)
+        for i in range(50):
+            bus.publish(org_id, "tick", {"i": i})
+
+        metrics = bus.get_dispatch_metrics(org_id, "sub")[0]
+        assert metrics["spilled"] > 0
+        assert os.listdir(tmp_path)
+
+        gate.set()
+        assert bus.flush(timeout=5) is True
+        assert received == list(range(50))
+        assert os.listdir(tmp_path) == []
+        bus.shutdown()
+
+    def test_block_timeout_records_failed_delivery(self):
+        bus = async_bus(
+            worker_count=1,
+            queue_capacity=1,
+            backpressure_policy=BackpressurePolicy.BLOCK,
+            block_timeout_seconds=0.05
+        )
+        org_id = "org-async-5"
+        gate = threading.Event()
+
+        bus.subscribe(org_id, "sub", ["tick"], lambda e: gate.wait(5))
+        bus.publish(org_id, "tick", {})
+        time.sleep(0.05)  # Worker now holds the first event
+        bus.publish(org_id, "tick", {})  # Fills the queue
+        rejected = bus.publish(org_id, "tick", {})
+
+        failures = bus.get_failed_deliveries(org_id, "sub")
+        assert [f["event_id"] for f in failures] == [rejected.event_id]
+        assert bus.get_dispatch_metrics(org_id, "sub")[0]["rejected"] == 1
+
+        gate.set()
+        assert bus.flush(timeout=5) is True
+        bus.shutdown()
+
+    def test_callback_failures_are_recorded(self):
+        bus = async_bus()
+        org_id = "org-async-6"
+
+        def failing(event):
+            raise RuntimeError("boom")
+
+        bus.subscribe(org_id, "bad", ["tick"], failing)
+        event = bus.publish(org_id, "tick", {})
+
+        assert bus.flush(timeout=5) is True
+        failures = bus.get_failed_deliveries(org_id, "bad")
+        assert failures[0]["event_id"] == event.event_id
+        assert failures[0]["error"] == "boom"
+        bus.shutdown()
+
+
+class TestEventLog:
+    """Durable segmented event log behind the bus"""
+
+    def test_events_survive_restart_and_sequence_continues(self, tmp_path):
+        org_id = "org-log-1"
+        bus = EventBus(event_log=EventLog(EventLogConfig(directory=str(tmp_path))))
+        for i in range(3):
+            bus.publish(org_id, "tick", {"i": i})
+        bus.shutdown()
+
+        bus = EventBus(event_log=EventLog(EventLogConfig(directory=str(tmp_path))))
+        event = bus.publish(org_id, "tock", {"i": 3})
+
+        assert event.sequence_number == 4
+        ordered = bus.get_events_in_order(org_id)
+        assert [e.payload["i"] for e in ordered] == [0, 1, 2, 3]
+        assert [e.sequence_number for e in bus.get_events_in_order(org_id, 3, 1)] == [3]
+        assert len(bus.get_published_events(org_id, "tick")) == 3
+        bus.shutdown()
+
+    def test_subscriber_resumes_from_committed_offset(self, tmp_path):
+        org_id = "org-log-2"
+        config = EventLogConfig(directory=str(tmp_path))
+        received = []
+
+        bus = EventBus(event_log=EventLog(config))
+        bus.subscribe(org_id, "sub", ["tick"], lambda e: received.append(e.payload["i"]))
+        bus.publish(org_id, "tick", {"i": 0})
+        bus.publish(org_id, "tick", {"i": 1})
+        bus.shutdown()
+
+        # Published while the subscriber was away
+        bus = EventBus(event_log=EventLog(config))
+        bus.publish(org_id, "tick", {"i": 2})
+        bus.publish(org_id, "other", {"i": -1})
+        bus.publish(org_id, "tick", {"i": 3})
+        bus.shutdown()
+
+        bus = EventBus(event_log=EventLog(config))
+        bus.subscribe(org_id, "sub", ["tick"], lambda e: received.append(e.payload["i"]))
+        assert bus.recover_from_failure(org_id) is True
+        assert received == [0, 1, 2, 3]
+
+        # Nothing left to replay
+        assert bus.replay_events(org_id, "sub") == 0
+        assert bus.event_log.get_offset(org_id, "sub") == 5
+        bus.shutdown()
+
+    def test_failed_events_are_replayed_until_delivered(self, tmp_path):
+        org_id = "org-log-6"
+        bus = EventBus(event_log=EventLog(EventLogConfig(directory=str(tmp_path))))
+        broken = {1}
+        received = []
+
+        def callback(event):
+            if event.payload["i"] in broken:
+                raise RuntimeError("downstream unavailable")
+            received.append(event.payload["i"])
+
+        bus.subscribe(org_id, "sub", ["tick"], callback)
+        for i in range(3):
+            bus.publish(org_id, "tick", {"i": i})
+        assert bus.event_log.get_offset(org_id, "sub") == 1  # Not past the failed event
+
+        bus.recover_from_failure(org_id)
+        assert bus.event_log.get_offset(org_id, "sub") == 1
+
+        broken.clear()
+        bus.recover_from_failure(org_id)
+
+        assert received == [0, 2, 2, 1, 2]
+        assert bus.event_log.get_offset(org_id, "sub") == 3
+        assert bus.replay_events(org_id, "sub") == 0
+        bus.shutdown()
+
+    def test_new_subscriber_starts_at_log_head(self, tmp_path):
+        org_id = "org-log-3"
+        bus = EventBus(event_log=EventLog(EventLogConfig(directory=str(tmp_path))))
+        bus.publish(org_id, "tick", {})
+        received = []
+
+        bus.subscribe(org_id, "late", [], received.append)
+        bus.recover_from_failure(org_id)
+
+        assert received == []
+        bus.shutdown()
+
+    def test_memory_window_is_bounded(self, tmp_path):
+        org_id = "org-log-4"
+        config = EventLogConfig(directory=str(tmp_path), memory_window=10)
+        bus = EventBus(event_log=EventLog(config))
+        for i in range(100):
+            bus.publish(org_id, "tick", {"i": i})
+
+        assert len(bus.published_events[org_id]) == 10
+        assert bus.event_queues[org_id].size() == 0
+        assert len(bus.get_events_in_order(org_id)) == 100
+        bus.shutdown()
+
+    def test_segments_roll_and_retention_removes_oldest(self, tmp_path):
+        org_id = "org-log-5"
+        log = EventLog(EventLogConfig(
+            directory=str(tmp_path),
+            segment_max_bytes=1024,
+            retention_max_bytes=4096
+        ))
+        for sequence in range(1, 501):
+            log.append(org_id, sequence, {"sequence_number": sequence, "pad": "x" * 20})
+
+        stats = log.get_log_stats(org_id)
+        assert stats["segment_count"] > 1
+        assert stats["size_bytes"] <= 4096 + 1024
+        assert stats["last_sequence"] == 500
+
+        first = stats["first_sequence"]
+        assert first > 1
+        records = list(log.read(org_id, 0))
+        assert [r["sequence_number"] for r in records] == list(range(first, 501))
+        assert [r["sequence_number"] for r in log.read(org_id, 490, 3)] == [490, 491, 492]
+        log.close()
+
+    def test_torn_tail_is_truncated_on_reopen(self, tmp_path):
+        org_id = "org-log-6"
+        log = EventLog(EventLogConfig(directory=str(tmp_path)))
+        for sequence in range(1, 4):
+            log.append(org_id, sequence, {"sequence_number": sequence})
+        log.close()
+
+        segment = next(p for p in (tmp_path / org_id).iterdir() if p.suffix == ".log")
+        with open(segment, "ab") as data_file:
+            data_file.write(b"\x00\x00\x01\x00partial")
+
+        log = EventLog(EventLogConfig(directory=str(tmp_path)))
+        assert log.last_sequence(org_id) == 3
+        log.append(org_id, 4, {"sequence_number": 4})
+        assert [r["sequence_number"] for r in log.read(org_id)] == [1, 2, 3, 4]
+        log.close()
+
+
+class TestPublishBatch:
+    """Batched publish API"""
+
+    def test_batch_reserves_contiguous_sequences(self):
+        bus = EventBus()
+        org_id = "org-batch-1"
+        bus.publish(org_id, "tick", {})
+
+        events = bus.publish_batch(org_id, [("tick", {"i": i}) for i in range(5)])
+
+        assert [e.sequence_number for e in events] == [2, 3, 4, 5, 6]
+        assert [e.event_id for e in events] == [f"evt_{n}_{org_id}" for n in range(2, 7)]
+        assert bus.verify_ordering(org_id) is True
+        assert bus.get_next_sequence(org_id) == 7
+        assert bus.publish_batch(org_id, []) == []
+
+    def test_batch_callback_receives_one_list(self):
+        bus = EventBus()
+        org_id = "org-batch-2"
+        batches = []
+        singles = []
+
+        bus.subscribe(org_id, "batched", ["tick"], batch_callback=batches.append)
+        bus.subscribe(org_id, "single", [], singles.append)
+
+        events = bus.publish_batch(org_id, [("tick", {}), ("tock", {}), ("tick", {})])
+
+        assert len(batches) == 1
+        assert [e.sequence_number for e in batches[0]] == [1, 3]
+        assert [e.sequence_number for e in singles] == [1, 2, 3]
+        assert events[0].delivered_to == ["batched", "single"]
+        assert events[1].delivered_to == ["single"]
+
+        # Single publishes reach batch subscribers as one-element lists
+        bus.publish(org_id, "tick", {})
+        assert len(batches[1]) == 1
+
+    def test_failing_batch_callback_records_each_event(self):
+        bus = EventBus()
+        org_id = "org-batch-3"
+
+        def failing(events):
+            raise RuntimeError("batch failed")
+
+        bus.subscribe(org_id, "bad", [], batch_callback=failing)
+        events = bus.publish_batch(org_id, [("tick", {}), ("tick", {})])
+
+        failures = bus.get_failed_deliveries(org_id, "bad")
+        assert [f["event_id"] for f in failures] == [e.event_id for e in events]
+
+    def test_batch_is_logged_and_commits_offsets(self, tmp_path):
+        org_id = "org-batch-4"
+        bus = EventBus(event_log=EventLog(EventLogConfig(directory=str(tmp_path))))
+        bus.subscribe(org_id, "sub", [], batch_callback=lambda events: None)
+
+        bus.publish_batch(org_id, [("tick", {"i": i}) for i in range(4)])
+
+        assert [e.payload["i"] for e in bus.get_events_in_order(org_id)] == [0, 1, 2, 3]
+        assert bus.event_log.get_offset(org_id, "sub") == 4
+        bus.shutdown()
+
+    def test_batch_in_async_mode(self):
+        bus = async_bus()
+        org_id = "org-batch-5"
+        received = []
+
+        bus.subscribe(org_id, "sub", [], received.append)
+        bus.publish_batch(org_id, [("tick", {"i": i}) for i in range(50)])
+
+        assert bus.flush(timeout=5) is True
+        assert [e.payload["i"] for e in received] == list(range(50))
+        bus.shutdown()
+
+
+class TestPerTenantLocking:
+    """Tenants publish independently with per-tenant ids and sequences"""
+
+    def test_ids_are_generated_per_tenant(self):
+        bus = EventBus()
+
+        first_a = bus.publish("org-a", "tick", {})
+        first_b = bus.publish("org-b", "tick", {})
+        second_a = bus.publish("org-a", "tick", {})
+
+        assert first_a.event_id == "evt_1_org-a"
+        assert first_b.event_id == "evt_1_org-b"
+        assert second_a.event_id == "evt_2_org-a"
+        assert bus.tenant_locks["org-a"] is not bus.tenant_locks["org-b"]
+
+    def test_concurrent_tenants_keep_their_own_ordering(self):
+        bus = EventBus()
+        tenants = [f"org-mt-{i}" for i in range(4)]
+        received = {tenant: [] for tenant in tenants}
+        for tenant in tenants:
+            bus.subscribe(tenant, "sub", [], received[tenant].append)
+
+        def publish_all(tenant):
+            for i in range(200):
+                bus.publish(tenant, "tick", {"i": i})
+
+        threads = [threading.Thread(target=publish_all, args=(t,)) for t in tenants]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for tenant in tenants:
+            assert [e.sequence_number for e in received[tenant]] == list(range(1, 201))
+            assert bus.verify_ordering(tenant) is True
+
+    def test_concurrent_publishers_dispatch_in_sequence_order(self):
+        bus = async_bus()
+        org_id = "org-race"
+        received = []
+        bus.subscribe(org_id, "sub", [], lambda e: received.append(e.sequence_number))
+        dispatch = bus.dispatcher.dispatch
+        first_reserved = threading.Event()
+
+        def slow_first_dispatch(subscription, event):
+            if event.sequence_number == 1:
+                first_reserved.set()
+                time.sleep(0.05)  # Lose the race to the second publisher
+            return dispatch(subscription, event)
+
+        bus.dispatcher.dispatch = slow_first_dispatch
+        first = threading.Thread(target=bus.publish, args=(org_id, "tick", {}))
+        first.start()
+        first_reserved.wait(timeout=5)
+        bus.publish_batch(org_id, [("tick", {}), ("tick", {})])
+        first.join()
+
+        assert bus.flush(timeout=5)
+        assert received == [1, 2, 3]
+        bus.shutdown()
+
+    def test_subscribe_during_publish_sees_consistent_snapshot(self):
+        bus = EventBus()
+        org_id = "org-cow"
+        seen = []
+
+        def subscribe_more(event):
+            # Mutating subscriptions mid-delivery must not disturb this delivery
+            bus.subscribe(org_id, f"late_{event.sequence_number}", ["tick"])
+            seen.append(event.sequence_number)
+
+        bus.subscribe(org_id, "first", ["tick"], subscribe_more)
+        event = bus.publish(org_id, "tick", {})
+
+        assert seen == [1]
+        assert event.delivered_to == ["first"]
+        assert len(bus.get_subscriptions(org_id)) == 2
@@ -0,0 +1,338 @@
+"""
+Tests for runtime FailurePredictor pattern mining and model training.
+
+Covers the runtime behaviour layered on top of the QA-261 and QA-265 suites:
+- Streamed failures in time-bucketed counters and windowed pattern queries
+- Correlation scores from co-occurring failure types
+- Logistic regression fitted by batch gradient descent, recovering known weights
+- Seeded train/validation split and validation metrics
+- Platt-calibrated probabilities
+- Feature matrix input and model export/import
+- NumPy and pure-Python training agreeing
+- The training backend reported, with a warning when NumPy is missing
+"""
+
+import json
+import math
+import random
+
+import pytest
+
+from runtime import failure_model
+from runtime.failure_model import LogisticRegressionModel, TrainingConfig
+from runtime.failure_patterns import FailurePatternMiner, PatternMiningConfig
+from runtime.failure_predictor import FailurePredictor
+
+
+ORG_ID = "org-predictor-1"
+START = 1_800_000_000.0  # Epoch seconds, on a bucket boundary
+TRUE_WEIGHTS = {"cpu": 2.0, "errors": -1.5, "memory": 0.0}
+TRUE_BIAS = -0.5
+
+
+class FakeClock:
+    """Manually advanced wall clock"""
+
+    def __init__(self):
+        self.now = START
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def synthetic_observations(count: int, seed: int = 7) -> list:
+    """Observations labelled by a known logistic model over standardized features"""
+    rng = random.Random(seed)
+    observations = []
+    for _ in range(count):
+        standardized = {name: rng.gauss(0, 1) for name in TRUE_WEIGHTS}
+        score = TRUE_BIAS + sum(TRUE_WEIGHTS[name] * value for name, value in standardized.items())
+        observations.append({
+            "cpu": 0.6 + 0.1 * standardized["cpu"],
+            "errors": 0.05 + 0.01 * standardized["errors"],
+            "memory": 512 + 64 * standardized["memory"],
+            "failed": rng.random() < 1 / (1 + math.exp(-score))
+        })
+    return observations
+
+
+class TestPatternStreaming:
+    """Failures ingested one at a time"""
+
+    def test_streamed_failures_form_patterns_inside_the_window(self):
+        clock = FakeClock()
+        predictor = FailurePredictor(ORG_ID, clock=clock)
+        predictor.record_failure({"type": "database_timeout", "timestamp": START - 3 * 3600})
+        for minutes in (0, 10, 20):
+            predictor.record_failure({"type": "database_timeout", "timestamp": START + minutes * 60})
+        predictor.record_failure({"type": "api_timeout", "timestamp": START + 1800})
+        clock.now = START + 1800
+
+        result = predictor.analyze_failure_patterns(time_window_hours=1)
+
+        assert result["pattern_types"] == ["database_timeout"]
+        assert result["pattern_frequency"] == {"database_timeout": 3}
+        assert result["failures_in_window"] == 4
+        assert predictor.analyze_failure_patterns(time_window_hours=4)["pattern_frequency"]["database_timeout"] == 4
+
+    def test_window_ends_now_not_at_the_last_failure(self):
+        clock = FakeClock()
+        predictor = FailurePredictor(ORG_ID, clock=clock)
+        predictor.record_failure({"type": "disk_full"})
+        predictor.record_failure({"type": "disk_full"})
+
+        clock.now += 2 * 3600
+
+        assert predictor.analyze_failure_patterns(time_window_hours=1)["patterns_detected"] == 0
+        assert predictor.analyze_failure_patterns(time_window_hours=3)["patterns_detected"] == 1
+
+    def test_co_occurring_types_are_correlated(self):
+        predictor = FailurePredictor(ORG_ID, clock=FakeClock())
+        rng = random.Random(3)
+        for bucket in range(288):
+            at = START - bucket * 300
+            if bucket % 4 == 0:
+                # Pool exhaustion and query timeouts arrive together
+                for _ in range(3):
+                    predictor.record_failure({"type": "pool_exhausted", "timestamp": at})
+                predictor.record_failure({"type": "query_timeout", "timestamp": at + 5})
+            if rng.random() < 0.3:
+                predictor.record_failure({"type": "cache_miss_storm", "timestamp": at + 10})
+
+        result = predictor.analyze_failure_patterns(time_window_hours=24)
+
+        assert result["correlation_score"] == pytest.approx(1.0)
+        assert result["correlated_patterns"][0]["pattern_types"] == ["pool_exhausted", "query_timeout"]
+        assert all("cache_miss_storm" not in entry["pattern_types"] for entry in result["correlated_patterns"])
+        pattern = predictor._patterns[f"pattern_query_timeout_{ORG_ID}"]
+        assert pattern.correlation_score == pytest.approx(1.0)
+
+    def test_history_matches_streamed_analysis(self):
+        failures = [
+            {"type": "database_timeout", "timestamp": "2026-01-09T10:00:00Z"},
+            {"type": "api_timeout", "timestamp": "2026-01-09T10:01:00Z"},
+            {"type": "database_timeout", "timestamp": "2026-01-09T10:30:00Z"},
+            {"type": "api_timeout", "timestamp": "2026-01-09T10:31:00Z"},
+            {"type": "database_timeout", "timestamp": "2026-01-09T11:00:00Z"},
+        ]
+        clock = FakeClock()
+        clock.now = 1767956400.0  # 2026-01-09T11:00:00Z
+        streamed = FailurePredictor(ORG_ID, clock=clock)
+        for failure in failures:
+            streamed.record_failure(failure)
+
+        batch = FailurePredictor(ORG_ID).analyze_failure_patterns(failures, time_window_hours=24)
+        stream = streamed.analyze_failure_patterns(time_window_hours=24)
+
+        assert batch == stream
+        assert batch["pattern_frequency"] == {"api_timeout": 2, "database_timeout": 3}
+        assert batch["correlation_score"] > 0.5
+
+
+class TestPatternMiner:
+    """Bounded ring of bucketed counters"""
+
+    def test_state_is_bounded_by_the_retention(self):
+        miner = FailurePatternMiner(PatternMiningConfig(bucket_seconds=60, retention_hours=1))
+        for second in range(0, 6 * 3600, 3):
+            miner.ingest("timeout", START + second)
+
+        stats = miner.get_stats()
+        window = miner.query(3600)
+
+        assert stats["ring_size"] == 60 and stats["buckets_in_use"] == 60
+        assert window["counts"] == {"timeout": 1200}
+        assert window["buckets"] == 60
+
+    def test_failures_older_than_the_retention_are_dropped(self):
+        miner = FailurePatternMiner(PatternMiningConfig(bucket_seconds=60, retention_hours=1))
+        miner.ingest("timeout", START + 7200)
+
+        assert not miner.ingest("timeout", START)
+        assert miner.ingest("timeout", START + 7200 - 1800)
+        assert miner.get_stats()["dropped_late"] == 1
+        assert miner.query(3600)["counts"] == {"timeout": 2}
+
+    def test_invalid_config_is_rejected(self):
+        with pytest.raises(ValueError):
+            FailurePatternMiner(PatternMiningConfig(bucket_seconds=0))
+
+
+class TestTraining:
+    """Gradient descent fit and metrics"""
+
+    def test_recovers_known_weights(self):
+        predictor = FailurePredictor(ORG_ID)
+
+        result = predictor.train_prediction_model({"features": synthetic_observations(3000)})
+
+        model = predictor._models[result["model_id"]].classifier
+        weights = dict(zip(model.feature_names, model.weights))
+        assert weights["cpu"] == pytest.approx(2.0, abs=0.3)
+        assert weights["errors"] == pytest.approx(-1.5, abs=0.3)
+        assert abs(weights["memory"]) < 0.2
+        assert result["feature_importance"]["cpu"] > result["feature_importance"]["memory"]
+        assert sum(result["feature_importance"].values()) == pytest.approx(1.0)
+
+    def test_metrics_come_from_the_validation_split(self):
+        predictor = FailurePredictor(ORG_ID)
+
+        result = predictor.train_prediction_model({"features": synthetic_observations(1000)})
+
+        assert result["training_samples"] == 1000
+        assert result["validation_samples"] == 200
+        assert 0.7 < result["accuracy"] < 1.0
+        assert 0 < result["log_loss"] < math.log(2)
+        assert 0 < result["brier_score"] < 0.25
+
+    def test_tiny_datasets_train_on_every_row(self):
+        predictor = FailurePredictor(ORG_ID)
+        observations = [
+            {"cpu": 0.2, "failed": False},
+            {"cpu": 0.3, "failed": False},
+            {"cpu": 0.9, "failed": True},
+        ]
+
+        result = predictor.train_prediction_model({"features": observations})
+
+        assert result["validation_samples"] == 0
+        assert result["accuracy"] == 1.0
+        assert predictor.predict_failure_probability(result["model_id"], {"cpu": 0.95})["failure_probability"] > 0.5
+
+    def test_split_is_deterministic(self):
+        first = FailurePredictor(ORG_ID).train_prediction_model({"features": synthetic_observations(500)})
+        second = FailurePredictor(ORG_ID).train_prediction_model({"features": synthetic_observations(500)})
+
+        assert first["accuracy"] == second["accuracy"]
+        assert first["log_loss"] == second["log_loss"]
+
+    def test_unsupported_model_type_and_invalid_config(self):
+        predictor = FailurePredictor(ORG_ID)
+        observations = synthetic_observations(20)
+
+        assert not predictor.train_prediction_model({"features": observations}, "random_forest")["model_trained"]
+        with pytest.raises(ValueError):
+            LogisticRegressionModel.train([[1.0]], [True], ["cpu"], TrainingConfig(learning_rate=2))
+
+
+class TestCalibration:
+    """Predicted probabilities match observed frequencies"""
+
+    def test_calibrated_probabilities_track_failure_rate(self):
+        observations = synthetic_observations(4000, seed=11)
+        holdout = synthetic_observations(4000, seed=12)
+        predictor = FailurePredictor(ORG_ID)
+        model_id = predictor.train_prediction_model({"features": observations})["model_id"]
+
+        predicted = [predictor._models[model_id].classifier.predict_proba(row) for row in holdout]
+        actual = [row["failed"] for row in holdout]
+
+        assert sum(predicted) / len(predicted) == pytest.approx(sum(actual) / len(actual), abs=0.03)
+        bucket = [failed for probability, failed in zip(predicted, actual) if probability >= 0.8]
+        assert sum(bucket) / len(bucket) >= 0.8
+
+    def test_platt_scaling_corrects_overconfident_scores(self):
+        rng = random.Random(5)
+        scores = [rng.uniform(-4, 4) for _ in range(5000)]
+        # Labels follow sigmoid(score / 2), so raw scores are twice too confident
+        labels = [rng.random() < 1 / (1 + math.exp(-score / 2)) for score in scores]
+
+        slope, intercept = failure_model._platt_scaling(scores, labels)
+
+        assert slope == pytest.approx(0.5, abs=0.08)
+        assert intercept == pytest.approx(0.0, abs=0.1)
+
+
+class TestMatrixAndSerialization:
+    """Columnar input and model round trips"""
+
+    def test_feature_matrix_input(self):
+        observations = synthetic_observations(600)
+        names = ["cpu", "errors", "memory"]
+        training_data = {
+            "matrix": [[row[name] for name in names] for row in observations],
+            "labels": [row["failed"] for row in observations],
+            "feature_names": names,
+        }
+        predictor = FailurePredictor(ORG_ID)
+
+        from_matrix = predictor.train_prediction_model(training_data)
+        from_rows = predictor.train_prediction_model({"features": observations})
+
+        assert from_matrix["model_trained"]
+        assert from_matrix["log_loss"] == from_rows["log_loss"]
+        mismatched = dict(training_data, feature_names=["cpu"])
+        assert not predictor.train_prediction_model(mismatched)["model_trained"]
+
+    def test_export_and_import_round_trip(self):
+        source = FailurePredictor(ORG_ID)
+        model_id = source.train_prediction_model({"features": synthetic_observations(300)})["model_id"]
+        metrics = {"cpu": 0.75, "errors": 0.04, "memory": 600}
+
+        serialized = json.loads(json.dumps(source.export_model(model_id)))
+        target = FailurePredictor(ORG_ID)
+        loaded = target.import_model(serialized)
+
+        assert loaded == {"model_loaded": True, "model_id": model_id, "organisation_id": ORG_ID}
+        assert target.predict_failure_probability(model_id, metrics) == \
+            source.predict_failure_probability(model_id, metrics)
+        assert source.export_model("missing") is None
+
+    def test_import_rejects_other_tenants_and_bad_payloads(self):
+        source = FailurePredictor(ORG_ID)
+        model_id = source.train_prediction_model({"features": synthetic_observations(50)})["model_id"]
+        serialized = source.export_model(model_id)
+
+        assert not FailurePredictor("other-org").import_model(serialized)["model_loaded"]
+        serialized["classifier"]["format_version"] = 99
+        assert not FailurePredictor(ORG_ID).import_model(serialized)["model_loaded"]
+
+
+class TestTrainingBackend:
+    """The result says which backend trained the model"""
+
+    def test_backend_follows_numpy_availability(self):
+        result = FailurePredictor(ORG_ID).train_prediction_model({"features": synthetic_observations(200)})
+
+        assert result["training_backend"] == ("numpy" if failure_model.NUMPY_AVAILABLE else "python")
+        assert ("warning" in result) == (not failure_model.NUMPY_AVAILABLE)
+
+    def test_missing_numpy_is_reported(self, monkeypatch):
+        monkeypatch.setattr(failure_model, "NUMPY_AVAILABLE", False)
+
+        result = FailurePredictor(ORG_ID).train_prediction_model({"features": synthetic_observations(200)})
+
+        assert result["model_trained"] and result["training_backend"] == "python"
+        assert "NumPy not installed" in result["warning"]
+
+    def test_explicit_python_training_is_not_a_warning(self, monkeypatch):
+        monkeypatch.setattr(failure_model, "NUMPY_AVAILABLE", False)
+
+        result = FailurePredictor(ORG_ID).train_prediction_model(
+            {"features": synthetic_observations(200)}, config=TrainingConfig(vectorized=False)
+        )
+
+        assert result["training_backend"] == "python" and "warning" not in result
+
+
+@pytest.mark.skipif(not failure_model.NUMPY_AVAILABLE, reason="NumPy not installed")
+class TestVectorizedTraining:
+    """NumPy and pure-Python paths fit the same model"""
+
+    def test_backends_agree(self):
+        observations = synthetic_observations(800)
+        names = ["cpu", "errors", "memory"]
+        matrix = [[row[name] for name in names] for row in observations]
+        labels = [row["failed"] for row in observations]
+
+        vectorized = LogisticRegressionModel.train(matrix, labels, names, TrainingConfig(validation_fraction=0.0))
+        python = LogisticRegressionModel.train(
+            matrix, labels, names, TrainingConfig(validation_fraction=0.0, vectorized=False)
+        )
+
+        assert vectorized.metrics["vectorized"] and not python.metrics["vectorized"]
+        assert vectorized.weights == pytest.approx(python.weights, abs=1e-6)
+        assert vectorized.bias == pytest.approx(python.bias, abs=1e-6)
+        assert vectorized.predict_proba_matrix(matrix[:5]) == pytest.approx(
+            [python.predict_proba(row) for row in observations[:5]], abs=1e-9
+        )
@@ -0,0 +1,115 @@
+"""
+Tests for runtime FailureRecoveryHandler.
+
+Covers the runtime behaviour layered on top of the QA-241 to QA-245 suite:
+- Recovery plans compiled once per (failure type, strategy) and shared
+- Immutable step graph with per-workflow cursor state
+- Strategy overrides scoped to one workflow
+"""
+
+import dataclasses
+
+import pytest
+
+from runtime.failure_recovery_handler import (
+    FailureRecoveryHandler,
+    RecoveryStrategy,
+    compile_recovery_plan,
+)
+
+
+ORG_ID = "org-recovery-plans-1"
+
+
+class TestCompiledPlans:
+    """compile_recovery_plan"""
+
+    def test_plans_are_cached_and_shared(self):
+        handler = FailureRecoveryHandler(ORG_ID)
+        first = handler.initiate_recovery("drill_down_failure", {}, RecoveryStrategy.COMPENSATE)
+        second = handler.initiate_recovery("drill_down_failure", {}, RecoveryStrategy.COMPENSATE)
+
+        plan = handler._workflows[first["workflow_id"]].plan
+
+        assert plan is handler._workflows[second["workflow_id"]].plan
+        assert plan is compile_recovery_plan("drill_down_failure", RecoveryStrategy.COMPENSATE)
+        assert plan is not compile_recovery_plan("evidence_retrieval", RecoveryStrategy.COMPENSATE)
+
+    def test_plan_is_an_immutable_step_chain(self):
+        plan = compile_recovery_plan("drill_down_failure", RecoveryStrategy.COMPENSATE)
+
+        assert [spec.step_type for spec in plan.steps] == [
+            "immediate_rollback", "state_verification", "compensating_action"
+        ]
+        assert [spec.next_step_id for spec in plan.steps] == [plan.steps[1].step_id, plan.steps[2].step_id, None]
+        assert plan.nested_levels == 3
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            plan.steps[0].strategy = RecoveryStrategy.SKIP
+        with pytest.raises(TypeError):
+            plan.positions["extra"] = 0
+
+    def test_strategies_keep_their_level_counts(self):
+        levels = {
+            strategy: compile_recovery_plan("x", strategy).nested_levels
+            for strategy in RecoveryStrategy
+        }
+
+        assert levels == {
+            RecoveryStrategy.RETRY: 1,
+            RecoveryStrategy.ROLLBACK: 2,
+            RecoveryStrategy.COMPENSATE: 3,
+            RecoveryStrategy.ESCALATE: 1,
+            RecoveryStrategy.SKIP: 1,
+        }
+
+
+class TestWorkflowCursor:
+    """Per-workflow mutable state"""
+
+    def test_cursor_follows_completed_steps(self):
+        handler = FailureRecoveryHandler(ORG_ID)
+        workflow_id = handler.initiate_recovery("db_failure", {}, RecoveryStrategy.COMPENSATE)["workflow_id"]
+        step_ids = handler.get_recovery_status(workflow_id)["step_ids"]
+
+        # Completing a later step first does not move the cursor past step 1
+        assert handler.execute_recovery_step(workflow_id, step_ids[1])["next_action"] == "continue_next_step"
+        assert handler.get_recovery_status(workflow_id)["next_step_id"] == step_ids[0]
+
+        handler.execute_recovery_step(workflow_id, step_ids[0])
+        assert handler.get_recovery_status(workflow_id)["next_step_id"] == step_ids[2]
+        assert handler.execute_recovery_step(workflow_id, step_ids[2])["next_action"] == "complete_recovery"
+
+        completed = handler.complete_recovery(workflow_id)
+        assert completed["completed"] and completed["steps_completed"] == 3
+
+    def test_incomplete_workflow_fails_on_completion(self):
+        handler = FailureRecoveryHandler(ORG_ID)
+        workflow_id = handler.initiate_recovery("db_failure", {}, RecoveryStrategy.ROLLBACK)["workflow_id"]
+        handler.execute_recovery_step(workflow_id, handler.get_recovery_status(workflow_id)["step_ids"][0])
+
+        result = handler.complete_recovery(workflow_id)
+
+        assert not result["completed"]
+        assert result["state"] == "failed"
+        assert result["steps_completed"] == 1 and result["total_steps"] == 2
+
+    def test_strategy_override_stays_in_its_workflow(self):
+        handler = FailureRecoveryHandler(ORG_ID)
+        overridden = handler.initiate_recovery("db_failure", {}, RecoveryStrategy.ROLLBACK)["workflow_id"]
+        untouched = handler.initiate_recovery("db_failure", {}, RecoveryStrategy.ROLLBACK)["workflow_id"]
+        step_id = handler.get_recovery_status(overridden)["step_ids"][0]
+
+        handler.execute_recovery_step(overridden, step_id, force_strategy=RecoveryStrategy.ESCALATE)
+
+        assert handler._workflows[overridden].steps[0].strategy == RecoveryStrategy.ESCALATE
+        assert handler._workflows[overridden].steps[0].completed
+        assert handler._workflows[untouched].steps[0].strategy == RecoveryStrategy.ROLLBACK
+        assert handler._workflows[overridden].audit_trail[-1]["strategy"] == "escalate"
+
+    def test_unknown_step_is_reported(self):
+        handler = FailureRecoveryHandler(ORG_ID)
+        workflow_id = handler.initiate_recovery("db_failure", {})["workflow_id"]
+
+        result = handler.execute_recovery_step(workflow_id, "missing")
+
+        assert result["next_action"] == "step_not_found"
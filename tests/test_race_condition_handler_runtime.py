@@ -0,0 +1,145 @@
+"""
+Tests for runtime RaceDetector.
+
+Covers the runtime behaviour layered on top of the QA-398 suite:
+- Detection from incrementally tracked write gaps
+- Sliding retention window and eviction of idle resources
+- Out-of-order write timestamps
+- Concurrent recording across lock stripes
+"""
+
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from runtime.race_condition_handler import AccessAttempt, RaceDetector
+
+
+ORG_ID = "org-race-1"
+EPOCH = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    """Settable clock in seconds since the epoch"""
+
+    def __init__(self):
+        self.now = EPOCH.timestamp()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def write(resource_id: str, offset_ms: float, accessor_id: str = "user", operation: str = "write") -> AccessAttempt:
+    """Access attempt offset_ms after EPOCH"""
+    return AccessAttempt(
+        resource_id=resource_id,
+        accessor_id=accessor_id,
+        operation=operation,
+        timestamp=EPOCH + timedelta(milliseconds=offset_ms),
+        organisation_id=ORG_ID
+    )
+
+
+class TestSlidingWindow:
+    """Incremental detection within the retention window"""
+
+    def test_close_writes_are_a_race(self):
+        clock = FakeClock()
+        detector = RaceDetector(retention_ms=1000, clock=clock)
+        detector.record_access(write("doc", 0, "user_1"))
+        detector.record_access(write("doc", 500, "user_2"))
+        assert not detector.is_race_detected("doc", time_window_ms=100)
+
+        detector.record_access(write("doc", 550, "user_1"))
+
+        assert detector.is_race_detected("doc", time_window_ms=100)
+        assert not detector.is_race_detected("doc", time_window_ms=40)
+
+    def test_reads_are_not_races(self):
+        detector = RaceDetector(clock=FakeClock())
+        detector.record_access(write("doc", 0, operation="read"))
+        detector.record_access(write("doc", 1, operation="read"))
+        detector.record_access(write("doc", 2))
+
+        assert not detector.is_race_detected("doc")
+
+    def test_race_expires_with_the_window(self):
+        clock = FakeClock()
+        detector = RaceDetector(retention_ms=1000, clock=clock)
+        detector.record_access(write("doc", 0))
+        detector.record_access(write("doc", 10))
+        detector.record_access(write("doc", 900))
+        clock.now += 0.9
+        assert detector.is_race_detected("doc")
+
+        clock.now += 0.5  # The 0/10 ms pair is now outside the window
+        assert not detector.is_race_detected("doc")
+
+        clock.now += 1.0
+        assert not detector.is_race_detected("doc")
+        assert detector.get_stats() == {"resources": 0, "buffered_writes": 0}
+
+    def test_late_arrival_is_compared_with_its_neighbours(self):
+        detector = RaceDetector(clock=FakeClock())
+        detector.record_access(write("doc", 0))
+        detector.record_access(write("doc", 500))
+        detector.record_access(write("doc", 480))  # Recorded late
+
+        assert detector.is_race_detected("doc", time_window_ms=50)
+
+    def test_late_arrival_does_not_evict_newer_gaps(self):
+        clock = FakeClock()
+        detector = RaceDetector(retention_ms=10_000, clock=clock)
+        for offset_ms in (0, 5000, 5500, 50):  # The 50 ms write is recorded late
+            detector.record_access(write("doc", offset_ms))
+        assert detector.is_race_detected("doc", time_window_ms=100)
+
+        clock.now += 10.2  # Only the 5000/5500 ms pair is left in the window
+
+        assert not detector.is_race_detected("doc", time_window_ms=100)
+        assert detector.is_race_detected("doc", time_window_ms=600)
+
+    def test_memory_is_bounded_by_the_window(self):
+        clock = FakeClock()
+        detector = RaceDetector(retention_ms=100, lock_stripes=4, clock=clock)
+        for i in range(5000):
+            clock.now = EPOCH.timestamp() + i / 1000
+            detector.record_access(write(f"resource_{i}", i))
+            detector.record_access(write("hot", i))
+
+        stats = detector.get_stats()
+        assert stats["buffered_writes"] < 5000 // 4 + 2 * 101
+        assert stats["resources"] < 5000 // 4 + 101
+
+    def test_invalid_configuration_is_rejected(self):
+        with pytest.raises(ValueError):
+            RaceDetector(lock_stripes=0)
+
+
+class TestStripedLocking:
+    """Concurrent recording"""
+
+    def test_concurrent_writers_on_many_resources(self):
+        detector = RaceDetector(lock_stripes=8)
+        barrier = threading.Barrier(8)
+
+        def writer(thread_index: int) -> None:
+            barrier.wait()
+            for i in range(500):
+                detector.record_access(AccessAttempt(
+                    resource_id=f"resource_{i % 50}",
+                    accessor_id=f"thread_{thread_index}",
+                    operation="write",
+                    timestamp=datetime.now(timezone.utc),
+                    organisation_id=ORG_ID
+                ))
+
+        threads = [threading.Thread(target=writer, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert detector.get_stats()["buffered_writes"] == 4000
+        assert all(detector.is_race_detected(f"resource_{i}") for i in range(50))
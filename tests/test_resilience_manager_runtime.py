@@ -0,0 +1,183 @@
+"""
+Tests for runtime ResilienceManager.
+
+Covers the runtime behaviour layered on top of the QA-266 to QA-270 suite:
+- Bulkhead callers waiting up to max_wait_duration_ms for a slot
+- FIFO hand-off of released slots to queued callers
+- The bulkhead context manager
+- Per-bulkhead queue, wait and rejection metrics
+"""
+
+import threading
+import time
+
+import pytest
+
+from runtime.resilience_manager import BulkheadFullError, ResilienceManager
+
+
+ORG_ID = "org-resilience-1"
+
+
+def wait_for_queue(manager: ResilienceManager, bulkhead_id: str, depth: int) -> None:
+    """Block until depth callers are queued on the bulkhead"""
+    deadline = time.monotonic() + 5
+    while manager.get_bulkhead_metrics(bulkhead_id)["queue_depth"] < depth:
+        assert time.monotonic() < deadline, "callers never queued"
+        time.sleep(0.001)
+
+
+class TestBulkhead:
+    """Blocking, fair bulkhead slots"""
+
+    def test_waiter_gets_slot_when_released(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=5000)
+        assert manager.acquire_bulkhead_slot(bulkhead_id, "first")["acquired"]
+        results = {}
+        waiter = threading.Thread(
+            target=lambda: results.update(second=manager.acquire_bulkhead_slot(bulkhead_id, "second"))
+        )
+        waiter.start()
+        wait_for_queue(manager, bulkhead_id, 1)
+
+        released = manager.release_bulkhead_slot(bulkhead_id, "first")
+        waiter.join(timeout=5)
+
+        assert released["handed_to"] == "second"
+        assert results["second"]["acquired"]
+        assert results["second"]["wait_ms"] > 0
+        metrics = manager.get_bulkhead_metrics(bulkhead_id)
+        assert metrics["current_calls"] == 1
+        assert metrics["queued"] == 1 and metrics["queue_depth"] == 0
+
+    def test_wait_is_bounded_by_max_wait_duration(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=50)
+        manager.acquire_bulkhead_slot(bulkhead_id, "holder")
+
+        started = time.monotonic()
+        result = manager.acquire_bulkhead_slot(bulkhead_id, "late")
+
+        assert not result["acquired"]
+        assert result["reason"] == "capacity_reached"
+        assert 0.045 <= time.monotonic() - started < 2
+        metrics = manager.get_bulkhead_metrics(bulkhead_id)
+        assert metrics["rejected"] == 1 and metrics["queue_depth"] == 0
+
+    def test_zero_wait_rejects_immediately(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=5000)
+        manager.acquire_bulkhead_slot(bulkhead_id, "holder")
+
+        result = manager.acquire_bulkhead_slot(bulkhead_id, "late", max_wait_ms=0)
+
+        assert not result["acquired"] and result["wait_ms"] == 0.0
+
+    def test_released_slots_go_to_waiters_in_arrival_order(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=5000)
+        manager.acquire_bulkhead_slot(bulkhead_id, "holder")
+        order = []
+        lock = threading.Lock()
+
+        def acquire(request_id: str) -> None:
+            manager.acquire_bulkhead_slot(bulkhead_id, request_id)
+            with lock:
+                order.append(request_id)
+            manager.release_bulkhead_slot(bulkhead_id, request_id)
+
+        waiters = []
+        for i in range(5):
+            waiter = threading.Thread(target=acquire, args=(f"w{i}",))
+            waiter.start()
+            wait_for_queue(manager, bulkhead_id, i + 1)
+            waiters.append(waiter)
+
+        manager.release_bulkhead_slot(bulkhead_id, "holder")
+        for waiter in waiters:
+            waiter.join(timeout=5)
+
+        assert order == [f"w{i}" for i in range(5)]
+        assert manager.get_bulkhead_metrics(bulkhead_id)["peak_queue_depth"] == 5
+
+    def test_new_caller_does_not_overtake_queue(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=5000)
+        manager.acquire_bulkhead_slot(bulkhead_id, "holder")
+        waiter = threading.Thread(target=manager.acquire_bulkhead_slot, args=(bulkhead_id, "queued"))
+        waiter.start()
+        wait_for_queue(manager, bulkhead_id, 1)
+
+        manager.release_bulkhead_slot(bulkhead_id, "holder")
+        barging = manager.acquire_bulkhead_slot(bulkhead_id, "barging", max_wait_ms=0)
+        waiter.join(timeout=5)
+
+        assert not barging["acquired"]
+
+    def test_release_of_unknown_request_is_refused(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=2, max_wait_duration_ms=0)
+
+        assert manager.release_bulkhead_slot(bulkhead_id, "nobody")["reason"] == "slot_not_held"
+        assert manager.acquire_bulkhead_slot(bulkhead_id, "a")["acquired"]
+        assert manager.acquire_bulkhead_slot(bulkhead_id, "a")["reason"] == "duplicate_request"
+
+
+class TestBulkheadContext:
+    """with manager.bulkhead(...)"""
+
+    def test_slot_is_released_on_exit_and_on_error(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=0)
+
+        with manager.bulkhead(bulkhead_id) as request_id:
+            assert manager.get_bulkhead_metrics(bulkhead_id)["current_calls"] == 1
+            assert request_id
+        with pytest.raises(RuntimeError):
+            with manager.bulkhead(bulkhead_id):
+                raise RuntimeError("query failed")
+
+        assert manager.get_bulkhead_metrics(bulkhead_id)["current_calls"] == 0
+
+    def test_full_bulkhead_raises(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=1, max_wait_duration_ms=10)
+
+        with manager.bulkhead(bulkhead_id):
+            with pytest.raises(BulkheadFullError) as error:
+                with manager.bulkhead(bulkhead_id):
+                    pass
+
+        assert error.value.bulkhead_id == bulkhead_id
+        assert error.value.waited_ms > 0
+        with pytest.raises(KeyError):
+            with manager.bulkhead("missing"):
+                pass
+
+    def test_concurrency_never_exceeds_capacity(self):
+        manager = ResilienceManager(ORG_ID)
+        bulkhead_id = manager.create_bulkhead("db", max_concurrent_calls=3, max_wait_duration_ms=5000)
+        active = [0]
+        peak = [0]
+        lock = threading.Lock()
+
+        def call() -> None:
+            with manager.bulkhead(bulkhead_id):
+                with lock:
+                    active[0] += 1
+                    peak[0] = max(peak[0], active[0])
+                time.sleep(0.002)
+                with lock:
+                    active[0] -= 1
+
+        workers = [threading.Thread(target=call) for _ in range(24)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=10)
+
+        metrics = manager.get_bulkhead_metrics(bulkhead_id)
+        assert peak[0] == 3
+        assert metrics["acquired"] == 24 and metrics["rejected"] == 0
+        assert metrics["current_calls"] == 0
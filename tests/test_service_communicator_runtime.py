@@ -0,0 +1,852 @@
+"""
+Tests for runtime.integration ServiceCommunicator.
+
+Covers the runtime behaviour layered on top of the QA-471 to QA-475 suite:
+- Pooled keep-alive HTTP transport against the local stub server
+- Per-host concurrency limits and connect/read timeouts
+- Stale keep-alive retries limited to idempotent methods
+- Response streaming
+- Bounded request/response history and latency histograms
+- Hedged and coalesced idempotent requests
+- Asyncio send and concurrency-limited gather_requests fan-out
+- Negotiated compression, binary encoding and payload sealing
+- Sealing keys from a dedicated shared secret, never from sent credentials
+"""
+
+import asyncio
+import base64
+import json
+import lzma
+import os
+import socket
+import threading
+import time
+import zlib
+
+import pytest
+
+from runtime.integration import payload_codec
+from runtime.integration.http_transport import HttpTransport, TransportConfig, TransportError
+from runtime.integration.payload_codec import (
+    BINARY_CONTENT_TYPE,
+    DEFLATE,
+    SEAL_FRAME_AEAD,
+    SEAL_FRAME_STREAM,
+    SEALED,
+    XZ,
+    CodecConfig,
+    PayloadCodec,
+    PayloadIntegrityError,
+    PeerCapabilities,
+    binary_dumps,
+    binary_loads,
+    derive_sealing_key,
+    seal,
+    unseal,
+)
+from runtime.integration.service_communicator import (
+    HedgingPolicy,
+    LatencyHistogram,
+    RequestSpec,
+    RetryPolicy,
+    SecurityLevel,
+    ServiceCommunicator,
+    ServiceEndpoint,
+    ServiceState,
+)
+from runtime.integration.stub_server import StubServiceServer
+
+
+ORG_ID = "org-transport"
+
+
+@pytest.fixture
+def stub():
+    with StubServiceServer() as server:
+        yield server
+
+
+def make_communicator(server, **config) -> ServiceCommunicator:
+    """Communicator with an HTTP transport and the stub registered as 'stub'"""
+    communicator = ServiceCommunicator(transport=HttpTransport(TransportConfig(**config)))
+    communicator.register_service(ORG_ID, "stub", "Stub Service", server.host, server.port)
+    return communicator
+
+
+def unused_port() -> int:
+    """A localhost port with nothing listening"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def drop_second_request_server(received: list) -> tuple[socket.socket, threading.Thread]:
+    """
+    Server that answers the first request on each connection, then reads the
+    next one and closes without replying, like a keep-alive peer timing out
+    """
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    listener.listen()
+
+    def serve():
+        while True:
+            try:
+                conn, _ = listener.accept()
+            except OSError:
+                return
+            with conn:
+                for reply in (True, False):
+                    data = conn.recv(65536)
+                    if not data:
+                        break
+                    received.append(data.split(b"\r\n", 1)[0].decode())
+                    if reply:
+                        conn.sendall(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return listener, thread
+
+
+class TestHttpTransport:
+    """Real requests over pooled connections"""
+
+    def test_request_round_trips_through_stub(self, stub):
+        communicator = make_communicator(stub)
+        communicator.configure_security(ORG_ID, SecurityLevel.BASIC, api_key="key-1")
+
+        response = communicator.send_request(
+            ORG_ID, "source", "stub", "POST", "/api/data", {"key": "value"}
+        )
+
+        assert response.status_code == 200
+        assert response.payload["echo"] == {"key": "value"}
+        assert response.payload["organisation_id"] == ORG_ID
+        assert communicator.get_response(ORG_ID, response.request_id) is response
+        communicator.close()
+
+    def test_keep_alive_connection_is_reused(self, stub):
+        communicator = make_communicator(stub)
+
+        for _ in range(5):
+            assert communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {}).is_successful()
+
+        stats = communicator.transport.get_pool_stats()[0]
+        assert stats.created == 1
+        assert stats.reused == 4
+        assert stats.in_use == 0
+        communicator.close()
+
+    def test_per_host_concurrency_limit(self):
+        with StubServiceServer(delay_seconds=0.1) as server:
+            communicator = make_communicator(server, max_connections_per_host=2)
+            results = []
+
+            def call():
+                results.append(communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {}))
+
+            threads = [threading.Thread(target=call) for _ in range(4)]
+            start = time.monotonic()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert time.monotonic() - start >= 0.2
+            assert all(r.is_successful() for r in results)
+            assert communicator.transport.get_pool_stats()[0].created <= 2
+            communicator.close()
+
+    def test_pool_wait_timeout_maps_to_504(self):
+        with StubServiceServer(delay_seconds=0.3) as server:
+            communicator = make_communicator(
+                server, max_connections_per_host=1, pool_wait_timeout_seconds=0.05
+            )
+            blocker = threading.Thread(
+                target=communicator.send_request, args=(ORG_ID, "s", "stub", "GET", "/x", {})
+            )
+            blocker.start()
+            time.sleep(0.05)
+
+            response = communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {})
+            blocker.join()
+
+            assert response.status_code == 504
+            assert communicator.transport.get_pool_stats()[0].wait_timeouts == 1
+            communicator.close()
+
+    def test_read_timeout_maps_to_504(self):
+        with StubServiceServer(delay_seconds=1.5) as server:
+            communicator = make_communicator(server)
+            response = communicator.send_request(
+                ORG_ID, "s", "stub", "GET", "/slow", {}, timeout_seconds=1
+            )
+            assert response.status_code == 504
+            communicator.close()
+
+    def test_connection_refused_is_retried_as_503(self):
+        communicator = ServiceCommunicator(
+            transport=HttpTransport(TransportConfig(connect_timeout_seconds=0.5))
+        )
+        communicator.register_service(ORG_ID, "down", "Down", "127.0.0.1", unused_port())
+
+        response = communicator.send_request_with_retry(
+            ORG_ID, "s", "down", "GET", "/x", {},
+            retry_policy=RetryPolicy(max_retries=2, initial_delay_seconds=0.01)
+        )
+
+        assert response.status_code == 503
+        assert len(communicator.requests[ORG_ID]) == 2
+
+    def test_stale_connection_retries_only_idempotent_methods(self):
+        received = []
+        listener, thread = drop_second_request_server(received)
+        endpoint = ServiceEndpoint("flaky", "Flaky", "127.0.0.1", listener.getsockname()[1])
+        transport = HttpTransport()
+
+        try:
+            assert transport.request(endpoint, "GET", "/a").status_code == 200
+            assert transport.request(endpoint, "GET", "/b").status_code == 200
+            assert received == ["GET /a HTTP/1.1", "GET /b HTTP/1.1", "GET /b HTTP/1.1"]
+
+            # The server may already have acted on a POST body; it is not resent
+            received.clear()
+            with pytest.raises(TransportError):
+                transport.request(endpoint, "POST", "/c", body=b"{}")
+            assert received == ["POST /c HTTP/1.1"]
+        finally:
+            transport.close()
+            listener.close()
+
+    def test_unexpected_error_releases_connection_slot(self, stub):
+        transport = HttpTransport(
+            TransportConfig(max_connections_per_host=1, pool_wait_timeout_seconds=0.2)
+        )
+        endpoint = ServiceEndpoint("stub", "Stub", stub.host, stub.port)
+
+        with pytest.raises(ValueError):
+            transport.request(endpoint, "GET", "/x", headers={"X-Bad": "a\r\nb"})
+
+        assert transport.request(endpoint, "GET", "/x").status_code == 200
+        assert transport.get_pool_stats()[0].in_use == 0
+        transport.close()
+
+    def test_streaming_large_response(self, stub):
+        body = bytes(range(256)) * 4096  # 1 MiB
+        stub.add_route("GET", "/bundle", lambda m, p, h, b: (200, body))
+        communicator = make_communicator(stub)
+
+        with communicator.stream_request(ORG_ID, "s", "stub", "GET", "/bundle") as response:
+            chunks = list(response.iter_content(chunk_size=65536))
+
+        assert response.status_code == 200
+        assert len(chunks) == 16
+        assert b"".join(chunks) == body
+
+        # Connection went back to the pool after the body was consumed
+        communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {})
+        assert communicator.transport.get_pool_stats()[0].reused == 1
+        communicator.close()
+
+    def test_health_check_uses_transport(self, stub):
+        communicator = make_communicator(stub)
+
+        assert communicator.perform_health_check(ORG_ID, "stub").state == ServiceState.HEALTHY
+
+        stub.add_route("GET", "/health", lambda m, p, h, b: (500, {"ok": False}))
+        assert communicator.perform_health_check(ORG_ID, "stub").state == ServiceState.UNHEALTHY
+        assert stub.request_log[("GET", "/health")] == 2
+        communicator.close()
+
+
+class TestBoundedHistory:
+    """Ring-buffer history with O(1) correlation"""
+
+    def test_history_is_bounded_and_indexed(self):
+        communicator = ServiceCommunicator(history_size=10)
+        communicator.register_service(ORG_ID, "svc", "Service", "localhost", 8080)
+
+        responses = [
+            communicator.send_request(ORG_ID, "s", "svc", "GET", "/x", {}) for _ in range(25)
+        ]
+
+        assert len(communicator.requests[ORG_ID]) == 10
+        assert len(communicator.responses[ORG_ID]) == 10
+        assert len(communicator.response_index[ORG_ID]) == 10
+        assert communicator.get_response(ORG_ID, responses[0].request_id) is None
+        assert communicator.get_response(ORG_ID, responses[-1].request_id) is responses[-1]
+        assert communicator.get_in_flight_requests(ORG_ID) == []
+
+    def test_in_flight_requests_are_tracked(self):
+        with StubServiceServer(delay_seconds=0.2) as server:
+            communicator = make_communicator(server)
+            sender = threading.Thread(
+                target=communicator.send_request, args=(ORG_ID, "s", "stub", "GET", "/x", {})
+            )
+            sender.start()
+            time.sleep(0.1)
+
+            in_flight = communicator.get_in_flight_requests(ORG_ID)
+            assert [r.target_service for r in in_flight] == ["stub"]
+
+            sender.join()
+            assert communicator.get_in_flight_requests(ORG_ID) == []
+            communicator.close()
+
+    def test_latency_histogram_per_endpoint(self, stub):
+        communicator = make_communicator(stub)
+        stub.add_route("GET", "/fail", lambda m, p, h, b: (500, {}))
+
+        for _ in range(9):
+            communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {})
+        communicator.send_request(ORG_ID, "s", "stub", "GET", "/fail", {})
+        communicator.send_request(ORG_ID, "s", "missing", "GET", "/x", {})
+
+        stats = communicator.get_latency_stats(ORG_ID, "stub")
+        assert stats["count"] == 10
+        assert stats["errors"] == 1
+        assert 0 < stats["p50_ms"] <= stats["p95_ms"] <= stats["max_ms"]
+        assert sum(stats["buckets"].values()) == 10
+        assert communicator.get_latency_stats(ORG_ID, "missing") is None
+        communicator.close()
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram()
+        for latency in [0.5] * 90 + [150] * 9 + [40000]:
+            histogram.record(latency)
+
+        assert histogram.percentile(50) == 1
+        assert histogram.percentile(95) == 200
+        assert histogram.percentile(100) == 40000
+        assert LatencyHistogram().percentile(95) is None
+
+
+def slow_first_call(delay_seconds: float):
+    """Stub handler that is slow on its first call only"""
+    calls = []
+    lock = threading.Lock()
+
+    def handler(method, path, headers, body):
+        with lock:
+            calls.append(path)
+            first = len(calls) == 1
+        if first:
+            time.sleep(delay_seconds)
+        return 200, {"attempt": len(calls)}
+
+    return handler
+
+
+class TestHedgingAndCoalescing:
+    """Tail-latency hedging and in-flight coalescing"""
+
+    def test_hedge_wins_over_slow_primary(self, stub):
+        stub.add_route("GET", "/report", slow_first_call(1.0))
+        communicator = make_communicator(stub)
+        policy = HedgingPolicy(default_delay_ms=50)
+
+        start = time.monotonic()
+        response = communicator.send_idempotent_request(
+            ORG_ID, "s", "stub", "GET", "/report", {}, hedging_policy=policy
+        )
+
+        assert time.monotonic() - start < 0.8
+        assert response.is_successful()
+        assert response.payload["attempt"] == 2
+        stats = communicator.get_hedging_stats(ORG_ID)
+        assert stats["hedges_sent"] == 1
+        assert stats["hedge_wins"] == 1
+        communicator.close()
+
+    def test_fast_response_is_not_hedged(self, stub):
+        communicator = make_communicator(stub)
+
+        response = communicator.send_idempotent_request(
+            ORG_ID, "s", "stub", "GET", "/x", {}, hedging_policy=HedgingPolicy(default_delay_ms=500)
+        )
+
+        assert response.is_successful()
+        assert communicator.get_hedging_stats(ORG_ID)["hedges_sent"] == 0
+        assert stub.request_count == 1
+        communicator.close()
+
+    def test_unhealthy_target_is_not_hedged(self, stub):
+        stub.add_route("GET", "/health", lambda m, p, h, b: (503, {}))
+        stub.add_route("GET", "/report", slow_first_call(0.3))
+        communicator = make_communicator(stub)
+        assert communicator.perform_health_check(ORG_ID, "stub").state == ServiceState.UNHEALTHY
+
+        response = communicator.send_idempotent_request(
+            ORG_ID, "s", "stub", "GET", "/report", {}, hedging_policy=HedgingPolicy(default_delay_ms=20)
+        )
+
+        assert response.payload["attempt"] == 1
+        stats = communicator.get_hedging_stats(ORG_ID)
+        assert stats["hedges_sent"] == 0
+        assert stats["hedges_skipped_unhealthy"] == 1
+        communicator.close()
+
+    def test_hedge_delay_follows_observed_percentile(self, stub):
+        communicator = make_communicator(stub)
+        policy = HedgingPolicy(default_delay_ms=1000, min_samples=5, min_delay_ms=1)
+
+        assert communicator._hedge_delay_ms(ORG_ID, "stub", policy) == 1000
+        for _ in range(5):
+            communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {})
+        assert communicator._hedge_delay_ms(ORG_ID, "stub", policy) < 1000
+        communicator.close()
+
+    def test_identical_requests_are_coalesced(self):
+        with StubServiceServer(delay_seconds=0.2) as server:
+            communicator = make_communicator(server)
+            results = []
+
+            def call():
+                results.append(communicator.send_idempotent_request(
+                    ORG_ID, "s", "stub", "GET", "/config", {"scope": "all"}
+                ))
+
+            threads = [threading.Thread(target=call) for _ in range(5)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert server.request_count == 1
+            assert len({id(r) for r in results}) == 1
+            assert communicator.get_hedging_stats(ORG_ID)["coalesced"] == 4
+            communicator.close()
+
+    def test_non_idempotent_requests_are_never_coalesced(self):
+        with StubServiceServer(delay_seconds=0.1) as server:
+            communicator = make_communicator(server)
+
+            threads = [
+                threading.Thread(
+                    target=communicator.send_idempotent_request,
+                    args=(ORG_ID, "s", "stub", "POST", "/create", {"n": 1})
+                )
+                for _ in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert server.request_count == 3
+            communicator.close()
+
+    def test_retry_with_hedging(self, stub):
+        failures = []
+
+        def flaky(method, path, headers, body):
+            if len(failures) < 1:
+                failures.append(path)
+                return 503, {}
+            return 200, {"ok": True}
+
+        stub.add_route("GET", "/flaky", flaky)
+        communicator = make_communicator(stub)
+
+        response = communicator.send_request_with_retry(
+            ORG_ID, "s", "stub", "GET", "/flaky", {},
+            retry_policy=RetryPolicy(max_retries=3, initial_delay_seconds=0.01),
+            hedging_policy=HedgingPolicy(default_delay_ms=200),
+            coalesce=True
+        )
+
+        assert response.is_successful()
+        assert stub.request_count == 2
+        communicator.close()
+
+
+class TestAsyncRequests:
+    """Coroutine API over the async transport"""
+
+    def test_send_round_trips_and_reuses_connection(self, stub):
+        communicator = make_communicator(stub)
+        communicator.configure_security(ORG_ID, SecurityLevel.BASIC, api_key="key-1")
+
+        async def scenario():
+            responses = [
+                await communicator.send(ORG_ID, "s", "stub", "POST", "/api", {"n": i})
+                for i in range(3)
+            ]
+            stats = communicator.async_transport.get_pool_stats()[0]
+            await communicator.aclose()
+            return responses, stats
+
+        responses, stats = asyncio.run(scenario())
+
+        assert [r.payload["echo"] for r in responses] == [{"n": 0}, {"n": 1}, {"n": 2}]
+        assert responses[0].payload["organisation_id"] == ORG_ID
+        assert communicator.get_response(ORG_ID, responses[0].request_id) is responses[0]
+        assert (stats.created, stats.reused, stats.in_use) == (1, 2, 0)
+        assert communicator.async_transport.get_pool_stats() == []
+        assert stub.request_count == 3
+        assert communicator.get_latency_stats(ORG_ID, "stub")["count"] == 3
+
+    def test_send_retries_with_tenant_policy(self, stub):
+        calls = []
+
+        def flaky(method, path, headers, body):
+            calls.append(path)
+            return (503, {}) if len(calls) < 3 else (200, {"ok": True})
+
+        stub.add_route("GET", "/flaky", flaky)
+        communicator = make_communicator(stub)
+        communicator.set_retry_policy(ORG_ID, RetryPolicy(max_retries=3, initial_delay_seconds=0.01))
+
+        response = asyncio.run(communicator.send(ORG_ID, "s", "stub", "GET", "/flaky", {}))
+
+        assert response.is_successful()
+        assert len(calls) == 3
+
+    def test_gather_preserves_order_across_services(self):
+        servers = [StubServiceServer().start() for _ in range(3)]
+        try:
+            communicator = ServiceCommunicator(transport=HttpTransport())
+            for i, server in enumerate(servers):
+                communicator.register_service(ORG_ID, f"svc-{i}", f"Service {i}", server.host, server.port)
+            specs = [RequestSpec(f"svc-{i % 3}", "POST", f"/item/{i}", {"i": i}) for i in range(9)]
+
+            responses = asyncio.run(communicator.gather_requests(ORG_ID, "s", specs))
+
+            assert [r.payload["path"] for r in responses] == [f"/item/{i}" for i in range(9)]
+            assert all(server.request_count == 3 for server in servers)
+        finally:
+            for server in servers:
+                server.stop()
+
+    def test_gather_respects_concurrency_cap(self):
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def tracked(method, path, headers, body):
+            with lock:
+                active.append(path)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(path)
+            return 200, {}
+
+        with StubServiceServer() as server:
+            for i in range(8):
+                server.add_route("GET", f"/r{i}", tracked)
+            communicator = make_communicator(server)
+            specs = [RequestSpec("stub", "GET", f"/r{i}") for i in range(8)]
+
+            responses = asyncio.run(communicator.gather_requests(ORG_ID, "s", specs, max_concurrency=2))
+
+        assert all(r.is_successful() for r in responses)
+        assert max(peak) == 2
+
+    def test_gather_deadline_answers_stragglers_with_504(self):
+        with StubServiceServer(delay_seconds=1.0) as server:
+            communicator = make_communicator(server)
+            specs = [RequestSpec("stub", "GET", "/slow") for _ in range(4)]
+
+            start = time.monotonic()
+            responses = asyncio.run(communicator.gather_requests(
+                ORG_ID, "s", specs, max_concurrency=2, deadline_seconds=0.2,
+                retry_policy=RetryPolicy(max_retries=0)
+            ))
+            elapsed = time.monotonic() - start
+
+        assert [r.status_code for r in responses] == [504] * 4
+        assert elapsed < 0.8
+        assert communicator.get_in_flight_requests(ORG_ID) == []
+
+    def test_without_transport_requests_are_simulated(self):
+        communicator = ServiceCommunicator()
+        communicator.register_service(ORG_ID, "svc", "Service", "localhost", 8080)
+
+        async def scenario():
+            return await communicator.gather_requests(ORG_ID, "s", [
+                RequestSpec("svc", "GET", "/a"),
+                RequestSpec("missing", "GET", "/b"),
+            ], retry_policy=RetryPolicy(max_retries=0))
+
+        found, missing = asyncio.run(scenario())
+
+        assert found.status_code == 200
+        assert missing.status_code == 404
+
+
+def evidence_bundle(items: int) -> dict:
+    """A compressible payload shaped like an evidence bundle"""
+    return {
+        "bundle_id": "bundle-1",
+        "items": [
+            {"control_id": f"C-{i}", "status": "passed", "score": i % 5, "notes": "reviewed"}
+            for i in range(items)
+        ],
+    }
+
+
+class TestPayloadCodec:
+    """Binary format, compression thresholds and sealing"""
+
+    def test_binary_round_trip(self):
+        payload = {
+            "text": "h\u00e9llo",
+            "numbers": [0, 1, -1, 2 ** 70, -(2 ** 70), 1.5],
+            "flags": [True, False, None],
+            "raw": b"\x00\x01",
+            "nested": {"a": {"b": []}},
+        }
+
+        assert binary_loads(binary_dumps(payload)) == payload
+
+    def test_binary_interns_repeated_keys(self):
+        payload = evidence_bundle(200)
+
+        assert len(binary_dumps(payload)) < len(json.dumps(payload)) * 0.6
+
+    def test_malformed_binary_is_rejected(self):
+        with pytest.raises(PayloadIntegrityError):
+            binary_loads(binary_dumps({"key": "value"})[:-2])
+
+    def test_decompression_is_bounded(self):
+        codec = PayloadCodec(CodecConfig(max_decoded_bytes=1024 * 1024))
+        bomb = b"\x00" * (8 * 1024 * 1024)
+
+        for coding, body in ((DEFLATE, zlib.compress(bomb)), (XZ, lzma.compress(bomb))):
+            with pytest.raises(PayloadIntegrityError, match="exceeds"):
+                codec.decode(body, None, [coding])
+        with pytest.raises(PayloadIntegrityError, match="truncated"):
+            codec.decode(zlib.compress(b'{"a": 1}')[:-3], None, [DEFLATE])
+        with pytest.raises(PayloadIntegrityError):
+            codec.decode(b"[]" + b" " * (2 * 1024 * 1024))
+
+    def test_deep_nesting_is_rejected(self):
+        codec = PayloadCodec()
+
+        with pytest.raises(PayloadIntegrityError):
+            codec.decode(b"\x07\x01" * 100000 + b"\x00", BINARY_CONTENT_TYPE)  # 100k nested lists
+        with pytest.raises(PayloadIntegrityError):
+            codec.decode(b"[" * 100000 + b"]" * 100000)
+
+    def test_non_str_keys_are_coerced_like_json(self):
+        payload = {1: "a" * 70000, 2.5: [{None: True, False: 0}]}
+        peer = PeerCapabilities(binary=True)
+
+        encoded = PayloadCodec().encode(payload, peer)
+        decoded, _ = PayloadCodec().decode(encoded.body, encoded.content_type)
+
+        assert encoded.content_type == BINARY_CONTENT_TYPE
+        assert decoded == json.loads(json.dumps(payload))
+
+    def test_seal_round_trip_and_tamper_detection(self):
+        key = derive_sealing_key("secret", ORG_ID)
+        frame = seal(b"sensitive", key)
+
+        assert b"sensitive" not in frame
+        assert unseal(frame, key) == b"sensitive"
+
+        tampered = bytearray(frame)
+        tampered[20] ^= 1
+        with pytest.raises(PayloadIntegrityError):
+            unseal(bytes(tampered), key)
+        with pytest.raises(PayloadIntegrityError):
+            unseal(frame, derive_sealing_key("secret", "other-org"))
+
+    @pytest.mark.skipif(not payload_codec.AEAD_AVAILABLE, reason="cryptography not installed")
+    def test_seal_uses_aes_gcm_when_available(self):
+        key = derive_sealing_key("secret", ORG_ID)
+        frame = seal(b"sensitive", key)
+
+        assert frame[0] == SEAL_FRAME_AEAD and len(frame) == 1 + 12 + len(b"sensitive") + 16
+        assert unseal(frame, key) == b"sensitive"
+        with pytest.raises(PayloadIntegrityError):
+            unseal(frame, derive_sealing_key("secret", "other-org"))
+
+    def test_fallback_frames_still_open(self, monkeypatch):
+        key = derive_sealing_key("secret", ORG_ID)
+        monkeypatch.setattr(payload_codec, "AEAD_AVAILABLE", False)
+        frame = seal(b"sensitive", key)
+        monkeypatch.undo()
+
+        assert frame[0] == SEAL_FRAME_STREAM
+        assert unseal(frame, key) == b"sensitive"
+
+    def test_compression_follows_size_thresholds(self):
+        codec = PayloadCodec()
+        peer = PeerCapabilities(content_codings=frozenset({DEFLATE, XZ}))
+
+        assert codec.encode({"small": 1}, peer).content_encoding == []
+        assert codec.encode(evidence_bundle(50), peer).content_encoding == [DEFLATE]
+        assert codec.encode(evidence_bundle(5000), peer).content_encoding == [XZ]
+        # Nothing negotiated: identity
+        assert codec.encode(evidence_bundle(5000)).content_encoding == []
+        # Incompressible data is sent as-is
+        assert codec.encode({"blob": os.urandom(4096).hex()}, peer).content_encoding in ([], [DEFLATE])
+
+    def test_decode_reverses_pipeline(self):
+        codec = PayloadCodec()
+        key = derive_sealing_key("secret", ORG_ID)
+        peer = PeerCapabilities(content_codings=frozenset({DEFLATE}), binary=True)
+        payload = evidence_bundle(3000)
+
+        encoded = PayloadCodec().encode(payload, peer, key)
+        decoded, _ = codec.decode(encoded.body, encoded.content_type, encoded.content_encoding, key)
+
+        assert encoded.content_encoding == [DEFLATE, SEALED]
+        assert decoded == payload
+
+
+class TestPayloadEncryption:
+    """encrypt_payload / decrypt_payload seal with the tenant credential"""
+
+    def test_envelope_hides_payload(self):
+        communicator = ServiceCommunicator()
+        communicator.configure_security(ORG_ID, SecurityLevel.ENCRYPTED, token="token-1")
+
+        envelope = communicator.encrypt_payload(ORG_ID, {"password": "hunter2"})
+
+        assert envelope["encrypted"] is True
+        assert "hunter2" not in str(envelope)
+        assert communicator.decrypt_payload(ORG_ID, envelope) == {"password": "hunter2"}
+
+    def test_tampered_envelope_is_rejected(self):
+        communicator = ServiceCommunicator()
+        communicator.configure_security(ORG_ID, SecurityLevel.BASIC, api_key="key-1")
+        envelope = communicator.encrypt_payload(ORG_ID, {"amount": 10})
+
+        envelope["data"] = envelope["data"][:-4] + "AAA="
+        with pytest.raises(PayloadIntegrityError):
+            communicator.decrypt_payload(ORG_ID, envelope)
+
+    def test_other_tenant_cannot_decrypt(self):
+        communicator = ServiceCommunicator()
+        communicator.configure_security(ORG_ID, SecurityLevel.BASIC, api_key="k", sealing_secret="shared")
+        communicator.configure_security("org-other", SecurityLevel.BASIC, api_key="k", sealing_secret="shared")
+        envelope = communicator.encrypt_payload(ORG_ID, {"amount": 10})
+
+        with pytest.raises(PayloadIntegrityError):
+            communicator.decrypt_payload("org-other", envelope)
+
+    def test_credentials_cannot_open_envelopes(self):
+        communicator = ServiceCommunicator()
+        communicator.configure_security(
+            ORG_ID, SecurityLevel.ENCRYPTED, token="token-1", sealing_secret="seal-1"
+        )
+        envelope = communicator.encrypt_payload(ORG_ID, {"pin": "1234"})
+        body = base64.b64decode(envelope["data"])
+
+        headers = communicator._build_headers(ORG_ID, "s")
+        assert "seal-1" not in str(headers)
+        with pytest.raises(PayloadIntegrityError):
+            unseal(body, derive_sealing_key("token-1", ORG_ID))
+        assert unseal(body, derive_sealing_key("seal-1", ORG_ID))
+
+    def test_envelopes_without_shared_secret_stay_local(self):
+        sender, receiver = ServiceCommunicator(), ServiceCommunicator()
+        for communicator in (sender, receiver):
+            communicator.configure_security(ORG_ID, SecurityLevel.BASIC, api_key="key-1")
+        envelope = sender.encrypt_payload(ORG_ID, {"amount": 10})
+
+        assert sender.decrypt_payload(ORG_ID, envelope) == {"amount": 10}
+        with pytest.raises(PayloadIntegrityError):
+            receiver.decrypt_payload(ORG_ID, envelope)
+
+
+class TestWireEncoding:
+    """Negotiated encodings over the transport"""
+
+    def test_compression_is_negotiated_from_first_response(self):
+        with StubServiceServer(codec=PayloadCodec()) as server:
+            communicator = make_communicator(server)
+            payload = evidence_bundle(500)
+
+            first = communicator.send_request(ORG_ID, "s", "stub", "POST", "/bundle", payload)
+            first_bytes = server.bytes_received
+            second = communicator.send_request(ORG_ID, "s", "stub", "POST", "/bundle", payload)
+            second_bytes = server.bytes_received - first_bytes
+
+            assert first.payload["echo"] == payload
+            assert second.payload["echo"] == payload
+            assert second_bytes < first_bytes / 5
+
+            stats = communicator.get_wire_stats(ORG_ID, "stub")
+            assert stats["requests"] == 2
+            assert stats["compressed_requests"] == 1
+            assert stats["response_savings_ratio"] > 0.5
+            communicator.close()
+
+    def test_plain_peer_gets_plain_json(self, stub):
+        communicator = make_communicator(stub)
+
+        for _ in range(2):
+            response = communicator.send_request(ORG_ID, "s", "stub", "POST", "/x", evidence_bundle(500))
+            assert response.is_successful()
+
+        assert communicator.get_wire_stats(ORG_ID, "stub")["compressed_requests"] == 0
+        communicator.close()
+
+    def test_encrypted_tenant_bodies_are_sealed(self):
+        seen = []
+
+        def capture(method, path, headers, body):
+            seen.append(body)
+            return 200, {"ok": True}
+
+        with StubServiceServer(codec=PayloadCodec(), sealing_secrets={ORG_ID: "seal-1"}) as server:
+            server.add_route("POST", "/secret", capture)
+            communicator = make_communicator(server)
+            communicator.configure_security(ORG_ID, SecurityLevel.ENCRYPTED, token="token-1", sealing_secret="seal-1")
+
+            response = communicator.send_request(ORG_ID, "s", "stub", "POST", "/secret", {"pin": "1234"})
+
+            assert response.payload == {"ok": True}
+            assert seen == [b'{"pin": "1234"}']
+            assert communicator.get_wire_stats(ORG_ID, "stub")["sealed_requests"] == 1
+            communicator.close()
+
+    def test_wrong_secret_is_rejected_by_peer(self):
+        with StubServiceServer(codec=PayloadCodec(), sealing_secrets={ORG_ID: "other"}) as server:
+            communicator = make_communicator(server)
+            communicator.configure_security(ORG_ID, SecurityLevel.ENCRYPTED, token="token-1", sealing_secret="seal-1")
+
+            response = communicator.send_request(ORG_ID, "s", "stub", "POST", "/secret", {"pin": "1234"})
+
+            assert response.status_code == 400
+            communicator.close()
+
+    def test_unsealed_response_is_refused(self, stub):
+        communicator = make_communicator(stub)
+        communicator.configure_security(ORG_ID, SecurityLevel.ENCRYPTED, token="token-1", sealing_secret="seal-1")
+
+        response = communicator.send_request(ORG_ID, "s", "stub", "GET", "/x", {})
+
+        assert response.status_code == 502
+        communicator.close()
+
+    def test_encrypted_level_needs_a_sealing_secret(self, stub):
+        communicator = make_communicator(stub)
+        communicator.configure_security(ORG_ID, SecurityLevel.ENCRYPTED, token="token-1")
+
+        with pytest.raises(ValueError):
+            communicator.send_request(ORG_ID, "s", "stub", "POST", "/x", {"pin": "1234"})
+        communicator.close()
+
+    def test_async_path_uses_codec(self):
+        with StubServiceServer(codec=PayloadCodec()) as server:
+            communicator = make_communicator(server)
+            payload = evidence_bundle(500)
+
+            async def scenario():
+                responses = [
+                    await communicator.send(ORG_ID, "s", "stub", "POST", "/bundle", payload)
+                    for _ in range(2)
+                ]
+                await communicator.aclose()
+                return responses
+
+            responses = asyncio.run(scenario())
+
+            assert all(r.payload["echo"] == payload for r in responses)
+            assert communicator.get_wire_stats(ORG_ID, "stub")["compressed_requests"] == 1
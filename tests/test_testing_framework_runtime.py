@@ -0,0 +1,153 @@
+"""
+Tests for runtime.integration IntegrationTestingFramework.
+
+Covers the runtime behaviour layered on top of the QA-486 to QA-490 suite:
+- Fixture providers and teardown for single test execution
+- Scheduling tests grouped by fixture on process and thread pools
+- Per-worker fixture reuse
+- Aggregated coverage metrics and failure analyses
+"""
+
+import time
+
+import pytest
+
+from runtime.integration.testing_framework import (
+    FailureCategory,
+    IntegrationTestingFramework,
+    IntegrationTestSpec,
+    IntegrationTestStatus,
+)
+
+
+ORG_ID = "org-testing-1"
+
+
+# Process workers need picklable, module-level fixtures and tests
+def make_database(resources):
+    return {"name": resources["database"], "rows": list(range(resources["rows"]))}
+
+
+def failing_provider(resources):
+    raise ConnectionError("database unavailable")
+
+
+def check_reads_rows(database):
+    assert len(database["rows"]) == 10
+
+
+def check_wrong_row_count(database):
+    assert len(database["rows"]) == 11, "expected 11 rows"
+
+
+def check_crashes(database):
+    raise RuntimeError("service returned 500")
+
+
+def check_sleeps(database):
+    time.sleep(0.05)
+
+
+def make_framework():
+    """Create a framework with one provider-backed fixture"""
+    framework = IntegrationTestingFramework()
+    fixture = framework.setup_fixture(
+        ORG_ID, "database", [], [], resources={"database": "test_db", "rows": 10}, provider=make_database
+    )
+    return framework, fixture
+
+
+class TestFixtureProvider:
+    """Providers on single test execution"""
+
+    def test_execute_test_passes_provided_fixture(self):
+        framework, fixture = make_framework()
+        torn_down = []
+        fixture.teardown = torn_down.append
+
+        execution = framework.execute_test(ORG_ID, fixture.fixture_id, "reads", check_reads_rows)
+
+        assert execution.status == IntegrationTestStatus.PASSED
+        assert torn_down[0]["name"] == "test_db"
+
+
+class TestScheduledRuns:
+    """Parallel runs grouped by fixture"""
+
+    def test_process_pool_runs_and_aggregates(self):
+        framework, fixture = make_framework()
+        tests = [
+            IntegrationTestSpec(f"reads_{i}", fixture.fixture_id, check_reads_rows, ["memory"])
+            for i in range(6)
+        ] + [
+            IntegrationTestSpec("wrong_count", fixture.fixture_id, check_wrong_row_count, ["qa"]),
+            IntegrationTestSpec("crashes", fixture.fixture_id, check_crashes, ["dashboard"]),
+        ]
+
+        run = framework.run_tests(ORG_ID, tests, max_workers=2)
+
+        assert [e.test_name for e in run.executions] == [t.test_name for t in tests]
+        assert run.coverage.total_tests == 8
+        assert run.coverage.passed_tests == 6
+        assert run.coverage.failed_tests == 2
+        assert run.coverage.subsystems_covered == ["dashboard", "memory", "qa"]
+        assert run.coverage.integration_points_tested == 8
+        names = {e.execution_id: e.test_name for e in run.executions}
+        categories = {names[a.execution_id]: a.failure_category for a in run.failure_analyses}
+        assert categories == {
+            "wrong_count": FailureCategory.ASSERTION,
+            "crashes": FailureCategory.EXECUTION,
+        }
+        crash = next(a for a in run.failure_analyses if names[a.execution_id] == "crashes")
+        assert crash.root_cause == "service returned 500"
+        assert crash.affected_subsystems == ["dashboard"]
+        assert framework.get_execution(run.executions[0].execution_id) is not None
+
+    def test_fixture_is_built_once_per_worker(self):
+        framework, fixture = make_framework()
+        tests = [IntegrationTestSpec(f"t{i}", fixture.fixture_id, check_reads_rows) for i in range(20)]
+
+        run = framework.run_tests(ORG_ID, tests, max_workers=2, chunk_size=2)
+
+        assert run.coverage.passed_tests == 20
+        assert 1 <= run.fixture_setups <= 2
+
+    def test_groups_run_in_parallel(self):
+        framework = IntegrationTestingFramework()
+        fixtures = [
+            framework.setup_fixture(ORG_ID, f"db_{i}", [], [], {"database": f"db_{i}", "rows": 10}, make_database)
+            for i in range(4)
+        ]
+        tests = [IntegrationTestSpec(f"sleep_{i}", f.fixture_id, check_sleeps) for i, f in enumerate(fixtures)]
+
+        run = framework.run_tests(ORG_ID, tests, max_workers=4, use_processes=False)
+
+        assert run.wall_clock_ms < 150
+        assert run.speedup() > 1.5
+
+    def test_setup_failure_fails_group_with_setup_category(self):
+        framework = IntegrationTestingFramework()
+        fixture = framework.setup_fixture(ORG_ID, "broken", [], [], provider=failing_provider)
+        tests = [IntegrationTestSpec(f"t{i}", fixture.fixture_id, check_reads_rows) for i in range(3)]
+
+        run = framework.run_tests(ORG_ID, tests, max_workers=1)
+
+        assert run.coverage.failed_tests == 3
+        assert run.fixture_setups == 1
+        assert all(a.failure_category == FailureCategory.SETUP for a in run.failure_analyses)
+        assert "database unavailable" in run.executions[0].error_message
+
+    def test_unpicklable_test_is_an_infrastructure_failure(self):
+        framework, fixture = make_framework()
+        tests = [IntegrationTestSpec("lambda", fixture.fixture_id, lambda database: None)]
+
+        run = framework.run_tests(ORG_ID, tests, max_workers=2)
+
+        assert run.executions[0].status == IntegrationTestStatus.FAILED
+        assert run.failure_analyses[0].failure_category == FailureCategory.INFRASTRUCTURE
+
+    def test_unknown_fixture_is_rejected(self):
+        framework = IntegrationTestingFramework()
+
+        with pytest.raises(ValueError):
+            framework.run_tests(ORG_ID, [IntegrationTestSpec("t", "fixture_missing")])
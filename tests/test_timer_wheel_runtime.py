@@ -0,0 +1,262 @@
+"""
+Tests for runtime TimerWheel.
+
+Covers the runtime behaviour layered on top of the QA-246 to QA-250 and QA-269 suites:
+- Expiry never before the deadline, across every wheel level and overflow
+- O(1) cancellation through the handle
+- The scheduler thread firing sub-second timeouts
+- TimeoutHandler and ResilienceManager sharing one wheel instead of a thread per timeout
+- Timeout callbacks run on a pool, never on the wheel thread
+"""
+
+import random
+import threading
+
+import pytest
+
+from runtime.resilience_manager import ResilienceManager
+from runtime.timeout_handler import TimeoutAction, TimeoutHandler
+from runtime.timer_wheel import TimerWheel, TimerWheelConfig
+
+
+ORG_ID = "org-timer-1"
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def manual_wheel(clock: FakeClock, **config) -> TimerWheel:
+    """Create a wheel driven by advance() rather than a thread"""
+    return TimerWheel(TimerWheelConfig(**config), clock=clock, background=False)
+
+
+class TestTimerWheel:
+    """Scheduling, cascading and cancellation"""
+
+    @pytest.mark.parametrize("shape", [
+        {"tick_ms": 1, "wheel_size": 4, "levels": 2},  # Mostly overflow
+        {"tick_ms": 1, "wheel_size": 8, "levels": 3},
+        {"tick_ms": 10, "wheel_size": 256, "levels": 4},
+    ])
+    def test_timers_fire_in_tick_order_and_never_early(self, shape):
+        clock = FakeClock()
+        wheel = manual_wheel(clock, **shape)
+        rng = random.Random(42)
+        fired = []
+        handles = [
+            wheel.schedule(rng.uniform(0, 2), lambda i=i: fired.append((clock.now, i)))
+            for i in range(500)
+        ]
+
+        while clock.now < 1003:
+            clock.now += rng.uniform(0, 0.004)
+            wheel.advance()
+
+        assert len(fired) == 500
+        assert all(at >= handles[i].deadline for at, i in fired)
+        ticks = [handles[i].expiry_tick for _, i in fired]
+        assert ticks == sorted(ticks)
+        assert wheel.get_stats()["pending"] == 0
+
+    def test_callback_time_is_within_a_tick_of_deadline(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock, tick_ms=10, wheel_size=16, levels=3)
+        deadlines = {}
+        lateness = []
+        for i, delay in enumerate([0.005, 0.15, 1.7, 12.3, 45.0]):
+            handle = wheel.schedule(delay, lambda i=i: lateness.append(clock.now - deadlines[i]))
+            deadlines[i] = handle.deadline
+
+        while clock.now < 1050:
+            clock.now += 0.001
+            wheel.advance()
+
+        assert len(lateness) == 5
+        assert all(0 <= late <= 0.011 for late in lateness)
+
+    def test_cancelled_timer_does_not_fire(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        fired = []
+        keep = wheel.schedule(1.0, fired.append, "keep")
+        drop = wheel.schedule(1.0, fired.append, "drop")
+
+        assert drop.cancel()
+        assert not drop.cancel()
+        clock.now += 2
+        wheel.advance()
+
+        assert fired == ["keep"]
+        assert not keep.active and keep.fired
+        assert not keep.cancel()
+        assert wheel.get_stats()["cancelled"] == 1
+
+    def test_failing_callback_is_counted_and_others_still_run(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        fired = []
+        wheel.schedule(0.1, lambda: 1 / 0)
+        wheel.schedule(0.1, fired.append, "ok")
+        clock.now += 1
+
+        assert wheel.advance() == 2
+        assert fired == ["ok"]
+        assert wheel.get_stats()["callback_errors"] == 1
+
+    def test_invalid_config_is_rejected(self):
+        with pytest.raises(ValueError):
+            TimerWheel(TimerWheelConfig(wheel_size=1))
+
+
+class TestSchedulerThread:
+    """Background expiry"""
+
+    def test_sub_second_timeouts_fire_on_one_thread(self):
+        wheel = TimerWheel(TimerWheelConfig(tick_ms=5))
+        done = threading.Event()
+        threads = set()
+        remaining = [50]
+
+        def expire():
+            threads.add(threading.current_thread().name)
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                done.set()
+
+        before = threading.active_count()
+        for i in range(50):
+            wheel.schedule(0.01 + i * 0.002, expire)
+
+        assert threading.active_count() <= before + 1
+        assert done.wait(timeout=5)
+        assert threads == {"timer-wheel"}
+        wheel.shutdown()
+        with pytest.raises(RuntimeError):
+            wheel.schedule(1, expire)
+
+    def test_earlier_timer_wakes_sleeping_scheduler(self):
+        wheel = TimerWheel(TimerWheelConfig(tick_ms=5))
+        wheel.schedule(60, lambda: None)
+        fired = threading.Event()
+
+        wheel.schedule(0.02, fired.set)
+
+        assert fired.wait(timeout=2)
+        wheel.shutdown()
+
+
+class TestTimeoutConsumers:
+    """TimeoutHandler and ResilienceManager on a shared wheel"""
+
+    def test_timeout_handler_uses_no_thread_per_operation(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        handler = TimeoutHandler(ORG_ID, timer_wheel=wheel)
+        before = threading.active_count()
+
+        for i in range(200):
+            handler.start_timeout_monitoring(f"op-{i}", "intent_rework", 30, TimeoutAction.ESCALATE)
+
+        assert threading.active_count() == before
+        assert wheel.get_stats()["pending"] == 200
+        handler.cancel_timeout_monitoring("op-0")
+        assert wheel.get_stats()["pending"] == 199
+        handler.shutdown()
+        assert wheel.get_stats()["pending"] == 0
+
+    def test_expired_operation_runs_callback_once(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        handler = TimeoutHandler(ORG_ID, timer_wheel=wheel)
+        expired = []
+        handler.start_timeout_monitoring("op-1", "requirement_approval", 5)
+        handler._configs["op-1"].callback = expired.append
+
+        clock.now += 4.9
+        wheel.advance()
+        assert handler.get_timeout_status("op-1")["state"] == "active"
+        clock.now += 0.2
+        wheel.advance()
+        assert handler.get_timeout_status("op-1")["state"] == "triggered"
+        handler.shutdown()  # Waits for the callback pool
+
+        assert expired == ["op-1"]
+
+    def test_slow_callback_does_not_hold_up_the_wheel(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        handler = TimeoutHandler(ORG_ID, timer_wheel=wheel, callback_workers=1)
+        release = threading.Event()
+        handler.start_timeout_monitoring("slow", "requirement_approval", 5)
+        handler.start_timeout_monitoring("next", "requirement_approval", 6)
+        handler._configs["slow"].callback = lambda operation_id: release.wait(5)
+
+        clock.now += 5.1
+        wheel.advance()
+        clock.now += 1
+        wheel.advance()
+
+        assert handler.get_timeout_status("next")["state"] == "triggered"
+        release.set()
+        handler.shutdown()
+
+    def test_replaced_timer_firing_late_is_ignored(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        handler = TimeoutHandler(ORG_ID, timer_wheel=wheel)
+        handler.start_timeout_monitoring("op-1", "requirement_approval", 5)
+        stale_generation, _ = handler._timers["op-1"]
+
+        handler.extend_timeout("op-1", 10)
+        handler._on_timer_expired("op-1", stale_generation)  # Old timer fired while being replaced
+
+        assert handler.get_timeout_status("op-1")["state"] == "active"
+        assert wheel.get_stats()["pending"] == 1
+        clock.now += 15.1
+        wheel.advance()
+        assert handler.get_timeout_status("op-1")["state"] == "triggered"
+
+    def test_extension_moves_the_deadline(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        handler = TimeoutHandler(ORG_ID, timer_wheel=wheel)
+        expired = []
+        handler.start_timeout_monitoring("op-1", "requirement_approval", 5)
+        handler._configs["op-1"].callback = expired.append
+
+        assert handler.extend_timeout("op-1", 10)["extended"]
+        clock.now += 6
+        wheel.advance()
+        assert expired == []
+        assert wheel.get_stats()["pending"] == 1
+
+    def test_handled_timeout_cancels_its_timer(self):
+        wheel = manual_wheel(FakeClock())
+        handler = TimeoutHandler(ORG_ID, timer_wheel=wheel)
+        handler.start_timeout_monitoring("op-1", "intent_rework", 5)
+
+        handler.handle_state_transition_timeout("op-1", "CLARIFIED", "RECEIVED", "intent", "intent-1")
+
+        assert wheel.get_stats()["pending"] == 0
+
+    def test_resilience_manager_times_out_on_wheel(self):
+        clock = FakeClock()
+        wheel = manual_wheel(clock)
+        manager = ResilienceManager(ORG_ID, timer_wheel=wheel)
+        operation_id = manager.start_timed_operation("query", timeout_ms=250)
+
+        clock.now += 0.2
+        wheel.advance()
+        assert not manager.get_operation_status(operation_id)["timed_out"]
+        clock.now += 0.1
+        wheel.advance()
+
+        status = manager.get_operation_status(operation_id)
+        assert status["timed_out"] and status["cancelled"] and status["cleanup_executed"]
@@ -0,0 +1,199 @@
+"""
+Tests for runtime.integration TransactionManager.
+
+Covers the runtime behaviour layered on top of the QA-476 to QA-480 suite:
+- Write-ahead log replay after restart
+- Presumed abort of transactions without a commit record
+- In-doubt transactions whose coordination was decided
+- Torn-tail repair of the transaction log
+- Group commit sharing fsyncs between concurrent committers
+- Checkpoint compaction
+"""
+
+import threading
+
+import pytest
+
+from runtime.integration.transaction_log import TransactionLog, TransactionLogConfig
+from runtime.integration.transaction_manager import (
+    CoordinationStatus,
+    TransactionManager,
+    TransactionState,
+)
+
+
+ORG_ID = "org-txn-1"
+
+
+def open_manager(directory, **overrides) -> TransactionManager:
+    """Create a TransactionManager backed by a log in directory"""
+    config = TransactionLogConfig(directory=str(directory), **overrides)
+    return TransactionManager(transaction_log=TransactionLog(config))
+
+
+class TestWriteAheadLog:
+    """Replay of logged transaction state"""
+
+    def test_committed_and_rolled_back_survive_restart(self, tmp_path):
+        manager = open_manager(tmp_path)
+        committed = manager.initialize_transaction(ORG_ID, ["memory", "qa"], [{"op": "write"}])
+        rolled_back = manager.initialize_transaction(ORG_ID, ["memory"], [{"op": "delete"}])
+        manager.commit_transaction(committed.transaction_id)
+        manager.rollback_transaction(rolled_back.transaction_id, "validation failed")
+        manager._log.close()
+
+        manager = open_manager(tmp_path)
+
+        restored = manager.get_transaction(committed.transaction_id)
+        assert restored.state == TransactionState.COMMITTED
+        assert restored.participating_subsystems == {"memory", "qa"}
+        assert restored.operations == [{"op": "write"}]
+        assert restored.committed_at == committed.committed_at
+        reverted = manager.get_transaction(rolled_back.transaction_id)
+        assert reverted.state == TransactionState.ROLLED_BACK
+        assert reverted.failure_reason == "validation failed"
+        assert manager.last_recovery["committed"] == [committed.transaction_id]
+        assert manager.last_recovery["rolled_back"] == [rolled_back.transaction_id]
+
+    def test_unlogged_transaction_is_presumed_aborted(self, tmp_path):
+        manager = open_manager(tmp_path)
+        transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+        manager._log.close()
+
+        manager = open_manager(tmp_path)
+
+        restored = manager.get_transaction(transaction.transaction_id)
+        assert restored.state == TransactionState.ROLLED_BACK
+        assert "Presumed aborted" in restored.failure_reason
+        assert manager.last_recovery["presumed_aborted"] == [transaction.transaction_id]
+
+        # The abort is itself logged, so a second restart agrees
+        manager._log.close()
+        manager = open_manager(tmp_path)
+        assert manager.last_recovery["rolled_back"] == [transaction.transaction_id]
+
+    def test_coordinated_transaction_is_in_doubt(self, tmp_path):
+        manager = open_manager(tmp_path)
+        transaction = manager.initialize_transaction(ORG_ID, ["memory", "qa"], [])
+        coordination = manager.coordinate_distributed_transaction(
+            ORG_ID, transaction.transaction_id, ["node-a", "node-b"]
+        )
+        manager._log.close()
+
+        manager = open_manager(tmp_path)
+
+        assert manager.last_recovery["in_doubt"] == [transaction.transaction_id]
+        assert manager.get_transaction(transaction.transaction_id).state == TransactionState.IN_PROGRESS
+        restored = manager.get_coordination(coordination.coordination_id)
+        assert restored.status == CoordinationStatus.COORDINATED
+        assert restored.participating_nodes == ["node-a", "node-b"]
+
+        manager.commit_transaction(transaction.transaction_id)
+        assert manager.get_transaction(transaction.transaction_id).state == TransactionState.COMMITTED
+
+    def test_recovery_is_replayed(self, tmp_path):
+        manager = open_manager(tmp_path)
+        transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+        recovery = manager.recover_from_failure(
+            ORG_ID, transaction.transaction_id, "node lost", ["retry"]
+        )
+        manager._log.close()
+
+        manager = open_manager(tmp_path)
+
+        assert manager.get_recovery(recovery.recovery_id).recovery_status == "completed"
+        assert manager.get_transaction(transaction.transaction_id).state == TransactionState.RECOVERING
+        assert manager.last_recovery["recovering"] == [transaction.transaction_id]
+
+    def test_torn_tail_is_truncated_on_reopen(self, tmp_path):
+        manager = open_manager(tmp_path)
+        transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+        manager.commit_transaction(transaction.transaction_id)
+        manager._log.close()
+        with open(manager._log.path, "ab") as log_file:
+            log_file.write(b"\x40\x00\x00\x00garbage")
+
+        manager = open_manager(tmp_path)
+
+        assert manager.get_transaction(transaction.transaction_id).state == TransactionState.COMMITTED
+        second = manager.initialize_transaction(ORG_ID, ["qa"], [])
+        manager.commit_transaction(second.transaction_id)
+        manager._log.close()
+        assert len(open_manager(tmp_path).last_recovery["committed"]) == 2
+
+    def test_manager_without_log_is_unchanged(self):
+        manager = TransactionManager()
+        transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+        manager.commit_transaction(transaction.transaction_id)
+
+        assert manager.last_recovery is None
+        with pytest.raises(ValueError):
+            manager.checkpoint()
+
+
+class TestGroupCommit:
+    """Shared fsyncs between concurrent committers"""
+
+    def test_concurrent_commits_share_syncs(self, tmp_path):
+        manager = open_manager(tmp_path, group_commit_delay_ms=1.0)
+        transactions = [
+            manager.initialize_transaction(ORG_ID, ["memory"], []) for _ in range(64)
+        ]
+        barrier = threading.Barrier(16)
+
+        def commit_slice(index: int) -> None:
+            barrier.wait()
+            for transaction in transactions[index::16]:
+                manager.commit_transaction(transaction.transaction_id)
+
+        workers = [threading.Thread(target=commit_slice, args=(i,)) for i in range(16)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        stats = manager._log.get_stats()
+        assert all(t.state == TransactionState.COMMITTED for t in transactions)
+        assert stats["syncs"] < 64
+        assert stats["max_group_size"] > 1
+
+    def test_commit_without_group_commit_syncs_each_time(self, tmp_path):
+        manager = open_manager(tmp_path, group_commit=False)
+        for _ in range(5):
+            transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+            manager.commit_transaction(transaction.transaction_id)
+
+        assert manager._log.get_stats()["syncs"] == 5
+
+    def test_outcome_is_decided_once(self, tmp_path):
+        manager = open_manager(tmp_path)
+        transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+        manager.commit_transaction(transaction.transaction_id)
+
+        with pytest.raises(ValueError, match="cannot be rolled back"):
+            manager.rollback_transaction(transaction.transaction_id)
+        with pytest.raises(ValueError, match="cannot be committed"):
+            manager.commit_transaction(transaction.transaction_id)
+
+
+class TestCheckpoint:
+    """Log compaction"""
+
+    def test_checkpoint_compacts_and_preserves_state(self, tmp_path):
+        manager = open_manager(tmp_path)
+        transaction = manager.initialize_transaction(ORG_ID, ["memory"], [])
+        manager.coordinate_distributed_transaction(ORG_ID, transaction.transaction_id, ["node-a"])
+        manager.commit_transaction(transaction.transaction_id)
+        before = manager._log.get_stats()["size_bytes"]
+
+        manager.checkpoint()
+
+        assert manager._log.get_stats()["size_bytes"] < before
+        later = manager.initialize_transaction(ORG_ID, ["qa"], [])
+        manager.rollback_transaction(later.transaction_id)
+        manager._log.close()
+
+        manager = open_manager(tmp_path)
+        assert manager.last_recovery["committed"] == [transaction.transaction_id]
+        assert manager.last_recovery["rolled_back"] == [later.transaction_id]
+        assert manager.last_recovery["in_doubt"] == []